@@ -37,6 +37,8 @@ exports: (
     OApp.endpoint,
     OApp.peers,
     OApp.setPeer,
+    OApp.setPeers,
+    OApp.getPeers,
     OApp.setDelegate,
     OApp.setReadChannel,
     OApp.isComposeMsgSender,
@@ -263,8 +265,8 @@ def lzReceive(
     @notice Handle both regular messages and read responses
     """
 
-    # Basic parameter validation for message source
-    OApp._lzReceive(_origin, _guid, _message, _executor, _extraData)
+    # Basic parameter validation for message source (message is not copied again)
+    OApp._lzReceiveOrigin(_origin)
 
     if _origin.srcEid > OApp.READ_CHANNEL_THRESHOLD:
         # Handle read response
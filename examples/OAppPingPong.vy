@@ -0,0 +1,158 @@
+# pragma version 0.4.3
+
+"""
+@title Ping-pong LayerZero Messenger
+
+@notice Example of the recursive lzReceive -> lzSend pattern: a ping carries a counter,
+and every received ping with a counter above zero is answered with counter - 1 to the
+source chain. Replies are sent from lzReceive, where msg.value is only the executor value,
+so their fees are paid from the contract balance with OAppGasTank (fund it with fundTank
+and set a budget per destination with setEidAllowance).
+
+@license Copyright (c) Curve.Fi, 2025 - all rights reserved
+
+@author curve.fi
+
+@custom:security security@curve.fi
+
+"""
+
+################################################################
+#                           MODULES                            #
+################################################################
+
+# Import ownership management
+from snekmate.auth import ownable
+
+initializes: ownable
+exports: (
+    ownable.owner,
+    ownable.transfer_ownership,
+    ownable.renounce_ownership,
+)
+
+# LayerZero module
+from ..src import OApp
+
+initializes: OApp[ownable := ownable]
+exports: (
+    OApp.endpoint,
+    OApp.peers,
+    OApp.setPeer,
+    OApp.setPeers,
+    OApp.setReadChannel,
+    OApp.isComposeMsgSender,
+    OApp.allowInitializePath,
+    OApp.nextNonce,
+)
+
+# Replies are paid from the contract balance
+from ..src import OAppGasTank
+
+initializes: OAppGasTank[ownable := ownable, OApp := OApp]
+exports: OAppGasTank.__interface__
+
+from ..src import OptionsBuilder
+
+################################################################
+#                            EVENTS                            #
+################################################################
+
+event PingReceived:
+    source: uint32
+    count: uint256
+
+
+################################################################
+#                           STORAGE                            #
+################################################################
+
+# lzReceive gas limit of replies
+returnGasLimit: public(uint128)
+
+################################################################
+#                          CONSTRUCTOR                         #
+################################################################
+
+@deploy
+def __init__(_endpoint: address, _returnGasLimit: uint128):
+    """
+    @notice Initialize messenger with LZ endpoint and the gas limit of replies
+    @param _endpoint LayerZero endpoint address
+    @param _returnGasLimit lzReceive gas limit of replies on the source chain
+    """
+    ownable.__init__()
+    ownable._transfer_ownership(tx.origin)
+
+    OApp.__init__(_endpoint, tx.origin)
+
+    # Replies are sent by the endpoint (lzReceive caller), bounded by the eid allowances
+    OAppGasTank.spenderAllowance[_endpoint] = max_value(uint256)
+    self.returnGasLimit = _returnGasLimit
+
+
+################################################################
+#                    MESSAGING FUNCTIONS                       #
+# ##############################################################
+
+@view
+@external
+def quote_ping(_dst_eid: uint32, _count: uint256, _gas_limit: uint128) -> OApp.MessagingFee:
+    """
+    @notice Quote the fee of the first ping
+    """
+    options: Bytes[OptionsBuilder.MAX_OPTIONS_TOTAL_SIZE] = OptionsBuilder.newOptions()
+    options = OptionsBuilder.addExecutorLzReceiveOption(options, _gas_limit, 0)
+    return OApp._quote(_dst_eid, abi_encode(_count), options, False)
+
+
+@payable
+@external
+def ping(_dst_eid: uint32, _count: uint256, _gas_limit: uint128):
+    """
+    @notice Start a ping-pong of _count + 1 messages
+    @param _dst_eid Destination chain ID
+    @param _count Number of replies
+    @param _gas_limit lzReceive gas limit on the destination, must cover the reply
+    """
+    options: Bytes[OptionsBuilder.MAX_OPTIONS_TOTAL_SIZE] = OptionsBuilder.newOptions()
+    options = OptionsBuilder.addExecutorLzReceiveOption(options, _gas_limit, 0)
+
+    fees: OApp.MessagingFee = OApp.MessagingFee(nativeFee=msg.value, lzTokenFee=0)
+    OApp._lzSend(_dst_eid, abi_encode(_count), options, fees, msg.sender)
+
+
+@external
+@payable
+def lzReceive(
+    _origin: OApp.Origin,
+    _guid: bytes32,
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+    _executor: address,
+    _extraData: Bytes[OApp.MAX_EXTRA_DATA_SIZE],
+):
+    """
+    @notice Answer a ping with counter - 1, until the counter reaches zero
+    """
+    OApp._lzReceiveOrigin(_origin)
+
+    count: uint256 = abi_decode(_message, uint256)
+    log PingReceived(source=_origin.srcEid, count=count)
+    if count == 0:
+        return
+
+    options: Bytes[OptionsBuilder.MAX_OPTIONS_TOTAL_SIZE] = OptionsBuilder.newOptions()
+    options = OptionsBuilder.addExecutorLzReceiveOption(options, self.returnGasLimit, 0)
+    message: Bytes[OApp.MAX_MESSAGE_SIZE] = abi_encode(count - 1)
+
+    fee: OApp.MessagingFee = OApp._quote(_origin.srcEid, message, options, False)
+    OAppGasTank._lzSendFromTank(_origin.srcEid, message, options, fee.nativeFee)
+
+
+@external
+@payable
+def __default__():
+    """
+    @notice Receive refunds from the endpoint
+    """
+    pass
@@ -0,0 +1,214 @@
+import importlib
+import json
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+# Lazy ABI registry: ABIs are registered by name (ABIs.py strings, JSON files or lists) and only
+# parsed on first access, then cached with selector -> function and topic -> event indexes for
+# decoding calldata and logs. Importing this module is cheap: the ABI JSON is parsed, hashed
+# and eth_abi imported only when an ABI is used, and hashing uses pycryptodome's keccak (what
+# eth_hash uses underneath) without the eth_utils import.
+
+Source = Union[str, list, Callable[[], Union[str, list]]]
+
+
+def _keccak(data: bytes) -> bytes:
+    try:
+        from Crypto.Hash import keccak
+    except ImportError:  # pragma: no cover - pycryptodome comes with web3
+        from eth_utils import keccak as eth_keccak
+
+        return eth_keccak(data)
+    return keccak.new(data=data, digest_bits=256).digest()
+
+
+def canonical_type(param: Dict[str, Any]) -> str:
+    # ABI param -> canonical type, tuples expanded: "(uint32,bytes32,uint64)[]"
+    if not param["type"].startswith("tuple"):
+        return param["type"]
+    inner = ",".join(canonical_type(c) for c in param["components"])
+    return f"({inner}){param['type'][len('tuple') :]}"
+
+
+def signature(entry: Dict[str, Any]) -> str:
+    return f"{entry['name']}({','.join(canonical_type(p) for p in entry['inputs'])})"
+
+
+@dataclass
+class DecodedCall:
+    name: str
+    args: Dict[str, Any]
+
+
+@dataclass
+class DecodedLog:
+    name: str
+    args: Dict[str, Any]
+
+
+class EventDecoder:
+    # Decoder of one event: indexed params from topics[1:], the others from data
+    def __init__(self, entry: Dict[str, Any]):
+        self.entry = entry
+        self.name = entry["name"]
+        self.signature = signature(entry)
+        self.topic = _keccak(self.signature.encode())
+        inputs = entry["inputs"]
+        self._indexed = [p for p in inputs if p.get("indexed")]
+        self._data = [p for p in inputs if not p.get("indexed")]
+        self._data_types = [canonical_type(p) for p in self._data]
+        self._order = [p["name"] for p in inputs]
+
+    def decode(self, topics: Sequence[bytes], data: bytes) -> DecodedLog:
+        import eth_abi
+
+        args = dict(zip((p["name"] for p in self._data), eth_abi.decode(self._data_types, data)))
+        for param, topic in zip(self._indexed, topics[1:]):
+            kind = canonical_type(param)
+            if kind in ("string", "bytes") or kind.endswith("]") or kind.startswith("("):
+                args[param["name"]] = topic  # dynamic types are indexed by hash
+            else:
+                args[param["name"]] = eth_abi.decode([kind], topic)[0]
+        return DecodedLog(self.name, {name: args[name] for name in self._order})
+
+
+class ContractABI:
+    def __init__(self, name: str, source: Source):
+        self.name = name
+        self._source = source
+
+    @cached_property
+    def abi(self) -> List[Dict[str, Any]]:
+        source = self._source() if callable(self._source) else self._source
+        return json.loads(source) if isinstance(source, str) else source
+
+    @cached_property
+    def functions(self) -> Dict[bytes, Dict[str, Any]]:
+        # 4-byte selector -> function entry
+        return {
+            _keccak(signature(e).encode())[:4]: e for e in self.abi if e.get("type") == "function"
+        }
+
+    @cached_property
+    def events(self) -> Dict[bytes, EventDecoder]:
+        # topic0 -> decoder, anonymous events have no topic0 and are skipped
+        decoders = [
+            EventDecoder(e)
+            for e in self.abi
+            if e.get("type") == "event" and not e.get("anonymous", False)
+        ]
+        return {d.topic: d for d in decoders}
+
+    @cached_property
+    def _functions_by_name(self) -> Dict[str, Dict[str, Any]]:
+        return {e["name"]: e for e in self.functions.values()}
+
+    def function(self, name: str) -> Dict[str, Any]:
+        # Function entry by name (the last overload wins)
+        return self._functions_by_name[name]
+
+    def selector(self, name: str) -> bytes:
+        return _keccak(signature(self.function(name)).encode())[:4]
+
+    def decode_calldata(self, calldata: bytes) -> Optional[DecodedCall]:
+        # None if the selector is not in this ABI
+        entry = self.functions.get(bytes(calldata[:4]))
+        if entry is None:
+            return None
+        import eth_abi
+
+        types = [canonical_type(p) for p in entry["inputs"]]
+        values = eth_abi.decode(types, bytes(calldata[4:]))
+        return DecodedCall(entry["name"], dict(zip((p["name"] for p in entry["inputs"]), values)))
+
+    def decode_log(self, topics: Sequence[bytes], data: bytes) -> Optional[DecodedLog]:
+        # None if topic0 is not an event of this ABI
+        if not topics:
+            return None
+        decoder = self.events.get(bytes(topics[0]))
+        return decoder.decode(topics, data) if decoder else None
+
+
+class ABIRegistry:
+    def __init__(self):
+        self._abis: Dict[str, ContractABI] = {}
+
+    def register(self, name: str, source: Source) -> None:
+        # source: JSON string, parsed list, or a callable returning either (called lazily)
+        self._abis[name] = ContractABI(name, source)
+
+    def register_file(self, name: str, filepath: str) -> None:
+        def load():
+            with open(filepath, "r") as f:
+                return f.read()
+
+        self.register(name, load)
+
+    def register_module(self, name: str, module: str, attribute: str) -> None:
+        # e.g. ("endpoint", "ABIs", "endpoint_abi"): the module is imported on first use
+        self.register(name, lambda: getattr(importlib.import_module(module), attribute))
+
+    def __getitem__(self, name: str) -> ContractABI:
+        return self._abis[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._abis
+
+    def names(self) -> List[str]:
+        return list(self._abis)
+
+    def is_loaded(self, name: str) -> bool:
+        return "abi" in vars(self._abis[name])
+
+    def decode_log(self, topics: Sequence[bytes], data: bytes) -> Optional[Tuple[str, DecodedLog]]:
+        # (ABI name, decoded log) from the first ABI that knows topic0; loads every ABI
+        for name, abi in self._abis.items():
+            decoded = abi.decode_log(topics, data)
+            if decoded is not None:
+                return name, decoded
+        return None
+
+
+# ABIs.py, by the name of their variable without "_abi"
+registry = ABIRegistry()
+registry.register_module("endpoint", "ABIs", "endpoint_abi")
+registry.register_module("lzreadlib", "ABIs", "lzreadlib_abi")
+
+
+if __name__ == "__main__":
+    # Example usage: python ABIRegistry.py [<name> <calldata hex>]
+    # Without arguments, measures import and first-use costs against eager loading
+    import subprocess
+    import sys
+
+    if len(sys.argv) == 3:
+        print(registry[sys.argv[1]].decode_calldata(bytes.fromhex(sys.argv[2].removeprefix("0x"))))
+        sys.exit()
+
+    def timed(code: str) -> float:
+        # Best of 5 fresh interpreters, in ms
+        runs = []
+        for _ in range(5):
+            out = subprocess.run(
+                [
+                    sys.executable,
+                    "-c",
+                    f"import time; t = time.perf_counter(); {code};"
+                    " print(time.perf_counter() - t)",
+                ],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            runs.append(float(out.stdout) * 1000)
+        return min(runs)
+
+    eager = "import json, eth_utils, ABIs; json.loads(ABIs.endpoint_abi); json.loads(ABIs.lzreadlib_abi)"
+    for label, code in (
+        ("eager (json.loads + eth_utils)", eager),
+        ("import ABIRegistry", "import ABIRegistry"),
+        ("first selector lookup", "import ABIRegistry; ABIRegistry.registry['endpoint'].functions"),
+        ("import LZMetadata", "import LZMetadata"),
+    ):
+        print(f"{label:<36}{timed(code):>8.1f} ms")
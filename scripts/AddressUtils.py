@@ -0,0 +1,26 @@
+from typing import Union
+
+# Left-padded bytes32 values as used by OApp peers (OApp.peers, Origin.sender, packet
+# receivers): 20 byte addresses and shorter hex values are padded with leading zeros. Shared
+# by the scripts and the tests, it has no dependencies so it stays cheap to import.
+
+
+def to_bytes32(value: Union[str, bytes]) -> bytes:
+    # Hex strings (addresses, boa Address) and raw bytes are padded as-is, other strings
+    # (e.g. salts, labels) are padded as their UTF-8 text
+    if isinstance(value, str) and value.startswith("0x"):
+        digits = value[2:]
+        value = bytes.fromhex(digits.rjust(len(digits) + len(digits) % 2, "0"))
+    elif isinstance(value, str):
+        value = value.encode()
+    if len(value) > 32:
+        raise ValueError(f"value longer than 32 bytes: 0x{value.hex()}")
+    return value.rjust(32, b"\x00")
+
+
+if __name__ == "__main__":
+    # Example usage: python AddressUtils.py <address> [<address> ...]
+    import sys
+
+    for address in sys.argv[1:]:
+        print("0x" + to_bytes32(address).hex())
@@ -0,0 +1,399 @@
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import eth_abi
+from AddressUtils import to_bytes32
+from eth_utils import function_signature_to_4byte_selector
+
+# Mirrors src/VyperConstants.vy and src/OAppConfigUtils.vy
+MAX_CONFIG_ITEMS = 32
+READ_CHANNEL_THRESHOLD = 4294965694
+CONFIG_TYPE_ULN = 0
+CONFIG_TYPE_EXECUTOR = 1
+CONFIG_TYPE_READ = 2
+EXECUTOR_MAX_MESSAGE_SIZE = 1024  # hardcoded by OAppConfigUtils.setExecutorConfigs
+
+ZERO_ADDRESS = "0x" + "00" * 20
+ZERO_BYTES32 = b"\x00" * 32
+
+ULN_CONFIG_ABI = "(uint64,uint8,uint8,uint8,address[],address[])"
+ULN_READ_CONFIG_ABI = "(address,uint8,uint8,uint8,address[],address[])"
+
+# Multicall3 is deployed at the same address on most chains. aggregate3 is payable on chain,
+# it is declared view here so that boa runs it as an eth_call.
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a6d83deD2b4"
+MULTICALL3_ABI = json.dumps(
+    [
+        {
+            "name": "aggregate3",
+            "type": "function",
+            "stateMutability": "view",
+            "inputs": [
+                {
+                    "name": "calls",
+                    "type": "tuple[]",
+                    "components": [
+                        {"name": "target", "type": "address"},
+                        {"name": "allowFailure", "type": "bool"},
+                        {"name": "callData", "type": "bytes"},
+                    ],
+                }
+            ],
+            "outputs": [
+                {
+                    "name": "returnData",
+                    "type": "tuple[]",
+                    "components": [
+                        {"name": "success", "type": "bool"},
+                        {"name": "returnData", "type": "bytes"},
+                    ],
+                }
+            ],
+        }
+    ]
+)
+DEFAULT_MAX_BATCH = 100  # reads per aggregate3 call, bounded by the node's eth_call gas cap
+
+
+@dataclass
+class PathwayConfig:
+    # Desired state of one pathway. None means "no opinion": the setting is left untouched.
+    eid: int
+    peer: Optional[bytes] = None
+    send_lib: Optional[str] = None
+    receive_lib: Optional[str] = None
+    grace_period: int = 0
+    executor: Optional[str] = None
+    confirmations: int = 0
+    required_dvns: Optional[List[str]] = None
+    optional_dvns: List[str] = field(default_factory=list)
+    optional_dvn_threshold: int = 0
+
+    @property
+    def is_read_channel(self) -> bool:
+        return self.eid > READ_CHANNEL_THRESHOLD
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PathwayConfig":
+        data = dict(data)
+        peer = data.pop("peer", None)
+        if isinstance(peer, str):
+            peer = to_bytes32(peer)
+        return cls(peer=peer, **data)
+
+
+@dataclass
+class PathwayState:
+    # Current on-chain state of one pathway, as read by read_state()
+    eid: int
+    peer: bytes = ZERO_BYTES32
+    send_lib: str = ZERO_ADDRESS
+    send_lib_is_default: bool = True
+    receive_lib: str = ZERO_ADDRESS
+    receive_lib_is_default: bool = True
+    # config bytes keyed by (lib, config type), empty bytes if unset
+    configs: Dict[Tuple[str, int], bytes] = field(default_factory=dict)
+
+
+@dataclass
+class PlannedCall:
+    # A single OApp call: OAppConfigUtils setters or OApp peer management
+    fn: str
+    args: tuple
+
+
+def load_desired(filepath: str) -> List[PathwayConfig]:
+    # Desired config file: {"pathways": [{"eid": ..., "peer": "0x..", "send_lib": ..., ...}]}
+    with open(filepath, "r") as f:
+        data = json.load(f)
+    return [PathwayConfig.from_dict(p) for p in data["pathways"]]
+
+
+################################################################
+#                          READERS                             #
+################################################################
+
+
+class BoaReader:
+    # Executes read calls against boa contract handles (local env or boa network env)
+    def execute(self, calls: Sequence[Tuple[Any, str, tuple]]) -> List[Any]:
+        return [getattr(contract, fn)(*args) for contract, fn, args in calls]
+
+
+def _abi_type(param: Dict[str, Any]) -> str:
+    # ABI JSON parameter to an eth_abi type string, e.g. "(address,bytes)[]"
+    if param["type"].startswith("tuple"):
+        components = ",".join(_abi_type(c) for c in param["components"])
+        return f"({components}){param['type'][len('tuple') :]}"
+    return param["type"]
+
+
+class MulticallReader:
+    # Executes read calls against boa contract handles through Multicall3.aggregate3: one
+    # eth_call per max_batch reads instead of one per getter. Calls are encoded and decoded
+    # with the contracts' ABIs, results have the same shape as BoaReader's.
+    def __init__(self, multicall, max_batch: int = DEFAULT_MAX_BATCH):
+        self.multicall = multicall
+        self.max_batch = max_batch
+
+    def execute(self, calls: Sequence[Tuple[Any, str, tuple]]) -> List[Any]:
+        results = []
+        for chunk in _chunks(list(calls), self.max_batch):
+            encoded, output_types = [], []
+            for contract, fn, args in chunk:
+                abi = next(f for f in contract.abi if f.get("name") == fn)
+                input_types = [_abi_type(i) for i in abi["inputs"]]
+                selector = function_signature_to_4byte_selector(f"{fn}({','.join(input_types)})")
+                encoded.append(
+                    (contract.address, False, selector + eth_abi.encode(input_types, list(args)))
+                )
+                output_types.append([_abi_type(o) for o in abi["outputs"]])
+
+            for types, (_, data) in zip(output_types, self.multicall.aggregate3(encoded)):
+                values = eth_abi.decode(types, data)
+                results.append(values[0] if len(values) == 1 else values)
+        return results
+
+
+class Web3BatchReader:
+    # Executes read calls against web3 contracts in a single JSON-RPC batch
+    def __init__(self, w3):
+        self.w3 = w3
+
+    def execute(self, calls: Sequence[Tuple[Any, str, tuple]]) -> List[Any]:
+        if not calls:
+            return []
+        with self.w3.batch_requests() as batch:
+            for contract, fn, args in calls:
+                batch.add(contract.functions[fn](*args))
+            return batch.execute()
+
+
+################################################################
+#                         STATE READ                           #
+################################################################
+
+
+def _norm(address: str) -> str:
+    return str(address).lower()
+
+
+def _chunks(items: List[Any], size: int = MAX_CONFIG_ITEMS) -> List[List[Any]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def read_state(reader, endpoint, oapp, desired: Sequence[PathwayConfig]) -> Dict[int, PathwayState]:
+    # Read current libraries, peers and configs for all desired pathways in two batches:
+    # libraries and peers first, then configs on the libraries that will be in effect
+    oapp_address = oapp.address
+    calls = []
+    for p in desired:
+        calls += [
+            (endpoint, "getSendLibrary", (oapp_address, p.eid)),
+            (endpoint, "isDefaultSendLibrary", (oapp_address, p.eid)),
+            (endpoint, "getReceiveLibrary", (oapp_address, p.eid)),
+        ]
+    # OApp.getPeers returns up to MAX_CONFIG_ITEMS peers per call
+    calls += [(oapp, "getPeers", ([p.eid for p in chunk],)) for chunk in _chunks(list(desired))]
+    results = reader.execute(calls)
+    peers = [peer for chunk in results[3 * len(desired) :] for peer in chunk]
+
+    states = {}
+    for i, p in enumerate(desired):
+        send_lib, send_is_default, (receive_lib, receive_is_default) = results[3 * i : 3 * i + 3]
+        states[p.eid] = PathwayState(
+            eid=p.eid,
+            peer=bytes(peers[i]),
+            send_lib=_norm(send_lib),
+            send_lib_is_default=send_is_default,
+            receive_lib=_norm(receive_lib),
+            receive_lib_is_default=receive_is_default,
+        )
+
+    config_keys = []
+    for p in desired:
+        state = states[p.eid]
+        send_lib = _norm(p.send_lib or state.send_lib)
+        receive_lib = _norm(p.receive_lib or state.receive_lib)
+        if p.is_read_channel:
+            config_keys += [(p.eid, send_lib, CONFIG_TYPE_READ)]
+            if receive_lib != send_lib:
+                config_keys += [(p.eid, receive_lib, CONFIG_TYPE_READ)]
+        else:
+            config_keys += [
+                (p.eid, send_lib, CONFIG_TYPE_ULN),
+                (p.eid, receive_lib, CONFIG_TYPE_ULN),
+                (p.eid, send_lib, CONFIG_TYPE_EXECUTOR),
+            ]
+
+    results = reader.execute(
+        [(endpoint, "getConfig", (oapp_address, lib, eid, ct)) for eid, lib, ct in config_keys]
+    )
+    for (eid, lib, config_type), config in zip(config_keys, results):
+        states[eid].configs[(lib, config_type)] = bytes(config)
+
+    return states
+
+
+################################################################
+#                            DIFF                              #
+################################################################
+
+
+def _sorted_dvns(dvns: Sequence[str]) -> List[str]:
+    # LayerZero requires DVNs sorted ascending, without duplicates
+    return sorted({_norm(d) for d in dvns}, key=lambda d: int(d, 16))
+
+
+def _uln_matches(p: PathwayConfig, config: bytes) -> bool:
+    if not config:
+        return False
+    confirmations, _, _, threshold, required, optional = eth_abi.decode([ULN_CONFIG_ABI], config)[0]
+    return (
+        confirmations == p.confirmations
+        and threshold == p.optional_dvn_threshold
+        and _sorted_dvns(required) == _sorted_dvns(p.required_dvns)
+        and _sorted_dvns(optional) == _sorted_dvns(p.optional_dvns)
+    )
+
+
+def _uln_read_matches(p: PathwayConfig, config: bytes) -> bool:
+    if not config:
+        return False
+    executor, _, _, threshold, required, optional = eth_abi.decode([ULN_READ_CONFIG_ABI], config)[0]
+    return (
+        _norm(executor) == _norm(p.executor or ZERO_ADDRESS)
+        and threshold == p.optional_dvn_threshold
+        and _sorted_dvns(required) == _sorted_dvns(p.required_dvns)
+        and _sorted_dvns(optional) == _sorted_dvns(p.optional_dvns)
+    )
+
+
+def _executor_matches(p: PathwayConfig, config: bytes) -> bool:
+    if not config:
+        return False
+    max_message_size, executor = eth_abi.decode(["uint32", "address"], config)
+    return max_message_size == EXECUTOR_MAX_MESSAGE_SIZE and _norm(executor) == _norm(p.executor)
+
+
+def plan(desired: Sequence[PathwayConfig], states: Dict[int, PathwayState]) -> List[PlannedCall]:
+    # Compare desired pathways with current state and return the minimal list of calls,
+    # each carrying at most MAX_CONFIG_ITEMS items
+    send_libs, receive_libs, uln, uln_read, executors, peers = [], [], [], [], [], []
+
+    for p in desired:
+        state = states[p.eid]
+        send_lib = _norm(p.send_lib or state.send_lib)
+        receive_lib = _norm(p.receive_lib or state.receive_lib)
+
+        if p.send_lib and (state.send_lib_is_default or state.send_lib != send_lib):
+            send_libs.append((p.eid, p.send_lib))
+        if p.receive_lib and (state.receive_lib_is_default or state.receive_lib != receive_lib):
+            # EndpointV2 only accepts a grace period between two non-default libraries
+            # (LZ_OnlyNonDefaultLib): leaving the default library takes effect at once
+            grace_period = 0 if state.receive_lib_is_default else p.grace_period
+            receive_libs.append((p.eid, p.receive_lib, grace_period))
+
+        if p.required_dvns is not None:
+            dvns = (_sorted_dvns(p.required_dvns), _sorted_dvns(p.optional_dvns))
+            if p.is_read_channel:
+                libs = [send_lib] if receive_lib == send_lib else [send_lib, receive_lib]
+                for lib in libs:
+                    if not _uln_read_matches(p, state.configs[(lib, CONFIG_TYPE_READ)]):
+                        uln_read.append((lib, p.eid, p.executor or ZERO_ADDRESS, p, dvns))
+            else:
+                for lib in [send_lib, receive_lib]:
+                    if not _uln_matches(p, state.configs[(lib, CONFIG_TYPE_ULN)]):
+                        uln.append((lib, p.eid, p, dvns))
+
+        if p.executor and not p.is_read_channel:
+            if not _executor_matches(p, state.configs[(send_lib, CONFIG_TYPE_EXECUTOR)]):
+                executors.append((send_lib, p.eid, p.executor))
+
+        if p.peer is not None and p.peer != state.peer:
+            peers.append((p.eid, p.peer))
+
+    calls = []
+    for chunk in _chunks(send_libs):
+        calls.append(
+            PlannedCall("setSendLibraries", ([e for e, _ in chunk], [lib for _, lib in chunk]))
+        )
+    for chunk in _chunks(receive_libs):
+        calls.append(
+            PlannedCall(
+                "setReceiveLibraries",
+                ([e for e, _, _ in chunk], [lib for _, lib, _ in chunk], [g for _, _, g in chunk]),
+            )
+        )
+
+    # OAppConfigUtils groups consecutive items sharing a lib into one endpoint.setConfig call
+    uln.sort(key=lambda item: item[0])
+    for chunk in _chunks(uln):
+        calls.append(
+            PlannedCall(
+                "setUlnConfigs",
+                (
+                    [lib for lib, _, _, _ in chunk],
+                    [eid for _, eid, _, _ in chunk],
+                    [p.confirmations for _, _, p, _ in chunk],
+                    [p.optional_dvn_threshold for _, _, p, _ in chunk],
+                    [dvns[0] for _, _, _, dvns in chunk],
+                    [dvns[1] for _, _, _, dvns in chunk],
+                ),
+            )
+        )
+
+    uln_read.sort(key=lambda item: item[0])
+    for chunk in _chunks(uln_read):
+        calls.append(
+            PlannedCall(
+                "setUlnReadConfigs",
+                (
+                    [lib for lib, _, _, _, _ in chunk],
+                    [eid for _, eid, _, _, _ in chunk],
+                    [executor for _, _, executor, _, _ in chunk],
+                    [p.optional_dvn_threshold for _, _, _, p, _ in chunk],
+                    [dvns[0] for _, _, _, _, dvns in chunk],
+                    [dvns[1] for _, _, _, _, dvns in chunk],
+                ),
+            )
+        )
+
+    executors.sort(key=lambda item: item[0])
+    for chunk in _chunks(executors):
+        calls.append(
+            PlannedCall(
+                "setExecutorConfigs",
+                ([lib for lib, _, _ in chunk], [e for _, e, _ in chunk], [x for _, _, x in chunk]),
+            )
+        )
+
+    for chunk in _chunks(peers):
+        calls.append(PlannedCall("setPeers", ([e for e, _ in chunk], [peer for _, peer in chunk])))
+
+    return calls
+
+
+def apply_plan(oapp, calls: Sequence[PlannedCall]) -> None:
+    # Submit planned calls through a boa contract handle of the OApp
+    for call in calls:
+        getattr(oapp, call.fn)(*call.args)
+
+
+if __name__ == "__main__":
+    # Example usage: python ConfigPlanner.py desired.json <rpc> <endpoint> <oapp>
+    import sys
+
+    import boa
+    from ABIs import endpoint_abi
+
+    config_path, rpc_url, endpoint_address, oapp_address = sys.argv[1:5]
+    boa.set_network_env(rpc_url)
+    endpoint = boa.loads_abi(endpoint_abi, name="EndpointV2").at(endpoint_address)
+    oapp = boa.load_partial("../examples/OAppExample.vy").at(oapp_address)
+    multicall = boa.loads_abi(MULTICALL3_ABI, name="Multicall3").at(MULTICALL3_ADDRESS)
+
+    desired = load_desired(config_path)
+    for call in plan(desired, read_state(MulticallReader(multicall), endpoint, oapp, desired)):
+        print(call.fn, call.args)
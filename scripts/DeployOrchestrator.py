@@ -0,0 +1,600 @@
+import asyncio
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+import eth_abi
+from AddressUtils import to_bytes32
+from ConfigPlanner import (
+    CONFIG_TYPE_EXECUTOR,
+    CONFIG_TYPE_READ,
+    CONFIG_TYPE_ULN,
+    EXECUTOR_MAX_MESSAGE_SIZE,
+    ULN_CONFIG_ABI,
+    ULN_READ_CONFIG_ABI,
+    ZERO_ADDRESS,
+)
+from eth_utils import function_signature_to_4byte_selector, keccak, to_checksum_address
+
+# Pipelined multi-chain rollout: every transaction of a chain gets its nonce up front (so
+# contract addresses are known on every chain before anything is mined, e.g. for peers), is
+# signed and recorded in a JSON state file, then submitted without waiting for the previous
+# receipt. Receipts are confirmed in bulk, chains run concurrently with asyncio. Steps marked
+# as barriers wait for everything before them (e.g. configuration after a deployment, whose
+# gas can only be estimated once the contract exists). An interrupted rollout resumes from the
+# state file: confirmed steps are skipped, signed ones are rebroadcast, never re-signed.
+
+DEFAULT_GAS_MULTIPLIER = 1.2
+DEFAULT_POLL_INTERVAL = 2.0  # seconds between receipt polls
+DEFAULT_TIMEOUT = 600.0  # seconds to wait for the receipts of one batch
+
+# Step statuses in the state file
+ASSIGNED = "assigned"  # nonce (and address, for deployments) reserved
+SENT = "sent"  # signed and broadcast, raw transaction kept for rebroadcasts
+CONFIRMED = "confirmed"
+FAILED = "failed"  # mined and reverted, or nonce used by another transaction
+
+Addresses = Dict[str, Dict[str, str]]  # chain -> deployment step -> address
+
+
+@dataclass
+class Step:
+    # One transaction. to=None deploys data as initcode. to and data can be callables of the
+    # predicted deployment addresses of every chain, resolved once all nonces are assigned.
+    name: str  # unique per chain, key in the state file
+    to: Union[None, str, Callable[[Addresses], str]]
+    data: Union[bytes, Callable[[Addresses], bytes]]
+    value: int = 0
+    gas: Optional[int] = None  # estimated if None
+    barrier: bool = False  # wait for the receipts of all previous steps first
+
+
+@dataclass
+class ChainResult:
+    chain: str
+    confirmed: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+    gas_used: int = 0
+
+
+def _rlp_string(value: bytes) -> bytes:
+    # RLP of a string shorter than 56 bytes
+    if len(value) == 1 and value[0] < 0x80:
+        return value
+    return bytes([0x80 + len(value)]) + value
+
+
+def create_address(sender: str, nonce: int) -> str:
+    # CREATE: keccak256(rlp([sender, nonce]))[12:], the list is at most 30 bytes long
+    payload = _rlp_string(bytes.fromhex(sender.removeprefix("0x"))) + _rlp_string(
+        nonce.to_bytes((nonce.bit_length() + 7) // 8, "big")
+    )
+    return to_checksum_address(keccak(bytes([0xC0 + len(payload)]) + payload)[12:])
+
+
+def _arg_types(signature: str) -> List[str]:
+    # "f(uint32,(uint8,address[])[])" -> ["uint32", "(uint8,address[])[]"]
+    args = signature[signature.index("(") + 1 : -1]
+    types, depth, current = [], 0, ""
+    for char in args:
+        if char == "," and depth == 0:
+            types.append(current)
+            current = ""
+            continue
+        depth += {"(": 1, ")": -1}.get(char, 0)
+        current += char
+    return types + [current] if current else types
+
+
+def encode_call(signature: str, *args) -> bytes:
+    return function_signature_to_4byte_selector(signature) + eth_abi.encode(
+        _arg_types(signature), list(args)
+    )
+
+
+################################################################
+#                            NODES                             #
+################################################################
+
+
+class Web3Node:
+    # JSON-RPC node through web3's AsyncWeb3, transactions signed locally by an eth_account
+    # account (e.g. Account.from_key)
+    def __init__(self, w3, account):
+        self.w3 = w3
+        self.account = account
+
+    @property
+    def address(self) -> str:
+        return self.account.address
+
+    async def nonce(self, block: str = "pending") -> int:
+        return await self.w3.eth.get_transaction_count(self.address, block)
+
+    async def estimate_gas(self, tx: Dict[str, Any]) -> int:
+        return await self.w3.eth.estimate_gas({**tx, "from": self.address})
+
+    async def fee_params(self) -> Dict[str, int]:
+        block = await self.w3.eth.get_block("latest")
+        if "baseFeePerGas" not in block:
+            return {"gasPrice": await self.w3.eth.gas_price}
+        priority = await self.w3.eth.max_priority_fee
+        return {
+            "maxFeePerGas": 2 * block["baseFeePerGas"] + priority,
+            "maxPriorityFeePerGas": priority,
+        }
+
+    async def sign(self, tx: Dict[str, Any]) -> tuple:
+        # (tx hash, raw transaction), both 0x-prefixed hex
+        signed = self.account.sign_transaction({**tx, "chainId": await self.w3.eth.chain_id})
+        return "0x" + bytes(signed.hash).hex(), "0x" + bytes(signed.raw_transaction).hex()
+
+    async def broadcast(self, raw: str) -> None:
+        await self.w3.eth.send_raw_transaction(raw)
+
+    async def receipt(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        from web3.exceptions import TransactionNotFound
+
+        try:
+            receipt = await self.w3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            return None
+        return {"status": receipt["status"], "gasUsed": receipt["gasUsed"]}
+
+
+class LocalNode:
+    # Stand-in node on a boa env: broadcast transactions wait in a mempool and are mined in
+    # nonce order, block_time seconds (wall clock) after broadcast, when the node is polled.
+    # Like a real node, it rejects used nonces and keeps nonce gaps pending. Nonces of the
+    # node account (env.eoa) start at 0: deploy fixtures such as endpoints from another account.
+    def __init__(self, env=None, block_time: float = 0.0):
+        import boa
+
+        self.env = env or boa.Env()
+        self.block_time = block_time
+        self.mempool: Dict[int, tuple] = {}  # nonce -> (broadcast time, tx hash, tx)
+        self.receipts: Dict[str, Dict[str, Any]] = {}
+        self.mined_nonce = 0
+        self.max_mempool = 0  # largest number of transactions pending at once
+
+    @property
+    def address(self) -> str:
+        return to_checksum_address(str(self.env.eoa))
+
+    def _execute(self, tx: Dict[str, Any]):
+        data = bytes.fromhex(tx["data"].removeprefix("0x"))
+        if tx.get("to") is None:
+            _, computation = self.env.deploy(
+                sender=self.address,
+                gas=tx["gas"],
+                value=tx["value"],
+                bytecode=data,
+                override_address=create_address(self.address, tx["nonce"]),
+            )
+            return computation
+        return self.env.execute_code(
+            to_address=tx["to"], sender=self.address, gas=tx["gas"], value=tx["value"], data=data
+        )
+
+    def _mine(self) -> None:
+        now = asyncio.get_running_loop().time()
+        mined = False
+        while self.mined_nonce in self.mempool:
+            sent_at, tx_hash, tx = self.mempool[self.mined_nonce]
+            if now < sent_at + self.block_time:
+                break
+            del self.mempool[self.mined_nonce]
+            computation = self._execute(tx)
+            self.receipts[tx_hash] = {
+                "status": 0 if computation.is_error else 1,
+                "gasUsed": computation.get_gas_used() + 21_000,
+            }
+            self.mined_nonce += 1
+            mined = True
+        if mined:
+            self.env.time_travel(blocks=1)
+
+    async def nonce(self, block: str = "pending") -> int:
+        self._mine()
+        if block == "pending":
+            return max([self.mined_nonce - 1, *self.mempool]) + 1
+        return self.mined_nonce
+
+    async def estimate_gas(self, tx: Dict[str, Any]) -> int:
+        with self.env.anchor():
+            computation = self._execute({**tx, "gas": self.env.evm.get_gas_limit()})
+        if computation.is_error:
+            raise ValueError(f"execution reverted: {computation.error!r}")
+        return computation.get_gas_used() + 21_000
+
+    async def fee_params(self) -> Dict[str, int]:
+        return {}
+
+    async def sign(self, tx: Dict[str, Any]) -> tuple:
+        raw = json.dumps(tx, sort_keys=True)
+        return "0x" + keccak(text=raw).hex(), raw
+
+    async def broadcast(self, raw: str) -> None:
+        tx = json.loads(raw)
+        self._mine()
+        if tx["nonce"] < self.mined_nonce:
+            raise ValueError("nonce too low")
+        tx_hash = "0x" + keccak(text=raw).hex()
+        if tx["nonce"] in self.mempool and self.mempool[tx["nonce"]][1] == tx_hash:
+            return  # already known
+        self.mempool[tx["nonce"]] = (asyncio.get_running_loop().time(), tx_hash, tx)
+        self.max_mempool = max(self.max_mempool, len(self.mempool))
+
+    async def receipt(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        self._mine()
+        return self.receipts.get(tx_hash)
+
+
+################################################################
+#                         ORCHESTRATOR                         #
+################################################################
+
+
+class DeployOrchestrator:
+    def __init__(
+        self,
+        nodes: Dict[str, Any],
+        plans: Dict[str, Sequence[Step]],
+        state_path: str = "rollout_state.json",
+        gas_multiplier: float = DEFAULT_GAS_MULTIPLIER,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        assert set(plans) <= set(nodes), "no node for some chains"
+        for chain, steps in plans.items():
+            assert len({s.name for s in steps}) == len(steps), f"duplicate step names on {chain}"
+        self.nodes = nodes
+        self.plans = {chain: list(steps) for chain, steps in plans.items()}
+        self.state_path = state_path
+        self.gas_multiplier = gas_multiplier
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.state: Dict[str, Any] = {"chains": {}}
+        if os.path.exists(state_path):
+            with open(state_path, "r") as f:
+                self.state = json.load(f)
+
+    def _save(self) -> None:
+        # Atomic replace: a crash leaves either the previous or the new state
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.state, f, indent=1)
+        os.replace(tmp_path, self.state_path)
+
+    def _entries(self, chain: str) -> Dict[str, Dict[str, Any]]:
+        return self.state["chains"][chain]["steps"]
+
+    def addresses(self) -> Addresses:
+        # Predicted (or actual) deployment addresses per chain and step
+        return {
+            chain: {name: e["address"] for name, e in data["steps"].items() if e.get("address")}
+            for chain, data in self.state["chains"].items()
+        }
+
+    async def _assign(self, chain: str) -> None:
+        # Reserve consecutive nonces for the steps that do not have one yet
+        node = self.nodes[chain]
+        data = self.state["chains"].setdefault(chain, {"sender": node.address, "steps": {}})
+        assert data["sender"].lower() == node.address.lower(), f"{chain}: sender changed"
+        entries = data["steps"]
+        nonces = [e["nonce"] for e in entries.values()]
+        nonce = max(await node.nonce("pending"), max(nonces, default=-1) + 1)
+        for step in self.plans[chain]:
+            if step.name in entries:
+                continue
+            entries[step.name] = {
+                "nonce": nonce,
+                "address": create_address(node.address, nonce) if step.to is None else None,
+                "status": ASSIGNED,
+            }
+            nonce += 1
+
+    async def _confirm(self, chain: str, names: List[str], result: ChainResult) -> None:
+        # Poll the receipts of all in-flight steps together until they are mined
+        node, entries = self.nodes[chain], self._entries(chain)
+        deadline = asyncio.get_running_loop().time() + self.timeout
+        waiting = list(names)
+        while waiting:
+            # Nonce first: a receipt can only be missing for a nonce mined before that read
+            # if another transaction took the nonce
+            mined_nonce = await node.nonce("latest")
+            receipts = await asyncio.gather(*(node.receipt(entries[n]["tx_hash"]) for n in waiting))
+            still_waiting = []
+            for name, receipt in zip(waiting, receipts):
+                entry = entries[name]
+                if receipt is not None:
+                    entry["status"] = CONFIRMED if receipt["status"] == 1 else FAILED
+                    entry["gas_used"] = receipt["gasUsed"]
+                elif entry["nonce"] < mined_nonce:
+                    # Mined nonce without our receipt: replaced by another transaction
+                    entry["status"] = FAILED
+                else:
+                    still_waiting.append(name)
+            self._save()
+            waiting = still_waiting
+            if waiting:
+                if asyncio.get_running_loop().time() > deadline:
+                    raise TimeoutError(f"{chain}: no receipt for {waiting}")
+                await asyncio.sleep(self.poll_interval)
+
+        for name in names:
+            entry = entries[name]
+            if entry["status"] == FAILED:
+                result.failed.append(name)
+            else:
+                result.confirmed.append(name)
+                result.gas_used += entry["gas_used"]
+
+    async def _execute(self, chain: str, addresses: Addresses) -> ChainResult:
+        node, entries = self.nodes[chain], self._entries(chain)
+        result = ChainResult(chain)
+        try:
+            fee_params = await node.fee_params()
+            in_flight: List[str] = []
+            for step in self.plans[chain]:
+                entry = entries[step.name]
+                if entry["status"] == CONFIRMED:
+                    result.confirmed.append(step.name)
+                    result.gas_used += entry.get("gas_used", 0)
+                    continue
+                if entry["status"] == FAILED:
+                    result.failed.append(step.name)
+                    break
+                if entry["status"] == SENT:
+                    # Resumed rollout: the node may have dropped it, rebroadcast the same bytes
+                    try:
+                        await node.broadcast(entry["raw"])
+                    except Exception:  # noqa: BLE001 - already known or already mined
+                        pass
+                    in_flight.append(step.name)
+                    continue
+
+                if step.barrier and in_flight:
+                    await self._confirm(chain, in_flight, result)
+                    in_flight = []
+                    if result.failed:
+                        break
+                assert entry["nonce"] >= await node.nonce(
+                    "latest"
+                ), f"{chain}: nonce {entry['nonce']} of {step.name} used by another transaction"
+
+                to = step.to(addresses) if callable(step.to) else step.to
+                data = step.data(addresses) if callable(step.data) else step.data
+                tx = {"nonce": entry["nonce"], "value": step.value, "data": "0x" + data.hex()}
+                if to is not None:
+                    tx["to"] = to_checksum_address(to)
+                gas = step.gas or int(await node.estimate_gas(tx) * self.gas_multiplier)
+                tx_hash, raw = await node.sign({**tx, **fee_params, "gas": gas})
+
+                # Recorded before broadcasting: after a crash, the same transaction is resent
+                entry.update(status=SENT, tx_hash=tx_hash, raw=raw)
+                self._save()
+                await node.broadcast(raw)
+                in_flight.append(step.name)
+
+            if in_flight:
+                await self._confirm(chain, in_flight, result)
+        except Exception as e:  # noqa: BLE001 - one failing chain does not stop the others
+            result.error = f"{type(e).__name__}: {e}"
+            self._save()
+        return result
+
+    async def run(self) -> Dict[str, ChainResult]:
+        await asyncio.gather(*(self._assign(chain) for chain in self.plans))
+        self._save()
+        addresses = self.addresses()
+        results = await asyncio.gather(*(self._execute(chain, addresses) for chain in self.plans))
+        return {r.chain: r for r in results}
+
+
+################################################################
+#                         OAPP ROLLOUT                         #
+################################################################
+
+
+@dataclass
+class ChainSpec:
+    # One chain of an OApp rollout, mostly LZMetadata fields
+    name: str
+    eid: int
+    endpoint: str
+    send_lib: Optional[str] = None
+    receive_lib: Optional[str] = None
+    executor: Optional[str] = None
+    confirmations: int = 1
+    required_dvns: List[str] = field(default_factory=list)
+    optional_dvns: List[str] = field(default_factory=list)
+    optional_dvn_threshold: int = 0
+    read_channel: Optional[int] = None
+    read_lib: Optional[str] = None
+    read_dvns: List[str] = field(default_factory=list)
+
+
+def _sorted(dvns: Sequence[str]) -> List[str]:
+    return sorted({d.lower() for d in dvns}, key=lambda d: int(d, 16))
+
+
+def _oapp(chain: str) -> Callable[[Addresses], str]:
+    return lambda addresses: addresses[chain]["deploy"]
+
+
+def oapp_rollout(
+    chains: Sequence[ChainSpec], initcode: Callable[[ChainSpec], bytes]
+) -> Dict[str, List[Step]]:
+    # Per chain: deploy the OApp (initcode(chain), deployer becomes the endpoint delegate),
+    # then libraries and DVN/executor configs for every other chain of the rollout, peers to
+    # all of them and the read channel. Everything after the deployment is pipelined.
+    plans = {}
+    for c in chains:
+        oapp = _oapp(c.name)
+        remotes = [r for r in chains if r.name != c.name]
+        steps = [Step("deploy", None, initcode(c))]
+
+        def endpoint_call(signature, *args, oapp=oapp):
+            return lambda addresses: encode_call(signature, oapp(addresses), *args)
+
+        for r in remotes:
+            if c.send_lib:
+                steps.append(
+                    Step(
+                        f"sendLibrary:{r.eid}",
+                        c.endpoint,
+                        endpoint_call("setSendLibrary(address,uint32,address)", r.eid, c.send_lib),
+                    )
+                )
+            if c.receive_lib:
+                steps.append(
+                    Step(
+                        f"receiveLibrary:{r.eid}",
+                        c.endpoint,
+                        endpoint_call(
+                            "setReceiveLibrary(address,uint32,address,uint256)",
+                            r.eid,
+                            c.receive_lib,
+                            0,
+                        ),
+                    )
+                )
+
+        # Counts must match the deduplicated DVN lists
+        required_dvns, optional_dvns = _sorted(c.required_dvns), _sorted(c.optional_dvns)
+        uln = eth_abi.encode(
+            [ULN_CONFIG_ABI],
+            [
+                (
+                    c.confirmations,
+                    len(required_dvns),
+                    len(optional_dvns),
+                    c.optional_dvn_threshold,
+                    required_dvns,
+                    optional_dvns,
+                )
+            ],
+        )
+        set_config = "setConfig(address,address,(uint32,uint32,bytes)[])"
+        for name, lib in (("sendConfig", c.send_lib), ("receiveConfig", c.receive_lib)):
+            params = []
+            if required_dvns or optional_dvns:
+                params += [(r.eid, CONFIG_TYPE_ULN, uln) for r in remotes]
+            if name == "sendConfig" and c.executor:
+                executor = eth_abi.encode(
+                    ["uint32", "address"], [EXECUTOR_MAX_MESSAGE_SIZE, c.executor]
+                )
+                params += [(r.eid, CONFIG_TYPE_EXECUTOR, executor) for r in remotes]
+            if lib and params:
+                steps.append(Step(name, c.endpoint, endpoint_call(set_config, lib, params)))
+
+        if c.read_channel is not None:
+            if c.read_lib:
+                for name, signature, args in (
+                    ("readSendLibrary", "setSendLibrary(address,uint32,address)", ()),
+                    (
+                        "readReceiveLibrary",
+                        "setReceiveLibrary(address,uint32,address,uint256)",
+                        (0,),
+                    ),
+                ):
+                    steps.append(
+                        Step(
+                            name,
+                            c.endpoint,
+                            endpoint_call(signature, c.read_channel, c.read_lib, *args),
+                        )
+                    )
+                if c.read_dvns:
+                    read_dvns = _sorted(c.read_dvns)
+                    read_config = eth_abi.encode(
+                        [ULN_READ_CONFIG_ABI],
+                        [(c.executor or ZERO_ADDRESS, len(read_dvns), 0, 0, read_dvns, [])],
+                    )
+                    params = [(c.read_channel, CONFIG_TYPE_READ, read_config)]
+                    steps.append(
+                        Step(
+                            "readConfig", c.endpoint, endpoint_call(set_config, c.read_lib, params)
+                        )
+                    )
+            steps.append(
+                Step(
+                    "readChannel",
+                    oapp,
+                    encode_call("setReadChannel(uint32,bool)", c.read_channel, True),
+                )
+            )
+
+        if remotes:
+            steps.append(
+                Step(
+                    "peers",
+                    oapp,
+                    lambda addresses, remotes=remotes: encode_call(
+                        "setPeers(uint32[],bytes32[])",
+                        [r.eid for r in remotes],
+                        [to_bytes32(addresses[r.name]["deploy"]) for r in remotes],
+                    ),
+                )
+            )
+
+        # Configuration gas is estimated against the deployed contract
+        if len(steps) > 1:
+            steps[1].barrier = True
+        plans[c.name] = steps
+    return plans
+
+
+def format_results(results: Dict[str, ChainResult]) -> str:
+    lines = [f"{'chain':<20}{'confirmed':>10}{'failed':>8}{'gas used':>14}  error"]
+    for r in results.values():
+        lines.append(
+            f"{r.chain:<20}{len(r.confirmed):>10}{len(r.failed):>8}{r.gas_used:>14}  {r.error or ''}"
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    # Example usage: python DeployOrchestrator.py <chain handle> [<chain handle> ...]
+    # Deploys OAppExample on every chain with LZMetadata libraries, DVNs and executor, peered
+    # all-to-all. Re-run the same command to resume an interrupted rollout.
+    import sys
+
+    import boa
+    from dotenv import load_dotenv
+    from eth_account import Account
+    from LZMetadata import LZMetadata
+    from web3 import AsyncHTTPProvider, AsyncWeb3
+
+    load_dotenv()
+    account = Account.from_key(os.environ["WEB3_TESTNET_PK"])
+    rpc_urls = json.loads(os.environ["RPC_URLS"])  # {"<chain handle>": "<rpc url>", ...}
+    deployer = boa.load_partial("../examples/OAppExample.vy")
+
+    lz, specs, nodes = LZMetadata(), [], {}
+    for handle in sys.argv[1:]:
+        chain = lz.get_chain_metadata(handle)
+        metadata = chain["metadata"]
+        dvns = [d["address"] for d in chain["dvns"] if d["id"] == "layerzero-labs"][:1]
+        specs.append(
+            ChainSpec(
+                name=handle,
+                eid=int(metadata["eid"]),
+                endpoint=metadata["endpointV2"],
+                send_lib=metadata.get("sendUln302"),
+                receive_lib=metadata.get("receiveUln302"),
+                executor=metadata.get("executor"),
+                required_dvns=dvns,
+            )
+        )
+        nodes[handle] = Web3Node(AsyncWeb3(AsyncHTTPProvider(rpc_urls[handle])), account)
+
+    plans = oapp_rollout(
+        specs,
+        lambda c: deployer.compiler_data.bytecode + eth_abi.encode(["address"], [c.endpoint]),
+    )
+    results = asyncio.run(DeployOrchestrator(nodes, plans).run())
+    print(format_results(results))
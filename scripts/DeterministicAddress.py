@@ -0,0 +1,41 @@
+from eth_utils import keccak, to_bytes, to_checksum_address
+from typing import Union
+
+from AddressUtils import to_bytes32
+
+# Precompute OAppFactory (CREATE2 from ERC-5202 blueprint) addresses, e.g. to set peers
+# across chains before deployment. Must match OAppFactory.vy.
+
+BLUEPRINT_PREAMBLE_SIZE = 3  # 0xFE7100, create_from_blueprint default code_offset
+
+
+def _to_bytes(value: Union[str, bytes]) -> bytes:
+    return value if isinstance(value, bytes) else to_bytes(hexstr=value)
+
+
+def blueprint_initcode(blueprint_code: Union[str, bytes], constructor_args: bytes = b"") -> bytes:
+    # Blueprint code (as returned by eth_getCode) without preamble, followed by ABI-encoded args
+    code = _to_bytes(blueprint_code)
+    assert code[:2] == b"\xfe\x71", "Not an ERC-5202 blueprint"
+    return code[BLUEPRINT_PREAMBLE_SIZE:] + constructor_args
+
+
+def deployer_salt(deployer: str, salt: Union[str, bytes]) -> bytes:
+    # Same as OAppFactory._deployerSalt
+    return keccak(to_bytes32(_to_bytes(deployer)) + _to_bytes(salt))
+
+
+def compute_address(factory: str, initcode: bytes, deployer: str, salt: Union[str, bytes]) -> str:
+    # CREATE2: keccak256(0xff ++ factory ++ salt ++ keccak256(initcode))[12:]
+    digest = keccak(b"\xff" + _to_bytes(factory) + deployer_salt(deployer, salt) + keccak(initcode))
+    return to_checksum_address(digest[12:])
+
+
+def compute_addresses(
+    factory: str, blueprint_code: Union[str, bytes], deployer: str, deployments: list
+) -> list:
+    # Batch helper for deployMany: deployments is a list of (constructor_args, salt)
+    return [
+        compute_address(factory, blueprint_initcode(blueprint_code, args), deployer, salt)
+        for args, salt in deployments
+    ]
@@ -0,0 +1,160 @@
+import os
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Sequence
+
+import boa
+import eth_abi
+from boa.profiling import GlobalProfile, global_profile
+from eth_utils import function_signature_to_4byte_selector
+
+# Gas profile of the OApp modules by source line and function, using boa's gas profiling on a
+# standard workload: OAppExample against the mock endpoint, sending messages (_lzSend,
+# OptionsBuilder.addExecutorOption), lzRead requests (ReadCmdCodecV1.appendEVMCallRequestV1),
+# quotes and deliveries. Line gas is net of refunds and excludes the gas of external calls
+# made from the line (which is attributed to the callee), so an extcall line is the cost of
+# the call itself: argument encoding, CALL and return data. The workload is deterministic,
+# so profiles written by write_profile can be kept between releases and compared with diff.
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+OAPP_EXAMPLE = os.path.join(ROOT, "examples", "OAppExample.vy")
+ENDPOINT_MOCK = os.path.join(ROOT, "tests", "mocks", "EndpointV2Mock.vy")
+
+SRC_EID = 30101
+DST_EID = 30110
+LZ_READ_CHANNEL = 4294967295
+RECEIVE_GAS = 200_000
+READ_RESPONSE_SIZE = 32
+TIMESTAMP = 1_750_000_000  # fixed, it is encoded in read commands
+PEER = b"\x42" * 32
+
+MESSAGES = ("", "profile", "x" * 128)  # String[128] in OAppExample
+READ_CALLDATA = function_signature_to_4byte_selector("dummy_endpoint(uint256)") + eth_abi.encode(
+    ["uint256"], [21]
+)
+
+
+@dataclass
+class LineGas:
+    lineno: int
+    fn_name: str
+    count: int  # calls that ran the line
+    gas: int  # total over the workload
+    source: str
+
+
+@dataclass
+class FunctionGas:
+    fn_name: str
+    lines: int
+    gas: int
+
+
+def setup_workload():
+    # Deployment and configuration, not profiled
+    endpoint = boa.load(ENDPOINT_MOCK, SRC_EID)
+    oapp = boa.load(OAPP_EXAMPLE, endpoint.address)
+    oapp.setPeer(DST_EID, PEER)
+    oapp.setPeer(SRC_EID, PEER)
+    oapp.setReadChannel(LZ_READ_CHANNEL, True)
+    boa.env.set_balance(boa.env.eoa, 10**21)
+    return endpoint, oapp
+
+
+def run_workload(endpoint, oapp):
+    for message in MESSAGES:
+        fee = oapp.quote_message_fee(DST_EID, oapp.address, message, RECEIVE_GAS)[0]
+        oapp.send_message(DST_EID, oapp.address, message, RECEIVE_GAS, value=fee)
+
+    read = (LZ_READ_CHANNEL, DST_EID, oapp.address, READ_CALLDATA, RECEIVE_GAS, 0)
+    fee = oapp.quote_read_fee(*read, READ_RESPONSE_SIZE)[0]
+    oapp.request_read(*read, READ_RESPONSE_SIZE, value=fee)
+
+    for nonce, message in enumerate(MESSAGES, start=1):
+        guid = nonce.to_bytes(32, "big")
+        endpoint.lzReceive((SRC_EID, PEER, nonce), oapp.address, guid, message.encode(), b"")
+
+
+def profile(
+    setup: Callable[[], tuple] = setup_workload,
+    workload: Callable[..., None] = run_workload,
+    prefixes: Sequence[str] = ("src/",),
+) -> Dict[str, List[LineGas]]:
+    # Source file (relative to the repo, filtered by prefixes) -> lines in source order.
+    # Runs setup() then workload(*setup()) in a fresh env, only the workload is profiled.
+    env = boa.Env()
+    env.timestamp = TIMESTAMP
+    with boa.swap_env(env):
+        contracts = setup()
+        GlobalProfile.clear_singleton()
+        env.enable_gas_profiling()
+        workload(*contracts)
+
+    collected = global_profile()
+    lines = {}
+    for info, gas in collected.line_profiles.items():
+        path = os.path.relpath(info.module_path, ROOT).replace(os.sep, "/")
+        if not path.startswith(tuple(prefixes)):
+            continue
+        # The same module line runs in every contract that uses the module
+        key = (path, info.lineno)
+        if key not in lines:
+            source = collected.get_module_line(info.module_path, info.lineno).strip()
+            lines[key] = LineGas(info.lineno, info.fn_name, 0, 0, source)
+        lines[key].count += len(gas)
+        lines[key].gas += sum(gas)
+    GlobalProfile.clear_singleton()
+
+    files = defaultdict(list)
+    for (path, _), line in sorted(lines.items()):
+        files[path].append(line)
+    return dict(sorted(files.items()))
+
+
+def functions(lines: List[LineGas]) -> List[FunctionGas]:
+    # Per-function totals of a file, in source order
+    totals = {}
+    for line in lines:
+        name = line.fn_name or "<module>"
+        entry = totals.setdefault(name, FunctionGas(name, 0, 0))
+        entry.lines += 1
+        entry.gas += line.gas
+    return list(totals.values())
+
+
+def format_file(path: str, lines: List[LineGas]) -> str:
+    # Plain text, one row per line: stable ordering and widths so releases diff cleanly
+    out = [f"# {path}", "", f"{'function':<36}{'lines':>7}{'gas':>12}"]
+    for fn in functions(lines):
+        out.append(f"{fn.fn_name:<36}{fn.lines:>7}{fn.gas:>12}")
+    out += ["", f"{'line':>6}  {'function':<36}{'count':>7}{'gas':>12}  source"]
+    for line in lines:
+        name = line.fn_name or "<module>"
+        out.append(f"{line.lineno:>6}  {name:<36}{line.count:>7}{line.gas:>12}  {line.source}")
+    return "\n".join(out) + "\n"
+
+
+def write_profile(files: Dict[str, List[LineGas]], out_dir: str) -> List[str]:
+    # One <out_dir>/<source path>.gas file per source file, returns the paths written
+    written = []
+    for path, lines in files.items():
+        target = os.path.join(out_dir, path + ".gas")
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, "w") as f:
+            f.write(format_file(path, lines))
+        written.append(target)
+    return written
+
+
+if __name__ == "__main__":
+    # Example usage: python GasProfile.py [<out dir>]
+    # e.g. python GasProfile.py ../gas/v0.2 && diff -r ../gas/v0.1 ../gas/v0.2
+    import sys
+
+    files = profile()
+    if len(sys.argv) > 1:
+        for target in write_profile(files, sys.argv[1]):
+            print(f"wrote {target}")
+    else:
+        for path, lines in files.items():
+            print(format_file(path, lines))
@@ -1,4 +1,3 @@
-import requests
 import json
 import os
 from typing import Dict, Any
@@ -13,7 +12,10 @@ class LZMetadata:
         self.metadata = None
 
     def fetch_metadata(self) -> Dict[str, Any]:
-        # Fresh fetch from LZ API
+        # Fresh fetch from LZ API (requests is imported here: it is slow to import and most
+        # runs read the cached file)
+        import requests
+
         try:
             response = requests.get(self.api_url)
             response.raise_for_status()
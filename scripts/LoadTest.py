@@ -0,0 +1,374 @@
+import os
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+import boa
+import eth_abi
+from AddressUtils import to_bytes32
+from eth_utils import function_abi_to_4byte_selector, function_signature_to_4byte_selector
+from LocalLayerZero import READ_CHANNEL_THRESHOLD, LocalLayerZero
+from LzReceiveGasEstimator import percentile
+from MessageTracker import Packet
+
+# Multi-chain load test: N local chains in one process (one boa env each, see LocalLayerZero),
+# each with an OAppExample (plain messages, lzRead) and an OAppPingPong (lzReceive -> lzSend
+# recursion), peered all-to-all. Traffic is issued block by block and relayed at the end of
+# every block; replies sent from lzReceive go out with the next block. Reports simulated
+# throughput, gas per operation (every call is metered as its own transaction: cold storage
+# and accounts), net gas per contract function, storage growth and fee accounting drift.
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+OAPP_EXAMPLE = os.path.join(ROOT, "examples", "OAppExample.vy")
+OAPP_PING_PONG = os.path.join(ROOT, "examples", "OAppPingPong.vy")
+
+LZ_READ_CHANNEL = 4294967295
+BLOCK_TIME = 12  # seconds
+RECEIVE_GAS = 200_000  # lzReceive gas limit of every message
+READ_RESPONSE_SIZE = 32
+TANK_FUNDING = 10**21  # ping-pong replies budget per chain
+EOA_FUNDING = 10**24
+
+MESSAGE = "load test"
+DUMMY_ENDPOINT = function_signature_to_4byte_selector("dummy_endpoint(uint256)")
+READ_CALLDATA = DUMMY_ENDPOINT + eth_abi.encode(["uint256"], [21])  # OAppExample view
+
+
+@dataclass
+class Traffic:
+    # Operations started by every chain, every block
+    fan_out: int = 0  # messages to each of the other chains
+    random: int = 0  # messages to a random other chain
+    ping_pong: int = 0  # pings to a random other chain
+    ping_pong_replies: int = 2  # replies per ping (depth of the recursion)
+    reads: int = 0  # lzRead requests of a view function on a random other chain
+
+
+@dataclass
+class GasStats:
+    count: int
+    total: int
+    min: int
+    p50: int
+    max: int
+
+    @property
+    def avg(self) -> int:
+        return self.total // self.count
+
+
+@dataclass
+class LoadTestReport:
+    chains: int
+    blocks: int  # including the blocks needed to drain replies
+    sent: int  # packets, including replies and read requests
+    delivered: int
+    pending: int
+    simulated_seconds: int
+    wall_seconds: float
+    gas: Dict[str, GasStats]  # per operation
+    hotspots: List[Tuple[str, int, int]]  # (contract.function, calls, net gas), descending
+    storage_growth: Dict[str, int]  # "<eid>:<contract>" -> nonzero slots added
+    fee_drift: Dict[int, int]  # per eid: endpoint balance change - fees paid, should be 0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def messages_per_second(self) -> float:
+        # Deliveries per simulated second
+        return self.delivered / self.simulated_seconds if self.simulated_seconds else 0.0
+
+    @property
+    def messages_per_wall_second(self) -> float:
+        return self.delivered / self.wall_seconds if self.wall_seconds else 0.0
+
+
+def _selectors(contract) -> Dict[bytes, str]:
+    selectors = {}
+    for abi in contract.abi:
+        if abi["type"] == "function":
+            selectors[function_abi_to_4byte_selector(abi)] = abi["name"]
+    return selectors
+
+
+class LoadTest:
+    def __init__(
+        self,
+        n_chains: int,
+        traffic: Traffic,
+        base_eid: int = 40101,
+        seed: int = 0,
+    ):
+        self.traffic = traffic
+        self.rng = random.Random(seed)
+        self.eids = [base_eid + i for i in range(n_chains)]
+        self.lz = LocalLayerZero(self.eids, env_per_chain=True)
+
+        self.messengers: Dict[int, object] = {}
+        self.ping_pongs: Dict[int, object] = {}
+        self._ops: Dict[str, List[int]] = defaultdict(list)
+        self._hotspots: Dict[Tuple[str, str], List[int]] = defaultdict(lambda: [0, 0])
+        self._selectors: Dict[str, Dict[bytes, str]] = {}
+        self._fees_paid: Dict[int, int] = defaultdict(int)
+        self._errors: List[str] = []
+        self._setup()
+
+    def __enter__(self):
+        self.lz.__enter__()
+        return self
+
+    def __exit__(self, *args):
+        self.lz.__exit__(*args)
+
+    ################################################################
+    #                            SETUP                             #
+    ################################################################
+
+    def _setup(self) -> None:
+        messenger = boa.load_partial(OAPP_EXAMPLE)
+        ping_pong = boa.load_partial(OAPP_PING_PONG)
+        for eid in self.eids:
+            env, endpoint = self.lz.env(eid), self.lz.endpoint(eid).address
+            env.set_balance(env.eoa, EOA_FUNDING)
+            self.messengers[eid] = messenger.deploy(endpoint, env=env)
+            self.ping_pongs[eid] = ping_pong.deploy(endpoint, RECEIVE_GAS, env=env)
+
+        for eid in self.eids:
+            others = [e for e in self.eids if e != eid]
+            for apps in (self.messengers, self.ping_pongs):
+                peers = [to_bytes32(apps[e].address) for e in others]
+                apps[eid].setPeers(others, peers)
+            self.messengers[eid].setReadChannel(LZ_READ_CHANNEL, True)
+
+            ping_pong = self.ping_pongs[eid]
+            ping_pong.fundTank(value=TANK_FUNDING)
+            for other in others:
+                ping_pong.setEidAllowance(other, 2**256 - 1)
+
+        for contract in [*self.messengers.values(), *self.ping_pongs.values()]:
+            self._selectors[contract.contract_name] = _selectors(contract)
+        self._selectors["EndpointV2Mock"] = _selectors(self.lz.endpoint(self.eids[0]))
+
+    ################################################################
+    #                           METERING                           #
+    ################################################################
+
+    def _meter(self, op: str, eid: int, call, *args, value: int = 0):
+        # Run one call as its own transaction and record its gas and per-function breakdown
+        env = self.lz.env(eid)
+        env.reset_gas_used()
+        if value:
+            self._fees_paid[eid] += value
+            call(*args, value=value)
+        else:
+            call(*args)
+        computation = call.contract._computation
+        self._record(op, eid, computation)
+
+    def _record(self, op: str, eid: int, computation) -> None:
+        self._ops[op].append(computation.get_gas_used())
+        self._attribute(self.lz.env(eid), computation)
+
+    def _attribute(self, env, computation) -> None:
+        # Net gas of each frame: its gas minus the gas of the calls it made
+        contract = env.lookup_contract(computation.msg.code_address)
+        if contract is None:
+            name = "0x" + computation.msg.code_address.hex()[:8]
+            function = "transfer"
+        else:
+            name = contract.contract_name
+            selector = bytes(computation.msg.data[:4])
+            function = self._selectors.get(name, {}).get(selector, "__default__")
+
+        children = computation.children
+        net = computation.get_gas_used() - sum(c.get_gas_used() for c in children)
+        stats = self._hotspots[(name, function)]
+        stats[0] += 1
+        stats[1] += net
+        for child in children:
+            self._attribute(env, child)
+
+    def _storage_slots(self) -> Dict[str, int]:
+        # Nonzero storage slots of the endpoints and apps, per chain
+        slots = {}
+        for eid in self.eids:
+            env = self.lz.env(eid)
+            contracts = (self.lz.endpoint(eid), self.messengers[eid], self.ping_pongs[eid])
+            for contract in contracts:
+                touched = env.sstore_trace.get(contract.address, set())
+                slots[f"{eid}:{contract.contract_name}"] = sum(
+                    1 for slot in touched if env.get_storage(contract.address, slot) != 0
+                )
+        return slots
+
+    def _balances(self) -> Dict[int, Tuple[int, int]]:
+        # (endpoint balance, ping-pong tank balance) per chain
+        return {
+            eid: (
+                self.lz.env(eid).get_balance(self.lz.endpoint(eid).address),
+                self.lz.env(eid).get_balance(self.ping_pongs[eid].address),
+            )
+            for eid in self.eids
+        }
+
+    ################################################################
+    #                           TRAFFIC                            #
+    ################################################################
+
+    def _other(self, eid: int) -> int:
+        return self.rng.choice([e for e in self.eids if e != eid])
+
+    def send(self, eid: int, dst_eid: int) -> None:
+        messenger = self.messengers[eid]
+        receiver = messenger.address
+        fee = messenger.quote_message_fee(dst_eid, receiver, MESSAGE, RECEIVE_GAS)[0]
+        self._meter(
+            "send", eid, messenger.send_message, dst_eid, receiver, MESSAGE, RECEIVE_GAS, value=fee
+        )
+
+    def ping(self, eid: int, dst_eid: int, replies: int) -> None:
+        ping_pong = self.ping_pongs[eid]
+        fee = ping_pong.quote_ping(dst_eid, replies, RECEIVE_GAS)[0]
+        self._meter("ping", eid, ping_pong.ping, dst_eid, replies, RECEIVE_GAS, value=fee)
+
+    def read(self, eid: int, target_eid: int) -> None:
+        messenger = self.messengers[eid]
+        target = self.messengers[target_eid].address
+        args = (LZ_READ_CHANNEL, target_eid, target, READ_CALLDATA, RECEIVE_GAS, 0)
+        fee = messenger.quote_read_fee(*args, READ_RESPONSE_SIZE)[0]
+        self._meter("read", eid, messenger.request_read, *args, READ_RESPONSE_SIZE, value=fee)
+
+    def _issue(self) -> None:
+        traffic = self.traffic
+        for eid in self.eids:
+            for dst_eid in self.eids:
+                if dst_eid != eid:
+                    for _ in range(traffic.fan_out):
+                        self.send(eid, dst_eid)
+            for _ in range(traffic.random):
+                self.send(eid, self._other(eid))
+            for _ in range(traffic.ping_pong):
+                self.ping(eid, self._other(eid), traffic.ping_pong_replies)
+            for _ in range(traffic.reads):
+                self.read(eid, self._other(eid))
+
+    def _op_of(self, packet: Packet) -> Tuple[str, int]:
+        # Operation name and chain of a delivery
+        if packet.dst_eid > READ_CHANNEL_THRESHOLD:
+            return "read response", packet.src_eid
+        receiver = packet.receiver[-20:]
+        if receiver == self.ping_pongs[packet.dst_eid].address.canonical_address:
+            count = int.from_bytes(packet.message[:32], "big")
+            return ("lzReceive + reply" if count else "lzReceive (last pong)"), packet.dst_eid
+        return "lzReceive", packet.dst_eid
+
+    def _relay(self) -> int:
+        delivered = 0
+        for packet in self.lz.pending():
+            op, eid = self._op_of(packet)
+            self.lz.env(eid).reset_gas_used()
+            try:
+                computation = self.lz.deliver(packet)
+            except Exception as e:  # noqa: BLE001 - a failed delivery is a finding, not a crash
+                self._errors.append(f"{op} {packet.src_eid}>{packet.dst_eid}: {e!r}"[:200])
+                self.lz.drop(packet)
+                continue
+            self._record(op, eid, computation)
+            delivered += 1
+        return delivered
+
+    ################################################################
+    #                             RUN                              #
+    ################################################################
+
+    def run(self, blocks: int, max_drain_blocks: int = 100) -> LoadTestReport:
+        # Issue traffic for `blocks` blocks, then keep relaying until nothing is in flight
+        slots_before, balances_before = self._storage_slots(), self._balances()
+        start, wall_start = self.lz.env(self.eids[0]).timestamp, time.perf_counter()
+
+        delivered, block = 0, 0
+        while block < blocks or (self.lz.pending() and block < blocks + max_drain_blocks):
+            if block < blocks:
+                self._issue()
+            delivered += self._relay()
+            self.lz.time_travel(BLOCK_TIME)
+            block += 1
+
+        wall_seconds = time.perf_counter() - wall_start
+        slots_after, balances_after = self._storage_slots(), self._balances()
+        fee_drift = {}
+        for eid in self.eids:
+            endpoint_delta = balances_after[eid][0] - balances_before[eid][0]
+            tank_spent = balances_before[eid][1] - balances_after[eid][1]
+            fee_drift[eid] = endpoint_delta - self._fees_paid[eid] - tank_spent
+
+        gas = {}
+        for op, values in sorted(self._ops.items()):
+            values = sorted(values)
+            gas[op] = GasStats(
+                len(values), sum(values), values[0], percentile(values, 50), values[-1]
+            )
+        hotspots = sorted(
+            ((f"{c}.{f}", calls, net) for (c, f), (calls, net) in self._hotspots.items()),
+            key=lambda h: -h[2],
+        )
+        return LoadTestReport(
+            chains=len(self.eids),
+            blocks=block,
+            sent=self.lz.sent,
+            delivered=delivered,
+            pending=len(self.lz.pending()),
+            simulated_seconds=self.lz.env(self.eids[0]).timestamp - start,
+            wall_seconds=wall_seconds,
+            gas=gas,
+            hotspots=hotspots,
+            storage_growth={k: slots_after[k] - slots_before[k] for k in slots_after},
+            fee_drift=fee_drift,
+            errors=list(self._errors),
+        )
+
+
+def format_report(report: LoadTestReport, top: int = 10) -> str:
+    lines = [
+        f"{report.chains} chains, {report.blocks} blocks: {report.sent} sent,"
+        f" {report.delivered} delivered, {report.pending} pending",
+        f"{report.messages_per_second:.1f} msg/s simulated,"
+        f" {report.messages_per_wall_second:.1f} msg/s wall clock",
+        "",
+        f"{'operation':<24}{'count':>8}{'avg':>10}{'min':>10}{'p50':>10}{'max':>10}",
+    ]
+    for op, s in report.gas.items():
+        lines.append(f"{op:<24}{s.count:>8}{s.avg:>10}{s.min:>10}{s.p50:>10}{s.max:>10}")
+
+    total = sum(h[2] for h in report.hotspots) or 1
+    lines += ["", f"{'hotspot':<40}{'calls':>8}{'net gas':>14}{'share':>8}"]
+    for name, calls, net in report.hotspots[:top]:
+        lines.append(f"{name:<40}{calls:>8}{net:>14}{net / total:>8.1%}")
+
+    growth = sum(report.storage_growth.values())
+    per_message = growth / report.delivered if report.delivered else 0
+    lines += ["", f"storage growth: {growth} slots ({per_message:.2f} per delivered message)"]
+    for key, slots in report.storage_growth.items():
+        if slots:
+            lines.append(f"  {key:<36}{slots:>8}")
+
+    drift = {eid: d for eid, d in report.fee_drift.items() if d}
+    lines.append(f"fee drift: {drift or 'none'}")
+    lines += [f"error: {e}" for e in report.errors]
+    return "\n".join(lines)
+
+
+def run_load_test(n_chains: int, blocks: int, traffic: Traffic, seed: int = 0) -> LoadTestReport:
+    with LoadTest(n_chains, traffic, seed=seed) as test:
+        return test.run(blocks)
+
+
+if __name__ == "__main__":
+    # Example usage: python LoadTest.py [chains] [blocks]
+    import sys
+
+    n_chains = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    blocks = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    traffic = Traffic(fan_out=1, random=5, ping_pong=2, ping_pong_replies=3, reads=2)
+    print(format_report(run_load_test(n_chains, blocks, traffic)))
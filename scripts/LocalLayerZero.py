@@ -0,0 +1,137 @@
+import os
+import random
+from typing import Dict, List, Optional, Sequence
+
+import boa
+import eth_abi
+from MessageTracker import PACKET_SENT_TOPIC, Packet, decode_packet
+from OAppIndexer import BoaLogSource
+from ReadCodec import decode_cmd
+
+# In-process stand-in for LayerZero between several chains, for offline simulations: one
+# EndpointV2Mock per eid, a recorder of their logs, and a relayer that delivers sent packets
+# after a chosen delay, or drops them. Apps deployed against endpoint(eid) (in env(eid))
+# send and receive as they would on a real pathway. Chains share boa.env by default, or get
+# one boa env each with env_per_chain=True; clocks are moved forward together either way.
+# lzRead packets are answered by running the requested view calls on the target chain, at
+# its current state (blockNumOrTimestamp and confirmations are ignored, compute unsupported).
+
+ENDPOINT_MOCK = os.path.join(os.path.dirname(__file__), "..", "tests", "mocks", "EndpointV2Mock.vy")
+
+READ_CHANNEL_THRESHOLD = 4294965694  # OApp.READ_CHANNEL_THRESHOLD
+
+
+class LocalLayerZero:
+    def __init__(self, eids: Sequence[int], env_per_chain: bool = False):
+        self.envs: Dict[int, object] = {
+            eid: boa.Env() if env_per_chain else boa.env for eid in eids
+        }
+        self.endpoints: Dict[int, object] = {}
+        for eid, env in self.envs.items():
+            with boa.swap_env(env):
+                self.endpoints[eid] = boa.load(ENDPOINT_MOCK, eid)
+
+        unique_envs = list({id(env): env for env in self.envs.values()}.values())
+        self.sources = [BoaLogSource(env) for env in unique_envs]
+        self._cursors = [0] * len(self.sources)
+        self._addresses = {str(e.address).lower() for e in self.endpoints.values()}
+        self._pending: Dict[bytes, Packet] = {}  # guid -> packet, in send order
+        self.sent = 0
+
+    def __enter__(self):
+        for source in self.sources:
+            source.__enter__()
+        return self
+
+    def __exit__(self, *args):
+        for source in reversed(self.sources):
+            source.__exit__(*args)
+
+    @property
+    def source(self) -> BoaLogSource:
+        # Log source of the shared env (env_per_chain=False)
+        assert len(self.sources) == 1, "one source per chain, use sources"
+        return self.sources[0]
+
+    def env(self, eid: int):
+        return self.envs[eid]
+
+    def endpoint(self, eid: int):
+        return self.endpoints[eid]
+
+    def time_travel(self, seconds: int) -> None:
+        for source in self.sources:
+            source.env.time_travel(seconds=seconds)
+
+    def _collect(self) -> None:
+        # Parse PacketSent logs recorded since the last call
+        for i, source in enumerate(self.sources):
+            for log in source.logs[self._cursors[i] :]:
+                if log.address in self._addresses and log.topics[0] == PACKET_SENT_TOPIC:
+                    encoded = eth_abi.decode(["bytes", "bytes", "address"], log.data)[0]
+                    packet = decode_packet(encoded)
+                    self._pending[packet.guid] = packet
+                    self.sent += 1
+            self._cursors[i] = len(source.logs)
+
+    def pending(self) -> List[Packet]:
+        self._collect()
+        return list(self._pending.values())
+
+    def resolve_read(self, cmd: bytes) -> bytes:
+        # Response of a read command without compute: results of its calls, concatenated
+        decoded = decode_cmd(cmd)
+        assert decoded.compute is None, "compute not supported"
+        return b"".join(
+            self.envs[r.target_eid].raw_call(r.to, data=r.call_data).output
+            for r in decoded.requests
+        )
+
+    def deliver(self, packet: Packet, delay: int = 0, value: int = 0, extra_data: bytes = b""):
+        # Executor step: wait delay seconds, then call lzReceive on the receiver. Read
+        # responses are delivered on the requesting chain, from the read channel. Returns the
+        # computation of the endpoint call (gas, logs).
+        if delay:
+            self.time_travel(delay)
+        src_eid, dst_eid, message = packet.src_eid, packet.dst_eid, packet.message
+        if packet.dst_eid > READ_CHANNEL_THRESHOLD:
+            src_eid, dst_eid = packet.dst_eid, packet.src_eid
+            message = self.resolve_read(packet.message)
+
+        env = self.envs[dst_eid]
+        env.set_balance(env.eoa, env.get_balance(env.eoa) + value)
+        endpoint = self.endpoints[dst_eid]
+        endpoint.lzReceive(
+            (src_eid, packet.sender, packet.nonce),
+            "0x" + packet.receiver[-20:].hex(),
+            packet.guid,
+            message,
+            extra_data,
+            value=value,
+        )
+        self._pending.pop(packet.guid, None)
+        return endpoint._computation
+
+    def drop(self, packet: Packet) -> None:
+        # The packet is never delivered (e.g. to simulate a stuck pathway)
+        self._pending.pop(packet.guid, None)
+
+    def relay(
+        self,
+        delay: int = 0,
+        jitter: int = 0,
+        drop_rate: float = 0.0,
+        rng: Optional[random.Random] = None,
+    ) -> int:
+        # Deliver (or drop, with probability drop_rate) every pending packet in send order,
+        # each after delay + uniform(0, jitter) seconds. Packets sent by the deliveries (e.g.
+        # replies from lzReceive) wait for the next call. Returns the number delivered.
+        rng = rng or random.Random(0)
+        delivered = 0
+        for packet in self.pending():
+            if rng.random() < drop_rate:
+                self.drop(packet)
+                continue
+            self.deliver(packet, delay + rng.randint(0, jitter))
+            delivered += 1
+        return delivered
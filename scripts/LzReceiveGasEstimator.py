@@ -0,0 +1,138 @@
+import json
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import boa
+from OptionsCodec import OptionsSummary, encode_options
+
+# Measure an OApp's lzReceive gas in a local boa env (calls are made as the endpoint) over a
+# corpus of representative payloads per source eid, and recommend per-eid executor
+# lzReceive gas limits for OptionsBuilder.addExecutorLzReceiveOption. No network needed.
+
+# Allowance for EndpointV2.lzReceive bookkeeping around the receiver call (payload hash
+# clearing, lazy nonce update, PacketDelivered), all of which is paid from the option gas
+ENDPOINT_OVERHEAD = 30_000
+DEFAULT_MARGIN = 0.2  # on top of the worst sample
+GAS_LIMIT_ROUNDING = 1_000
+
+ZERO_ADDRESS = "0x" + "00" * 20
+
+
+@dataclass
+class GasReport:
+    eid: int
+    samples: int
+    p50: int
+    p99: int
+    max: int
+    gas_limit: int  # recommended executor lzReceive gas
+
+    def options(self, value: int = 0) -> bytes:
+        # TYPE_3 options with a single lzReceive option, same as OptionsBuilder produces
+        return encode_options(
+            OptionsSummary(
+                has_lz_receive=True, lz_receive_gas=self.gas_limit, lz_receive_value=value
+            )
+        )
+
+
+def load_corpus(filepath: str) -> Dict[int, List[bytes]]:
+    # JSON: {"<src eid>": ["0x<payload>", ...], ...}
+    with open(filepath) as f:
+        data = json.load(f)
+    return {
+        int(eid): [bytes.fromhex(m.removeprefix("0x")) for m in messages]
+        for eid, messages in data.items()
+    }
+
+
+def percentile(values: Sequence[int], q: float) -> int:
+    # Nearest-rank percentile, q in [0, 100]
+    ordered = sorted(values)
+    rank = max(math.ceil(q / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def recommend_gas_limit(
+    max_gas: int, margin: float = DEFAULT_MARGIN, overhead: int = ENDPOINT_OVERHEAD
+) -> int:
+    # The receiver gets at most 63/64 of the gas left in endpoint.lzReceive (EIP-150)
+    needed = math.ceil(max_gas * 64 / 63) + overhead
+    return math.ceil(needed * (1 + margin) / GAS_LIMIT_ROUNDING) * GAS_LIMIT_ROUNDING
+
+
+def measure_lz_receive(
+    oapp,
+    src_eid: int,
+    message: bytes,
+    sender: Optional[bytes] = None,
+    nonce: int = 1,
+    guid: bytes = b"\x01" * 32,
+    executor: str = ZERO_ADDRESS,
+    extra_data: bytes = b"",
+    value: int = 0,
+) -> int:
+    # Gas used by one oapp.lzReceive call, state changes are rolled back afterwards.
+    # Sender defaults to the configured peer, so the OApp origin checks pass.
+    endpoint = oapp.endpoint()
+    sender = oapp.peers(src_eid) if sender is None else sender
+
+    # Fresh warm/cold access sets, so every sample is priced as a first access
+    boa.env.reset_gas_used()
+    with boa.env.anchor(), boa.env.prank(endpoint):
+        boa.env.set_balance(endpoint, value)
+        oapp.lzReceive((src_eid, sender, nonce), guid, message, executor, extra_data, value=value)
+        return oapp._computation.get_gas_used()
+
+
+def estimate(
+    oapp,
+    corpus: Dict[int, Sequence[bytes]],
+    margin: float = DEFAULT_MARGIN,
+    overhead: int = ENDPOINT_OVERHEAD,
+    **call_args,
+) -> Dict[int, GasReport]:
+    # One report per source eid; a reverting sample raises, since it would skew the estimate
+    reports = {}
+    for eid, messages in corpus.items():
+        assert messages, f"no samples for eid {eid}"
+        gas = []
+        for i, message in enumerate(messages):
+            try:
+                gas.append(measure_lz_receive(oapp, eid, message, **call_args))
+            except Exception as e:
+                raise ValueError(f"lzReceive reverted for eid {eid}, sample {i}: {e}") from e
+
+        reports[eid] = GasReport(
+            eid=eid,
+            samples=len(gas),
+            p50=percentile(gas, 50),
+            p99=percentile(gas, 99),
+            max=max(gas),
+            gas_limit=recommend_gas_limit(max(gas), margin, overhead),
+        )
+    return reports
+
+
+def format_reports(reports: Dict[int, GasReport]) -> str:
+    lines = [f"{'eid':>8}{'samples':>9}{'p50':>10}{'p99':>10}{'max':>10}{'gas limit':>11}"]
+    for r in reports.values():
+        lines.append(f"{r.eid:>8}{r.samples:>9}{r.p50:>10}{r.p99:>10}{r.max:>10}{r.gas_limit:>11}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    # Example usage: python LzReceiveGasEstimator.py corpus.json ../examples/OAppExample.vy
+    import sys
+
+    corpus_path, contract_path = sys.argv[1:3]
+    corpus = load_corpus(corpus_path)
+
+    # Local deployment against the mock endpoint, with a dummy peer per source eid
+    endpoint = boa.load("../tests/mocks/EndpointV2Mock.vy", 30101)
+    oapp = boa.load(contract_path, endpoint.address)
+    for eid in corpus:
+        oapp.setPeer(eid, b"\x42" * 32)
+
+    print(format_reports(estimate(oapp, corpus)))
@@ -0,0 +1,269 @@
+import sqlite3
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import eth_abi
+from AddressUtils import to_bytes32
+from eth_utils import keccak
+from LzReceiveGasEstimator import percentile
+from OAppIndexer import RawLog
+
+# Correlate sends and deliveries across chains by guid, from endpoint logs: PacketSent on the
+# source chain carries the encoded packet (and its guid), PacketDelivered on the destination
+# chain carries the origin and receiver, from which the same guid is recomputed
+# (GUID.generate). Latencies are block timestamp differences between the two chains.
+
+PACKET_SENT_TOPIC = keccak(text="PacketSent(bytes,bytes,address)")
+PACKET_DELIVERED_TOPIC = keccak(text="PacketDelivered((uint32,bytes32,uint64),address)")
+
+# PacketV1Codec: version(1) + nonce(8) + srcEid(4) + sender(32) + dstEid(4) + receiver(32) + guid(32)
+PACKET_HEADER_SIZE = 113
+
+DEFAULT_LATENCY_BUCKETS = [10, 30, 60, 120, 300, 600, 1800, 3600]  # seconds, upper bounds
+
+
+@dataclass
+class Packet:
+    nonce: int
+    src_eid: int
+    sender: bytes  # bytes32
+    dst_eid: int
+    receiver: bytes  # bytes32
+    guid: bytes
+    message: bytes
+
+
+@dataclass
+class PathwayStats:
+    src_eid: int
+    dst_eid: int
+    sent: int
+    delivered: int
+    pending: int
+    delivery_rate: float
+    p50: Optional[int]  # latencies in seconds, None if nothing was delivered
+    p90: Optional[int]
+    p99: Optional[int]
+    max: Optional[int]
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    guid BLOB PRIMARY KEY,
+    src_eid INTEGER NOT NULL,
+    dst_eid INTEGER NOT NULL,
+    sender BLOB NOT NULL,
+    receiver BLOB NOT NULL,
+    nonce INTEGER NOT NULL,
+    sent_at INTEGER,
+    delivered_at INTEGER
+);
+CREATE INDEX IF NOT EXISTS messages_pathway ON messages (src_eid, dst_eid, sent_at);
+"""
+
+
+def compute_guid(nonce: int, src_eid: int, sender: bytes, dst_eid: int, receiver: bytes) -> bytes:
+    # GUID.generate: keccak256(nonce ++ srcEid ++ sender ++ dstEid ++ receiver)
+    return keccak(
+        nonce.to_bytes(8, "big")
+        + src_eid.to_bytes(4, "big")
+        + sender
+        + dst_eid.to_bytes(4, "big")
+        + receiver
+    )
+
+
+def decode_packet(encoded: bytes) -> Packet:
+    assert len(encoded) >= PACKET_HEADER_SIZE, "invalid packet"
+    return Packet(
+        nonce=int.from_bytes(encoded[1:9], "big"),
+        src_eid=int.from_bytes(encoded[9:13], "big"),
+        sender=encoded[13:45],
+        dst_eid=int.from_bytes(encoded[45:49], "big"),
+        receiver=encoded[49:81],
+        guid=encoded[81:113],
+        message=encoded[113:],
+    )
+
+
+class MessageTracker:
+    def __init__(self, db_path: str = "message_tracker.sqlite"):
+        self.db = sqlite3.connect(db_path)
+        self.db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.db.close()
+
+    ################################################################
+    #                          RECORDING                           #
+    ################################################################
+
+    def record_sent(self, packet: Packet, timestamp: int) -> None:
+        # Deliveries can be ingested before their send (chains are indexed independently)
+        with self.db:
+            self.db.execute(
+                "INSERT INTO messages VALUES (?, ?, ?, ?, ?, ?, ?, NULL)"
+                " ON CONFLICT (guid) DO UPDATE SET sent_at = excluded.sent_at",
+                (
+                    packet.guid,
+                    packet.src_eid,
+                    packet.dst_eid,
+                    packet.sender,
+                    packet.receiver,
+                    packet.nonce,
+                    timestamp,
+                ),
+            )
+
+    def record_delivered(
+        self, src_eid: int, sender: bytes, nonce: int, dst_eid: int, receiver: bytes, timestamp: int
+    ) -> bytes:
+        guid = compute_guid(nonce, src_eid, sender, dst_eid, receiver)
+        with self.db:
+            self.db.execute(
+                "INSERT INTO messages VALUES (?, ?, ?, ?, ?, ?, NULL, ?)"
+                " ON CONFLICT (guid) DO UPDATE SET delivered_at = excluded.delivered_at",
+                (guid, src_eid, dst_eid, sender, receiver, nonce, timestamp),
+            )
+        return guid
+
+    def ingest(
+        self,
+        eid: int,
+        logs: Sequence[RawLog],
+        timestamp_of: Optional[Callable[[int], int]] = None,
+    ) -> int:
+        # Record PacketSent/PacketDelivered logs of the endpoint of chain eid. timestamp_of maps
+        # a block number to its timestamp, for sources that do not set RawLog.timestamp.
+        count = 0
+        for log in logs:
+            timestamp = (
+                log.timestamp if log.timestamp is not None else timestamp_of(log.block_number)
+            )
+            if log.topics[0] == PACKET_SENT_TOPIC:
+                encoded, _, _ = eth_abi.decode(["bytes", "bytes", "address"], log.data)
+                self.record_sent(decode_packet(encoded), timestamp)
+            elif log.topics[0] == PACKET_DELIVERED_TOPIC:
+                (src_eid, sender, nonce), receiver = eth_abi.decode(
+                    ["(uint32,bytes32,uint64)", "address"], log.data
+                )
+                self.record_delivered(src_eid, sender, nonce, eid, to_bytes32(receiver), timestamp)
+            else:
+                continue
+            count += 1
+        return count
+
+    def sync(
+        self,
+        eid: int,
+        source,
+        endpoint: str,
+        from_block: int,
+        to_block: int,
+        timestamp_of: Optional[Callable[[int], int]] = None,
+    ) -> int:
+        # Fetch and ingest endpoint logs with an OAppIndexer log source
+        topics = [PACKET_SENT_TOPIC, PACKET_DELIVERED_TOPIC]
+        logs = source.get_logs([endpoint], topics, from_block, to_block)
+        return self.ingest(eid, logs, timestamp_of)
+
+    ################################################################
+    #                           QUERIES                            #
+    ################################################################
+
+    def _latencies(
+        self, src_eid: int, dst_eid: int, since: Optional[int], until: Optional[int]
+    ) -> List[int]:
+        rows = self.db.execute(
+            "SELECT delivered_at - sent_at FROM messages WHERE src_eid = ? AND dst_eid = ?"
+            " AND sent_at BETWEEN ? AND ? AND delivered_at IS NOT NULL",
+            (src_eid, dst_eid, since or 0, 2**63 - 1 if until is None else until),
+        )
+        return [max(r[0], 0) for r in rows]  # clocks of different chains can disagree slightly
+
+    def pathway_stats(
+        self, since: Optional[int] = None, until: Optional[int] = None
+    ) -> Dict[Tuple[int, int], PathwayStats]:
+        # Per (src_eid, dst_eid): messages sent in [since, until] and how many were delivered
+        rows = self.db.execute(
+            "SELECT src_eid, dst_eid, COUNT(*), COUNT(delivered_at) FROM messages"
+            " WHERE sent_at BETWEEN ? AND ? GROUP BY src_eid, dst_eid ORDER BY src_eid, dst_eid",
+            (since or 0, 2**63 - 1 if until is None else until),
+        ).fetchall()
+
+        stats = {}
+        for src_eid, dst_eid, sent, delivered in rows:
+            latencies = self._latencies(src_eid, dst_eid, since, until)
+            stats[(src_eid, dst_eid)] = PathwayStats(
+                src_eid=src_eid,
+                dst_eid=dst_eid,
+                sent=sent,
+                delivered=delivered,
+                pending=sent - delivered,
+                delivery_rate=delivered / sent,
+                p50=percentile(latencies, 50) if latencies else None,
+                p90=percentile(latencies, 90) if latencies else None,
+                p99=percentile(latencies, 99) if latencies else None,
+                max=max(latencies) if latencies else None,
+            )
+        return stats
+
+    def latency_histogram(
+        self,
+        src_eid: int,
+        dst_eid: int,
+        buckets: Sequence[int] = DEFAULT_LATENCY_BUCKETS,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+    ) -> List[Tuple[Optional[int], int]]:
+        # [(upper bound in seconds, count), ...], the last bucket (None) is everything above
+        counts = [0] * (len(buckets) + 1)
+        for latency in self._latencies(src_eid, dst_eid, since, until):
+            index = next((i for i, b in enumerate(buckets) if latency <= b), len(buckets))
+            counts[index] += 1
+        return list(zip([*buckets, None], counts))
+
+    def pending(self, older_than: int, now: int) -> List[bytes]:
+        # guids sent before now - older_than and not delivered yet
+        rows = self.db.execute(
+            "SELECT guid FROM messages WHERE delivered_at IS NULL AND sent_at <= ?"
+            " ORDER BY sent_at",
+            (now - older_than,),
+        )
+        return [r[0] for r in rows]
+
+
+def format_stats(stats: Dict[Tuple[int, int], PathwayStats]) -> str:
+    lines = [f"{'pathway':>14}{'sent':>7}{'deliv':>7}{'rate':>7}{'p50':>7}{'p90':>7}{'p99':>7}"]
+    for s in stats.values():
+        lines.append(
+            f"{f'{s.src_eid}>{s.dst_eid}':>14}{s.sent:>7}{s.delivered:>7}{s.delivery_rate:>7.1%}"
+            f"{str(s.p50):>7}{str(s.p90):>7}{str(s.p99):>7}"
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    # Example usage: python MessageTracker.py <eid>:<rpc>:<endpoint>:<from block> [...]
+    # Ingests every chain up to its head, then prints per-pathway stats
+    import sys
+    from functools import lru_cache
+
+    from OAppIndexer import Web3LogSource
+    from web3 import Web3
+
+    tracker = MessageTracker()
+    for chain in sys.argv[1:]:
+        eid, rest = chain.split(":", 1)
+        rpc_url, endpoint, from_block = rest.rsplit(":", 2)
+        w3 = Web3(Web3.HTTPProvider(rpc_url))
+        timestamp_of = lru_cache(maxsize=None)(lambda b, w3=w3: w3.eth.get_block(b).timestamp)
+        tracker.sync(
+            int(eid),
+            Web3LogSource(w3),
+            endpoint,
+            int(from_block),
+            w3.eth.block_number,
+            timestamp_of,
+        )
+    print(format_stats(tracker.pathway_stats()))
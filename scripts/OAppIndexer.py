@@ -0,0 +1,433 @@
+import sqlite3
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import eth_abi
+from eth_utils import keccak, to_checksum_address
+
+# Index OApp traffic (OAppExample events, OAppEvents events and OApp.PeerSet) into a local
+# SQLite file. Logs are fetched in adaptive block-range chunks (halved when the provider
+# rejects a range, grown while results are sparse), and the last indexed block per OApp is
+# checkpointed in the same transaction as its events, so an interrupted sync resumes where it
+# stopped. OApps in the OAppEvents light mode only log payload hashes: with the endpoint
+# address, its PacketSent logs are indexed too and payloads are resolved by guid.
+
+DEFAULT_CHUNK_SIZE = 2_000
+MAX_CHUNK_SIZE = 50_000
+SPARSE_CHUNK_LOGS = 1_000  # chunks returning fewer logs than this double the next range
+
+
+@dataclass
+class EventSpec:
+    name: str
+    types: List[str]
+    eid_field: int  # index of the eid in the decoded values
+    fee_field: Optional[int] = None  # index of a MessagingFee tuple, if any
+
+    @property
+    def topic(self) -> bytes:
+        return keccak(text=f"{self.name}({','.join(self.types)})")
+
+
+EVENTS = [
+    EventSpec("MessageSent", ["uint32", "string", "(uint256,uint256)"], 0, 2),
+    EventSpec("MessageReceived", ["uint32", "string"], 0),
+    EventSpec("ReadRequestSent", ["uint32", "address", "bytes"], 0),
+    EventSpec("ReadResponseReceived", ["uint32", "string"], 0),
+    EventSpec("PeerSet", ["uint32", "bytes32"], 0),
+    # OAppEvents: (eid, guid, nonce, payload) or (eid, guid, nonce, payloadHash, length)
+    EventSpec("PayloadSent", ["uint32", "bytes32", "uint64", "bytes"], 0),
+    EventSpec("PayloadReceived", ["uint32", "bytes32", "uint64", "bytes"], 0),
+    EventSpec("PayloadHashSent", ["uint32", "bytes32", "uint64", "bytes32", "uint256"], 0),
+    EventSpec("PayloadHashReceived", ["uint32", "bytes32", "uint64", "bytes32", "uint256"], 0),
+]
+EVENTS_BY_TOPIC = {e.topic: e for e in EVENTS}
+SENT_EVENTS = ("MessageSent", "PayloadSent", "PayloadHashSent")
+RECEIVED_EVENTS = ("MessageReceived", "PayloadReceived", "PayloadHashReceived")
+PAYLOAD_EVENTS = ("PayloadSent", "PayloadReceived", "PayloadHashSent", "PayloadHashReceived")
+
+
+@dataclass
+class RawLog:
+    block_number: int
+    log_index: int
+    tx_hash: str
+    address: str
+    topics: List[bytes]
+    data: bytes
+    timestamp: Optional[int] = None  # block timestamp, when the source knows it
+
+
+@dataclass
+class EidStats:
+    eid: int
+    messages_sent: int = 0
+    messages_received: int = 0
+    reads_sent: int = 0
+    reads_received: int = 0
+    native_fees: int = 0  # sum of MessageSent fees.nativeFee
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    address TEXT PRIMARY KEY,
+    last_block INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    tx_hash TEXT NOT NULL,
+    address TEXT NOT NULL,
+    event TEXT NOT NULL,
+    eid INTEGER NOT NULL,
+    native_fee TEXT,
+    data BLOB NOT NULL,
+    PRIMARY KEY (block_number, log_index)
+);
+CREATE INDEX IF NOT EXISTS events_eid ON events (address, eid, block_number);
+CREATE TABLE IF NOT EXISTS peers (
+    address TEXT NOT NULL,
+    eid INTEGER NOT NULL,
+    peer TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    PRIMARY KEY (address, eid)
+);
+CREATE TABLE IF NOT EXISTS payloads (
+    guid BLOB PRIMARY KEY,
+    payload_hash BLOB,
+    length INTEGER,
+    payload BLOB
+);
+"""
+
+################################################################
+#                         LOG SOURCES                          #
+################################################################
+
+
+class Web3LogSource:
+    # eth_getLogs over JSON-RPC, filtered by address and event topics
+    def __init__(self, w3):
+        self.w3 = w3
+
+    def block_number(self) -> int:
+        return self.w3.eth.block_number
+
+    def get_logs(
+        self, addresses: Sequence[str], topics: Sequence[bytes], from_block: int, to_block: int
+    ) -> List[RawLog]:
+        entries = self.w3.eth.get_logs(
+            {
+                "address": [to_checksum_address(a) for a in addresses],
+                "topics": [["0x" + t.hex() for t in topics]],
+                "fromBlock": from_block,
+                "toBlock": to_block,
+            }
+        )
+        return [
+            RawLog(
+                block_number=e["blockNumber"],
+                log_index=e["logIndex"],
+                tx_hash="0x" + bytes(e["transactionHash"]).hex(),
+                address=e["address"].lower(),
+                topics=[bytes(t) for t in e["topics"]],
+                data=bytes(e["data"]),
+            )
+            for e in entries
+        ]
+
+
+class BoaLogSource:
+    # A local boa chain has no eth_getLogs: record the logs of every boa.env call made while
+    # attached, tagged with the block number it ran in
+    def __init__(self, env=None):
+        import boa
+
+        self.env = env or boa.env
+        self.logs: List[RawLog] = []
+        self._execute_code: Optional[Callable] = None
+        self._patched: Optional[Callable] = None
+
+    def __enter__(self):
+        # Sources can be nested: keep whatever execute_code is current and put it back on exit
+        self._patched = vars(self.env).get("execute_code")
+        self._execute_code = self.env.execute_code
+
+        def execute_code(*args, **kwargs):
+            computation = self._execute_code(*args, **kwargs)
+            if not computation.is_error:
+                self._record(computation)
+            return computation
+
+        self.env.execute_code = execute_code
+        return self
+
+    def __exit__(self, *args):
+        if self._patched is None:
+            del self.env.execute_code
+        else:
+            self.env.execute_code = self._patched
+
+    def _record(self, computation) -> None:
+        block = self.block_number()
+        index = sum(1 for log in self.logs if log.block_number == block)
+        for i, (_, address, topics, data) in enumerate(sorted(computation.get_raw_log_entries())):
+            self.logs.append(
+                RawLog(
+                    block_number=block,
+                    log_index=index + i,
+                    tx_hash="",
+                    address=to_checksum_address(address).lower(),
+                    topics=[t.to_bytes(32, "big") for t in topics],
+                    data=data,
+                    timestamp=self.env.evm.patch.timestamp,
+                )
+            )
+
+    def block_number(self) -> int:
+        return self.env.evm.patch.block_number
+
+    def get_logs(
+        self, addresses: Sequence[str], topics: Sequence[bytes], from_block: int, to_block: int
+    ) -> List[RawLog]:
+        addresses = {a.lower() for a in addresses}
+        return [
+            log
+            for log in self.logs
+            if from_block <= log.block_number <= to_block
+            and log.address in addresses
+            and log.topics
+            and log.topics[0] in topics
+        ]
+
+
+################################################################
+#                           INDEXER                            #
+################################################################
+
+
+class OAppIndexer:
+    def __init__(
+        self,
+        source,
+        addresses: Sequence[str],
+        db_path: str = "oapp_index.sqlite",
+        start_block: int = 0,
+        confirmations: int = 0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_chunk_size: int = MAX_CHUNK_SIZE,
+        endpoint: Optional[str] = None,  # to resolve light mode payloads from PacketSent
+    ):
+        self.source = source
+        self.addresses = [str(a).lower() for a in addresses]
+        self.endpoint = None if endpoint is None else str(endpoint).lower()
+        self.start_block = start_block
+        self.confirmations = confirmations  # blocks behind head, to stay clear of reorgs
+        self.chunk_size = chunk_size
+        self.max_chunk_size = max_chunk_size
+        self.db = sqlite3.connect(db_path)
+        self.db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.db.close()
+
+    def checkpoint(self, address: str) -> int:
+        # Last indexed block of an OApp, start_block - 1 if never synced
+        row = self.db.execute(
+            "SELECT last_block FROM checkpoints WHERE address = ?", (address.lower(),)
+        ).fetchone()
+        return row[0] if row else self.start_block - 1
+
+    def sync(self, to_block: Optional[int] = None) -> int:
+        # Index new logs up to to_block (default: head - confirmations), returns events stored
+        if to_block is None:
+            to_block = self.source.block_number() - self.confirmations
+        start = min(self.checkpoint(a) for a in self.addresses) + 1
+        addresses, topics = self.addresses, list(EVENTS_BY_TOPIC)
+        if self.endpoint is not None:
+            from MessageTracker import PACKET_SENT_TOPIC
+
+            addresses, topics = addresses + [self.endpoint], topics + [PACKET_SENT_TOPIC]
+
+        stored, ceiling = 0, self.max_chunk_size
+        while start <= to_block:
+            end = min(start + self.chunk_size - 1, to_block)
+            try:
+                logs = self.source.get_logs(addresses, topics, start, end)
+            except Exception:
+                # Range too large for the provider (result limit, timeout): retry with half,
+                # and do not grow back past it for the rest of this sync
+                if self.chunk_size == 1:
+                    raise
+                self.chunk_size = ceiling = max(self.chunk_size // 2, 1)
+                continue
+
+            stored += self._store(logs, end)
+            start = end + 1
+            if len(logs) < SPARSE_CHUNK_LOGS:
+                self.chunk_size = min(self.chunk_size * 2, ceiling)
+        return stored
+
+    def _store(self, logs: Sequence[RawLog], last_block: int) -> int:
+        stored = 0
+        with self.db:
+            for log in logs:
+                if log.address == self.endpoint:
+                    self._store_packet(log)
+                    continue
+                spec = EVENTS_BY_TOPIC.get(log.topics[0])
+                if spec is None:
+                    continue
+                values = eth_abi.decode(spec.types, log.data)
+                native_fee = values[spec.fee_field][0] if spec.fee_field is not None else None
+                cursor = self.db.execute(
+                    "INSERT OR IGNORE INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        log.block_number,
+                        log.log_index,
+                        log.tx_hash,
+                        log.address,
+                        spec.name,
+                        values[spec.eid_field],
+                        None if native_fee is None else str(native_fee),
+                        log.data,
+                    ),
+                )
+                stored += cursor.rowcount
+                if spec.name == "PeerSet":
+                    self.db.execute(
+                        "INSERT INTO peers VALUES (?, ?, ?, ?) ON CONFLICT (address, eid) DO UPDATE"
+                        " SET peer = excluded.peer, block_number = excluded.block_number"
+                        " WHERE excluded.block_number >= peers.block_number",
+                        (log.address, values[0], "0x" + values[1].hex(), log.block_number),
+                    )
+                elif spec.name in PAYLOAD_EVENTS:
+                    self._store_payload_event(spec.name, values)
+
+            for address in self.addresses:
+                self.db.execute(
+                    "INSERT INTO checkpoints VALUES (?, ?) ON CONFLICT (address) DO UPDATE"
+                    " SET last_block = MAX(last_block, excluded.last_block)",
+                    (address, last_block),
+                )
+        return stored
+
+    def _store_payload_event(self, name: str, values: Tuple) -> None:
+        # Hash and length from either OAppEvents mode, the payload itself from full mode
+        guid = values[1]
+        if name.startswith("PayloadHash"):
+            payload_hash, length, payload = values[3], values[4], None
+        else:
+            payload_hash, length, payload = keccak(values[3]), len(values[3]), values[3]
+        self.db.execute(
+            "INSERT INTO payloads VALUES (?, ?, ?, ?) ON CONFLICT (guid) DO UPDATE"
+            " SET payload_hash = excluded.payload_hash, length = excluded.length,"
+            " payload = COALESCE(payloads.payload, excluded.payload)",
+            (guid, payload_hash, length, payload),
+        )
+
+    def _store_packet(self, log: RawLog) -> None:
+        # Endpoint PacketSent of one of the indexed OApps: the payload of a sent message
+        from MessageTracker import PACKET_SENT_TOPIC, decode_packet
+
+        if log.topics[0] != PACKET_SENT_TOPIC:
+            return
+        encoded, _, _ = eth_abi.decode(["bytes", "bytes", "address"], log.data)
+        packet = decode_packet(encoded)
+        if "0x" + packet.sender[12:].hex() not in self.addresses:
+            return
+        self.db.execute(
+            "INSERT INTO payloads VALUES (?, NULL, NULL, ?) ON CONFLICT (guid) DO UPDATE"
+            " SET payload = excluded.payload",
+            (packet.guid, packet.message),
+        )
+
+    ################################################################
+    #                           QUERIES                            #
+    ################################################################
+
+    def throughput(
+        self,
+        from_block: Optional[int] = None,
+        to_block: Optional[int] = None,
+        address: Optional[str] = None,
+    ) -> Dict[int, EidStats]:
+        # Per-eid message/read counts and native fees over a block range (inclusive)
+        where = "WHERE block_number BETWEEN ? AND ?"
+        params: Tuple = (
+            0 if from_block is None else from_block,
+            2**63 - 1 if to_block is None else to_block,
+        )
+        if address is not None:
+            where += " AND address = ?"
+            params += (address.lower(),)
+
+        fields = {
+            **{event: "messages_sent" for event in SENT_EVENTS},
+            **{event: "messages_received" for event in RECEIVED_EVENTS},
+            "ReadRequestSent": "reads_sent",
+            "ReadResponseReceived": "reads_received",
+        }
+        stats: Dict[int, EidStats] = {}
+        rows = self.db.execute(
+            f"SELECT eid, event, COUNT(*) FROM events {where} AND event != 'PeerSet'"
+            " GROUP BY eid, event",
+            params,
+        )
+        for eid, event, count in rows:
+            entry = stats.setdefault(eid, EidStats(eid))
+            setattr(entry, fields[event], getattr(entry, fields[event]) + count)
+
+        # Fees are stored as text (uint256 overflows SQLite integers), summed here
+        rows = self.db.execute(
+            f"SELECT eid, native_fee FROM events {where} AND native_fee IS NOT NULL", params
+        )
+        for eid, fee in rows:
+            stats[eid].native_fees += int(fee)
+        return dict(sorted(stats.items()))
+
+    def throughput_per_block(
+        self, eid: int, bucket: int, from_block: int = 0, to_block: int = 2**63 - 1
+    ) -> List[Tuple[int, int]]:
+        # [(bucket start block, messages sent + received), ...] for one eid
+        events = SENT_EVENTS + RECEIVED_EVENTS
+        rows = self.db.execute(
+            "SELECT block_number / ? * ?, COUNT(*) FROM events"
+            f" WHERE eid = ? AND event IN ({', '.join('?' * len(events))})"
+            " AND block_number BETWEEN ? AND ? GROUP BY 1 ORDER BY 1",
+            (bucket, bucket, eid, *events, from_block, to_block),
+        )
+        return [tuple(r) for r in rows]
+
+    def peers(self, address: str) -> Dict[int, str]:
+        # Current peers from PeerSet events, replaces polling peers() per eid
+        rows = self.db.execute(
+            "SELECT eid, peer FROM peers WHERE address = ? ORDER BY eid", (address.lower(),)
+        )
+        return dict(rows.fetchall())
+
+    def payload(self, guid: bytes) -> Optional[bytes]:
+        # Payload of a message by guid: from a full mode event, or from the endpoint PacketSent
+        # of a sent message (received messages resolve on the source chain's index). Checked
+        # against the hash of a light mode event when there is one.
+        row = self.db.execute(
+            "SELECT payload_hash, payload FROM payloads WHERE guid = ?", (guid,)
+        ).fetchone()
+        if row is None or row[1] is None:
+            return None
+        payload_hash, payload = row
+        assert payload_hash is None or keccak(payload) == payload_hash, "payload hash mismatch"
+        return payload
+
+
+if __name__ == "__main__":
+    # Example usage: python OAppIndexer.py <rpc> <oapp> [<oapp> ...]
+    import sys
+
+    from web3 import Web3
+
+    rpc_url, *oapps = sys.argv[1:]
+    indexer = OAppIndexer(Web3LogSource(Web3(Web3.HTTPProvider(rpc_url))), oapps, confirmations=12)
+    print(f"indexed {indexer.sync()} events")
+    for stats in indexer.throughput().values():
+        print(stats)
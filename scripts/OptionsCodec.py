@@ -0,0 +1,159 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Union
+
+# Off-chain counterpart of the OptionsBuilder.vy parser: decode TYPE_3 options, merge and
+# compact them. Output is byte-identical to OptionsBuilder.mergeOptions/compactOptions.
+
+TYPE_3 = 3
+EXECUTOR_WORKER_ID = 1
+DVN_WORKER_ID = 2
+
+OPTION_TYPE_LZRECEIVE = 1
+OPTION_TYPE_NATIVE_DROP = 2
+OPTION_TYPE_LZCOMPOSE = 3
+OPTION_TYPE_ORDERED_EXECUTION = 4
+OPTION_TYPE_LZREAD = 5
+
+UINT128_MAX = 2**128 - 1
+UINT32_MAX = 2**32 - 1
+
+
+@dataclass
+class WorkerOption:
+    # One raw entry of an options container. For DVN options, body starts with the DVN index.
+    worker_id: int
+    option_type: int
+    body: bytes
+
+    def encode(self) -> bytes:
+        if self.worker_id == EXECUTOR_WORKER_ID:
+            payload = bytes([self.option_type]) + self.body
+        else:
+            payload = self.body[:1] + bytes([self.option_type]) + self.body[1:]
+        return bytes([self.worker_id]) + len(payload).to_bytes(2, "big") + payload
+
+
+@dataclass
+class OptionsSummary:
+    # Executor totals, as summed by the executor. Mirrors OptionsBuilder.OptionsSummary.
+    has_lz_receive: bool = False
+    lz_receive_gas: int = 0
+    lz_receive_value: int = 0
+    native_drops: Dict[bytes, int] = field(default_factory=dict)  # receiver -> amount
+    lz_composes: Dict[int, List[int]] = field(default_factory=dict)  # index -> [gas, value]
+    ordered_execution: bool = False
+    has_lz_read: bool = False
+    lz_read_gas: int = 0
+    lz_read_size: int = 0
+    lz_read_value: int = 0
+    passthrough: bytes = b""  # DVN and unknown executor options, verbatim
+
+
+def _to_bytes(value: Union[str, bytes]) -> bytes:
+    return value if isinstance(value, bytes) else bytes.fromhex(value.removeprefix("0x"))
+
+
+def parse_options(options: Union[str, bytes]) -> List[WorkerOption]:
+    # Split a TYPE_3 container into its entries, without summing anything
+    options = _to_bytes(options)
+    if not options:
+        return []
+    assert int.from_bytes(options[:2], "big") == TYPE_3, "invalid option type"
+
+    entries, cursor = [], 2
+    while cursor < len(options):
+        assert cursor + 4 <= len(options), "invalid options"
+        worker_id = options[cursor]
+        size = int.from_bytes(options[cursor + 1 : cursor + 3], "big")
+        payload = options[cursor + 3 : cursor + 3 + size]
+        assert size > 0 and len(payload) == size, "invalid options"
+
+        if worker_id == EXECUTOR_WORKER_ID:
+            entries.append(WorkerOption(worker_id, payload[0], payload[1:]))
+        else:
+            assert worker_id == DVN_WORKER_ID, "invalid worker id"
+            assert size >= 2, "invalid options"
+            entries.append(WorkerOption(worker_id, payload[1], payload[:1] + payload[2:]))
+        cursor += 3 + size
+    return entries
+
+
+def decode_options(options: Union[str, bytes], summary: OptionsSummary = None) -> OptionsSummary:
+    # Sum executor options into summary (a new one by default), like OptionsBuilder.decodeOptions
+    summary = OptionsSummary() if summary is None else summary
+    for entry in parse_options(options):
+        body = entry.body
+        if entry.worker_id != EXECUTOR_WORKER_ID:
+            summary.passthrough += entry.encode()
+        elif entry.option_type == OPTION_TYPE_LZRECEIVE:
+            assert len(body) in (16, 32), "invalid lzReceive option"
+            summary.has_lz_receive = True
+            summary.lz_receive_gas += int.from_bytes(body[:16], "big")
+            summary.lz_receive_value += int.from_bytes(body[16:], "big")
+        elif entry.option_type == OPTION_TYPE_NATIVE_DROP:
+            assert len(body) == 48, "invalid native drop option"
+            receiver, amount = body[16:], int.from_bytes(body[:16], "big")
+            summary.native_drops[receiver] = summary.native_drops.get(receiver, 0) + amount
+        elif entry.option_type == OPTION_TYPE_LZCOMPOSE:
+            assert len(body) in (18, 34), "invalid lzCompose option"
+            totals = summary.lz_composes.setdefault(int.from_bytes(body[:2], "big"), [0, 0])
+            totals[0] += int.from_bytes(body[2:18], "big")
+            totals[1] += int.from_bytes(body[18:], "big")
+        elif entry.option_type == OPTION_TYPE_ORDERED_EXECUTION:
+            assert len(body) == 0, "invalid ordered execution option"
+            summary.ordered_execution = True
+        elif entry.option_type == OPTION_TYPE_LZREAD:
+            assert len(body) in (20, 36), "invalid lzRead option"
+            summary.has_lz_read = True
+            summary.lz_read_gas += int.from_bytes(body[:16], "big")
+            summary.lz_read_size += int.from_bytes(body[16:20], "big")
+            summary.lz_read_value += int.from_bytes(body[20:], "big")
+        else:
+            summary.passthrough += entry.encode()
+    return summary
+
+
+def _executor_option(option_type: int, body: bytes) -> bytes:
+    return WorkerOption(EXECUTOR_WORKER_ID, option_type, body).encode()
+
+
+def _u128(value: int) -> bytes:
+    assert value <= UINT128_MAX, "uint128 overflow"
+    return value.to_bytes(16, "big")
+
+
+def encode_options(summary: OptionsSummary) -> bytes:
+    # Same order as OptionsBuilder.encodeOptions; values are omitted when zero
+    options = TYPE_3.to_bytes(2, "big")
+    if summary.has_lz_receive:
+        value = _u128(summary.lz_receive_value) if summary.lz_receive_value else b""
+        options += _executor_option(OPTION_TYPE_LZRECEIVE, _u128(summary.lz_receive_gas) + value)
+    for receiver, amount in summary.native_drops.items():
+        options += _executor_option(OPTION_TYPE_NATIVE_DROP, _u128(amount) + receiver)
+    for index, (gas, value) in summary.lz_composes.items():
+        value = _u128(value) if value else b""
+        options += _executor_option(
+            OPTION_TYPE_LZCOMPOSE, index.to_bytes(2, "big") + _u128(gas) + value
+        )
+    if summary.ordered_execution:
+        options += _executor_option(OPTION_TYPE_ORDERED_EXECUTION, b"")
+    if summary.has_lz_read:
+        assert summary.lz_read_size <= UINT32_MAX, "uint32 overflow"
+        value = _u128(summary.lz_read_value) if summary.lz_read_value else b""
+        options += _executor_option(
+            OPTION_TYPE_LZREAD,
+            _u128(summary.lz_read_gas) + summary.lz_read_size.to_bytes(4, "big") + value,
+        )
+    return options + summary.passthrough
+
+
+def compact_options(options: Union[str, bytes]) -> bytes:
+    return encode_options(decode_options(options))
+
+
+def merge_options(*options: Union[str, bytes]) -> bytes:
+    # Merge any number of containers (e.g. enforced + caller options) into one
+    summary = OptionsSummary()
+    for blob in options:
+        decode_options(blob, summary)
+    return encode_options(summary)
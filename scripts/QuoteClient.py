@@ -0,0 +1,296 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import eth_abi
+from DeployOrchestrator import encode_call
+
+# Fee quotes for OApp consumers (bots quoting many pathways per tick). Concurrent quote calls
+# are collected over one event loop turn and sent as JSON-RPC batches of eth_call (one round
+# trip for up to max_batch quotes), fees are cached by (oapp, dstEid, options, message length)
+# for ttl seconds, and identical quotes in flight share one call. A JSON-RPC batch needs no
+# contract on chain (unlike Multicall3) and keeps per-call errors apart: a reverting quote
+# (e.g. no peer) fails only its own request.
+
+MESSAGE_QUOTE = "quote_message_fee(uint32,address,string,uint128,uint128,bool)"
+READ_QUOTE = "quote_read_fee(uint32,uint32,address,bytes,uint128,uint128,uint32,bool)"
+
+DEFAULT_TTL = 12.0  # seconds, about a block
+DEFAULT_MAX_BATCH = 100  # calls per JSON-RPC batch, providers cap batch sizes
+
+Fee = Tuple[int, int]  # (nativeFee, lzTokenFee)
+
+
+@dataclass(frozen=True)
+class QuoteRequest:
+    oapp: str
+    data: bytes  # calldata of a view returning MessagingFee
+    key: Hashable  # cache and deduplication key
+
+
+def message_quote(
+    oapp: str,
+    dst_eid: int,
+    receiver: str,
+    message: str,
+    gas_limit: int = 0,
+    value: int = 0,
+    pay_in_lz_token: bool = False,
+) -> QuoteRequest:
+    # OAppExample.quote_message_fee, cached by message length
+    options = ("message", gas_limit, value, pay_in_lz_token)
+    return QuoteRequest(
+        oapp=oapp,
+        data=encode_call(
+            MESSAGE_QUOTE, dst_eid, receiver, message, gas_limit, value, pay_in_lz_token
+        ),
+        key=(str(oapp).lower(), dst_eid, options, len(message.encode())),
+    )
+
+
+def read_quote(
+    oapp: str,
+    read_channel: int,
+    dst_eid: int,
+    target: str,
+    calldata: bytes,
+    gas_limit: int = 0,
+    value: int = 0,
+    response_size: int = 64,
+    pay_in_lz_token: bool = False,
+) -> QuoteRequest:
+    # OAppExample.quote_read_fee, cached by calldata length
+    options = (
+        "read",
+        dst_eid,
+        str(target).lower(),
+        gas_limit,
+        value,
+        response_size,
+        pay_in_lz_token,
+    )
+    return QuoteRequest(
+        oapp=oapp,
+        data=encode_call(
+            READ_QUOTE,
+            read_channel,
+            dst_eid,
+            target,
+            calldata,
+            gas_limit,
+            value,
+            response_size,
+            pay_in_lz_token,
+        ),
+        key=(str(oapp).lower(), read_channel, options, len(calldata)),
+    )
+
+
+################################################################
+#                          TRANSPORTS                          #
+################################################################
+
+
+class HTTPTransport:
+    # JSON-RPC over HTTP with aiohttp (installed with web3), one POST per batch
+    def __init__(self, url: str, session=None):
+        self.url = url
+        self.session = session
+
+    async def send(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        import aiohttp
+
+        if self.session is None:
+            self.session = aiohttp.ClientSession()
+        async with self.session.post(self.url, json=batch) as response:
+            response.raise_for_status()
+            result = await response.json()
+        if not isinstance(result, list):
+            # A single error object: the provider rejected the batch as a whole
+            raise ValueError(f"batch rejected: {result.get('error', result)}")
+        return result
+
+    async def close(self) -> None:
+        if self.session is not None:
+            await self.session.close()
+
+
+class LocalRPC:
+    # Stand-in JSON-RPC node on a boa env, answering eth_call batches. Counts round trips
+    # and calls; latency (seconds) is awaited per batch, like a network round trip.
+    def __init__(self, env=None, latency: float = 0.0):
+        import boa
+
+        self.env = env or boa.env
+        self.latency = latency
+        self.round_trips = 0
+        self.calls = 0
+
+    def _call(self, params: List[Any]) -> Dict[str, Any]:
+        tx = params[0]
+        with self.env.anchor():
+            computation = self.env.execute_code(
+                to_address=tx["to"],
+                gas=self.env.evm.get_gas_limit(),
+                data=bytes.fromhex(tx["data"].removeprefix("0x")),
+                is_modifying=False,
+            )
+        output = "0x" + bytes(computation.output or b"").hex()
+        if computation.is_error:
+            return {"error": {"code": 3, "message": "execution reverted", "data": output}}
+        return {"result": output}
+
+    async def send(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        self.round_trips += 1
+        await asyncio.sleep(self.latency)
+        responses = []
+        for request in batch:
+            self.calls += 1
+            if request["method"] == "eth_call":
+                response = self._call(request["params"])
+            else:
+                response = {"error": {"code": -32601, "message": "method not found"}}
+            responses.append({"jsonrpc": "2.0", "id": request["id"], **response})
+        return responses[::-1]  # batch responses may come in any order
+
+
+################################################################
+#                            CLIENT                            #
+################################################################
+
+
+class QuoteClient:
+    def __init__(
+        self,
+        transport,
+        ttl: float = DEFAULT_TTL,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        block: str = "latest",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.transport = transport
+        self.ttl = ttl
+        self.max_batch = max_batch
+        self.block = block
+        self.clock = clock
+        self.cache: Dict[Hashable, Tuple[float, Fee]] = {}  # key -> (expiry, fee)
+        self.hits = 0
+        self.deduplicated = 0
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._pending: List[Tuple[QuoteRequest, asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._next_id = 0
+
+    def cached(self, key: Hashable) -> Optional[Fee]:
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        if self.clock() >= entry[0]:
+            del self.cache[key]
+            return None
+        return entry[1]
+
+    def invalidate(self, oapp: Optional[str] = None) -> None:
+        # Drop cached fees, of one OApp (keys built by message_quote/read_quote) or all
+        if oapp is None:
+            self.cache.clear()
+            return
+        for key in [k for k in self.cache if k[0] == str(oapp).lower()]:
+            del self.cache[key]
+
+    async def quote(self, request: QuoteRequest) -> Fee:
+        fee = self.cached(request.key)
+        if fee is not None:
+            self.hits += 1
+            return fee
+
+        future = self._inflight.get(request.key)
+        if future is not None:
+            self.deduplicated += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[request.key] = future
+            if not self._pending:
+                # Runs on the next loop turn: everything requested until then is one batch
+                self._flush_task = asyncio.ensure_future(self._flush())
+            self._pending.append((request, future))
+        # Shielded: a cancelled caller must not cancel the quote others are waiting on
+        return await asyncio.shield(future)
+
+    async def quote_many(self, requests: Sequence[QuoteRequest]) -> List[Fee]:
+        return list(await asyncio.gather(*(self.quote(r) for r in requests)))
+
+    async def _flush(self) -> None:
+        pending, self._pending = self._pending, []
+        chunks = [pending[i : i + self.max_batch] for i in range(0, len(pending), self.max_batch)]
+        await asyncio.gather(*(self._send(chunk) for chunk in chunks))
+
+    async def _send(self, chunk: List[Tuple[QuoteRequest, asyncio.Future]]) -> None:
+        by_id = {}
+        batch = []
+        for request, future in chunk:
+            self._next_id += 1
+            by_id[self._next_id] = (request, future)
+            call = {"to": request.oapp, "data": "0x" + request.data.hex()}
+            batch.append(
+                {
+                    "jsonrpc": "2.0",
+                    "id": self._next_id,
+                    "method": "eth_call",
+                    "params": [call, self.block],
+                }
+            )
+
+        try:
+            responses = await self.transport.send(batch)
+        except Exception as e:
+            for request, future in chunk:
+                self._settle(request, future, error=e)
+            return
+
+        expiry = self.clock() + self.ttl
+        for response in responses:
+            request, future = by_id.pop(response["id"])
+            if "error" in response:
+                error = ValueError(f"quote failed for {request.key}: {response['error']}")
+                self._settle(request, future, error=error)
+                continue
+            fee = eth_abi.decode(["uint256", "uint256"], bytes.fromhex(response["result"][2:]))
+            self.cache[request.key] = (expiry, fee)
+            self._settle(request, future, fee=fee)
+        for request, future in by_id.values():
+            self._settle(request, future, error=ValueError(f"no response for {request.key}"))
+
+    def _settle(self, request, future, fee=None, error=None) -> None:
+        del self._inflight[request.key]
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(fee)
+
+
+if __name__ == "__main__":
+    # Example usage: python QuoteClient.py <rpc> <oapp> <receiver> <dst eid> [<dst eid> ...]
+    # Quotes a 32 byte message to every eid in one batch, twice (the second from the cache)
+    import sys
+
+    rpc_url, oapp, receiver, *eids = sys.argv[1:]
+
+    async def main():
+        transport = HTTPTransport(rpc_url)
+        client = QuoteClient(transport)
+        requests = [message_quote(oapp, int(eid), receiver, "x" * 32, 200_000) for eid in eids]
+        try:
+            for _ in range(2):
+                start = time.perf_counter()
+                fees = await client.quote_many(requests)
+                print(f"{len(fees)} quotes in {time.perf_counter() - start:.3f}s")
+            for eid, (native_fee, _) in zip(eids, fees):
+                print(f"{eid:>8}{native_fee:>24}")
+        finally:
+            await transport.close()
+
+    asyncio.run(main())
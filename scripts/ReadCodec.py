@@ -0,0 +1,178 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+# Off-chain counterpart of ReadCmdCodecV1.vy: encode/decode lzRead commands and split the
+# response of a multi-request command (no compute) into per-request results, the same way as
+# ReadCmdCodecV1.decodeResponses.
+
+CMD_VERSION = 1
+REQUEST_VERSION = 1
+RESOLVER_TYPE_SINGLE_VIEW_EVM_CALL = 1
+COMPUTE_VERSION = 1
+COMPUTE_TYPE_SINGLE_VIEW_EVM_CALL = 1
+
+CMD_HEADER_SIZE = 6  # version(2) + appCmdLabel(2) + requestCount(2)
+REQUEST_HEADER_SIZE = 7  # version(1) + appRequestLabel(2) + resolverType(2) + size(2)
+COMPUTE_SIZE = 39
+
+
+@dataclass
+class EVMCallRequest:
+    # Mirrors ReadCmdCodecV1.EVMCallRequestV1
+    app_request_label: int
+    target_eid: int
+    is_block_num: bool
+    block_num_or_timestamp: int
+    confirmations: int
+    to: str
+    call_data: bytes
+
+    def encode(self) -> bytes:
+        body = (
+            self.target_eid.to_bytes(4, "big")
+            + bytes([self.is_block_num])
+            + self.block_num_or_timestamp.to_bytes(8, "big")
+            + self.confirmations.to_bytes(2, "big")
+            + _to_bytes(self.to)
+            + self.call_data
+        )
+        return (
+            bytes([REQUEST_VERSION])
+            + self.app_request_label.to_bytes(2, "big")
+            + RESOLVER_TYPE_SINGLE_VIEW_EVM_CALL.to_bytes(2, "big")
+            + len(body).to_bytes(2, "big")
+            + body
+        )
+
+
+@dataclass
+class EVMCallCompute:
+    # Mirrors ReadCmdCodecV1.EVMCallComputeV1
+    compute_setting: int
+    target_eid: int
+    is_block_num: bool
+    block_num_or_timestamp: int
+    confirmations: int
+    to: str
+
+    def encode(self) -> bytes:
+        return (
+            bytes([COMPUTE_VERSION])
+            + COMPUTE_TYPE_SINGLE_VIEW_EVM_CALL.to_bytes(2, "big")
+            + bytes([self.compute_setting])
+            + self.target_eid.to_bytes(4, "big")
+            + bytes([self.is_block_num])
+            + self.block_num_or_timestamp.to_bytes(8, "big")
+            + self.confirmations.to_bytes(2, "big")
+            + _to_bytes(self.to)
+        )
+
+
+@dataclass
+class ReadCommand:
+    app_cmd_label: int
+    requests: List[EVMCallRequest]
+    compute: Optional[EVMCallCompute] = None
+
+
+def _to_bytes(value: Union[str, bytes]) -> bytes:
+    return value if isinstance(value, bytes) else bytes.fromhex(value.removeprefix("0x"))
+
+
+def encode_cmd(
+    app_cmd_label: int,
+    requests: Sequence[EVMCallRequest],
+    compute: Optional[EVMCallCompute] = None,
+) -> bytes:
+    # Byte-identical to ReadCmdCodecV1.encode
+    cmd = (
+        CMD_VERSION.to_bytes(2, "big")
+        + app_cmd_label.to_bytes(2, "big")
+        + len(requests).to_bytes(2, "big")
+    )
+    cmd += b"".join(r.encode() for r in requests)
+    if compute is not None:
+        cmd += compute.encode()
+    return cmd
+
+
+def decode_cmd(cmd: Union[str, bytes]) -> ReadCommand:
+    cmd = _to_bytes(cmd)
+    assert len(cmd) >= CMD_HEADER_SIZE, "invalid read command"
+    assert int.from_bytes(cmd[:2], "big") == CMD_VERSION, "invalid version"
+    count = int.from_bytes(cmd[4:6], "big")
+
+    requests, cursor = [], CMD_HEADER_SIZE
+    for _ in range(count):
+        assert cursor + REQUEST_HEADER_SIZE <= len(cmd), "invalid read command"
+        assert cmd[cursor] == REQUEST_VERSION, "invalid version"
+        size = int.from_bytes(cmd[cursor + 5 : cursor + 7], "big")
+        body = cmd[cursor + REQUEST_HEADER_SIZE : cursor + REQUEST_HEADER_SIZE + size]
+        assert size >= 35 and len(body) == size, "invalid read command"
+        requests.append(
+            EVMCallRequest(
+                app_request_label=int.from_bytes(cmd[cursor + 1 : cursor + 3], "big"),
+                target_eid=int.from_bytes(body[:4], "big"),
+                is_block_num=bool(body[4]),
+                block_num_or_timestamp=int.from_bytes(body[5:13], "big"),
+                confirmations=int.from_bytes(body[13:15], "big"),
+                to="0x" + body[15:35].hex(),
+                call_data=body[35:],
+            )
+        )
+        cursor += REQUEST_HEADER_SIZE + size
+
+    compute = None
+    if cursor < len(cmd):
+        body = cmd[cursor:]
+        assert len(body) == COMPUTE_SIZE and body[0] == COMPUTE_VERSION, "invalid read command"
+        compute = EVMCallCompute(
+            compute_setting=body[3],
+            target_eid=int.from_bytes(body[4:8], "big"),
+            is_block_num=bool(body[8]),
+            block_num_or_timestamp=int.from_bytes(body[9:17], "big"),
+            confirmations=int.from_bytes(body[17:19], "big"),
+            to="0x" + body[19:39].hex(),
+        )
+    return ReadCommand(int.from_bytes(cmd[2:4], "big"), requests, compute)
+
+
+def split_responses(
+    response: Union[str, bytes], labels: Sequence[int], sizes: Optional[Sequence[int]] = None
+) -> List[Tuple[int, bytes]]:
+    # [(appRequestLabel, result), ...] in command order; without sizes, results are equal-sized
+    response = _to_bytes(response)
+    assert labels, "invalid read response"
+    if not sizes:
+        assert len(response) % len(labels) == 0, "invalid read response"
+        sizes = [len(response) // len(labels)] * len(labels)
+    assert len(sizes) == len(labels) and sum(sizes) == len(response), "invalid read response"
+
+    results, cursor = [], 0
+    for label, size in zip(labels, sizes):
+        results.append((label, response[cursor : cursor + size]))
+        cursor += size
+    return results
+
+
+def decode_responses(
+    cmd: Union[str, bytes], response: Union[str, bytes], sizes: Optional[Sequence[int]] = None
+) -> List[Tuple[int, bytes]]:
+    # Same result and checks as ReadCmdCodecV1.decodeResponses
+    decoded = decode_cmd(cmd)
+    assert decoded.compute is None, "compute not supported"
+    return split_responses(response, [r.app_request_label for r in decoded.requests], sizes)
+
+
+def responses_by_label(results: Sequence[Tuple[int, bytes]]) -> Dict[int, bytes]:
+    # Labels are app-defined and may repeat; the last result wins
+    return dict(results)
+
+
+if __name__ == "__main__":
+    # Example usage: python ReadCodec.py <cmd hex> <response hex> [size,size,...]
+    import sys
+
+    sizes = [int(s) for s in sys.argv[3].split(",")] if len(sys.argv) > 3 else None
+    for label, result in decode_responses(sys.argv[1], sys.argv[2], sizes):
+        print(f"{label:>6}  0x{result.hex()}")
@@ -71,6 +71,9 @@ MAX_MESSAGE_SIZE: constant(uint256) = constants.MAX_MESSAGE_SIZE
 MAX_OPTIONS_TOTAL_SIZE: constant(uint256) = constants.MAX_OPTIONS_TOTAL_SIZE
 MAX_EXTRA_DATA_SIZE: constant(uint256) = constants.MAX_EXTRA_DATA_SIZE
 
+# Batch size limit for peer management
+MAX_CONFIG_ITEMS: constant(uint256) = constants.MAX_CONFIG_ITEMS
+
 # Offspec constant, useful for read messages detection
 READ_CHANNEL_THRESHOLD: constant(
     uint32
@@ -157,6 +160,40 @@ def setPeer(_eid: uint32, _peer: bytes32):
     self._setPeer(_eid, _peer)
 
 
+@external
+def setPeers(
+    _eids: DynArray[uint32, MAX_CONFIG_ITEMS], _peers: DynArray[bytes32, MAX_CONFIG_ITEMS]
+):
+    """
+    @notice Sets the peer addresses for multiple endpoints in a single transaction.
+    @param _eids Array of endpoint IDs.
+    @param _peers Array of peer addresses (must match _eids length).
+    @dev Only the owner/admin of the OApp can call this function.
+    @dev Vyper-specific: batched setPeer, emits PeerSet for every entry.
+    """
+    ownable._check_owner()
+
+    assert len(_eids) == len(_peers), "OApp: Array length mismatch"
+
+    for i: uint256 in range(len(_eids), bound=MAX_CONFIG_ITEMS):
+        self._setPeer(_eids[i], _peers[i])
+
+
+@external
+@view
+def getPeers(_eids: DynArray[uint32, MAX_CONFIG_ITEMS]) -> DynArray[bytes32, MAX_CONFIG_ITEMS]:
+    """
+    @notice Returns the peer addresses for multiple endpoints in a single call.
+    @param _eids Array of endpoint IDs.
+    @return peers Array of peers, bytes32(0) where no peer is set.
+    """
+    peers: DynArray[bytes32, MAX_CONFIG_ITEMS] = []
+    for eid: uint32 in _eids:
+        peers.append(self.peers[eid])
+
+    return peers
+
+
 @internal
 def _setPeer(_eid: uint32, _peer: bytes32):
     """
@@ -289,6 +326,19 @@ def _lzReceive(
     @param _executor The address of the executor for the received message.
     @param _extraData Additional arbitrary data provided by the corresponding executor.
     """
+    self._lzReceiveOrigin(_origin)
+
+
+@internal
+@view
+def _lzReceiveOrigin(_origin: Origin):
+    """
+    @dev Vyper-specific: the checks of _lzReceive, without passing message and extra data.
+    Internal calls copy Bytes arguments by value into a new max-sized buffer, so this should
+    be preferred over _lzReceive. The external lzReceive already holds the decoded _message;
+    read fields from it in place (e.g. extract32(_message, offset)) instead of copying.
+    @param _origin The origin information containing the source endpoint and sender address.
+    """
     # Verify that the sender is the endpoint
     assert msg.sender == endpoint.address, "OApp: only endpoint"
 
@@ -321,11 +371,33 @@ def _quote(
             - nativeFee: The native fee for the message.
             - lzTokenFee: The LZ token fee for the message.
     """
+    return self._quoteToPeer(
+        _dstEid, self._getPeerOrRevert(_dstEid), _message, _options, _payInLzToken
+    )
+
 
+@internal
+@view
+def _quoteToPeer(
+    _dstEid: uint32,
+    _peer: bytes32,
+    _message: Bytes[MAX_MESSAGE_SIZE],
+    _options: Bytes[MAX_OPTIONS_TOTAL_SIZE],
+    _payInLzToken: bool,
+) -> MessagingFee:
+    """
+    @dev Vyper-specific: _quote with an already resolved peer, see _lzSendToPeer.
+    @param _dstEid The destination endpoint ID.
+    @param _peer The peer address on the destination endpoint.
+    @param _message The message payload.
+    @param _options Additional options for the message.
+    @param _payInLzToken Flag indicating whether to pay the fee in LZ tokens.
+    @return fee The calculated MessagingFee for the message.
+    """
     return staticcall endpoint.quote(
         MessagingParams(
             dstEid=_dstEid,
-            receiver=self._getPeerOrRevert(_dstEid),
+            receiver=_peer,
             message=_message,
             options=_options,
             payInLzToken=_payInLzToken,
@@ -348,6 +420,10 @@ def _lzSend(
         - _payNative and _payLzToken are inlined.
         - Multiple sends are supported within single transaction (msg.value >= native_fee) instead of '=='.
 
+    @dev MessagingParams is built in place and ABI-encoded by the actual message/options length,
+    not by the Bytes[] maximum (see tests/benchmarks/test_gas_send_encoding.py). Hand-built
+    raw_call calldata was measured to be more expensive, so there is no raw send path.
+
     @dev Internal function to interact with the LayerZero EndpointV2.send() for sending a message.
     @param _dstEid The destination endpoint ID.
     @param _message The message payload.
@@ -362,24 +438,40 @@ def _lzSend(
         - fee: The LayerZero fee incurred for the message.
     """
     # Get the peer address for the destination or revert if not set
-    peer: bytes32 = self._getPeerOrRevert(_dstEid)
+    return self._lzSendToPeer(
+        _dstEid, self._getPeerOrRevert(_dstEid), _message, _options, _fee, _refundAddress
+    )
 
-    # Handle native fee
-    native_fee: uint256 = _fee.nativeFee
-    if native_fee > 0:
-        assert msg.value >= native_fee, "OApp: not enough fee"
 
-    lzToken_fee: uint256 = _fee.lzTokenFee
-    if lzToken_fee > 0:
-        # Pay LZ token fee by sending tokens to the endpoint.
-        lzToken: address = staticcall endpoint.lzToken()
-        assert lzToken != empty(address), "OApp: LZ token unavailable"
-        assert extcall IERC20(lzToken).transferFrom(msg.sender, endpoint.address, lzToken_fee, default_return_value=True), "OApp: token transfer failed"
+@internal
+@payable
+def _lzSendToPeer(
+    _dstEid: uint32,
+    _peer: bytes32,
+    _message: Bytes[MAX_MESSAGE_SIZE],
+    _options: Bytes[MAX_OPTIONS_TOTAL_SIZE],
+    _fee: MessagingFee,
+    _refundAddress: address,
+) -> MessagingReceipt:
+    """
+    @dev Vyper-specific: the single send path. _lzSend resolves the peer from the peers mapping
+    and calls it, modules that keep peers elsewhere (see OAppFixedPeers.vy) call it directly.
+    The extra internal call copies the message once more, which costs gas linear in its length.
+    @param _dstEid The destination endpoint ID.
+    @param _peer The peer address on the destination endpoint.
+    @param _message The message payload.
+    @param _options Additional options for the message.
+    @param _fee The calculated LayerZero fee for the message.
+    @param _refundAddress The address to receive any excess fee values sent to the endpoint.
+    @return receipt The receipt for the sent message.
+    """
+    # Handle native and lzToken fees
+    native_fee: uint256 = self._payFee(_fee)
 
     return extcall endpoint.send(
         MessagingParams(
             dstEid=_dstEid,
-            receiver=peer,
+            receiver=_peer,
             message=_message,
             options=_options,
             payInLzToken=_fee.lzTokenFee > 0,
@@ -387,3 +479,28 @@ def _lzSend(
         _refundAddress,
         value=native_fee,
     )
+
+
+@internal
+@payable
+def _payFee(_fee: MessagingFee) -> uint256:
+    """
+    @dev Vyper-specific: inlined _payNative/_payLzToken of Solidity OApp.
+        - msg.value must cover the native fee ('>=' to support multiple sends in single tx).
+        - LZ token fee is transferred from msg.sender to the endpoint.
+    @param _fee The calculated LayerZero fee for the message.
+    @return native_fee The native fee to forward to the endpoint.
+    """
+    # Handle native fee
+    native_fee: uint256 = _fee.nativeFee
+    if native_fee > 0:
+        assert msg.value >= native_fee, "OApp: not enough fee"
+
+    lzToken_fee: uint256 = _fee.lzTokenFee
+    if lzToken_fee > 0:
+        # Pay LZ token fee by sending tokens to the endpoint.
+        lzToken: address = staticcall endpoint.lzToken()
+        assert lzToken != empty(address), "OApp: LZ token unavailable"
+        assert extcall IERC20(lzToken).transferFrom(msg.sender, endpoint.address, lzToken_fee, default_return_value=True), "OApp: token transfer failed"
+
+    return native_fee
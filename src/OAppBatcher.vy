@@ -0,0 +1,184 @@
+# pragma version 0.4.3
+
+"""
+@title OAppBatcher - Aggregate small app messages into one LayerZero message
+
+@notice Small app-level updates to the same destination are framed into a single
+LayerZero message, so they share one fee. Messages accumulate per dstEid in storage
+(_queue, then _flush) or in memory within a transaction (_appendToBatch, then OApp._lzSend),
+and the receiver splits the batch back into app messages with _unbatch.
+
+@dev Batch format: count (uint8) ++ [length (uint16) ++ message] * count, at most
+MAX_BATCH_MESSAGES messages of up to MAX_BATCH_MESSAGE_SIZE bytes, MAX_MESSAGE_SIZE in total.
+Usage in the main contract:
+    @external
+    @payable
+    def lzReceive(_origin, _guid, _message, _executor, _extraData):
+        OApp._lzReceiveOrigin(_origin)
+        messages: DynArray[Bytes[...], ...] = OAppBatcher._unbatch(_message)
+        for m: Bytes[OAppBatcher.MAX_BATCH_MESSAGE_SIZE] in messages:
+            ... app logic ...
+
+Gas limits in the executor options must cover the whole batch.
+
+@license Copyright (c) Curve.Fi, 2025 - all rights reserved
+
+@author curve.fi
+
+@custom:security security@curve.fi
+"""
+
+################################################################
+#                            MODULES                           #
+################################################################
+
+# Sends and origin checks. Must be initialized in main contract.
+from . import OApp
+
+uses: OApp
+
+# Vyper-specific constants
+from . import VyperConstants as constants
+
+################################################################
+#                           CONSTANTS                          #
+################################################################
+
+MAX_MESSAGE_SIZE: constant(uint256) = constants.MAX_MESSAGE_SIZE
+MAX_OPTIONS_TOTAL_SIZE: constant(uint256) = constants.MAX_OPTIONS_TOTAL_SIZE
+MAX_BATCH_MESSAGES: constant(uint256) = constants.MAX_BATCH_MESSAGES
+MAX_BATCH_MESSAGE_SIZE: constant(uint256) = constants.MAX_BATCH_MESSAGE_SIZE
+
+# Frame sizes: 1 byte message count, 2 bytes length per message
+COUNT_SIZE: constant(uint256) = 1
+LENGTH_SIZE: constant(uint256) = 2
+
+################################################################
+#                           STORAGE                            #
+################################################################
+
+# dstEid -> framed batch waiting for _flush, empty if nothing is queued
+pendingBatches: public(HashMap[uint32, Bytes[MAX_MESSAGE_SIZE]])
+
+
+################################################################
+#                         SEND FUNCTIONS                       #
+################################################################
+
+@internal
+def _queue(_dstEid: uint32, _message: Bytes[MAX_BATCH_MESSAGE_SIZE]) -> uint256:
+    """
+    @notice Add a message to the pending batch of a destination
+    @param _dstEid The destination endpoint ID.
+    @param _message The app message.
+    @return The number of messages in the pending batch, flush when MAX_BATCH_MESSAGES.
+    @dev Reverts with "OApp: batch full" if the message does not fit, flush first.
+    """
+    batch: Bytes[MAX_MESSAGE_SIZE] = self._appendToBatch(self.pendingBatches[_dstEid], _message)
+    self.pendingBatches[_dstEid] = batch
+    return convert(slice(batch, 0, COUNT_SIZE), uint256)
+
+
+@internal
+@view
+def _quoteFlush(
+    _dstEid: uint32, _options: Bytes[MAX_OPTIONS_TOTAL_SIZE], _payInLzToken: bool
+) -> OApp.MessagingFee:
+    """
+    @notice Quote the fee for sending the pending batch of a destination
+    @param _dstEid The destination endpoint ID.
+    @param _options Message execution options, gas must cover every message in the batch.
+    @param _payInLzToken Whether to return fee in ZRO token.
+    @return A MessagingFee struct containing the calculated fees.
+    """
+    return OApp._quote(_dstEid, self.pendingBatches[_dstEid], _options, _payInLzToken)
+
+
+@internal
+def _flush(
+    _dstEid: uint32,
+    _options: Bytes[MAX_OPTIONS_TOTAL_SIZE],
+    _fee: OApp.MessagingFee,
+    _refundAddress: address,
+) -> OApp.MessagingReceipt:
+    """
+    @notice Send the pending batch of a destination as one LayerZero message
+    @param _dstEid The destination endpoint ID.
+    @param _options Message execution options, gas must cover every message in the batch.
+    @param _fee The calculated LayerZero fee for the message.
+    @param _refundAddress The address to receive any excess fee values sent to the endpoint.
+    @return A MessagingReceipt struct containing details of the message sent.
+    """
+    batch: Bytes[MAX_MESSAGE_SIZE] = self.pendingBatches[_dstEid]
+    assert len(batch) > 0, "OApp: empty batch"
+
+    # Only the length slot is cleared, data slots stay dirty for the next batch
+    self.pendingBatches[_dstEid] = b""
+
+    return OApp._lzSend(_dstEid, batch, _options, _fee, _refundAddress)
+
+
+@internal
+@pure
+def _appendToBatch(
+    _batch: Bytes[MAX_MESSAGE_SIZE], _message: Bytes[MAX_BATCH_MESSAGE_SIZE]
+) -> Bytes[MAX_MESSAGE_SIZE]:
+    """
+    @notice Append a message to a framed batch
+    @param _batch The batch, empty bytes to start a new one.
+    @param _message The app message.
+    @return The updated batch.
+    @dev Use directly to batch within a transaction, then send with OApp._lzSend.
+    """
+    frame: Bytes[LENGTH_SIZE + MAX_BATCH_MESSAGE_SIZE] = concat(
+        convert(convert(len(_message), uint16), bytes2), _message
+    )
+    if len(_batch) == 0:
+        return concat(convert(convert(1, uint8), bytes1), frame)
+
+    count: uint8 = convert(slice(_batch, 0, COUNT_SIZE), uint8)
+    assert convert(count, uint256) < MAX_BATCH_MESSAGES, "OApp: batch full"
+    assert len(_batch) + len(frame) <= MAX_MESSAGE_SIZE, "OApp: batch full"
+
+    return convert(
+        concat(
+            convert(count + 1, bytes1),
+            slice(_batch, COUNT_SIZE, len(_batch) - COUNT_SIZE),
+            frame,
+        ),
+        Bytes[MAX_MESSAGE_SIZE],
+    )
+
+
+################################################################
+#                        RECEIVE FUNCTIONS                     #
+################################################################
+
+@internal
+@pure
+def _unbatch(
+    _message: Bytes[MAX_MESSAGE_SIZE],
+) -> DynArray[Bytes[MAX_BATCH_MESSAGE_SIZE], MAX_BATCH_MESSAGES]:
+    """
+    @notice Split a received batch back into app messages
+    @param _message The payload of the received LayerZero message.
+    @return The app messages, in the order they were batched.
+    @dev Call after OApp._lzReceiveOrigin (or OApp._lzReceive) in lzReceive.
+    """
+    assert len(_message) >= COUNT_SIZE, "OApp: invalid batch"
+    count: uint256 = convert(slice(_message, 0, COUNT_SIZE), uint256)
+    assert count <= MAX_BATCH_MESSAGES, "OApp: invalid batch"
+
+    messages: DynArray[Bytes[MAX_BATCH_MESSAGE_SIZE], MAX_BATCH_MESSAGES] = []
+    cursor: uint256 = COUNT_SIZE
+    for i: uint256 in range(count, bound=MAX_BATCH_MESSAGES):
+        assert cursor + LENGTH_SIZE <= len(_message), "OApp: invalid batch"
+        size: uint256 = convert(slice(_message, cursor, LENGTH_SIZE), uint256)
+        cursor += LENGTH_SIZE
+
+        assert size <= MAX_BATCH_MESSAGE_SIZE and cursor + size <= len(_message), "OApp: invalid batch"
+        messages.append(convert(slice(_message, cursor, size), Bytes[MAX_BATCH_MESSAGE_SIZE]))
+        cursor += size
+
+    assert cursor == len(_message), "OApp: invalid batch"
+    return messages
@@ -0,0 +1,94 @@
+# pragma version 0.4.3
+
+"""
+@title OAppComposer - Split receive work into lzCompose steps
+
+@notice Lets an OApp queue follow-up work from lzReceive with endpoint.sendCompose and run
+it later in lzCompose. Expensive per-message processing then executes under its own gas
+limit (OptionsBuilder.addExecutorLzComposeOption) instead of inflating the lzReceive gas
+option on every message. Compose messages are sent to self, so OApp.isComposeMsgSender
+(sender == self) already approves them.
+
+@dev Usage in the main contract:
+    @external
+    @payable
+    def lzReceive(_origin, _guid, _message, _executor, _extraData):
+        OApp._lzReceiveOrigin(_origin)
+        ... cheap work ...
+        OAppComposer._sendCompose(_guid, 0, follow_up_message)
+
+    @external
+    @payable
+    def lzCompose(_from, _guid, _message, _executor, _extraData):
+        OAppComposer._lzCompose(_from, _guid, _message, _executor, _extraData)
+        ... expensive work ...
+
+On the source chain, add one addExecutorLzComposeOption per compose index (0, 1, ...).
+Compose messages are delivered at most once by the endpoint, in any order.
+
+@license Copyright (c) Curve.Fi, 2025 - all rights reserved
+
+@author curve.fi
+
+@custom:security security@curve.fi
+"""
+
+################################################################
+#                            MODULES                           #
+################################################################
+
+# Endpoint is stored in OApp. Must be initialized in main contract.
+from . import OApp
+
+uses: OApp
+
+################################################################
+#                         INTERFACES                           #
+################################################################
+
+interface ILayerZeroEndpointV2:
+    def sendCompose(
+        _to: address, _guid: bytes32, _index: uint16, _message: Bytes[OApp.MAX_MESSAGE_SIZE]
+    ): nonpayable
+
+
+################################################################
+#                       COMPOSE FUNCTIONS                      #
+################################################################
+
+@internal
+def _sendCompose(_guid: bytes32, _index: uint16, _message: Bytes[OApp.MAX_MESSAGE_SIZE]):
+    """
+    @notice Queue a compose message to self at the endpoint
+    @param _guid The guid of the message being received (lzReceive _guid).
+    @param _index The compose index, unique per guid (0, 1, ...).
+    @param _message The compose payload, handed to lzCompose as-is.
+    """
+    extcall ILayerZeroEndpointV2(OApp.endpoint.address).sendCompose(
+        self, _guid, _index, _message
+    )
+
+
+@internal
+@view
+def _lzCompose(
+    _from: address,
+    _guid: bytes32,
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+    _executor: address,
+    _extraData: Bytes[OApp.MAX_EXTRA_DATA_SIZE],
+):
+    """
+    @dev Must be called first in external lzCompose implementation.
+    @notice Entry point checks for compose messages delivered by the endpoint.
+    @param _from The address that queued the compose message (must be self).
+    @param _guid The guid of the original LayerZero message.
+    @param _message The compose payload.
+    @param _executor The address of the executor for the compose message.
+    @param _extraData Additional arbitrary data provided by the corresponding executor.
+    """
+    # Verify that the sender is the endpoint
+    assert msg.sender == OApp.endpoint.address, "OApp: only endpoint"
+
+    # Verify that the compose message was queued by this OApp
+    assert _from == self, "OApp: invalid compose sender"
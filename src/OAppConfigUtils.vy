@@ -61,6 +61,9 @@ CONFIG_TYPE_ULN: constant(uint32) = 0
 CONFIG_TYPE_EXECUTOR: constant(uint32) = 1
 CONFIG_TYPE_READ: constant(uint32) = 2
 
+# Default max message size of executor configs, can be adjusted as needed
+EXECUTOR_MAX_MESSAGE_SIZE: constant(uint32) = 1024
+
 
 ################################################################
 #                           STORAGE                            #
@@ -352,7 +355,7 @@ def setExecutorConfigs(
     for i: uint256 in range(items_count, bound=MAX_CONFIG_ITEMS):
         # Create the Executor config
         executor_config: ULNExecutorConfig = ULNExecutorConfig(
-            max_message_size=1024, executor=_executors[i]  # Default size, can be adjusted as needed
+            max_message_size=EXECUTOR_MAX_MESSAGE_SIZE, executor=_executors[i]
         )
 
         # Create the config parameter
@@ -0,0 +1,144 @@
+# pragma version 0.4.3
+
+"""
+@title OAppEvents - Message events with a lightweight mode for high-volume apps
+
+@notice App-level events for sent and received messages, in one of two modes chosen at
+deployment. Full mode logs the payload (PayloadSent, PayloadReceived), so log data gas
+grows with the message size. Light mode logs (eid, guid, nonce, keccak256(payload), length)
+instead (PayloadHashSent, PayloadHashReceived), a fixed-size event: indexers get the payload
+from the endpoint's own PacketSent event, whose encoded packet holds the same guid and
+message, and can check it against payloadHash. Light mode is cheaper at any message size and
+saves about 8 gas per payload byte (see tests/benchmarks/test_gas_light_events.py).
+
+@dev Usage in the main contract:
+    initializes: OAppEvents
+    ...
+    OAppEvents.__init__(_lightEvents)
+    ...
+    receipt: OApp.MessagingReceipt = OApp._lzSend(_dstEid, message, options, fee, msg.sender)
+    OAppEvents._logSent(_dstEid, receipt, message)
+    ...
+    # in lzReceive, after the origin checks
+    OAppEvents._logReceived(_origin, _guid, _message)
+
+and export OAppEvents.lightEvents for off-chain tooling to pick the events to follow.
+
+@license Copyright (c) Curve.Fi, 2025 - all rights reserved
+
+@author curve.fi
+
+@custom:security security@curve.fi
+"""
+
+################################################################
+#                            MODULES                           #
+################################################################
+
+# Message types and size limits only, no OApp state is used
+from . import OApp
+
+################################################################
+#                            EVENTS                            #
+################################################################
+
+event PayloadSent:
+    dstEid: uint32
+    guid: bytes32
+    nonce: uint64
+    payload: Bytes[OApp.MAX_MESSAGE_SIZE]
+
+
+event PayloadReceived:
+    srcEid: uint32
+    guid: bytes32
+    nonce: uint64
+    payload: Bytes[OApp.MAX_MESSAGE_SIZE]
+
+
+event PayloadHashSent:
+    dstEid: uint32
+    guid: bytes32
+    nonce: uint64
+    payloadHash: bytes32
+    length: uint256
+
+
+event PayloadHashReceived:
+    srcEid: uint32
+    guid: bytes32
+    nonce: uint64
+    payloadHash: bytes32
+    length: uint256
+
+
+################################################################
+#                           STORAGE                            #
+################################################################
+
+# True: PayloadHash* events, False: Payload* events
+lightEvents: public(immutable(bool))
+
+################################################################
+#                         CONSTRUCTOR                          #
+################################################################
+
+@deploy
+def __init__(_lightEvents: bool):
+    """
+    @notice Initialize the event mode
+    @param _lightEvents True to log payload hashes and lengths instead of payloads.
+    """
+    lightEvents = _lightEvents
+
+
+################################################################
+#                      INTERNAL FUNCTIONS                      #
+################################################################
+
+@internal
+def _logSent(
+    _dstEid: uint32, _receipt: OApp.MessagingReceipt, _message: Bytes[OApp.MAX_MESSAGE_SIZE]
+):
+    """
+    @notice Log a sent message in the configured mode
+    @param _dstEid The destination endpoint ID.
+    @param _receipt The receipt returned by OApp._lzSend.
+    @param _message The message payload.
+    """
+    if lightEvents:
+        log PayloadHashSent(
+            dstEid=_dstEid,
+            guid=_receipt.guid,
+            nonce=_receipt.nonce,
+            payloadHash=keccak256(_message),
+            length=len(_message),
+        )
+    else:
+        log PayloadSent(
+            dstEid=_dstEid, guid=_receipt.guid, nonce=_receipt.nonce, payload=_message
+        )
+
+
+@internal
+def _logReceived(
+    _origin: OApp.Origin, _guid: bytes32, _message: Bytes[OApp.MAX_MESSAGE_SIZE]
+):
+    """
+    @notice Log a received message in the configured mode
+    @param _origin The origin of the message (srcEid, sender, nonce).
+    @param _guid The unique identifier of the message.
+    @param _message The message payload.
+    """
+    if lightEvents:
+        log PayloadHashReceived(
+            srcEid=_origin.srcEid,
+            guid=_guid,
+            nonce=_origin.nonce,
+            payloadHash=keccak256(_message),
+            length=len(_message),
+        )
+    else:
+        log PayloadReceived(
+            srcEid=_origin.srcEid, guid=_guid, nonce=_origin.nonce, payload=_message
+        )
@@ -0,0 +1,147 @@
+# pragma version 0.4.3
+
+"""
+@title OAppFactory - Deterministic OApp deployments from blueprints
+
+@notice Deploys OApp-based contracts (e.g. one per market and per chain) from an on-chain
+ERC-5202 blueprint with CREATE2. The bytecode is stored once as a blueprint, every instance
+only pays for its own runtime code and constructor.
+
+@dev Addresses only depend on this factory address, the blueprint initcode (bytecode and
+constructor arguments) and a salt mixed with the caller, so the same deployer gets the same
+address on every chain where factory, blueprint initcode and args match. Peers can therefore
+be precomputed (computeAddress, or scripts/DeterministicAddress.py) before anything is
+deployed. Mixing msg.sender into the salt keeps others from taking a precomputed address.
+
+Minimal proxies are not supported: OApp keeps its endpoint (and OAppFixedPeers its peers)
+in immutables, which live in the implementation code and cannot be set per proxy.
+
+Note: OAppExample-style constructors take ownership from tx.origin, i.e. the account
+calling this factory.
+
+@license Copyright (c) Curve.Fi, 2025 - all rights reserved
+
+@author curve.fi
+
+@custom:security security@curve.fi
+"""
+
+################################################################
+#                            EVENTS                            #
+################################################################
+
+event OAppDeployed:
+    deployer: indexed(address)
+    blueprint: indexed(address)
+    instance: address
+    salt: bytes32
+
+
+################################################################
+#                           CONSTANTS                          #
+################################################################
+
+# ABI-encoded constructor arguments size limit
+MAX_CONSTRUCTOR_ARGS_SIZE: constant(uint256) = 1024
+
+# Batch size limit for deployments
+MAX_DEPLOYMENTS: constant(uint256) = 16
+
+
+################################################################
+#                      DEPLOYMENT FUNCTIONS                    #
+################################################################
+
+@external
+def deploy(
+    _blueprint: address, _constructorArgs: Bytes[MAX_CONSTRUCTOR_ARGS_SIZE], _salt: bytes32
+) -> address:
+    """
+    @notice Deploy an OApp instance from a blueprint with CREATE2
+    @param _blueprint ERC-5202 blueprint address
+    @param _constructorArgs ABI-encoded constructor arguments
+    @param _salt Salt, mixed with msg.sender
+    @return The deployed instance address
+    """
+    return self._deploy(_blueprint, _constructorArgs, _salt)
+
+
+@external
+def deployMany(
+    _blueprint: address,
+    _constructorArgs: DynArray[Bytes[MAX_CONSTRUCTOR_ARGS_SIZE], MAX_DEPLOYMENTS],
+    _salts: DynArray[bytes32, MAX_DEPLOYMENTS],
+) -> DynArray[address, MAX_DEPLOYMENTS]:
+    """
+    @notice Deploy multiple OApp instances from the same blueprint in a single transaction
+    @param _blueprint ERC-5202 blueprint address
+    @param _constructorArgs Array of ABI-encoded constructor arguments
+    @param _salts Array of salts (must match _constructorArgs length)
+    @return Array of deployed instance addresses
+    """
+    assert len(_constructorArgs) == len(_salts), "OAppFactory: Array length mismatch"
+
+    instances: DynArray[address, MAX_DEPLOYMENTS] = []
+    for i: uint256 in range(len(_salts), bound=MAX_DEPLOYMENTS):
+        instances.append(self._deploy(_blueprint, _constructorArgs[i], _salts[i]))
+
+    return instances
+
+
+@internal
+def _deploy(
+    _blueprint: address, _constructorArgs: Bytes[MAX_CONSTRUCTOR_ARGS_SIZE], _salt: bytes32
+) -> address:
+    """
+    @notice Internal function to deploy from blueprint and log the deployment
+    @param _blueprint ERC-5202 blueprint address
+    @param _constructorArgs ABI-encoded constructor arguments
+    @param _salt Salt, mixed with msg.sender
+    @return The deployed instance address
+    """
+    instance: address = create_from_blueprint(
+        _blueprint,
+        _constructorArgs,
+        raw_args=True,
+        salt=self._deployerSalt(msg.sender, _salt),
+    )
+
+    log OAppDeployed(deployer=msg.sender, blueprint=_blueprint, instance=instance, salt=_salt)
+    return instance
+
+
+################################################################
+#                        VIEW FUNCTIONS                        #
+################################################################
+
+@external
+@view
+def computeAddress(_initcodeHash: bytes32, _salt: bytes32, _deployer: address) -> address:
+    """
+    @notice Compute the address of an instance before deployment
+    @param _initcodeHash keccak256 of blueprint code (without ERC-5202 preamble) ++ constructor args
+    @param _salt Salt passed to deploy/deployMany
+    @param _deployer Account calling deploy/deployMany
+    @return The CREATE2 address
+    """
+    digest: bytes32 = keccak256(
+        concat(
+            b"\xff",
+            convert(self, bytes20),
+            self._deployerSalt(_deployer, _salt),
+            _initcodeHash,
+        )
+    )
+    return convert(convert(digest, uint256) & convert(max_value(uint160), uint256), address)
+
+
+@internal
+@pure
+def _deployerSalt(_deployer: address, _salt: bytes32) -> bytes32:
+    """
+    @notice Internal function to mix the deployer into the salt
+    @param _deployer Account calling deploy/deployMany
+    @param _salt User-provided salt
+    @return The CREATE2 salt
+    """
+    return keccak256(concat(convert(_deployer, bytes32), _salt))
@@ -0,0 +1,334 @@
+# pragma version 0.4.3
+
+"""
+@title OAppFixedPeers - Immutable peers for fixed-topology deployments
+
+@notice OApp variant where a small set of (eid, peer) pairs is fixed at deployment.
+Fixed peers live in immutables (contract code), so _quote, _lzSend, _lzReceive and
+allowInitializePath resolve them without a storage read. Eids outside the fixed set fall
+back to the OApp peers mapping and are managed as usual.
+
+@dev Up to MAX_FIXED_PEERS eids are packed into a single uint256 (8 x uint32), peers are kept
+in a static bytes32 array. Main contract must use this module's peer functions
+(peers, getPeers, setPeer, setPeers, setReadChannel, allowInitializePath) instead of OApp's,
+and its _quote/_lzSend/_lzReceive instead of OApp's. Fixed peers cannot be changed or removed.
+
+@license Copyright (c) Curve.Fi, 2025 - all rights reserved
+
+@author curve.fi
+
+@custom:security security@curve.fi
+"""
+
+################################################################
+#                            MODULES                           #
+################################################################
+
+# Ownership management. Must be initialized in main contract.
+from snekmate.auth import ownable
+
+uses: ownable
+
+# Non-fixed peers are stored in OApp. Must be initialized in main contract.
+from . import OApp
+
+uses: OApp
+
+# Vyper-specific constants
+from . import VyperConstants as constants
+
+################################################################
+#                           CONSTANTS                          #
+################################################################
+
+MAX_FIXED_PEERS: constant(uint256) = constants.MAX_FIXED_PEERS
+MAX_CONFIG_ITEMS: constant(uint256) = constants.MAX_CONFIG_ITEMS
+
+EID_MASK: constant(uint256) = 2**32 - 1
+EID_BITS: constant(uint256) = 32
+
+################################################################
+#                           STORAGE                            #
+################################################################
+
+# Fixed eids packed as uint32 words, first eid in the lowest bits
+FIXED_EIDS: immutable(uint256)
+FIXED_PEERS: immutable(bytes32[MAX_FIXED_PEERS])
+FIXED_COUNT: immutable(uint256)
+
+################################################################
+#                         CONSTRUCTOR                          #
+################################################################
+
+@deploy
+def __init__(
+    _eids: DynArray[uint32, MAX_FIXED_PEERS], _peers: DynArray[bytes32, MAX_FIXED_PEERS]
+):
+    """
+    @notice Initialize fixed peers
+    @param _eids Array of endpoint IDs with a fixed peer
+    @param _peers Array of peer addresses (must match _eids length)
+    @dev Emits OApp.PeerSet for every fixed peer, so off-chain tooling sees them as regular peers.
+    """
+    assert len(_eids) == len(_peers), "OApp: Array length mismatch"
+
+    packed: uint256 = 0
+    peers: bytes32[MAX_FIXED_PEERS] = empty(bytes32[MAX_FIXED_PEERS])
+    for i: uint256 in range(len(_eids), bound=MAX_FIXED_PEERS):
+        assert _eids[i] != 0, "OApp: invalid fixed eid"
+        assert _peers[i] != empty(bytes32), "OApp: invalid fixed peer"
+        for j: uint256 in range(i, bound=MAX_FIXED_PEERS):
+            assert _eids[j] != _eids[i], "OApp: duplicate fixed eid"
+
+        packed |= convert(_eids[i], uint256) << (EID_BITS * i)
+        peers[i] = _peers[i]
+
+        log OApp.PeerSet(eid=_eids[i], peer=_peers[i])
+
+    FIXED_EIDS = packed
+    FIXED_PEERS = peers
+    FIXED_COUNT = len(_eids)
+
+
+################################################################
+#                       PEER MANAGEMENT                        #
+################################################################
+
+@external
+@view
+def peers(_eid: uint32) -> bytes32:
+    """
+    @notice Returns the peer for an endpoint, fixed or stored.
+    @param _eid The endpoint ID.
+    @return peer The peer address, bytes32(0) if not set.
+    """
+    return self._getPeer(_eid)
+
+
+@external
+@view
+def getPeers(_eids: DynArray[uint32, MAX_CONFIG_ITEMS]) -> DynArray[bytes32, MAX_CONFIG_ITEMS]:
+    """
+    @notice Returns the peer addresses for multiple endpoints in a single call.
+    @param _eids Array of endpoint IDs.
+    @return peers Array of peers, bytes32(0) where no peer is set.
+    """
+    peers: DynArray[bytes32, MAX_CONFIG_ITEMS] = []
+    for eid: uint32 in _eids:
+        peers.append(self._getPeer(eid))
+
+    return peers
+
+
+@external
+@view
+def isFixedPeer(_eid: uint32) -> bool:
+    """
+    @notice Checks whether the peer for an endpoint is fixed at deployment.
+    @param _eid The endpoint ID.
+    @return Whether the peer is fixed.
+    """
+    return self._fixedPeer(_eid) != empty(bytes32)
+
+
+@external
+def setPeer(_eid: uint32, _peer: bytes32):
+    """
+    @notice Sets the peer address for an endpoint without a fixed peer.
+    @param _eid The endpoint ID.
+    @param _peer The address of the peer to be associated with the corresponding endpoint.
+    @dev Only the owner/admin of the OApp can call this function.
+    """
+    ownable._check_owner()
+
+    self._setPeer(_eid, _peer)
+
+
+@external
+def setPeers(
+    _eids: DynArray[uint32, MAX_CONFIG_ITEMS], _peers: DynArray[bytes32, MAX_CONFIG_ITEMS]
+):
+    """
+    @notice Sets the peer addresses for multiple endpoints without a fixed peer.
+    @param _eids Array of endpoint IDs.
+    @param _peers Array of peer addresses (must match _eids length).
+    @dev Only the owner/admin of the OApp can call this function.
+    """
+    ownable._check_owner()
+
+    assert len(_eids) == len(_peers), "OApp: Array length mismatch"
+
+    for i: uint256 in range(len(_eids), bound=MAX_CONFIG_ITEMS):
+        self._setPeer(_eids[i], _peers[i])
+
+
+@external
+def setReadChannel(_channelId: uint32, _active: bool):
+    """
+    @notice Set or unset a read channel without a fixed peer
+    @param _channelId The channel ID to use for read requests
+    @param _active Whether to activate or deactivate the channel
+    """
+    ownable._check_owner()
+
+    peer: bytes32 = convert(self, bytes32) if _active else convert(empty(address), bytes32)
+    self._setPeer(_channelId, peer)
+
+
+@internal
+def _setPeer(_eid: uint32, _peer: bytes32):
+    """
+    @notice Internal function to set a stored peer, reverts for fixed eids
+    @param _eid The endpoint ID.
+    @param _peer The peer address.
+    """
+    assert self._fixedPeer(_eid) == empty(bytes32), "OApp: fixed peer"
+
+    OApp._setPeer(_eid, _peer)
+
+
+@view
+@internal
+def _fixedPeer(_eid: uint32) -> bytes32:
+    """
+    @notice Internal function to look up a fixed peer, no storage reads.
+    @param _eid The endpoint ID.
+    @return peer The fixed peer, bytes32(0) if the eid has no fixed peer.
+    """
+    packed: uint256 = FIXED_EIDS
+    eid: uint256 = convert(_eid, uint256)
+    for i: uint256 in range(FIXED_COUNT, bound=MAX_FIXED_PEERS):
+        if (packed & EID_MASK) == eid:
+            return FIXED_PEERS[i]
+        packed >>= EID_BITS
+
+    return empty(bytes32)
+
+
+@view
+@internal
+def _getPeer(_eid: uint32) -> bytes32:
+    """
+    @notice Internal function to get the peer, fixed peers first, then the peers mapping.
+    @param _eid The endpoint ID.
+    @return peer The peer address, bytes32(0) if not set.
+    """
+    peer: bytes32 = self._fixedPeer(_eid)
+    if peer == empty(bytes32):
+        peer = OApp.peers[_eid]
+
+    return peer
+
+
+@view
+@internal
+def _getPeerOrRevert(_eid: uint32) -> bytes32:
+    """
+    @notice Internal function to get the peer address; reverts if NOT set.
+    @param _eid The endpoint ID.
+    @return peer The address of the peer associated with the specified endpoint.
+    """
+    peer: bytes32 = self._getPeer(_eid)
+    assert peer != empty(bytes32), "OApp: no peer"
+    return peer
+
+
+################################################################
+#                         OAppReceiver                         #
+################################################################
+
+@external
+@view
+def allowInitializePath(_origin: OApp.Origin) -> bool:
+    """
+    @notice Checks if the path initialization is allowed based on the provided origin.
+    @param _origin The origin information containing the source endpoint and sender address.
+    @return Whether the path has been initialized.
+    """
+    return self._getPeer(_origin.srcEid) == _origin.sender
+
+
+@internal
+@view
+def _lzReceive(
+    _origin: OApp.Origin,
+    _guid: bytes32,
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+    _executor: address,
+    _extraData: Bytes[OApp.MAX_EXTRA_DATA_SIZE],
+):
+    """
+    @dev Same as OApp._lzReceive, must be called first in external lzReceive implementation.
+    @param _origin The origin information containing the source endpoint and sender address.
+    @param _guid The unique identifier for the received LayerZero message.
+    @param _message The payload of the received message.
+    @param _executor The address of the executor for the received message.
+    @param _extraData Additional arbitrary data provided by the corresponding executor.
+    """
+    # Verify that the sender is the endpoint
+    assert msg.sender == OApp.endpoint.address, "OApp: only endpoint"
+
+    # Verify that the message comes from a trusted peer
+    assert self._getPeerOrRevert(_origin.srcEid) == _origin.sender, "OApp: invalid sender"
+
+
+@internal
+@view
+def _lzReceiveOrigin(_origin: OApp.Origin):
+    """
+    @dev Same as OApp._lzReceiveOrigin, with fixed peer lookup.
+    @param _origin The origin information containing the source endpoint and sender address.
+    """
+    # Verify that the sender is the endpoint
+    assert msg.sender == OApp.endpoint.address, "OApp: only endpoint"
+
+    # Verify that the message comes from a trusted peer
+    assert self._getPeerOrRevert(_origin.srcEid) == _origin.sender, "OApp: invalid sender"
+
+
+################################################################
+#                         OAppSender                           #
+################################################################
+
+@internal
+@view
+def _quote(
+    _dstEid: uint32,
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+    _options: Bytes[OApp.MAX_OPTIONS_TOTAL_SIZE],
+    _payInLzToken: bool,
+) -> OApp.MessagingFee:
+    """
+    @dev Same as OApp._quote, with fixed peer lookup.
+    @param _dstEid The destination endpoint ID.
+    @param _message The message payload.
+    @param _options Additional options for the message.
+    @param _payInLzToken Flag indicating whether to pay the fee in LZ tokens.
+    @return fee The calculated MessagingFee for the message.
+    """
+    return OApp._quoteToPeer(
+        _dstEid, self._getPeerOrRevert(_dstEid), _message, _options, _payInLzToken
+    )
+
+
+@internal
+@payable
+def _lzSend(
+    _dstEid: uint32,
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+    _options: Bytes[OApp.MAX_OPTIONS_TOTAL_SIZE],
+    _fee: OApp.MessagingFee,
+    _refundAddress: address,
+) -> OApp.MessagingReceipt:
+    """
+    @dev Same as OApp._lzSend, with fixed peer lookup.
+    @param _dstEid The destination endpoint ID.
+    @param _message The message payload.
+    @param _options Additional options for the message.
+    @param _fee The calculated LayerZero fee for the message.
+    @param _refundAddress The address to receive any excess fee values sent to the endpoint.
+    @return receipt The receipt for the sent message.
+    """
+    return OApp._lzSendToPeer(
+        _dstEid, self._getPeerOrRevert(_dstEid), _message, _options, _fee, _refundAddress
+    )
@@ -0,0 +1,213 @@
+# pragma version 0.4.3
+
+"""
+@title OAppGasTank - Pay native fees from the OApp's own balance
+
+@notice Gas-tank mode for keeper-driven sends: native fees are paid from a pre-funded
+contract balance instead of msg.value. Spending is bounded per caller and per destination
+eid by owner-set allowances, and the endpoint refunds any excess back to the contract, so
+the tank recycles its own refunds.
+
+@dev Usage in the main contract:
+    @external
+    def push(_dstEid: uint32, ...):
+        fee: OApp.MessagingFee = OApp._quote(_dstEid, message, options, False)
+        OAppGasTank._lzSendFromTank(_dstEid, message, options, fee.nativeFee)
+
+    @external
+    @payable
+    def __default__():
+        pass  # endpoint refunds
+
+Allowances are budgets in wei that are consumed by the fee actually charged by the endpoint
+(receipt.fee). max_value(uint256) means unlimited and is never decremented. LZ token fees
+are not supported in gas-tank mode.
+
+The tank is tracked in tankBalance, not self.balance: native tokens received otherwise
+(e.g. lzReceive value, other payable functions of the main contract) can neither be spent
+on fees nor withdrawn with withdrawTank.
+
+@license Copyright (c) Curve.Fi, 2025 - all rights reserved
+
+@author curve.fi
+
+@custom:security security@curve.fi
+"""
+
+################################################################
+#                            MODULES                           #
+################################################################
+
+# Ownership management. Must be initialized in main contract.
+from snekmate.auth import ownable
+
+uses: ownable
+
+# Endpoint and peers. Must be initialized in main contract.
+from . import OApp
+
+uses: OApp
+
+################################################################
+#                            EVENTS                            #
+################################################################
+
+event TankFunded:
+    sender: indexed(address)
+    amount: uint256
+
+
+event TankWithdrawn:
+    receiver: indexed(address)
+    amount: uint256
+
+
+event TankSpent:
+    spender: indexed(address)
+    dstEid: indexed(uint32)
+    guid: bytes32
+    nativeFee: uint256
+
+
+event SpenderAllowanceSet:
+    spender: indexed(address)
+    allowance: uint256
+
+
+event EidAllowanceSet:
+    eid: indexed(uint32)
+    allowance: uint256
+
+
+################################################################
+#                           STORAGE                            #
+################################################################
+
+# Native tokens in the tank: funded with fundTank, minus fees spent and withdrawals
+tankBalance: public(uint256)
+
+# Remaining native fee budget per caller of _lzSendFromTank
+spenderAllowance: public(HashMap[address, uint256])
+
+# Remaining native fee budget per destination eid
+eidAllowance: public(HashMap[uint32, uint256])
+
+
+################################################################
+#                       TANK MANAGEMENT                        #
+################################################################
+
+@external
+@payable
+def fundTank():
+    """
+    @notice Add native tokens to the gas tank
+    """
+    self.tankBalance += msg.value
+    log TankFunded(sender=msg.sender, amount=msg.value)
+
+
+@external
+def withdrawTank(_receiver: address, _amount: uint256):
+    """
+    @notice Withdraw native tokens from the gas tank
+    @param _receiver The address to receive the tokens.
+    @param _amount The amount to withdraw.
+    @dev Only the owner/admin of the OApp can call this function.
+    """
+    ownable._check_owner()
+
+    tank_balance: uint256 = self.tankBalance
+    assert tank_balance >= _amount, "OApp: insufficient tank balance"
+    self.tankBalance = tank_balance - _amount
+    send(_receiver, _amount)
+    log TankWithdrawn(receiver=_receiver, amount=_amount)
+
+
+@external
+def setSpenderAllowance(_spender: address, _allowance: uint256):
+    """
+    @notice Set the native fee budget of a caller
+    @param _spender The caller of the send function backed by the tank (e.g. a keeper).
+    @param _allowance The budget in wei, max_value(uint256) for unlimited.
+    @dev Only the owner/admin of the OApp can call this function.
+    """
+    ownable._check_owner()
+
+    self.spenderAllowance[_spender] = _allowance
+    log SpenderAllowanceSet(spender=_spender, allowance=_allowance)
+
+
+@external
+def setEidAllowance(_eid: uint32, _allowance: uint256):
+    """
+    @notice Set the native fee budget of a destination
+    @param _eid The destination endpoint ID.
+    @param _allowance The budget in wei, max_value(uint256) for unlimited.
+    @dev Only the owner/admin of the OApp can call this function.
+    """
+    ownable._check_owner()
+
+    self.eidAllowance[_eid] = _allowance
+    log EidAllowanceSet(eid=_eid, allowance=_allowance)
+
+
+################################################################
+#                         SEND FUNCTIONS                       #
+################################################################
+
+@internal
+def _lzSendFromTank(
+    _dstEid: uint32,
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+    _options: Bytes[OApp.MAX_OPTIONS_TOTAL_SIZE],
+    _nativeFee: uint256,
+) -> OApp.MessagingReceipt:
+    """
+    @notice Send a message paying the native fee from the contract balance
+    @param _dstEid The destination endpoint ID.
+    @param _message The message payload.
+    @param _options Additional options for the message.
+    @param _nativeFee The native fee to forward, excess is refunded to this contract.
+    @return receipt The receipt for the sent message.
+    @dev msg.value is not required, msg.sender is charged against spenderAllowance.
+    """
+    spender_allowance: uint256 = self.spenderAllowance[msg.sender]
+    eid_allowance: uint256 = self.eidAllowance[_dstEid]
+    assert spender_allowance >= _nativeFee, "OApp: spender allowance exceeded"
+    assert eid_allowance >= _nativeFee, "OApp: eid allowance exceeded"
+    tank_balance: uint256 = self.tankBalance
+    assert tank_balance >= _nativeFee, "OApp: insufficient tank balance"
+
+    # Reserve the full fee before the external call
+    self.tankBalance = tank_balance - _nativeFee
+    unlimited_spender: bool = spender_allowance == max_value(uint256)
+    unlimited_eid: bool = eid_allowance == max_value(uint256)
+    if not unlimited_spender:
+        self.spenderAllowance[msg.sender] = spender_allowance - _nativeFee
+    if not unlimited_eid:
+        self.eidAllowance[_dstEid] = eid_allowance - _nativeFee
+
+    receipt: OApp.MessagingReceipt = extcall OApp.endpoint.send(
+        OApp.MessagingParams(
+            dstEid=_dstEid,
+            receiver=OApp._getPeerOrRevert(_dstEid),
+            message=_message,
+            options=_options,
+            payInLzToken=False,
+        ),
+        self,
+        value=_nativeFee,
+    )
+
+    # Only the fee actually taken by the endpoint is charged, refunds stay in the tank
+    spent: uint256 = receipt.fee.nativeFee
+    if spent < _nativeFee:
+        self.tankBalance += _nativeFee - spent
+        if not unlimited_spender:
+            self.spenderAllowance[msg.sender] += _nativeFee - spent
+        if not unlimited_eid:
+            self.eidAllowance[_dstEid] += _nativeFee - spent
+
+    log TankSpent(spender=msg.sender, dstEid=_dstEid, guid=receipt.guid, nativeFee=spent)
+    return receipt
@@ -0,0 +1,267 @@
+# pragma version 0.4.3
+
+"""
+@title OAppNonblocking - Non-blocking receive with failed-message store and retries
+
+@notice Receiver module that keeps pathways flowing when the app's receive logic reverts.
+The handler runs in a self-call; if it fails, only the payload hash is stored per
+(srcEid, sender, nonce) and MessageFailed is emitted. Failed messages can then be retried,
+one by one or in bulk, by anyone holding the original payload (owner, keeper, or relayer):
+the stored hash guarantees that only the original message is executed.
+
+@dev Usage in the main contract:
+    @external
+    @payable
+    def lzReceive(_origin, _guid, _message, _executor, _extraData):
+        OAppNonblocking._lzReceive(_origin, _guid, _message, _executor, _extraData)
+
+    @external
+    def nonblockingLzReceive(_origin: OApp.Origin, _guid: bytes32, _message: Bytes[...]):
+        OAppNonblocking._checkSelf()
+        ... app logic ...
+
+and export OAppNonblocking.retryMessage, OAppNonblocking.retryMessages and
+OAppNonblocking.failedMessages. GAS_RESERVE is kept back from the handler, so a handler
+running out of gas is stored as failed instead of reverting lzReceive.
+
+@license Copyright (c) Curve.Fi, 2025 - all rights reserved
+
+@author curve.fi
+
+@custom:security security@curve.fi
+"""
+
+################################################################
+#                            MODULES                           #
+################################################################
+
+# Origin checks and peers. Must be initialized in main contract.
+from . import OApp
+
+uses: OApp
+
+################################################################
+#                            EVENTS                            #
+################################################################
+
+event MessageFailed:
+    srcEid: indexed(uint32)
+    sender: indexed(bytes32)
+    nonce: uint64
+    guid: bytes32
+    payloadHash: bytes32
+    reason: Bytes[MAX_REASON_SIZE]
+
+
+event MessageRetried:
+    srcEid: indexed(uint32)
+    sender: indexed(bytes32)
+    nonce: uint64
+    guid: bytes32
+    payloadHash: bytes32
+
+
+################################################################
+#                           CONSTANTS                          #
+################################################################
+
+NONBLOCKING_LZ_RECEIVE: constant(Bytes[4]) = method_id(
+    "nonblockingLzReceive((uint32,bytes32,uint64),bytes32,bytes)"
+)
+
+# Gas kept back from the handler to store the failed message and log MessageFailed
+GAS_RESERVE: constant(uint256) = 40000
+
+# Revert reason bytes kept in MessageFailed
+MAX_REASON_SIZE: constant(uint256) = 128
+
+# Batch size limit for retryMessages
+MAX_RETRY_MESSAGES: constant(uint256) = 16
+
+# Gas a batch retry must have left, on top of GAS_RESERVE, to run the next handler
+MIN_RETRY_GAS: constant(uint256) = 50000
+
+################################################################
+#                           STRUCTS                            #
+################################################################
+
+struct FailedMessage:
+    origin: OApp.Origin
+    guid: bytes32
+    message: Bytes[OApp.MAX_MESSAGE_SIZE]
+
+
+################################################################
+#                           STORAGE                            #
+################################################################
+
+# srcEid -> sender -> nonce -> keccak256(guid ++ message), empty if not failed
+failedMessages: public(HashMap[uint32, HashMap[bytes32, HashMap[uint64, bytes32]]])
+
+
+################################################################
+#                        RECEIVE FUNCTIONS                     #
+################################################################
+
+@internal
+def _lzReceive(
+    _origin: OApp.Origin,
+    _guid: bytes32,
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+    _executor: address,
+    _extraData: Bytes[OApp.MAX_EXTRA_DATA_SIZE],
+):
+    """
+    @notice Validate origin and run the handler without reverting on its failure
+    @dev Must be called from the external lzReceive implementation.
+    @param _origin The origin information containing the source endpoint and sender address.
+    @param _guid The unique identifier for the received LayerZero message.
+    @param _message The payload of the received message.
+    @param _executor The address of the executor for the received message.
+    @param _extraData Additional arbitrary data provided by the corresponding executor.
+    """
+    OApp._lzReceiveOrigin(_origin)
+
+    success: bool = False
+    reason: Bytes[MAX_REASON_SIZE] = b""
+    success, reason = raw_call(
+        self,
+        abi_encode(_origin, _guid, _message, method_id=NONBLOCKING_LZ_RECEIVE),
+        max_outsize=MAX_REASON_SIZE,
+        gas=msg.gas - GAS_RESERVE,
+        revert_on_failure=False,
+    )
+
+    if not success:
+        self._storeFailedMessage(_origin, _guid, _message, reason)
+
+
+@internal
+@view
+def _checkSelf():
+    """
+    @notice Restrict nonblockingLzReceive to self-calls from _lzReceive and retries
+    """
+    assert msg.sender == self, "OApp: only self"
+
+
+@internal
+def _storeFailedMessage(
+    _origin: OApp.Origin,
+    _guid: bytes32,
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+    _reason: Bytes[MAX_REASON_SIZE],
+):
+    """
+    @notice Internal function to store the payload hash of a failed message
+    @param _origin The origin of the failed message.
+    @param _guid The unique identifier of the failed message.
+    @param _message The payload of the failed message.
+    @param _reason Revert data of the handler (truncated).
+    """
+    payload_hash: bytes32 = keccak256(concat(_guid, _message))
+    self.failedMessages[_origin.srcEid][_origin.sender][_origin.nonce] = payload_hash
+
+    log MessageFailed(
+        srcEid=_origin.srcEid,
+        sender=_origin.sender,
+        nonce=_origin.nonce,
+        guid=_guid,
+        payloadHash=payload_hash,
+        reason=_reason,
+    )
+
+
+################################################################
+#                         RETRY FUNCTIONS                      #
+################################################################
+
+@external
+def retryMessage(
+    _origin: OApp.Origin, _guid: bytes32, _message: Bytes[OApp.MAX_MESSAGE_SIZE]
+):
+    """
+    @notice Retry a failed message, reverts if the handler fails again
+    @param _origin The origin of the failed message.
+    @param _guid The unique identifier of the failed message.
+    @param _message The original payload.
+    @dev Callable by anyone, only the stored payload can be executed.
+    """
+    payload_hash: bytes32 = self._consumeFailedMessage(_origin, _guid, _message)
+
+    raw_call(self, abi_encode(_origin, _guid, _message, method_id=NONBLOCKING_LZ_RECEIVE))
+
+    log MessageRetried(
+        srcEid=_origin.srcEid,
+        sender=_origin.sender,
+        nonce=_origin.nonce,
+        guid=_guid,
+        payloadHash=payload_hash,
+    )
+
+
+@external
+def retryMessages(
+    _messages: DynArray[FailedMessage, MAX_RETRY_MESSAGES]
+) -> DynArray[bool, MAX_RETRY_MESSAGES]:
+    """
+    @notice Retry multiple failed messages in a single transaction
+    @param _messages Array of failed messages with their original payloads.
+    @return Array of flags, True where the retry succeeded.
+    @dev Callable by anyone. Messages failing again stay stored (MessageFailed is emitted
+    again), they do not revert the batch. Invalid payloads revert the batch. The batch stops
+    when less than GAS_RESERVE + MIN_RETRY_GAS is left (e.g. after a handler ran out of gas):
+    the remaining messages stay stored and the returned array is shorter than _messages.
+    """
+    results: DynArray[bool, MAX_RETRY_MESSAGES] = []
+    for m: FailedMessage in _messages:
+        if msg.gas < GAS_RESERVE + MIN_RETRY_GAS:
+            break
+
+        payload_hash: bytes32 = self._consumeFailedMessage(m.origin, m.guid, m.message)
+
+        success: bool = False
+        reason: Bytes[MAX_REASON_SIZE] = b""
+        success, reason = raw_call(
+            self,
+            abi_encode(m.origin, m.guid, m.message, method_id=NONBLOCKING_LZ_RECEIVE),
+            max_outsize=MAX_REASON_SIZE,
+            gas=msg.gas - GAS_RESERVE,
+            revert_on_failure=False,
+        )
+
+        if success:
+            log MessageRetried(
+                srcEid=m.origin.srcEid,
+                sender=m.origin.sender,
+                nonce=m.origin.nonce,
+                guid=m.guid,
+                payloadHash=payload_hash,
+            )
+        else:
+            self._storeFailedMessage(m.origin, m.guid, m.message, reason)
+
+        results.append(success)
+
+    return results
+
+
+@internal
+def _consumeFailedMessage(
+    _origin: OApp.Origin, _guid: bytes32, _message: Bytes[OApp.MAX_MESSAGE_SIZE]
+) -> bytes32:
+    """
+    @notice Internal function to check a payload against the store and clear it
+    @param _origin The origin of the failed message.
+    @param _guid The unique identifier of the failed message.
+    @param _message The original payload.
+    @return The payload hash.
+    """
+    stored_hash: bytes32 = self.failedMessages[_origin.srcEid][_origin.sender][_origin.nonce]
+    assert stored_hash != empty(bytes32), "OApp: no failed message"
+
+    payload_hash: bytes32 = keccak256(concat(_guid, _message))
+    assert payload_hash == stored_hash, "OApp: invalid payload"
+
+    self.failedMessages[_origin.srcEid][_origin.sender][_origin.nonce] = empty(bytes32)
+    return payload_hash
@@ -0,0 +1,200 @@
+# pragma version 0.4.3
+
+"""
+@title OAppPathways - Single-transaction pathway onboarding
+
+@notice Combines OAppConfigUtils-style endpoint configuration with OApp peer management,
+so a whole batch of pathways (send/receive libraries, DVN/read configs, executor configs
+and peers) can be applied by the owner in one transaction.
+
+@dev Regular pathways get the ULN (DVN) config on both the send and the receive library,
+and the executor config on the send library. Read channels (eid > OApp.READ_CHANNEL_THRESHOLD)
+get a ULN Read config on the send library (the read library serves both directions).
+Empty peer/library/executor/DVN fields leave the corresponding setting untouched (peers are
+removed with OApp.setPeer).
+
+@license Copyright (c) Curve.Fi, 2025 - all rights reserved
+
+@author curve.fi
+
+@custom:security security@curve.fi
+"""
+
+################################################################
+#                            MODULES                           #
+################################################################
+
+# Ownership management. Must be initialized in main contract.
+from snekmate.auth import ownable
+
+uses: ownable
+
+# Peers are stored in OApp. Must be initialized in main contract.
+from . import OApp
+
+uses: OApp
+
+# Config structs and types are shared with OAppConfigUtils
+from . import OAppConfigUtils
+
+# Vyper-specific constants
+from . import VyperConstants as constants
+
+################################################################
+#                         INTERFACES                           #
+################################################################
+
+interface ILayerZeroEndpointV2:
+    def setSendLibrary(_oapp: address, _eid: uint32, _newLib: address): nonpayable
+    def setReceiveLibrary(
+        _oapp: address, _eid: uint32, _newLib: address, _gracePeriod: uint256
+    ): nonpayable
+    def setConfig(
+        _oapp: address,
+        _lib: address,
+        _params: DynArray[OAppConfigUtils.SetConfigParam, MAX_CONFIG_ITEMS],
+    ): nonpayable
+
+
+################################################################
+#                           CONSTANTS                          #
+################################################################
+
+MAX_DVNS: constant(uint256) = constants.MAX_DVNS
+MAX_CONFIG_ITEMS: constant(uint256) = constants.MAX_CONFIG_ITEMS
+
+
+################################################################
+#                           STRUCTS                            #
+################################################################
+
+struct PathwayConfig:
+    eid: uint32
+    peer: bytes32  # bytes32(0) leaves the peer unchanged, read channels need self as peer
+    sendLib: address  # empty(address) leaves send library and its configs unchanged
+    receiveLib: address  # empty(address) leaves receive library and its configs unchanged
+    gracePeriod: uint256  # grace period for the old receive library
+    executor: address  # empty(address) leaves executor config unchanged
+    confirmations: uint64  # ignored for read channels
+    optional_dvn_threshold: uint8
+    required_dvns: DynArray[address, MAX_DVNS]  # no DVNs leaves DVN config unchanged
+    optional_dvns: DynArray[address, MAX_DVNS]
+
+
+################################################################
+#                      PATHWAY FUNCTIONS                       #
+################################################################
+
+@external
+def applyPathways(_pathways: DynArray[PathwayConfig, MAX_CONFIG_ITEMS]):
+    """
+    @notice Configure libraries, DVN/read/executor configs and peers for a batch of eids
+    @param _pathways Array of pathway configurations, one per eid
+    @dev Only the owner/admin of the OApp can call this function.
+    """
+    ownable._check_owner()
+
+    endpoint: ILayerZeroEndpointV2 = ILayerZeroEndpointV2(OApp.endpoint.address)
+
+    for pathway: PathwayConfig in _pathways:
+        is_read_channel: bool = pathway.eid > OApp.READ_CHANNEL_THRESHOLD
+        has_dvns: bool = len(pathway.required_dvns) > 0 or len(pathway.optional_dvns) > 0
+
+        if has_dvns:
+            optional_count: uint8 = convert(len(pathway.optional_dvns), uint8)
+            assert pathway.optional_dvn_threshold <= optional_count, "OAppConfig: Invalid DVN threshold"
+
+        if pathway.sendLib != empty(address):
+            extcall endpoint.setSendLibrary(self, pathway.eid, pathway.sendLib)
+
+            send_params: DynArray[OAppConfigUtils.SetConfigParam, MAX_CONFIG_ITEMS] = []
+            if is_read_channel:
+                if has_dvns:
+                    send_params.append(self._ulnReadConfigParam(pathway))
+            else:
+                if has_dvns:
+                    send_params.append(self._ulnConfigParam(pathway))
+                if pathway.executor != empty(address):
+                    send_params.append(self._executorConfigParam(pathway))
+
+            if len(send_params) > 0:
+                extcall endpoint.setConfig(self, pathway.sendLib, send_params)
+
+        if pathway.receiveLib != empty(address):
+            extcall endpoint.setReceiveLibrary(
+                self, pathway.eid, pathway.receiveLib, pathway.gracePeriod
+            )
+
+            # Read library config is shared between directions and already set above
+            if has_dvns and not (is_read_channel and pathway.receiveLib == pathway.sendLib):
+                param: OAppConfigUtils.SetConfigParam = self._ulnConfigParam(pathway)
+                if is_read_channel:
+                    param = self._ulnReadConfigParam(pathway)
+                extcall endpoint.setConfig(self, pathway.receiveLib, [param])
+
+        if pathway.peer != empty(bytes32):
+            OApp._setPeer(pathway.eid, pathway.peer)
+
+
+@internal
+@pure
+def _ulnConfigParam(_pathway: PathwayConfig) -> OAppConfigUtils.SetConfigParam:
+    """
+    @notice Build the ULN (DVN) config param for a pathway
+    @param _pathway The pathway configuration
+    @return The encoded config param
+    """
+    uln_config: OAppConfigUtils.ULNConfig = OAppConfigUtils.ULNConfig(
+        confirmations=_pathway.confirmations,
+        required_dvn_count=convert(len(_pathway.required_dvns), uint8),
+        optional_dvn_count=convert(len(_pathway.optional_dvns), uint8),
+        optional_dvn_threshold=_pathway.optional_dvn_threshold,
+        required_dvns=_pathway.required_dvns,
+        optional_dvns=_pathway.optional_dvns,
+    )
+    return OAppConfigUtils.SetConfigParam(
+        eid=_pathway.eid,
+        configType=OAppConfigUtils.CONFIG_TYPE_ULN,
+        config=abi_encode(uln_config),
+    )
+
+
+@internal
+@pure
+def _ulnReadConfigParam(_pathway: PathwayConfig) -> OAppConfigUtils.SetConfigParam:
+    """
+    @notice Build the ULN Read config param for a read channel
+    @param _pathway The pathway configuration
+    @return The encoded config param
+    """
+    uln_read_config: OAppConfigUtils.ULNReadConfig = OAppConfigUtils.ULNReadConfig(
+        executor=_pathway.executor,
+        required_dvn_count=convert(len(_pathway.required_dvns), uint8),
+        optional_dvn_count=convert(len(_pathway.optional_dvns), uint8),
+        optional_dvn_threshold=_pathway.optional_dvn_threshold,
+        required_dvns=_pathway.required_dvns,
+        optional_dvns=_pathway.optional_dvns,
+    )
+    return OAppConfigUtils.SetConfigParam(
+        eid=_pathway.eid,
+        configType=OAppConfigUtils.CONFIG_TYPE_READ,
+        config=abi_encode(uln_read_config),
+    )
+
+
+@internal
+@pure
+def _executorConfigParam(_pathway: PathwayConfig) -> OAppConfigUtils.SetConfigParam:
+    """
+    @notice Build the executor config param for a pathway
+    @param _pathway The pathway configuration
+    @return The encoded config param
+    """
+    executor_config: OAppConfigUtils.ULNExecutorConfig = OAppConfigUtils.ULNExecutorConfig(
+        max_message_size=OAppConfigUtils.EXECUTOR_MAX_MESSAGE_SIZE, executor=_pathway.executor
+    )
+    return OAppConfigUtils.SetConfigParam(
+        eid=_pathway.eid,
+        configType=OAppConfigUtils.CONFIG_TYPE_EXECUTOR,
+        config=abi_encode(executor_config),
+    )
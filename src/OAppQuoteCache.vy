@@ -0,0 +1,286 @@
+# pragma version 0.4.3
+
+"""
+@title OAppQuoteCache - Cached endpoint quotes with a staleness bound
+
+@notice Optional cache of the last MessagingFee per (dstEid, options hash, message-length
+bucket, payInLzToken). endpoint.quote walks the send library, executor and DVN fee libraries
+and price feed on every call; apps that quote and then send in the same flow can use a
+cached fee instead, for up to quoteMaxAge blocks. Cached fees are quoted for the longest
+message of their bucket (zero-padded), so they cover every length in the bucket whatever
+message filled the entry, and are increased by quoteBufferBps to absorb price moves; the
+endpoint refunds any excess to the refund address.
+
+@dev Usage in the main contract:
+    fee: OApp.MessagingFee = OAppQuoteCache._cachedQuote(_dstEid, message, options, False)
+    OApp._lzSend(_dstEid, message, options, fee, msg.sender)
+
+with msg.value >= fee.nativeFee. If a send reverts on an insufficient fee, the cached
+quote is too low: refresh it with refreshQuote (or _refreshQuote) and retry. The cache is
+disabled until the owner sets a max age with setQuoteCacheConfig.
+
+@license Copyright (c) Curve.Fi, 2025 - all rights reserved
+
+@author curve.fi
+
+@custom:security security@curve.fi
+"""
+
+################################################################
+#                            MODULES                           #
+################################################################
+
+# Ownership management. Must be initialized in main contract.
+from snekmate.auth import ownable
+
+uses: ownable
+
+# Quotes go through OApp. Must be initialized in main contract.
+from . import OApp
+
+uses: OApp
+
+################################################################
+#                            EVENTS                            #
+################################################################
+
+event QuoteCacheConfigSet:
+    maxAge: uint256
+    bufferBps: uint256
+
+
+################################################################
+#                           CONSTANTS                          #
+################################################################
+
+# Messages are grouped by length into buckets of this many bytes
+QUOTE_BUCKET_SIZE: constant(uint256) = 32
+
+BPS: constant(uint256) = 10000
+MAX_QUOTE_BUFFER_BPS: constant(uint256) = 10000
+
+FEE_MASK: constant(uint256) = 2**128 - 1
+BLOCK_SHIFT: constant(uint256) = 128
+
+################################################################
+#                           STORAGE                            #
+################################################################
+
+# Max age of a cached quote in blocks, 0 disables the cache
+quoteMaxAge: public(uint256)
+
+# Buffer added to cached fees, in basis points
+quoteBufferBps: public(uint256)
+
+# cache key -> nativeFee (bits 0..127) | block of the quote (bits 128..255), 0 if unset
+quoteCache: public(HashMap[bytes32, uint256])
+
+# cache key -> lzTokenFee, only written for payInLzToken quotes
+lzTokenFeeCache: public(HashMap[bytes32, uint256])
+
+
+################################################################
+#                       OWNER FUNCTIONS                        #
+################################################################
+
+@external
+def setQuoteCacheConfig(_maxAge: uint256, _bufferBps: uint256):
+    """
+    @notice Set the max age and buffer of cached quotes
+    @param _maxAge Max age of a cached quote in blocks, 0 disables the cache.
+    @param _bufferBps Buffer added to cached fees, in basis points.
+    @dev Only the owner/admin of the OApp can call this function.
+    """
+    ownable._check_owner()
+
+    assert _bufferBps <= MAX_QUOTE_BUFFER_BPS, "OApp: invalid quote buffer"
+
+    self.quoteMaxAge = _maxAge
+    self.quoteBufferBps = _bufferBps
+    log QuoteCacheConfigSet(maxAge=_maxAge, bufferBps=_bufferBps)
+
+
+################################################################
+#                        QUOTE FUNCTIONS                       #
+################################################################
+
+@external
+def refreshQuote(
+    _dstEid: uint32,
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+    _options: Bytes[OApp.MAX_OPTIONS_TOTAL_SIZE],
+    _payInLzToken: bool,
+) -> OApp.MessagingFee:
+    """
+    @notice Force a fresh endpoint quote into the cache
+    @param _dstEid The destination endpoint ID.
+    @param _message A message of the length that will be sent.
+    @param _options The options that will be sent.
+    @param _payInLzToken Whether the fee will be paid in ZRO token.
+    @return The fresh (unbuffered) fee for the longest message of the length bucket.
+    @dev Callable by anyone: the cached value always comes from the endpoint, for the bucket's
+    maximum length, so the message passed does not change it.
+    """
+    return self._refreshQuote(_dstEid, _message, _options, _payInLzToken)
+
+
+@internal
+@view
+def _peekQuote(
+    _dstEid: uint32,
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+    _options: Bytes[OApp.MAX_OPTIONS_TOTAL_SIZE],
+    _payInLzToken: bool,
+) -> OApp.MessagingFee:
+    """
+    @notice View quote: the buffered cached fee if fresh, an endpoint quote otherwise
+    @param _dstEid The destination endpoint ID.
+    @param _message The message payload.
+    @param _options Additional options for the message.
+    @param _payInLzToken Whether to return fee in ZRO token.
+    @return fee The fee to send with.
+    """
+    key: bytes32 = self._quoteCacheKey(_dstEid, len(_message), _options, _payInLzToken)
+    hit: bool = False
+    fee: OApp.MessagingFee = empty(OApp.MessagingFee)
+    hit, fee = self._cachedFee(key, _payInLzToken)
+    if hit:
+        return fee
+
+    return OApp._quote(_dstEid, _message, _options, _payInLzToken)
+
+
+@internal
+def _cachedQuote(
+    _dstEid: uint32,
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+    _options: Bytes[OApp.MAX_OPTIONS_TOTAL_SIZE],
+    _payInLzToken: bool,
+) -> OApp.MessagingFee:
+    """
+    @notice Quote for a send: the buffered cached fee if fresh, else quote and cache
+    @param _dstEid The destination endpoint ID.
+    @param _message The message payload.
+    @param _options Additional options for the message.
+    @param _payInLzToken Whether to return fee in ZRO token.
+    @return fee The fee to send with.
+    @dev On a miss with the cache enabled, the fresh quote of the bucket's longest message is
+    stored and returned unbuffered. With the cache disabled, _message is quoted as is.
+    """
+    key: bytes32 = self._quoteCacheKey(_dstEid, len(_message), _options, _payInLzToken)
+    hit: bool = False
+    fee: OApp.MessagingFee = empty(OApp.MessagingFee)
+    hit, fee = self._cachedFee(key, _payInLzToken)
+    if hit:
+        return fee
+
+    if self.quoteMaxAge == 0:
+        return OApp._quote(_dstEid, _message, _options, _payInLzToken)
+
+    fee = OApp._quote(_dstEid, self._bucketMessage(_message), _options, _payInLzToken)
+    self._storeQuote(key, fee, _payInLzToken)
+    return fee
+
+
+@internal
+def _refreshQuote(
+    _dstEid: uint32,
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+    _options: Bytes[OApp.MAX_OPTIONS_TOTAL_SIZE],
+    _payInLzToken: bool,
+) -> OApp.MessagingFee:
+    """
+    @notice Forced-refresh path: quote the endpoint and overwrite the cache entry
+    @param _dstEid The destination endpoint ID.
+    @param _message The message payload.
+    @param _options Additional options for the message.
+    @param _payInLzToken Whether to return fee in ZRO token.
+    @return fee The fresh (unbuffered) fee for the longest message of the length bucket.
+    """
+    fee: OApp.MessagingFee = OApp._quote(
+        _dstEid, self._bucketMessage(_message), _options, _payInLzToken
+    )
+    self._storeQuote(
+        self._quoteCacheKey(_dstEid, len(_message), _options, _payInLzToken), fee, _payInLzToken
+    )
+    return fee
+
+
+@internal
+@pure
+def _quoteCacheKey(
+    _dstEid: uint32,
+    _messageLength: uint256,
+    _options: Bytes[OApp.MAX_OPTIONS_TOTAL_SIZE],
+    _payInLzToken: bool,
+) -> bytes32:
+    """
+    @notice Cache key of a quote: (dstEid, length bucket, options hash, payInLzToken)
+    @param _dstEid The destination endpoint ID.
+    @param _messageLength The length of the message payload.
+    @param _options Additional options for the message.
+    @param _payInLzToken Whether the fee is paid in ZRO token.
+    @return The cache key.
+    """
+    bucket: uint256 = (_messageLength + QUOTE_BUCKET_SIZE - 1) // QUOTE_BUCKET_SIZE
+    return keccak256(abi_encode(_dstEid, bucket, keccak256(_options), _payInLzToken))
+
+
+@internal
+@pure
+def _bucketMessage(_message: Bytes[OApp.MAX_MESSAGE_SIZE]) -> Bytes[OApp.MAX_MESSAGE_SIZE]:
+    """
+    @notice Zero-pad a message to the longest length of its bucket
+    @param _message The message payload.
+    @return The padded message, at most MAX_MESSAGE_SIZE bytes.
+    """
+    padded_length: uint256 = min(
+        (len(_message) + QUOTE_BUCKET_SIZE - 1) // QUOTE_BUCKET_SIZE * QUOTE_BUCKET_SIZE,
+        OApp.MAX_MESSAGE_SIZE,
+    )
+    if padded_length == len(_message):
+        return _message
+
+    # Less than QUOTE_BUCKET_SIZE (32) bytes of padding: fits in a bytes32
+    return convert(
+        slice(concat(_message, empty(bytes32)), 0, padded_length), Bytes[OApp.MAX_MESSAGE_SIZE]
+    )
+
+
+@internal
+@view
+def _cachedFee(_key: bytes32, _payInLzToken: bool) -> (bool, OApp.MessagingFee):
+    """
+    @notice Read a cache entry
+    @param _key The cache key (_quoteCacheKey).
+    @param _payInLzToken Whether the fee is paid in ZRO token.
+    @return hit True if the entry exists and is not older than quoteMaxAge blocks.
+    @return fee The cached fee with quoteBufferBps applied.
+    """
+    packed: uint256 = self.quoteCache[_key]
+    max_age: uint256 = self.quoteMaxAge
+    if packed == 0 or max_age == 0 or block.number > (packed >> BLOCK_SHIFT) + max_age:
+        return False, empty(OApp.MessagingFee)
+
+    factor: uint256 = BPS + self.quoteBufferBps
+    lz_token_fee: uint256 = 0
+    if _payInLzToken:
+        lz_token_fee = self.lzTokenFeeCache[_key] * factor // BPS
+
+    return True, OApp.MessagingFee(
+        nativeFee=(packed & FEE_MASK) * factor // BPS, lzTokenFee=lz_token_fee
+    )
+
+
+@internal
+def _storeQuote(_key: bytes32, _fee: OApp.MessagingFee, _payInLzToken: bool):
+    """
+    @notice Write a cache entry for the current block
+    @param _key The cache key (_quoteCacheKey).
+    @param _fee The fee quoted for the longest message of the key's bucket.
+    @param _payInLzToken Whether the fee is paid in ZRO token.
+    """
+    assert _fee.nativeFee <= FEE_MASK, "OApp: fee too large"
+    self.quoteCache[_key] = _fee.nativeFee | (block.number << BLOCK_SHIFT)
+    if _payInLzToken:
+        self.lzTokenFeeCache[_key] = _fee.lzTokenFee
@@ -0,0 +1,330 @@
+# pragma version 0.4.3
+
+"""
+@title OAppReadCache - Cache lzRead responses with freshness metadata
+
+@notice Stores the latest lzRead response per (targetEid, to, calldata hash) together with
+the block number or timestamp it refers to. Consumers read the cached value locally and
+issue a new lzRead (paying the fee and the latency) only when the cached value is older
+than readMaxAge seconds and no read of the same key is already in flight.
+
+@dev Usage in the main contract:
+    # send side
+    receipt: OApp.MessagingReceipt = OAppReadCache._requestReadIfStale(
+        readChannel, request, options, fee, msg.sender
+    )  # receipt.guid is empty if the cached response is fresh
+
+    # lzReceive, for read channels (_origin.srcEid > OApp.READ_CHANNEL_THRESHOLD)
+    OApp._lzReceiveOrigin(_origin)
+    OAppReadCache._cacheReadResponse(_guid, _message)
+
+Requests are matched to responses by guid, so they must be sent with _requestRead or
+_requestReadIfStale (a single EVMCallRequestV1, no compute). Responses that cannot be cached
+(unknown guid, larger than MAX_READ_RESPONSE_SIZE) are skipped with ReadResponseSkipped
+instead of reverting, so the read channel keeps flowing. Freshness is measured with the
+remote timestamp for timestamp requests, and with the local timestamp at which the request
+was sent for block number requests (remote block numbers are not comparable locally). A read
+in flight blocks new requests of its key until its response arrives, or for readMaxAge
+seconds if the response is lost.
+
+@license Copyright (c) Curve.Fi, 2025 - all rights reserved
+
+@author curve.fi
+
+@custom:security security@curve.fi
+"""
+
+################################################################
+#                            MODULES                           #
+################################################################
+
+# Ownership management. Must be initialized in main contract.
+from snekmate.auth import ownable
+
+uses: ownable
+
+# Sends and origin checks. Must be initialized in main contract.
+from . import OApp
+
+uses: OApp
+
+# Read command encoding
+from . import ReadCmdCodecV1
+
+# Vyper-specific constants
+from . import VyperConstants as constants
+
+################################################################
+#                           CONSTANTS                          #
+################################################################
+
+MAX_READ_RESPONSE_SIZE: constant(uint256) = constants.MAX_READ_RESPONSE_SIZE
+
+################################################################
+#                            STRUCTS                           #
+################################################################
+
+struct ReadCacheEntry:
+    response: Bytes[MAX_READ_RESPONSE_SIZE]
+    isBlockNum: bool  # True if blockNumOrTimestamp is a remote block number
+    blockNumOrTimestamp: uint64  # Remote block number or timestamp the response refers to
+    requestedAt: uint64  # Local timestamp of the request
+    receivedAt: uint64  # Local timestamp of the response
+
+
+struct PendingRead:
+    key: bytes32
+    isBlockNum: bool
+    blockNumOrTimestamp: uint64
+    requestedAt: uint64
+
+
+################################################################
+#                            EVENTS                            #
+################################################################
+
+event ReadCacheConfigSet:
+    maxAge: uint256
+
+
+event ReadCached:
+    key: indexed(bytes32)
+    guid: bytes32
+    isBlockNum: bool
+    blockNumOrTimestamp: uint64
+
+
+event ReadResponseSkipped:
+    guid: indexed(bytes32)
+    key: bytes32  # empty if the guid is unknown
+    responseHash: bytes32
+    length: uint256
+
+
+################################################################
+#                           STORAGE                            #
+################################################################
+
+# Max age of a cached response in seconds, 0 disables the cache
+readMaxAge: public(uint256)
+
+# cache key -> latest response
+readCache: public(HashMap[bytes32, ReadCacheEntry])
+
+# guid -> request waiting for its response, requestedAt is 0 if unset
+pendingReads: public(HashMap[bytes32, PendingRead])
+
+# cache key -> guid of the latest read in flight, empty if none
+inFlightReads: public(HashMap[bytes32, bytes32])
+
+
+################################################################
+#                       OWNER FUNCTIONS                        #
+################################################################
+
+@external
+def setReadMaxAge(_maxAge: uint256):
+    """
+    @notice Set the max age of cached read responses
+    @param _maxAge Max age in seconds, 0 disables the cache.
+    @dev Only the owner/admin of the OApp can call this function.
+    """
+    ownable._check_owner()
+
+    self.readMaxAge = _maxAge
+    log ReadCacheConfigSet(maxAge=_maxAge)
+
+
+################################################################
+#                         VIEW FUNCTIONS                       #
+################################################################
+
+@external
+@view
+def isReadFresh(
+    _targetEid: uint32, _to: address, _callData: Bytes[ReadCmdCodecV1.MAX_CALLDATA_SIZE]
+) -> bool:
+    """
+    @notice Whether the cached response of a read is not older than readMaxAge
+    @param _targetEid The target endpoint ID of the read.
+    @param _to The target contract of the read.
+    @param _callData The calldata of the read.
+    @return True if a fresh response is cached.
+    """
+    return self._isReadFresh(self._readCacheKey(_targetEid, _to, _callData))
+
+
+@internal
+@view
+def _getCachedRead(
+    _targetEid: uint32, _to: address, _callData: Bytes[ReadCmdCodecV1.MAX_CALLDATA_SIZE]
+) -> (Bytes[MAX_READ_RESPONSE_SIZE], bool):
+    """
+    @notice Read a cached response
+    @param _targetEid The target endpoint ID of the read.
+    @param _to The target contract of the read.
+    @param _callData The calldata of the read.
+    @return response The latest cached response, empty if none.
+    @return fresh True if the response is not older than readMaxAge.
+    """
+    key: bytes32 = self._readCacheKey(_targetEid, _to, _callData)
+    return self.readCache[key].response, self._isReadFresh(key)
+
+
+@internal
+@view
+def _isReadFresh(_key: bytes32) -> bool:
+    """
+    @notice Whether a cache entry exists and is not older than readMaxAge
+    @param _key The cache key of the read (_readCacheKey).
+    @return True if a fresh response is cached.
+    """
+    entry: ReadCacheEntry = self.readCache[_key]
+    max_age: uint256 = self.readMaxAge
+    if entry.receivedAt == 0 or max_age == 0:
+        return False
+
+    data_timestamp: uint64 = entry.requestedAt if entry.isBlockNum else entry.blockNumOrTimestamp
+    return convert(data_timestamp, uint256) + max_age >= block.timestamp
+
+
+@internal
+@pure
+def _readCacheKey(
+    _targetEid: uint32, _to: address, _callData: Bytes[ReadCmdCodecV1.MAX_CALLDATA_SIZE]
+) -> bytes32:
+    """
+    @notice Cache key of a read: (targetEid, to, calldata hash)
+    @param _targetEid The target endpoint ID of the read.
+    @param _to The target contract of the read.
+    @param _callData The calldata of the read.
+    @return The cache key.
+    """
+    return keccak256(abi_encode(_targetEid, _to, keccak256(_callData)))
+
+
+@internal
+@view
+def _isReadInFlight(_key: bytes32) -> bool:
+    """
+    @notice Whether a read of a key was sent less than readMaxAge seconds ago and is unanswered
+    @param _key The cache key of the read (_readCacheKey).
+    @return True if a new request of the key would duplicate the one in flight.
+    """
+    max_age: uint256 = self.readMaxAge
+    guid: bytes32 = self.inFlightReads[_key]
+    if guid == empty(bytes32) or max_age == 0:
+        return False
+
+    requested_at: uint64 = self.pendingReads[guid].requestedAt
+    return convert(requested_at, uint256) + max_age >= block.timestamp
+
+
+################################################################
+#                         SEND FUNCTIONS                       #
+################################################################
+
+@internal
+def _requestRead(
+    _readChannel: uint32,
+    _request: ReadCmdCodecV1.EVMCallRequestV1,
+    _options: Bytes[OApp.MAX_OPTIONS_TOTAL_SIZE],
+    _fee: OApp.MessagingFee,
+    _refundAddress: address,
+) -> OApp.MessagingReceipt:
+    """
+    @notice Send a single lzRead request whose response will be cached
+    @param _readChannel The read channel ID.
+    @param _request The read request.
+    @param _options Read options (OptionsBuilder.addExecutorLzReadOption).
+    @param _fee The calculated LayerZero fee for the message.
+    @param _refundAddress The address to receive any excess fee values sent to the endpoint.
+    @return receipt The receipt for the sent message.
+    """
+    receipt: OApp.MessagingReceipt = OApp._lzSend(
+        _readChannel, ReadCmdCodecV1.encode(0, [_request]), _options, _fee, _refundAddress
+    )
+
+    key: bytes32 = self._readCacheKey(_request.targetEid, _request.to, _request.callData)
+    self.inFlightReads[key] = receipt.guid
+    self.pendingReads[receipt.guid] = PendingRead(
+        key=key,
+        isBlockNum=_request.isBlockNum,
+        blockNumOrTimestamp=_request.blockNumOrTimestamp,
+        requestedAt=convert(block.timestamp, uint64),
+    )
+    return receipt
+
+
+@internal
+def _requestReadIfStale(
+    _readChannel: uint32,
+    _request: ReadCmdCodecV1.EVMCallRequestV1,
+    _options: Bytes[OApp.MAX_OPTIONS_TOTAL_SIZE],
+    _fee: OApp.MessagingFee,
+    _refundAddress: address,
+) -> OApp.MessagingReceipt:
+    """
+    @notice Send an lzRead request only if the cached response is missing or stale, and no
+    read of the same key is in flight
+    @param _readChannel The read channel ID.
+    @param _request The read request.
+    @param _options Read options (OptionsBuilder.addExecutorLzReadOption).
+    @param _fee The calculated LayerZero fee for the message.
+    @param _refundAddress The address to receive any excess fee values sent to the endpoint.
+    @return receipt The receipt for the sent message, empty if nothing was sent.
+    @dev If nothing is sent, any msg.value stays in the contract: refund it in the caller.
+    """
+    key: bytes32 = self._readCacheKey(_request.targetEid, _request.to, _request.callData)
+    if self._isReadFresh(key) or self._isReadInFlight(key):
+        return empty(OApp.MessagingReceipt)
+
+    return self._requestRead(_readChannel, _request, _options, _fee, _refundAddress)
+
+
+################################################################
+#                        RECEIVE FUNCTIONS                     #
+################################################################
+
+@internal
+def _cacheReadResponse(_guid: bytes32, _message: Bytes[OApp.MAX_MESSAGE_SIZE]) -> bool:
+    """
+    @notice Store the response of a request sent with _requestRead
+    @param _guid The guid of the received message.
+    @param _message The read response.
+    @return True if the cache was updated, False if the response was skipped or a newer
+    request was already answered.
+    @dev Call after OApp._lzReceiveOrigin (or OApp._lzReceive) in lzReceive. Never reverts:
+    responses to unknown requests and oversized responses only log ReadResponseSkipped.
+    """
+    pending: PendingRead = self.pendingReads[_guid]
+    if pending.requestedAt != 0 and self.inFlightReads[pending.key] == _guid:
+        self.inFlightReads[pending.key] = empty(bytes32)
+
+    if pending.requestedAt == 0 or len(_message) > MAX_READ_RESPONSE_SIZE:
+        log ReadResponseSkipped(
+            guid=_guid, key=pending.key, responseHash=keccak256(_message), length=len(_message)
+        )
+        self.pendingReads[_guid] = empty(PendingRead)
+        return False
+
+    self.pendingReads[_guid] = empty(PendingRead)
+
+    # Responses can arrive out of order, keep the one of the latest request
+    if pending.requestedAt < self.readCache[pending.key].requestedAt:
+        return False
+
+    self.readCache[pending.key] = ReadCacheEntry(
+        response=convert(_message, Bytes[MAX_READ_RESPONSE_SIZE]),
+        isBlockNum=pending.isBlockNum,
+        blockNumOrTimestamp=pending.blockNumOrTimestamp,
+        requestedAt=pending.requestedAt,
+        receivedAt=convert(block.timestamp, uint64),
+    )
+    log ReadCached(
+        key=pending.key,
+        guid=_guid,
+        isBlockNum=pending.isBlockNum,
+        blockNumOrTimestamp=pending.blockNumOrTimestamp,
+    )
+    return True
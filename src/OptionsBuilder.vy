@@ -37,6 +37,42 @@ OPTION_TYPE_LZREAD: constant(uint8) = 5
 OPTION_TYPE_DVN: constant(uint8) = 10
 OPTION_TYPE_DVN_PRECRIME: constant(uint8) = 1
 
+# Parsing bounds, derived from the smallest encoding of each option
+# (header: 1 worker + 2 size + 1 type = 4 bytes, native drop 4 + 48, lzCompose 4 + 18)
+MAX_OPTIONS_COUNT: constant(uint256) = (MAX_OPTIONS_TOTAL_SIZE - 2) // 4
+MAX_NATIVE_DROP_OPTIONS: constant(uint256) = (MAX_OPTIONS_TOTAL_SIZE - 2) // 52
+MAX_LZCOMPOSE_OPTIONS: constant(uint256) = (MAX_OPTIONS_TOTAL_SIZE - 2) // 22
+
+
+################################################################
+#                           STRUCTS                            #
+################################################################
+
+struct NativeDropOption:
+    receiver: bytes32
+    amount: uint128
+
+
+struct LzComposeOption:
+    index: uint16
+    gas: uint128
+    value: uint128
+
+
+struct OptionsSummary:
+    hasLzReceive: bool
+    lzReceiveGas: uint128
+    lzReceiveValue: uint128
+    nativeDrops: DynArray[NativeDropOption, MAX_NATIVE_DROP_OPTIONS]
+    lzComposes: DynArray[LzComposeOption, MAX_LZCOMPOSE_OPTIONS]
+    orderedExecution: bool
+    hasLzRead: bool
+    lzReadGas: uint128
+    lzReadSize: uint32
+    lzReadValue: uint128
+    # DVN and unknown executor options, kept verbatim (worker id + size + body)
+    passthrough: Bytes[MAX_OPTIONS_TOTAL_SIZE]
+
 
 ################################################################
 #                        OptionsBuilder                        #
@@ -245,3 +281,247 @@ def addDVNPreCrimeOption(
     @return options The updated options container.
     """
     return self.addDVNOption(_options, _dvnIdx, OPTION_TYPE_DVN_PRECRIME, b"")
+
+
+################################################################
+#                    OptionsParser / Merge                     #
+################################################################
+# The executor sums duplicate lzReceive, nativeDrop (per receiver), lzCompose (per index)
+# and lzRead options. Parsing them into an OptionsSummary and re-encoding yields the
+# smallest equivalent TYPE_3 blob, e.g. when combining enforced and caller options.
+
+@internal
+@pure
+def decodeOptions(_options: Bytes[MAX_OPTIONS_TOTAL_SIZE]) -> OptionsSummary:
+    """
+    @notice Parses a TYPE_3 options container into executor totals.
+    @param _options The options container (empty bytes are treated as no options).
+    @return summary Summed executor options plus verbatim DVN/unknown options.
+    """
+    return self._decodeOptionsInto(empty(OptionsSummary), _options)
+
+
+@internal
+@pure
+def encodeOptions(_summary: OptionsSummary) -> Bytes[MAX_OPTIONS_TOTAL_SIZE]:
+    """
+    @notice Encodes an OptionsSummary with one executor option per (type, index).
+    @param _summary The summary to encode.
+    @return options The TYPE_3 options container.
+    @dev Order: lzReceive, nativeDrops, lzComposes, orderedExecution, lzRead, passthrough.
+    """
+    options: Bytes[MAX_OPTIONS_TOTAL_SIZE] = self.newOptions()
+
+    if _summary.hasLzReceive:
+        options = self.addExecutorLzReceiveOption(
+            options, _summary.lzReceiveGas, _summary.lzReceiveValue
+        )
+
+    for drop: NativeDropOption in _summary.nativeDrops:
+        options = self.addExecutorNativeDropOption(options, drop.amount, drop.receiver)
+
+    for compose: LzComposeOption in _summary.lzComposes:
+        options = self.addExecutorLzComposeOption(
+            options, compose.index, compose.gas, compose.value
+        )
+
+    if _summary.orderedExecution:
+        options = self.addExecutorOrderedExecutionOption(options)
+
+    if _summary.hasLzRead:
+        options = self.addExecutorLzReadOption(
+            options, _summary.lzReadGas, _summary.lzReadSize, _summary.lzReadValue
+        )
+
+    if len(_summary.passthrough) > 0:
+        assert (len(options) + len(_summary.passthrough) <= MAX_OPTIONS_TOTAL_SIZE), "OApp: options size exceeded"
+        options = convert(concat(options, _summary.passthrough), Bytes[MAX_OPTIONS_TOTAL_SIZE])
+
+    return options
+
+
+@internal
+@pure
+def compactOptions(_options: Bytes[MAX_OPTIONS_TOTAL_SIZE]) -> Bytes[MAX_OPTIONS_TOTAL_SIZE]:
+    """
+    @notice Rewrites an options container with duplicate executor options summed.
+    @param _options The options container.
+    @return options The smallest equivalent options container.
+    """
+    return self.encodeOptions(self.decodeOptions(_options))
+
+
+@internal
+@pure
+def mergeOptions(
+    _a: Bytes[MAX_OPTIONS_TOTAL_SIZE], _b: Bytes[MAX_OPTIONS_TOTAL_SIZE]
+) -> Bytes[MAX_OPTIONS_TOTAL_SIZE]:
+    """
+    @notice Merges two options containers (e.g. enforced and caller options).
+    @param _a The first options container.
+    @param _b The second options container.
+    @return options One executor option per (type, index) with the amounts of both summed.
+    @dev The result is executed identically to concat(_a, _b[2:]), but is never larger.
+    """
+    summary: OptionsSummary = self._decodeOptionsInto(empty(OptionsSummary), _a)
+    summary = self._decodeOptionsInto(summary, _b)
+    return self.encodeOptions(summary)
+
+
+@internal
+@pure
+def _decodeOptionsInto(
+    _summary: OptionsSummary, _options: Bytes[MAX_OPTIONS_TOTAL_SIZE]
+) -> OptionsSummary:
+    """
+    @dev Adds the options of a TYPE_3 container to an existing summary.
+    @param _summary The summary to add to.
+    @param _options The options container (empty bytes are treated as no options).
+    @return summary The updated summary.
+    """
+    summary: OptionsSummary = _summary
+    if len(_options) == 0:
+        return summary
+
+    assert len(_options) >= 2, "OApp: invalid options"
+    assert convert(slice(_options, 0, 2), uint16) == TYPE_3, "OApp: invalid option type"
+
+    cursor: uint256 = 2
+    for i: uint256 in range(MAX_OPTIONS_COUNT):
+        if cursor == len(_options):
+            break
+
+        # header: worker id (1) + size (2)
+        assert cursor + 3 < len(_options), "OApp: invalid options"
+        worker_id: uint8 = convert(slice(_options, cursor, 1), uint8)
+        size: uint256 = convert(slice(_options, cursor + 1, 2), uint256)
+        assert size > 0 and cursor + 3 + size <= len(_options), "OApp: invalid options"
+
+        if worker_id != EXECUTOR_WORKER_ID:
+            assert worker_id == DVN_WORKER_ID, "OApp: invalid worker id"
+            assert size >= 2, "OApp: invalid options"  # dvnIdx + optionType
+            summary = self._appendPassthrough(summary, slice(_options, cursor, size + 3))
+            cursor += size + 3
+            continue
+
+        option_type: uint8 = convert(slice(_options, cursor + 3, 1), uint8)
+        start: uint256 = cursor + 4  # option body
+        body_size: uint256 = size - 1
+
+        if option_type == OPTION_TYPE_LZRECEIVE:
+            assert body_size == 16 or body_size == 32, "OApp: invalid lzReceive option"
+            summary.hasLzReceive = True
+            summary.lzReceiveGas += convert(slice(_options, start, 16), uint128)
+            if body_size == 32:
+                summary.lzReceiveValue += convert(slice(_options, start + 16, 16), uint128)
+
+        elif option_type == OPTION_TYPE_NATIVE_DROP:
+            assert body_size == 48, "OApp: invalid native drop option"
+            summary = self._addNativeDrop(
+                summary,
+                convert(slice(_options, start + 16, 32), bytes32),
+                convert(slice(_options, start, 16), uint128),
+            )
+
+        elif option_type == OPTION_TYPE_LZCOMPOSE:
+            assert body_size == 18 or body_size == 34, "OApp: invalid lzCompose option"
+            value: uint128 = 0
+            if body_size == 34:
+                value = convert(slice(_options, start + 18, 16), uint128)
+            summary = self._addLzCompose(
+                summary,
+                convert(slice(_options, start, 2), uint16),
+                convert(slice(_options, start + 2, 16), uint128),
+                value,
+            )
+
+        elif option_type == OPTION_TYPE_ORDERED_EXECUTION:
+            assert body_size == 0, "OApp: invalid ordered execution option"
+            summary.orderedExecution = True
+
+        elif option_type == OPTION_TYPE_LZREAD:
+            assert body_size == 20 or body_size == 36, "OApp: invalid lzRead option"
+            summary.hasLzRead = True
+            summary.lzReadGas += convert(slice(_options, start, 16), uint128)
+            summary.lzReadSize += convert(slice(_options, start + 16, 4), uint32)
+            if body_size == 36:
+                summary.lzReadValue += convert(slice(_options, start + 20, 16), uint128)
+
+        else:
+            # Not summed by this library, left for the executor to validate
+            summary = self._appendPassthrough(summary, slice(_options, cursor, size + 3))
+
+        cursor += size + 3
+
+    assert cursor == len(_options), "OApp: invalid options"
+    return summary
+
+
+@internal
+@pure
+def _addNativeDrop(
+    _summary: OptionsSummary, _receiver: bytes32, _amount: uint128
+) -> OptionsSummary:
+    """
+    @notice Adds a native drop to a summary, summed with an existing drop to the same receiver.
+    @param _summary The summary to add to.
+    @param _receiver The receiver address of the native drop.
+    @param _amount The amount of native tokens to drop.
+    @return summary The updated summary.
+    """
+    summary: OptionsSummary = _summary
+    for i: uint256 in range(MAX_NATIVE_DROP_OPTIONS):
+        if i == len(summary.nativeDrops):
+            break
+        if summary.nativeDrops[i].receiver == _receiver:
+            summary.nativeDrops[i].amount += _amount
+            return summary
+
+    assert len(summary.nativeDrops) < MAX_NATIVE_DROP_OPTIONS, "OApp: options size exceeded"
+    summary.nativeDrops.append(NativeDropOption(receiver=_receiver, amount=_amount))
+    return summary
+
+
+@internal
+@pure
+def _addLzCompose(
+    _summary: OptionsSummary, _index: uint16, _gas: uint128, _value: uint128
+) -> OptionsSummary:
+    """
+    @notice Adds an lzCompose option to a summary, summed with an existing one of the same index.
+    @param _summary The summary to add to.
+    @param _index The index of the compose message.
+    @param _gas The gas limit for the compose call.
+    @param _value The msg.value for the compose call.
+    @return summary The updated summary.
+    """
+    summary: OptionsSummary = _summary
+    for i: uint256 in range(MAX_LZCOMPOSE_OPTIONS):
+        if i == len(summary.lzComposes):
+            break
+        if summary.lzComposes[i].index == _index:
+            summary.lzComposes[i].gas += _gas
+            summary.lzComposes[i].value += _value
+            return summary
+
+    assert len(summary.lzComposes) < MAX_LZCOMPOSE_OPTIONS, "OApp: options size exceeded"
+    summary.lzComposes.append(LzComposeOption(index=_index, gas=_gas, value=_value))
+    return summary
+
+
+@internal
+@pure
+def _appendPassthrough(
+    _summary: OptionsSummary, _option: Bytes[MAX_OPTIONS_TOTAL_SIZE]
+) -> OptionsSummary:
+    """
+    @notice Appends an option that is not summed (DVN or unknown executor option) as-is.
+    @param _summary The summary to append to.
+    @param _option The encoded option, with its worker id and size header.
+    @return summary The updated summary.
+    @dev 2 bytes are kept for the TYPE_3 prefix of the encoded container.
+    """
+    summary: OptionsSummary = _summary
+    assert (len(summary.passthrough) + len(_option) <= MAX_OPTIONS_TOTAL_SIZE - 2), "OApp: options size exceeded"
+    summary.passthrough = convert(concat(summary.passthrough, _option), Bytes[MAX_OPTIONS_TOTAL_SIZE])
+    return summary
@@ -61,6 +61,11 @@ struct EVMCallComputeV1:
     to: address  # Address of the target contract on the target chain
 
 
+struct ReadResponseV1:
+    appRequestLabel: uint16  # Label of the request this result answers
+    result: Bytes[MAX_MESSAGE_SIZE]  # Raw return data of the view call
+
+
 # ################################################################
 # #                     ReadCmdCodecV1 LIBRARY                   #
 # ################################################################
@@ -165,3 +170,91 @@ def appendEVMCallComputeV1(
         convert(_compute.confirmations, bytes2),
         convert(_compute.to, bytes20),
     )
+
+
+################################################################
+#                   Response decoding (Vyper-specific)         #
+################################################################
+
+@internal
+@pure
+def decodeRequestLabels(_cmd: Bytes[MAX_MESSAGE_SIZE]) -> DynArray[uint16, MAX_EVM_CALL_REQUESTS]:
+    """
+    @notice Read the appRequestLabel of every request of a command, in order
+    @param _cmd A command built with encode, without compute
+    @return The request labels
+    @dev Reverts on commands with a compute: their response is the compute result, not
+    one result per request.
+    """
+    self._decodeCmdAppLabel(_cmd)
+    count: uint256 = convert(slice(_cmd, 4, 2), uint256)
+    assert count <= MAX_EVM_CALL_REQUESTS, "OApp: invalid read command"
+
+    labels: DynArray[uint16, MAX_EVM_CALL_REQUESTS] = []
+    cursor: uint256 = 6
+    for i: uint256 in range(count, bound=MAX_EVM_CALL_REQUESTS):
+        # request header: version(1) + appRequestLabel(2) + resolverType(2) + size(2)
+        assert cursor + 7 <= len(_cmd), "OApp: invalid read command"
+        assert convert(slice(_cmd, cursor, 1), uint8) == REQUEST_VERSION, "OApp: InvalidVersion"
+        labels.append(convert(slice(_cmd, cursor + 1, 2), uint16))
+        cursor += 7 + convert(slice(_cmd, cursor + 5, 2), uint256)
+
+    assert cursor <= len(_cmd), "OApp: invalid read command"
+    assert cursor == len(_cmd), "OApp: compute not supported"
+    return labels
+
+
+@internal
+@pure
+def splitResponses(
+    _response: Bytes[MAX_MESSAGE_SIZE],
+    _labels: DynArray[uint16, MAX_EVM_CALL_REQUESTS],
+    _sizes: DynArray[uint256, MAX_EVM_CALL_REQUESTS],
+) -> DynArray[ReadResponseV1, MAX_EVM_CALL_REQUESTS]:
+    """
+    @notice Split a concatenated read response into per-request results
+    @param _response The lzRead response of a command without compute
+    @param _labels The appRequestLabel of every request, in command order
+    @param _sizes The result size of every request, or empty if all results have the same size
+    @return One (appRequestLabel, result) per request, in command order
+    """
+    count: uint256 = len(_labels)
+    assert count > 0, "OApp: invalid read response"
+
+    size: uint256 = len(_response) // count
+    if len(_sizes) == 0:
+        assert size * count == len(_response), "OApp: invalid read response"
+    else:
+        assert len(_sizes) == count, "OApp: invalid read response"
+
+    responses: DynArray[ReadResponseV1, MAX_EVM_CALL_REQUESTS] = []
+    cursor: uint256 = 0
+    for i: uint256 in range(count, bound=MAX_EVM_CALL_REQUESTS):
+        if len(_sizes) != 0:
+            size = _sizes[i]
+        assert cursor + size <= len(_response), "OApp: invalid read response"
+        responses.append(
+            ReadResponseV1(appRequestLabel=_labels[i], result=slice(_response, cursor, size))
+        )
+        cursor += size
+
+    assert cursor == len(_response), "OApp: invalid read response"
+    return responses
+
+
+@internal
+@pure
+def decodeResponses(
+    _cmd: Bytes[MAX_MESSAGE_SIZE],
+    _response: Bytes[MAX_MESSAGE_SIZE],
+    _sizes: DynArray[uint256, MAX_EVM_CALL_REQUESTS] = [],
+) -> DynArray[ReadResponseV1, MAX_EVM_CALL_REQUESTS]:
+    """
+    @notice Split the response of a multi-request command into per-request results
+    @param _cmd The command that was sent, built with encode, without compute
+    @param _response The lzRead response received in lzReceive
+    @param _sizes The result size of every request, or empty if all results have the same size
+    (e.g. one uint256 each)
+    @return One (appRequestLabel, result) per request, in command order
+    """
+    return self.splitResponses(_response, self.decodeRequestLabels(_cmd), _sizes)
@@ -25,3 +25,13 @@ MAX_CALLDATA_SIZE: constant(uint256) = 128
 # ConfigUtils limits
 MAX_DVNS: constant(uint256) = 16
 MAX_CONFIG_ITEMS: constant(uint256) = 32
+
+# OAppFixedPeers limits (eids are packed into a single uint256, 8 x uint32)
+MAX_FIXED_PEERS: constant(uint256) = 8
+
+# OAppBatcher limits (a batch is framed into a single message of at most MAX_MESSAGE_SIZE)
+MAX_BATCH_MESSAGES: constant(uint256) = 16
+MAX_BATCH_MESSAGE_SIZE: constant(uint256) = 64
+
+# OAppReadCache limits (max cached lzRead response size)
+MAX_READ_RESPONSE_SIZE: constant(uint256) = 128
@@ -0,0 +1,58 @@
+"""Benchmark: fee and gas per app update, one LayerZero message each vs OAppBatcher batches.
+
+Run with `pytest tests/benchmarks -s` to print the table.
+"""
+
+import boa
+import pytest
+from conftest import WRAPPER_PEER_EID
+from OptionsCodec import OptionsSummary, encode_options
+
+DST_EID = WRAPPER_PEER_EID  # peer set by the fixture
+UPDATE = b"\x42" * 24
+OPTIONS = encode_options(OptionsSummary(has_lz_receive=True, lz_receive_gas=100_000))
+
+
+def _gas(contract, fn, *args, value=0):
+    boa.env.reset_gas_used()  # also resets warm/cold access sets
+    getattr(contract, fn)(*args, value=value)
+    return contract._computation.get_gas_used()
+
+
+def _fee(mock_endpoint, message_size):
+    return mock_endpoint.nativeFeeBase() + mock_endpoint.nativeFeePerByte() * (
+        message_size + len(OPTIONS)
+    )
+
+
+# reset_gas_used() drops the journal checkpoints boa's test isolation relies on
+@pytest.mark.ignore_isolation
+def test_gas_batching(oapp_batcher_contract, mock_endpoint):
+    """Per-update fee and gas against batch size (steady state, batch slots already dirty)."""
+    oapp = oapp_batcher_contract
+    boa.env.set_balance(boa.env.eoa, 10**20)
+
+    # Warm-up: first batch writes zero slots, later batches overwrite them
+    for _ in range(16):
+        oapp.queue(DST_EID, UPDATE)
+    oapp.flush(DST_EID, OPTIONS, value=10**18)
+
+    single_fee = _fee(mock_endpoint, len(UPDATE))
+    single_gas = _gas(oapp, "send", DST_EID, UPDATE, OPTIONS, value=single_fee)
+
+    print(f"\none message per update: fee {single_fee}, gas {single_gas}")
+    print(f"{'batch':<7}{'fee/update':>14}{'queue+flush gas':>17}{'in-memory gas':>15}")
+    for n in [1, 2, 4, 8, 16]:
+        batch_size = 1 + n * (2 + len(UPDATE))
+        fee = _fee(mock_endpoint, batch_size)
+        assert oapp.quoteFlush(DST_EID, OPTIONS)[0] == _fee(mock_endpoint, 0)
+
+        stored = sum(_gas(oapp, "queue", DST_EID, UPDATE) for _ in range(n))
+        assert oapp.quoteFlush(DST_EID, OPTIONS)[0] == fee
+        stored += _gas(oapp, "flush", DST_EID, OPTIONS, value=fee)
+        in_memory = _gas(oapp, "sendBatch", DST_EID, [UPDATE] * n, OPTIONS, value=fee)
+
+        print(f"{n:<7}{fee // n:>14}{stored // n:>17}{in_memory // n:>15}")
+        if n > 1:
+            assert fee // n < single_fee
+            assert in_memory // n < single_gas
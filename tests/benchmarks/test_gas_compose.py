@@ -0,0 +1,52 @@
+"""Gas benchmark: heavy receive work inline in lzReceive vs split into lzCompose.
+
+Run with `pytest tests/benchmarks -s` to print the gas table.
+"""
+
+import boa
+import pytest
+from conftest import WRAPPER_PEER, WRAPPER_PEER_EID
+
+SRC_EID = WRAPPER_PEER_EID  # peer set by the fixture
+PEER = WRAPPER_PEER
+
+
+def _gas_used(contract, fn, *args):
+    boa.env.reset_gas_used()  # also resets warm/cold access sets
+    fn(*args)
+    return contract._computation.children[0].get_gas_used()
+
+
+# reset_gas_used() drops the journal checkpoints boa's test isolation relies on
+@pytest.mark.ignore_isolation
+def test_gas_compose(oapp_composer_factory, mock_endpoint):
+    """Compare the lzReceive gas limit needed with and without compose, per message size."""
+    inline = oapp_composer_factory(compose=False)
+    composer = oapp_composer_factory()
+
+    print(f"\n{'message':<10}{'inline':>10}{'receive':>10}{'compose':>10}")
+    for nonce, size in enumerate([32, 512], start=1):
+        message = b"\x42" * size
+        guid = nonce.to_bytes(32, "big")
+        origin = (SRC_EID, PEER, nonce)
+
+        inline_gas = _gas_used(
+            mock_endpoint, mock_endpoint.lzReceive, origin, inline.address, guid, message, b""
+        )
+        receive_gas = _gas_used(
+            mock_endpoint, mock_endpoint.lzReceive, origin, composer.address, guid, message, b""
+        )
+        compose_gas = _gas_used(
+            mock_endpoint,
+            mock_endpoint.lzCompose,
+            composer.address,
+            composer.address,
+            guid,
+            0,
+            message,
+            b"",
+        )
+        print(f"{size:<10}{inline_gas:>10}{receive_gas:>10}{compose_gas:>10}")
+
+    # lzReceive no longer scales with the processing work
+    assert receive_gas < inline_gas
@@ -0,0 +1,87 @@
+"""Gas benchmark: storage peers (OApp) vs immutable peers (OAppFixedPeers).
+
+Run with `pytest tests/benchmarks -s` to print the gas table.
+"""
+
+import boa
+import pytest
+from AddressUtils import to_bytes32
+from conftest import _load_oapp_wrapper, OAPP_FIXED_PEERS_BODY
+
+FIXED_EIDS = [30101 + i for i in range(8)]
+FIXED_PEERS = [to_bytes32("0x" + f"{i + 1:02x}" * 20) for i in range(8)]
+FALLBACK_EID = 30201
+FALLBACK_PEER = to_bytes32("0x" + "42" * 20)
+MESSAGE = b"\x42" * 64
+
+
+def _gas_used(contract, fn, *args, **kwargs):
+    boa.env.reset_gas_used()  # also resets warm/cold access sets
+    fn(*args, **kwargs)
+    return contract._computation.get_gas_used()
+
+
+def _measure(oapp, mock_endpoint, sender, eid, peer):
+    fee = oapp.quote(eid, MESSAGE)[0]
+    boa.env.set_balance(sender, fee)
+    with boa.env.prank(sender):
+        send_gas = _gas_used(oapp, oapp.send, eid, MESSAGE, value=fee)
+
+    receive_gas = _gas_used(
+        mock_endpoint,
+        mock_endpoint.lzReceive,
+        (eid, peer, 1),
+        oapp.address,
+        b"\x01" * 32,
+        MESSAGE,
+        b"",
+    )
+    return send_gas, receive_gas
+
+
+@pytest.fixture()
+def oapp_storage_contract(dev_deployer, mock_endpoint):
+    # Same wrapper as the fixed peers fixture, with the OApp peers mapping
+    body = OAPP_FIXED_PEERS_BODY.format(peers_module="OApp")
+    oapp = _load_oapp_wrapper(dev_deployer, None, body, mock_endpoint.address, set_peer=False)
+    with boa.env.prank(dev_deployer):
+        oapp.setPeers(FIXED_EIDS + [FALLBACK_EID], FIXED_PEERS + [FALLBACK_PEER])
+    return oapp
+
+
+# reset_gas_used() drops the journal checkpoints boa's test isolation relies on
+@pytest.mark.ignore_isolation
+def test_gas_fixed_vs_storage_peers(
+    oapp_storage_contract, oapp_fixed_peers_factory, mock_endpoint, dev_deployer
+):
+    """Compare send/receive gas for the first, last and a non-fixed eid in both modes."""
+    oapp_fixed = oapp_fixed_peers_factory(FIXED_EIDS, FIXED_PEERS)
+    with boa.env.prank(dev_deployer):
+        oapp_fixed.setPeer(FALLBACK_EID, FALLBACK_PEER)
+
+    cases = [
+        ("fixed #1", FIXED_EIDS[0], FIXED_PEERS[0]),
+        ("fixed #8", FIXED_EIDS[-1], FIXED_PEERS[-1]),
+        ("fallback", FALLBACK_EID, FALLBACK_PEER),
+    ]
+
+    print(
+        f"\n{'eid':<10}{'send storage':>14}{'send fixed':>12}{'recv storage':>14}{'recv fixed':>12}"
+    )
+    results = {}
+    for label, eid, peer in cases:
+        storage = _measure(oapp_storage_contract, mock_endpoint, dev_deployer, eid, peer)
+        fixed = _measure(oapp_fixed, mock_endpoint, dev_deployer, eid, peer)
+        results[label] = (storage, fixed)
+        print(f"{label:<10}{storage[0]:>14}{fixed[0]:>12}{storage[1]:>14}{fixed[1]:>12}")
+
+    # Fixed peers skip the cold SLOAD on both hot paths
+    for label in ["fixed #1", "fixed #8"]:
+        storage, fixed = results[label]
+        assert fixed[0] < storage[0]
+        assert fixed[1] < storage[1]
+
+    # Non-fixed eids only pay for the scan over the fixed set on top of the storage read
+    storage, fixed = results["fallback"]
+    assert fixed[0] - storage[0] < 2000
+    assert fixed[1] - storage[1] < 2000
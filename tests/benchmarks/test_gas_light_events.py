@@ -0,0 +1,68 @@
+"""Gas benchmark: OAppEvents full (payload) vs light (hash + length) events by message size.
+
+Full mode log data grows by 8 gas per payload byte, light mode pays a fixed-size event plus
+the keccak256 of the payload. Send gas includes the endpoint, whose PacketSent logs the
+payload in both modes. Run with `pytest tests/benchmarks -s` to print the gas table.
+"""
+
+import boa
+import pytest
+from conftest import WRAPPER_PEER, WRAPPER_PEER_EID
+
+SRC_EID = WRAPPER_PEER_EID  # peer set by the fixture
+PEER = WRAPPER_PEER
+SIZES = [0, 32, 64, 128, 256, 512]
+
+
+def _gas_used(contract, fn, *args, **kwargs):
+    boa.env.reset_gas_used()  # also resets warm/cold access sets
+    fn(*args, **kwargs)
+    return contract._computation.get_gas_used()
+
+
+def _measure(oapp, mock_endpoint, message, nonce):
+    fee = oapp.quote(SRC_EID, message)[0]
+    boa.env.set_balance(boa.env.eoa, fee)
+    send_gas = _gas_used(oapp, oapp.send, SRC_EID, message, value=fee)
+
+    receive_gas = _gas_used(
+        mock_endpoint,
+        mock_endpoint.lzReceive,
+        (SRC_EID, PEER, nonce),
+        oapp.address,
+        nonce.to_bytes(32, "big"),
+        message,
+        b"",
+    )
+    return send_gas, receive_gas
+
+
+# reset_gas_used() drops the journal checkpoints boa's test isolation relies on
+@pytest.mark.ignore_isolation
+def test_gas_light_events(oapp_events_factory, mock_endpoint):
+    """Compare send/receive gas of both event modes for 0 to 512 byte messages."""
+    full, light = oapp_events_factory(False), oapp_events_factory(True)
+    for oapp in (full, light):
+        _measure(oapp, mock_endpoint, b"", 1)  # endpoint nonces zero to non-zero writes
+
+    print(
+        f"\n{'message':<10}{'send full':>11}{'send light':>12}{'recv full':>11}{'recv light':>12}"
+    )
+    results = {}
+    for nonce, size in enumerate(SIZES, start=2):
+        message = b"\x42" * size
+        results[size] = (
+            _measure(full, mock_endpoint, message, nonce),
+            _measure(light, mock_endpoint, message, nonce),
+        )
+        (send_full, recv_full), (send_light, recv_light) = results[size]
+        print(f"{size:<10}{send_full:>11}{send_light:>12}{recv_full:>11}{recv_light:>12}")
+
+    # Savings grow by about 8 gas per payload byte, and light mode is never more expensive
+    for direction in (0, 1):
+        savings = {size: r[0][direction] - r[1][direction] for size, r in results.items()}
+        assert all(saving > 0 for saving in savings.values())
+        assert savings[512] - savings[0] > 512 * 8 - 500
+
+    # On receive, light events cost the same at any size, up to the keccak256 words
+    assert results[512][1][1] - results[0][1][1] < 500
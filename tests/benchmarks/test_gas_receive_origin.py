@@ -0,0 +1,37 @@
+"""Gas benchmark: _lzReceive (message passed by value) vs _lzReceiveOrigin.
+
+Run with `pytest tests/benchmarks -s` to print the gas table.
+"""
+
+import boa
+import pytest
+from conftest import WRAPPER_PEER, WRAPPER_PEER_EID
+
+SRC_EID = WRAPPER_PEER_EID  # peer set by the fixture
+PEER = WRAPPER_PEER
+
+
+def _receive_gas(oapp, mock_endpoint, message):
+    boa.env.reset_gas_used()  # also resets warm/cold access sets
+    mock_endpoint.lzReceive((SRC_EID, PEER, 1), oapp.address, b"\x01" * 32, message, b"")
+    return mock_endpoint._computation.children[0].get_gas_used()
+
+
+# reset_gas_used() drops the journal checkpoints boa's test isolation relies on
+@pytest.mark.ignore_isolation
+def test_gas_receive_origin(mock_endpoint, oapp_receiver_factory):
+    """Compare lzReceive gas (OApp call only) of both paths for 32 and 500 byte messages."""
+    oapps = {}
+    for mode, origin_only in [("by value", False), ("origin", True)]:
+        oapps[mode] = oapp_receiver_factory(origin_only)
+        _receive_gas(oapps[mode], mock_endpoint, b"\x01" * 32)  # lastWord zero to non-zero
+
+    print(f"\n{'message':<10}{'_lzReceive':>12}{'_lzReceiveOrigin':>18}{'saved':>8}")
+    for size in [32, 500]:
+        message = b"\x42" * size
+        by_value = _receive_gas(oapps["by value"], mock_endpoint, message)
+        origin = _receive_gas(oapps["origin"], mock_endpoint, message)
+        print(f"{size:<10}{by_value:>12}{origin:>18}{by_value - origin:>8}")
+
+        assert oapps["origin"].lastWord() == oapps["by value"].lastWord()
+        assert origin < by_value
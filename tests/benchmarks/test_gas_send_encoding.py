@@ -0,0 +1,45 @@
+"""Gas benchmark: _lzSend encoding cost by message size.
+
+MessagingParams holds Bytes[MAX_MESSAGE_SIZE] and Bytes[MAX_OPTIONS_TOTAL_SIZE], but is
+encoded by the actual length, so the OApp side of a send barely depends on the message size.
+Run with `pytest tests/benchmarks -s` to print the gas table.
+"""
+
+import boa
+import pytest
+from AddressUtils import to_bytes32
+
+DST_EID = 30101
+PEER = to_bytes32("0x" + "42" * 20)
+OPTIONS = bytes.fromhex("0003010011010000000000000000000000000000ea60")
+
+
+def _send_gas(oapp, sender, message):
+    fee = oapp.quote(DST_EID, message, OPTIONS)[0]
+    boa.env.set_balance(sender, fee)
+    with boa.env.prank(sender):
+        boa.env.reset_gas_used()  # also resets warm/cold access sets
+        oapp.send(DST_EID, message, OPTIONS, value=fee)
+
+    computation = oapp._computation
+    endpoint_gas = sum(child.get_gas_used() for child in computation.children)
+    return computation.get_gas_used(), computation.get_gas_used() - endpoint_gas
+
+
+# reset_gas_used() drops the journal checkpoints boa's test isolation relies on
+@pytest.mark.ignore_isolation
+def test_gas_send_encoding(oapp_send_contract, dev_deployer):
+    """Compare total and OApp-side send gas for 32 and 500 byte messages."""
+    oapp = oapp_send_contract
+    with boa.env.prank(dev_deployer):
+        oapp.setPeer(DST_EID, PEER)
+    _send_gas(oapp, dev_deployer, b"")  # endpoint nonce zero to non-zero write
+
+    print(f"\n{'message':<10}{'total':>8}{'OApp side':>11}")
+    results = {}
+    for size in [32, 500]:
+        results[size] = _send_gas(oapp, dev_deployer, b"\x42" * size)
+        print(f"{size:<10}{results[size][0]:>8}{results[size][1]:>11}")
+
+    # 468 more bytes add less than 1 gas per byte on the OApp side
+    assert results[500][1] - results[32][1] < 468
@@ -1,8 +1,10 @@
 import boa
+import json
 import pytest
 import os
+import timing_plugin
 from web3 import Web3
-from eth_utils import to_bytes
+from AddressUtils import to_bytes32
 
 LZ_ENDPOINT_BASE_SEPOLIA = "0x6EDCE65403992e310A62460808c4b910D972f10f"
 LZ_CHAIN_ID = 84532
@@ -12,38 +14,72 @@ LZ_READ_CHANNEL = 4294967295
 BOA_CACHE = True
 
 
-def _to_bytes32(value):
-    """Convert a string or address to bytes32 format."""
-    if isinstance(value, str) and value.startswith("0x"):
-        # Convert hex string to bytes and pad to 32 bytes
-        return to_bytes(hexstr=value).rjust(32, b"\x00")
-    else:
-        # For non-hex strings or other types
-        return to_bytes(text=str(value)).rjust(32, b"\x00")
+# Contracts that are not necessarily called but appear in the traces of forked tests. Their
+# ABIs are only fetched with --traces, and cached in TRACE_CACHE.
+TRACE_CONTRACTS = [
+    # "0x6EDCE65403992e310A62460808c4b910D972f10f",
+    # "0xcFB06A2F39FfDeF4dE68bd1Efa7AED07c525855D",
+    # "0x23e7950ED3253Ec45D9FbbbF8Ba30B42d7537f7B",
+    # "0xABCE9415ae2c7DF8C37CbdBa73B6C0630Be02AdA",
+    # "0x6098e96a28E02f27B1e6BD381f870F1C8Bd169d3",
+    # "0xB4171f3d814cd7E2dbacB533ba550EE0DA919406",
+    # "0x8A3D588D9f6AC041476b094f97FF94ec30169d3D",
+    # "0x07F5127dDfc5Dd01F2709d3f37a50E0F6C01d797",
+    # "0xe67DC0bF6241C71a6609108A15b8976cd78c2109",
+]
+TRACE_CACHE = os.path.join(os.path.dirname(__file__), ".trace_cache")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--traces",
+        action="store_true",
+        help="fetch TRACE_CONTRACTS ABIs (cached) for better traces in forked tests",
+    )
+    timing_plugin.add_options(parser)
+
+
+def pytest_configure(config):
+    timing_plugin.configure(config)
+
+
+def pytest_unconfigure(config):
+    timing_plugin.unconfigure(config)
+
+
+def _trace_abi(address, scan_url, scan_api):
+    """Load a contract ABI from the local cache, fetching it from the explorer once."""
+    path = os.path.join(TRACE_CACHE, f"{address.lower()}.json")
+    if not os.path.exists(path):
+        from boa.explorer import Etherscan
+
+        abi = Etherscan(scan_url, scan_api).fetch_abi(address)
+        os.makedirs(TRACE_CACHE, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(abi, f)
+    with open(path) as f:
+        return f.read()
+
+
+@pytest.fixture(autouse=True)
+def isolated_env(request):
+    # Each test gets its own env: forked if it uses forked_env, a fresh local one otherwise
+    if "forked_env" in request.fixturenames:
+        yield
+        return
+    with boa.swap_env(boa.Env()):
+        yield
 
 
 @pytest.fixture(autouse=True)
-def better_traces(forked_env, scan_url, scan_api):
-    # contains contracts that are not necessarily called
-    # but appear in the traces
-    contracts = [
-        # "0x6EDCE65403992e310A62460808c4b910D972f10f",
-        # "0xcFB06A2F39FfDeF4dE68bd1Efa7AED07c525855D",
-        # "0x23e7950ED3253Ec45D9FbbbF8Ba30B42d7537f7B",
-        # "0xABCE9415ae2c7DF8C37CbdBa73B6C0630Be02AdA",
-        # "0x6098e96a28E02f27B1e6BD381f870F1C8Bd169d3",
-        # "0xB4171f3d814cd7E2dbacB533ba550EE0DA919406",
-        # "0x8A3D588D9f6AC041476b094f97FF94ec30169d3D",
-        # "0x07F5127dDfc5Dd01F2709d3f37a50E0F6C01d797",
-        # "0xe67DC0bF6241C71a6609108A15b8976cd78c2109",
-        # "0x6098e96a28E02f27B1e6BD381f870F1C8Bd169d3",
-        # "0xB4171f3d814cd7E2dbacB533ba550EE0DA919406",
-        # "0x6EDCE65403992e310A62460808c4b910D972f10f",
-        # "0xcFB06A2F39FfDeF4dE68bd1Efa7AED07c525855D",
-    ]
-    for contract in contracts:
+def better_traces(request, scan_url, scan_api):
+    # Opt-in (--traces), and only for tests that fork
+    if not request.config.getoption("traces") or "forked_env" not in request.fixturenames:
+        return
+    request.getfixturevalue("forked_env")
+    for contract in TRACE_CONTRACTS:
         try:
-            boa.from_etherscan(contract, uri=scan_url, api_key=scan_api)
+            boa.loads_abi(_trace_abi(contract, scan_url, scan_api)).at(contract)
         except Exception as e:
             print(f"Error fetching contract {contract}: {e}")
 
@@ -71,7 +107,7 @@ def dev_deployer():
 
 @pytest.fixture()
 def forked_env(rpc_url):
-    """Automatically fork each test with the specified chain."""
+    """Fork the specified chain for tests (and fixtures) that request it."""
     block_to_fork = "latest"
     with boa.swap_env(boa.Env()):
         if BOA_CACHE:
@@ -101,7 +137,7 @@ def scan_url():
 
 
 @pytest.fixture()
-def oapp_module_contract(dev_deployer):
+def oapp_module_contract(dev_deployer, forked_env):
     with boa.env.prank(dev_deployer):
         wrapper_contract = """
         from snekmate.auth import ownable
@@ -131,7 +167,585 @@ def oapp_module_contract(dev_deployer):
 
 
 @pytest.fixture()
-def messenger_contract(dev_deployer):
+def mock_endpoint():
+    return boa.load("tests/mocks/EndpointV2Mock.vy", LZ_ENDPOINT_ID)
+
+
+# Peer set by _load_oapp_wrapper, tests deliver messages from it
+WRAPPER_PEER_EID = 30101
+WRAPPER_PEER = to_bytes32("0x" + "42" * 20)
+
+OAPP_WRAPPER_PREAMBLE = """
+from snekmate.auth import ownable
+from src import OApp
+{module_import}
+
+initializes: ownable
+initializes: OApp[ownable:=ownable]
+{module_initializes}
+
+exports: ownable.__interface__
+{exports}
+
+@deploy
+def __init__(_endpoint: address{init_params}):
+    ownable.__init__()
+    ownable._transfer_ownership(tx.origin)
+
+    OApp.__init__(_endpoint, tx.origin)
+{init}
+"""
+
+
+def _load_oapp_wrapper(
+    deployer,
+    module,
+    body,
+    *args,
+    module_uses="[OApp:=OApp]",
+    exports="exports: OApp.__interface__",
+    init_params="",
+    init="",
+    set_peer=True,
+):
+    """
+    Deploy an ownable OApp wrapper with a src module (None for OApp alone) and a contract body,
+    with WRAPPER_PEER set unless set_peer=False.
+    """
+    source = OAPP_WRAPPER_PREAMBLE.format(
+        module_import=f"from src import {module}" if module else "",
+        module_initializes=f"initializes: {module}{module_uses}" if module else "",
+        exports=exports,
+        init_params=init_params,
+        init=init,
+    )
+    with boa.env.prank(deployer):
+        contract = boa.loads(source + body, *args)
+        if set_peer:
+            contract.setPeer(WRAPPER_PEER_EID, WRAPPER_PEER)
+    return contract
+
+
+@pytest.fixture()
+def oapp_pathways_contract(dev_deployer, mock_endpoint):
+    return _load_oapp_wrapper(
+        dev_deployer,
+        "OAppPathways",
+        "",
+        mock_endpoint.address,
+        module_uses="[ownable:=ownable, OApp:=OApp]",
+        exports="exports: OApp.__interface__\nexports: OAppPathways.applyPathways",
+        set_peer=False,
+    )
+
+
+@pytest.fixture()
+def oapp_config_contract(dev_deployer, mock_endpoint):
+    return _load_oapp_wrapper(
+        dev_deployer,
+        "OAppConfigUtils",
+        "",
+        mock_endpoint.address,
+        module_uses="[ownable:=ownable]",
+        exports="exports: OApp.__interface__\nexports: OAppConfigUtils.__interface__",
+        init="    OAppConfigUtils.__init__(_endpoint)",
+        set_peer=False,
+    )
+
+
+OAPP_SEND_BODY = """
+@view
+@external
+def quote(
+    _dstEid: uint32,
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+    _options: Bytes[OApp.MAX_OPTIONS_TOTAL_SIZE],
+) -> OApp.MessagingFee:
+    return OApp._quote(_dstEid, _message, _options, False)
+
+@payable
+@external
+def send(
+    _dstEid: uint32,
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+    _options: Bytes[OApp.MAX_OPTIONS_TOTAL_SIZE],
+) -> OApp.MessagingReceipt:
+    fee: OApp.MessagingFee = OApp.MessagingFee(nativeFee=msg.value, lzTokenFee=0)
+    return OApp._lzSend(_dstEid, _message, _options, fee, msg.sender)
+"""
+
+
+@pytest.fixture()
+def oapp_send_contract(dev_deployer, mock_endpoint):
+    return _load_oapp_wrapper(
+        dev_deployer, None, OAPP_SEND_BODY, mock_endpoint.address, set_peer=False
+    )
+
+
+OAPP_NONBLOCKING_BODY = """
+# messages starting with this prefix revert while failing is enabled
+FAIL_PREFIX: constant(Bytes[4]) = b"fail"
+
+failing: public(bool)
+received: public(uint256)
+
+@external
+def setFailing(_failing: bool):
+    self.failing = _failing
+
+@payable
+@external
+def lzReceive(
+    _origin: OApp.Origin,
+    _guid: bytes32,
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+    _executor: address,
+    _extraData: Bytes[OApp.MAX_EXTRA_DATA_SIZE],
+):
+    OAppNonblocking._lzReceive(_origin, _guid, _message, _executor, _extraData)
+
+@external
+def nonblockingLzReceive(
+    _origin: OApp.Origin, _guid: bytes32, _message: Bytes[OApp.MAX_MESSAGE_SIZE]
+):
+    OAppNonblocking._checkSelf()
+
+    if _message == b"burn":
+        for i: uint256 in range(10**6):  # runs out of gas
+            self.received += 1
+
+    if self.failing and len(_message) >= 4:
+        assert slice(_message, 0, 4) != FAIL_PREFIX, "handler failed"
+
+    self.received += 1
+"""
+
+
+@pytest.fixture()
+def oapp_nonblocking_contract(dev_deployer, mock_endpoint):
+    return _load_oapp_wrapper(
+        dev_deployer,
+        "OAppNonblocking",
+        OAPP_NONBLOCKING_BODY,
+        mock_endpoint.address,
+        exports="exports: OApp.__interface__\nexports: OAppNonblocking.__interface__",
+    )
+
+
+OAPP_BATCHER_BODY = """
+# received app messages, in delivery order
+received: public(HashMap[uint256, Bytes[OAppBatcher.MAX_BATCH_MESSAGE_SIZE]])
+receivedCount: public(uint256)
+
+@external
+def queue(_dstEid: uint32, _message: Bytes[OAppBatcher.MAX_BATCH_MESSAGE_SIZE]) -> uint256:
+    return OAppBatcher._queue(_dstEid, _message)
+
+@view
+@external
+def quoteFlush(_dstEid: uint32, _options: Bytes[OApp.MAX_OPTIONS_TOTAL_SIZE]) -> OApp.MessagingFee:
+    return OAppBatcher._quoteFlush(_dstEid, _options, False)
+
+@payable
+@external
+def flush(_dstEid: uint32, _options: Bytes[OApp.MAX_OPTIONS_TOTAL_SIZE]) -> OApp.MessagingReceipt:
+    fee: OApp.MessagingFee = OApp.MessagingFee(nativeFee=msg.value, lzTokenFee=0)
+    return OAppBatcher._flush(_dstEid, _options, fee, msg.sender)
+
+@payable
+@external
+def sendBatch(
+    _dstEid: uint32,
+    _messages: DynArray[Bytes[OAppBatcher.MAX_BATCH_MESSAGE_SIZE], OAppBatcher.MAX_BATCH_MESSAGES],
+    _options: Bytes[OApp.MAX_OPTIONS_TOTAL_SIZE],
+) -> OApp.MessagingReceipt:
+    batch: Bytes[OApp.MAX_MESSAGE_SIZE] = b""
+    for m: Bytes[OAppBatcher.MAX_BATCH_MESSAGE_SIZE] in _messages:
+        batch = OAppBatcher._appendToBatch(batch, m)
+    fee: OApp.MessagingFee = OApp.MessagingFee(nativeFee=msg.value, lzTokenFee=0)
+    return OApp._lzSend(_dstEid, batch, _options, fee, msg.sender)
+
+@payable
+@external
+def send(
+    _dstEid: uint32,
+    _message: Bytes[OAppBatcher.MAX_BATCH_MESSAGE_SIZE],
+    _options: Bytes[OApp.MAX_OPTIONS_TOTAL_SIZE],
+) -> OApp.MessagingReceipt:
+    fee: OApp.MessagingFee = OApp.MessagingFee(nativeFee=msg.value, lzTokenFee=0)
+    return OApp._lzSend(_dstEid, _message, _options, fee, msg.sender)
+
+@pure
+@external
+def unbatch(
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+) -> DynArray[Bytes[OAppBatcher.MAX_BATCH_MESSAGE_SIZE], OAppBatcher.MAX_BATCH_MESSAGES]:
+    return OAppBatcher._unbatch(_message)
+
+@payable
+@external
+def lzReceive(
+    _origin: OApp.Origin,
+    _guid: bytes32,
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+    _executor: address,
+    _extraData: Bytes[OApp.MAX_EXTRA_DATA_SIZE],
+):
+    OApp._lzReceiveOrigin(_origin)
+    messages: DynArray[Bytes[OAppBatcher.MAX_BATCH_MESSAGE_SIZE], OAppBatcher.MAX_BATCH_MESSAGES] = OAppBatcher._unbatch(_message)
+    count: uint256 = self.receivedCount
+    for m: Bytes[OAppBatcher.MAX_BATCH_MESSAGE_SIZE] in messages:
+        self.received[count] = m
+        count += 1
+    self.receivedCount = count
+"""
+
+
+@pytest.fixture()
+def oapp_batcher_contract(dev_deployer, mock_endpoint):
+    return _load_oapp_wrapper(
+        dev_deployer,
+        "OAppBatcher",
+        OAPP_BATCHER_BODY,
+        mock_endpoint.address,
+        exports="exports: OApp.__interface__\nexports: OAppBatcher.pendingBatches",
+    )
+
+
+OAPP_QUOTE_CACHE_BODY = """
+@view
+@external
+def quote(
+    _dstEid: uint32,
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+    _options: Bytes[OApp.MAX_OPTIONS_TOTAL_SIZE],
+) -> OApp.MessagingFee:
+    return OAppQuoteCache._peekQuote(_dstEid, _message, _options, False)
+
+@payable
+@external
+def send(
+    _dstEid: uint32,
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+    _options: Bytes[OApp.MAX_OPTIONS_TOTAL_SIZE],
+) -> OApp.MessagingReceipt:
+    fee: OApp.MessagingFee = OAppQuoteCache._cachedQuote(_dstEid, _message, _options, False)
+    return OApp._lzSend(_dstEid, _message, _options, fee, msg.sender)
+"""
+
+
+@pytest.fixture()
+def oapp_quote_cache_contract(dev_deployer, mock_endpoint):
+    return _load_oapp_wrapper(
+        dev_deployer,
+        "OAppQuoteCache",
+        OAPP_QUOTE_CACHE_BODY,
+        mock_endpoint.address,
+        module_uses="[ownable:=ownable, OApp:=OApp]",
+        exports="exports: OApp.__interface__\nexports: OAppQuoteCache.__interface__",
+    )
+
+
+OAPP_GAS_TANK_BODY = """
+@external
+def push(
+    _dstEid: uint32,
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+    _options: Bytes[OApp.MAX_OPTIONS_TOTAL_SIZE],
+    _nativeFee: uint256,
+) -> OApp.MessagingReceipt:
+    return OAppGasTank._lzSendFromTank(_dstEid, _message, _options, _nativeFee)
+
+@external
+@payable
+def __default__():
+    pass
+"""
+
+
+@pytest.fixture()
+def oapp_gas_tank_contract(dev_deployer, mock_endpoint):
+    return _load_oapp_wrapper(
+        dev_deployer,
+        "OAppGasTank",
+        OAPP_GAS_TANK_BODY,
+        mock_endpoint.address,
+        module_uses="[ownable:=ownable, OApp:=OApp]",
+        exports="exports: OApp.__interface__\nexports: OAppGasTank.__interface__",
+    )
+
+
+OAPP_READ_CACHE_BODY = """
+from src import ReadCmdCodecV1
+
+@external
+@payable
+def requestIfStale(
+    _readChannel: uint32,
+    _targetEid: uint32,
+    _to: address,
+    _callData: Bytes[ReadCmdCodecV1.MAX_CALLDATA_SIZE],
+    _isBlockNum: bool,
+    _blockNumOrTimestamp: uint64,
+) -> bytes32:
+    request: ReadCmdCodecV1.EVMCallRequestV1 = ReadCmdCodecV1.EVMCallRequestV1(
+        appRequestLabel=0,
+        targetEid=_targetEid,
+        isBlockNum=_isBlockNum,
+        blockNumOrTimestamp=_blockNumOrTimestamp,
+        confirmations=0,
+        to=_to,
+        callData=_callData,
+    )
+    receipt: OApp.MessagingReceipt = OAppReadCache._requestReadIfStale(
+        _readChannel,
+        request,
+        b"",
+        OApp.MessagingFee(nativeFee=msg.value, lzTokenFee=0),
+        msg.sender,
+    )
+    if receipt.guid == empty(bytes32):
+        send(msg.sender, msg.value)
+    return receipt.guid
+
+@external
+@view
+def getCachedRead(
+    _targetEid: uint32, _to: address, _callData: Bytes[ReadCmdCodecV1.MAX_CALLDATA_SIZE]
+) -> (Bytes[OAppReadCache.MAX_READ_RESPONSE_SIZE], bool):
+    return OAppReadCache._getCachedRead(_targetEid, _to, _callData)
+
+@external
+@payable
+def lzReceive(
+    _origin: OApp.Origin,
+    _guid: bytes32,
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+    _executor: address,
+    _extraData: Bytes[OApp.MAX_EXTRA_DATA_SIZE],
+):
+    OApp._lzReceiveOrigin(_origin)
+    OAppReadCache._cacheReadResponse(_guid, _message)
+"""
+
+
+@pytest.fixture()
+def oapp_read_cache_contract(dev_deployer, mock_endpoint):
+    contract = _load_oapp_wrapper(
+        dev_deployer,
+        "OAppReadCache",
+        OAPP_READ_CACHE_BODY,
+        mock_endpoint.address,
+        module_uses="[ownable:=ownable, OApp:=OApp]",
+        exports="exports: OApp.__interface__\nexports: OAppReadCache.__interface__",
+        set_peer=False,
+    )
+    with boa.env.prank(dev_deployer):
+        contract.setReadChannel(LZ_READ_CHANNEL, True)
+    return contract
+
+
+OAPP_COMPOSER_BODY = """
+# heavy work: one storage slot per message word
+processed: public(HashMap[bytes32, HashMap[uint256, bytes32]])
+received: public(uint256)
+
+@internal
+def _process(_guid: bytes32, _message: Bytes[OApp.MAX_MESSAGE_SIZE]):
+    for i: uint256 in range(len(_message) // 32, bound=OApp.MAX_MESSAGE_SIZE // 32):
+        self.processed[_guid][i] = extract32(_message, i * 32)
+
+@payable
+@external
+def lzReceive(
+    _origin: OApp.Origin,
+    _guid: bytes32,
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+    _executor: address,
+    _extraData: Bytes[OApp.MAX_EXTRA_DATA_SIZE],
+):
+    OApp._lzReceiveOrigin(_origin)
+    self.received += 1
+    {receive_work}
+
+@payable
+@external
+def lzCompose(
+    _from: address,
+    _guid: bytes32,
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+    _executor: address,
+    _extraData: Bytes[OApp.MAX_EXTRA_DATA_SIZE],
+):
+    OAppComposer._lzCompose(_from, _guid, _message, _executor, _extraData)
+    self._process(_guid, _message)
+"""
+
+
+@pytest.fixture()
+def oapp_composer_factory(dev_deployer, mock_endpoint):
+    """Deploy an OAppComposer wrapper; compose=False processes messages inline in lzReceive."""
+
+    def deploy(compose=True):
+        receive_work = (
+            "OAppComposer._sendCompose(_guid, 0, _message)"
+            if compose
+            else "self._process(_guid, _message)"
+        )
+        body = OAPP_COMPOSER_BODY.format(receive_work=receive_work)
+        return _load_oapp_wrapper(dev_deployer, "OAppComposer", body, mock_endpoint.address)
+
+    return deploy
+
+
+OAPP_RECEIVER_BODY = """
+event MessageRead:
+    length: uint256
+    word: bytes32
+
+readOffset: public(uint256)
+lastWord: public(bytes32)
+
+@external
+def setReadOffset(_offset: uint256):
+    self.readOffset = _offset
+
+@payable
+@external
+def lzReceive(
+    _origin: OApp.Origin,
+    _guid: bytes32,
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+    _executor: address,
+    _extraData: Bytes[OApp.MAX_EXTRA_DATA_SIZE],
+):
+    {receive_check}
+    self.lastWord = extract32(_message, self.readOffset)
+    log MessageRead(length=len(_message), word=self.lastWord)
+"""
+
+
+@pytest.fixture()
+def oapp_receiver_factory(dev_deployer, mock_endpoint):
+    """Deploy an OApp receiver checking with _lzReceiveOrigin, or _lzReceive if origin_only=False."""
+
+    def deploy(origin_only=True):
+        receive_check = (
+            "OApp._lzReceiveOrigin(_origin)"
+            if origin_only
+            else "OApp._lzReceive(_origin, _guid, _message, _executor, _extraData)"
+        )
+        body = OAPP_RECEIVER_BODY.format(receive_check=receive_check)
+        return _load_oapp_wrapper(dev_deployer, None, body, mock_endpoint.address)
+
+    return deploy
+
+
+OAPP_FIXED_PEERS_BODY = """
+@view
+@external
+def quote(_dstEid: uint32, _message: Bytes[OApp.MAX_MESSAGE_SIZE]) -> OApp.MessagingFee:
+    return {peers_module}._quote(_dstEid, _message, b"", False)
+
+@payable
+@external
+def send(_dstEid: uint32, _message: Bytes[OApp.MAX_MESSAGE_SIZE]):
+    {peers_module}._lzSend(
+        _dstEid, _message, b"", OApp.MessagingFee(nativeFee=msg.value, lzTokenFee=0), msg.sender
+    )
+
+@payable
+@external
+def lzReceive(
+    _origin: OApp.Origin,
+    _guid: bytes32,
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+    _executor: address,
+    _extraData: Bytes[OApp.MAX_EXTRA_DATA_SIZE],
+):
+    {peers_module}._lzReceive(_origin, _guid, _message, _executor, _extraData)
+"""
+
+
+@pytest.fixture()
+def oapp_fixed_peers_factory(dev_deployer, mock_endpoint):
+    """Deploy an OAppFixedPeers wrapper with the given fixed (eid, peer) pairs."""
+
+    def deploy(eids, peers):
+        return _load_oapp_wrapper(
+            dev_deployer,
+            "OAppFixedPeers",
+            OAPP_FIXED_PEERS_BODY.format(peers_module="OAppFixedPeers"),
+            mock_endpoint.address,
+            eids,
+            peers,
+            module_uses="[ownable:=ownable, OApp:=OApp]",
+            exports=(
+                "exports: (OApp.endpoint, OApp.setDelegate, OApp.isComposeMsgSender, "
+                "OApp.nextNonce)\nexports: OAppFixedPeers.__interface__"
+            ),
+            init_params=(
+                ", _eids: DynArray[uint32, OAppFixedPeers.MAX_FIXED_PEERS]"
+                ", _peers: DynArray[bytes32, OAppFixedPeers.MAX_FIXED_PEERS]"
+            ),
+            init="    OAppFixedPeers.__init__(_eids, _peers)",
+            set_peer=False,
+        )
+
+    return deploy
+
+
+OAPP_EVENTS_BODY = """
+exports: OAppEvents.lightEvents
+
+@view
+@external
+def quote(_dstEid: uint32, _message: Bytes[OApp.MAX_MESSAGE_SIZE]) -> OApp.MessagingFee:
+    return OApp._quote(_dstEid, _message, b"", False)
+
+@payable
+@external
+def send(_dstEid: uint32, _message: Bytes[OApp.MAX_MESSAGE_SIZE]):
+    receipt: OApp.MessagingReceipt = OApp._lzSend(
+        _dstEid, _message, b"", OApp.MessagingFee(nativeFee=msg.value, lzTokenFee=0), msg.sender
+    )
+    OAppEvents._logSent(_dstEid, receipt, _message)
+
+@payable
+@external
+def lzReceive(
+    _origin: OApp.Origin,
+    _guid: bytes32,
+    _message: Bytes[OApp.MAX_MESSAGE_SIZE],
+    _executor: address,
+    _extraData: Bytes[OApp.MAX_EXTRA_DATA_SIZE],
+):
+    OApp._lzReceiveOrigin(_origin)
+    OAppEvents._logReceived(_origin, _guid, _message)
+"""
+
+
+@pytest.fixture()
+def oapp_events_factory(dev_deployer, mock_endpoint):
+    """Deploy an OAppEvents wrapper in full (light_events=False) or light event mode."""
+
+    def deploy(light_events):
+        return _load_oapp_wrapper(
+            dev_deployer,
+            "OAppEvents",
+            OAPP_EVENTS_BODY,
+            mock_endpoint.address,
+            light_events,
+            module_uses="",
+            init_params=", _lightEvents: bool",
+            init="    OAppEvents.__init__(_lightEvents)",
+        )
+
+    return deploy
+
+
+@pytest.fixture()
+def messenger_contract(dev_deployer, forked_env):
     with boa.env.prank(dev_deployer):
         return boa.load("examples/OAppExample.vy", LZ_ENDPOINT_BASE_SEPOLIA)
 
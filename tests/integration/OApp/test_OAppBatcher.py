@@ -0,0 +1,84 @@
+"""Test OAppBatcher queueing, flushing and unbatching against the mock endpoint."""
+
+import boa
+from conftest import WRAPPER_PEER, WRAPPER_PEER_EID
+
+DST_EID = WRAPPER_PEER_EID  # peer set by the fixture
+PEER = WRAPPER_PEER
+PACKET_HEADER_SIZE = 113  # PacketV1Codec header + guid
+MESSAGES = [b"", b"\x01", b"update-2" * 4, b"\x03" * 64]
+
+
+def _frame(messages):
+    return bytes([len(messages)]) + b"".join(len(m).to_bytes(2, "big") + m for m in messages)
+
+
+def _sent_message(oapp):
+    packet = [e for e in oapp.get_logs() if "PacketSent" in str(e)][0]
+    return packet.encodedPayload[PACKET_HEADER_SIZE:]
+
+
+def test_queue_and_flush(oapp_batcher_contract, mock_endpoint):
+    """Test that queued messages are sent as one framed message and the queue is cleared."""
+    oapp = oapp_batcher_contract
+
+    for i, message in enumerate(MESSAGES):
+        assert oapp.queue(DST_EID, message) == i + 1
+    assert oapp.pendingBatches(DST_EID) == _frame(MESSAGES)
+
+    fee = oapp.quoteFlush(DST_EID, b"")[0]
+    assert fee == mock_endpoint.nativeFeeBase() + mock_endpoint.nativeFeePerByte() * len(
+        _frame(MESSAGES)
+    )
+    boa.env.set_balance(boa.env.eoa, fee)
+    oapp.flush(DST_EID, b"", value=fee)
+
+    assert _sent_message(oapp) == _frame(MESSAGES)
+    assert oapp.pendingBatches(DST_EID) == b""
+    with boa.reverts("OApp: empty batch"):
+        oapp.flush(DST_EID, b"")
+
+
+def test_send_batch_in_memory(oapp_batcher_contract):
+    """Test batching within a transaction produces the same framing."""
+    oapp = oapp_batcher_contract
+
+    boa.env.set_balance(boa.env.eoa, 10**18)
+    oapp.sendBatch(DST_EID, MESSAGES, b"", value=10**18)
+    assert _sent_message(oapp) == _frame(MESSAGES)
+
+
+def test_batch_full(oapp_batcher_contract):
+    """Test that batches are capped by message count and total size."""
+    oapp = oapp_batcher_contract
+
+    for _ in range(16):
+        oapp.queue(DST_EID, b"\x01")
+    with boa.reverts("OApp: batch full"):
+        oapp.queue(DST_EID, b"\x01")
+
+    # 7 x 66 bytes fit in 512, the 8th does not
+    for _ in range(7):
+        oapp.queue(DST_EID + 1, b"\x02" * 64)
+    with boa.reverts("OApp: batch full"):
+        oapp.queue(DST_EID + 1, b"\x02" * 64)
+
+
+def test_receive_unbatches(oapp_batcher_contract, mock_endpoint):
+    """Test that the receiver handles each batched message in order."""
+    oapp = oapp_batcher_contract
+
+    mock_endpoint.lzReceive((DST_EID, PEER, 1), oapp.address, b"\x01" * 32, _frame(MESSAGES), b"")
+    assert oapp.receivedCount() == len(MESSAGES)
+    assert [oapp.received(i) for i in range(len(MESSAGES))] == MESSAGES
+
+
+def test_unbatch_invalid(oapp_batcher_contract):
+    """Test that malformed batches are rejected."""
+    oapp = oapp_batcher_contract
+    batch = _frame(MESSAGES)
+
+    assert oapp.unbatch(batch) == MESSAGES
+    for invalid in [b"", batch[:-1], batch + b"\x00", b"\x11" + batch[1:], _frame([b"\x01" * 65])]:
+        with boa.reverts("OApp: invalid batch"):
+            oapp.unbatch(invalid)
@@ -0,0 +1,65 @@
+"""Test OAppComposer compose queueing and lzCompose handling against the mock endpoint."""
+
+import boa
+from conftest import WRAPPER_PEER, WRAPPER_PEER_EID
+
+SRC_EID = WRAPPER_PEER_EID  # peer set by the fixture
+PEER = WRAPPER_PEER
+GUID = b"\x01" * 32
+MESSAGE = b"".join(i.to_bytes(32, "big") for i in range(1, 5))
+
+
+def _deliver(mock_endpoint, oapp, message=MESSAGE):
+    mock_endpoint.lzReceive((SRC_EID, PEER, 1), oapp.address, GUID, message, b"")
+
+
+def test_receive_queues_compose(oapp_composer_factory, mock_endpoint):
+    """Test that lzReceive queues the follow-up work at the endpoint."""
+    oapp = oapp_composer_factory()
+    _deliver(mock_endpoint, oapp)
+
+    events = [e for e in mock_endpoint.get_logs() if "ComposeSent" in str(e)]
+    assert len(events) == 1
+    assert events[0].to == oapp.address
+    assert events[0].message == MESSAGE
+
+    assert oapp.received() == 1
+    assert oapp.processed(GUID, 0) == b"\x00" * 32
+
+
+def test_compose_runs_work(oapp_composer_factory, mock_endpoint):
+    """Test that lzCompose runs the queued work exactly once."""
+    oapp = oapp_composer_factory()
+    _deliver(mock_endpoint, oapp)
+
+    mock_endpoint.lzCompose(oapp.address, oapp.address, GUID, 0, MESSAGE, b"")
+    assert [oapp.processed(GUID, i) for i in range(4)] == [
+        MESSAGE[i * 32 : (i + 1) * 32] for i in range(4)
+    ]
+
+    with boa.reverts("Endpoint: compose already delivered"):
+        mock_endpoint.lzCompose(oapp.address, oapp.address, GUID, 0, MESSAGE, b"")
+
+
+def test_compose_checks(oapp_composer_factory, mock_endpoint):
+    """Test that lzCompose only accepts the endpoint and compose messages queued by self."""
+    oapp = oapp_composer_factory()
+
+    with boa.reverts("OApp: only endpoint"):
+        oapp.lzCompose(oapp.address, GUID, MESSAGE, oapp.address, b"")
+
+    # another app queues a compose message to this OApp
+    other = boa.env.generate_address()
+    with boa.env.prank(other):
+        mock_endpoint.sendCompose(oapp.address, GUID, 0, MESSAGE)
+
+    with boa.reverts("OApp: invalid compose sender"):
+        mock_endpoint.lzCompose(other, oapp.address, GUID, 0, MESSAGE, b"")
+
+
+def test_compose_sender(oapp_composer_factory):
+    """Test that self is an approved compose sender."""
+    oapp = oapp_composer_factory()
+
+    assert oapp.isComposeMsgSender((SRC_EID, PEER, 1), MESSAGE, oapp.address)
+    assert not oapp.isComposeMsgSender((SRC_EID, PEER, 1), MESSAGE, boa.env.generate_address())
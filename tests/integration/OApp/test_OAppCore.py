@@ -1,17 +1,17 @@
 """Test peer management functionality for OApp."""
 
 import boa
-from conftest import _to_bytes32
+from AddressUtils import to_bytes32
 
 
 def test_set_peer(oapp_module_contract, dev_deployer):
     """Test basic peer setting functionality"""
     # Set up test data
     test_eid = 1234
-    test_peer = _to_bytes32("0x" + "42" * 20)
+    test_peer = to_bytes32("0x" + "42" * 20)
 
     # Initially should be empty/zero
-    assert oapp_module_contract.peers(test_eid) == _to_bytes32("0x" + "00" * 20)
+    assert oapp_module_contract.peers(test_eid) == to_bytes32("0x" + "00" * 20)
 
     # Set peer as owner
     with boa.env.prank(dev_deployer):
@@ -25,9 +25,9 @@ def test_multiple_peers(oapp_module_contract, dev_deployer):
     """Test setting multiple peers"""
     # Set up test data
     peers = [
-        (1234, _to_bytes32("0x" + "42" * 20)),
-        (5678, _to_bytes32("0x" + "43" * 20)),
-        (9012, _to_bytes32("0x" + "44" * 20)),
+        (1234, to_bytes32("0x" + "42" * 20)),
+        (5678, to_bytes32("0x" + "43" * 20)),
+        (9012, to_bytes32("0x" + "44" * 20)),
     ]
 
     # Set multiple peers
@@ -44,9 +44,9 @@ def test_remove_peer(oapp_module_contract, dev_deployer):
     """Test removing peers"""
     # Set up initial peers
     test_eid_1 = 1234
-    test_peer_1 = _to_bytes32("0x" + "42" * 20)
+    test_peer_1 = to_bytes32("0x" + "42" * 20)
     test_eid_2 = 5678
-    test_peer_2 = _to_bytes32("0x" + "43" * 20)
+    test_peer_2 = to_bytes32("0x" + "43" * 20)
 
     # Add peers
     with boa.env.prank(dev_deployer):
@@ -57,18 +57,18 @@ def test_remove_peer(oapp_module_contract, dev_deployer):
 
     # Remove first peer by setting to zero bytes32
     with boa.env.prank(dev_deployer):
-        oapp_module_contract.setPeer(test_eid_1, _to_bytes32("0x" + "00" * 20))
+        oapp_module_contract.setPeer(test_eid_1, to_bytes32("0x" + "00" * 20))
 
     # Verify peer is removed
-    assert oapp_module_contract.peers(test_eid_1) == _to_bytes32("0x" + "00" * 20)
+    assert oapp_module_contract.peers(test_eid_1) == to_bytes32("0x" + "00" * 20)
     assert oapp_module_contract.peers(test_eid_2) == test_peer_2
 
 
 def test_update_peer(oapp_module_contract, dev_deployer):
     """Test updating existing peer"""
     test_eid = 1234
-    test_peer_1 = _to_bytes32("0x" + "42" * 20)
-    test_peer_2 = _to_bytes32("0x" + "43" * 20)
+    test_peer_1 = to_bytes32("0x" + "42" * 20)
+    test_peer_2 = to_bytes32("0x" + "43" * 20)
 
     # Set initial peer
     with boa.env.prank(dev_deployer):
@@ -89,7 +89,7 @@ def test_unauthorized_peer_setting(oapp_module_contract):
     # Generate unauthorized user
     unauthorized_user = boa.env.generate_address()
     test_eid = 1234
-    test_peer = _to_bytes32("0x" + "42" * 20)
+    test_peer = to_bytes32("0x" + "42" * 20)
 
     # Attempt to set peer as non-owner
     with boa.env.prank(unauthorized_user):
@@ -100,7 +100,7 @@ def test_unauthorized_peer_setting(oapp_module_contract):
 def test_event_emission(oapp_module_contract, dev_deployer):
     """Test that PeerSet event is emitted when setting a peer"""
     test_eid = 1234
-    test_peer = _to_bytes32("0x" + "42" * 20)
+    test_peer = to_bytes32("0x" + "42" * 20)
 
     # Set peer
     with boa.env.prank(dev_deployer):
@@ -117,7 +117,7 @@ def test_event_emission(oapp_module_contract, dev_deployer):
 def test_getPeerOrRevert(oapp_module_contract, dev_deployer):
     """Test getPeerOrRevert function"""
     test_eid = 1234
-    test_peer = _to_bytes32("0x" + "42" * 20)
+    test_peer = to_bytes32("0x" + "42" * 20)
 
     # Check reverts with no peer set
     with boa.reverts("OApp: no peer"):
@@ -133,7 +133,7 @@ def test_getPeerOrRevert(oapp_module_contract, dev_deployer):
 
     # Check reverts with peer set to zero bytes32
     with boa.env.prank(dev_deployer):
-        oapp_module_contract.setPeer(test_eid, _to_bytes32("0x" + "00" * 20))
+        oapp_module_contract.setPeer(test_eid, to_bytes32("0x" + "00" * 20))
 
     with boa.env.prank(dev_deployer):
         with boa.reverts("OApp: no peer"):
@@ -146,3 +146,47 @@ def test_setDelegate(oapp_module_contract, dev_deployer):
 
     with boa.env.prank(dev_deployer):
         oapp_module_contract.setDelegate(delegate)
+
+
+def test_set_peers(oapp_module_contract, dev_deployer):
+    """Test setting multiple peers in a single call"""
+    eids = [1234 + i for i in range(20)]
+    peers = [to_bytes32("0x" + f"{i + 1:02x}" * 20) for i in range(20)]
+
+    with boa.env.prank(dev_deployer):
+        oapp_module_contract.setPeers(eids, peers)
+
+    # Verify PeerSet is emitted per entry
+    events = [str(e) for e in oapp_module_contract.get_logs() if "PeerSet" in str(e)]
+    assert len(events) == len(eids)
+    assert all(str(eid) in event for eid, event in zip(eids, events))
+
+    # Verify all peers are set
+    for eid, peer in zip(eids, peers):
+        assert oapp_module_contract.peers(eid) == peer
+
+
+def test_set_peers_length_mismatch(oapp_module_contract, dev_deployer):
+    """Test that setPeers reverts on mismatched array lengths"""
+    with boa.env.prank(dev_deployer):
+        with boa.reverts("OApp: Array length mismatch"):
+            oapp_module_contract.setPeers([1234, 5678], [to_bytes32("0x" + "42" * 20)])
+
+
+def test_unauthorized_set_peers(oapp_module_contract):
+    """Test that unauthorized users cannot set peers in batch"""
+    with boa.env.prank(boa.env.generate_address()):
+        with boa.reverts("ownable: caller is not the owner"):
+            oapp_module_contract.setPeers([1234], [to_bytes32("0x" + "42" * 20)])
+
+
+def test_get_peers(oapp_module_contract, dev_deployer):
+    """Test reading multiple peers in a single call"""
+    test_peer = to_bytes32("0x" + "42" * 20)
+    empty_peer = to_bytes32("0x" + "00" * 20)
+
+    with boa.env.prank(dev_deployer):
+        oapp_module_contract.setPeers([1234, 9012], [test_peer, test_peer])
+
+    assert oapp_module_contract.getPeers([1234, 5678, 9012]) == [test_peer, empty_peer, test_peer]
+    assert oapp_module_contract.getPeers([]) == []
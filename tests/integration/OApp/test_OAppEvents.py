@@ -0,0 +1,58 @@
+"""Test OAppEvents full and light event modes against the mock endpoint."""
+
+import boa
+from conftest import WRAPPER_PEER, WRAPPER_PEER_EID
+from eth_utils import keccak
+from MessageTracker import decode_packet
+
+SRC_EID = WRAPPER_PEER_EID  # peer set by the fixture
+PEER = WRAPPER_PEER
+MESSAGE = b"\x42" * 100
+
+
+def _send(oapp, message=MESSAGE):
+    fee = oapp.quote(SRC_EID, message)[0]
+    boa.env.set_balance(boa.env.eoa, fee)
+    oapp.send(SRC_EID, message, value=fee)
+
+
+def _logs(contract, name):
+    return [e for e in contract.get_logs() if type(e).__name__ == name]
+
+
+def test_full_mode(oapp_events_factory, mock_endpoint):
+    """Test that full mode logs the payload of sent and received messages."""
+    oapp = oapp_events_factory(False)
+    assert not oapp.lightEvents()
+
+    _send(oapp)
+    (sent,) = _logs(oapp, "PayloadSent")
+    assert (sent.dstEid, sent.nonce, sent.payload) == (SRC_EID, 1, MESSAGE)
+    assert _logs(oapp, "PayloadHashSent") == []
+
+    mock_endpoint.lzReceive((SRC_EID, PEER, 7), oapp.address, b"\x07" * 32, MESSAGE, b"")
+    (received,) = _logs(mock_endpoint, "PayloadReceived")
+    assert (received.srcEid, received.guid, received.nonce) == (SRC_EID, b"\x07" * 32, 7)
+    assert received.payload == MESSAGE
+
+
+def test_light_mode(oapp_events_factory, mock_endpoint):
+    """Test that light mode logs hash and length, matching the endpoint's PacketSent."""
+    oapp = oapp_events_factory(True)
+    assert oapp.lightEvents()
+
+    _send(oapp)
+    (sent,) = _logs(oapp, "PayloadHashSent")
+    assert (sent.dstEid, sent.nonce, sent.length) == (SRC_EID, 1, len(MESSAGE))
+    assert sent.payloadHash == keccak(MESSAGE)
+    assert _logs(oapp, "PayloadSent") == []
+
+    # Indexers resolve the payload from PacketSent by guid
+    (packet_sent,) = _logs(oapp, "PacketSent")
+    packet = decode_packet(packet_sent.encodedPayload)
+    assert packet.guid == sent.guid and keccak(packet.message) == sent.payloadHash
+
+    mock_endpoint.lzReceive((SRC_EID, PEER, 7), oapp.address, b"\x07" * 32, b"", b"")
+    (received,) = _logs(mock_endpoint, "PayloadHashReceived")
+    assert (received.srcEid, received.nonce, received.length) == (SRC_EID, 7, 0)
+    assert received.payloadHash == keccak(b"")
@@ -0,0 +1,78 @@
+"""Test OAppFactory blueprint deployments and address precomputation."""
+
+import boa
+import eth_abi
+from AddressUtils import to_bytes32
+from DeterministicAddress import blueprint_initcode, compute_address, compute_addresses
+from eth_utils import keccak
+
+SALTS = [to_bytes32(f"market-{i}") for i in range(3)]
+
+
+def _args(endpoint):
+    return eth_abi.encode(["address"], [endpoint])
+
+
+def _blueprint():
+    return boa.load_partial("examples/OAppExample.vy").deploy_as_blueprint()
+
+
+def test_deploy(mock_endpoint, dev_deployer):
+    """Test that deploy creates a working instance at the precomputed address."""
+    factory = boa.load("src/OAppFactory.vy")
+    blueprint = _blueprint()
+    initcode = blueprint_initcode(boa.env.get_code(blueprint.address), _args(mock_endpoint.address))
+
+    expected = compute_address(factory.address, initcode, dev_deployer, SALTS[0])
+    assert factory.computeAddress(keccak(initcode), SALTS[0], dev_deployer) == expected
+
+    with boa.env.prank(dev_deployer):
+        instance = factory.deploy(blueprint.address, _args(mock_endpoint.address), SALTS[0])
+
+    assert instance == expected
+    oapp = boa.load_partial("examples/OAppExample.vy").at(instance)
+    assert oapp.owner() == dev_deployer
+    assert oapp.endpoint() == mock_endpoint.address
+
+
+def test_deploy_many(mock_endpoint, dev_deployer):
+    """Test that deployMany deploys a batch at the precomputed addresses."""
+    factory = boa.load("src/OAppFactory.vy")
+    blueprint = _blueprint()
+    args = [_args(mock_endpoint.address)] * len(SALTS)
+
+    expected = compute_addresses(
+        factory.address, boa.env.get_code(blueprint.address), dev_deployer, list(zip(args, SALTS))
+    )
+
+    with boa.env.prank(dev_deployer):
+        instances = factory.deployMany(blueprint.address, args, SALTS)
+
+    assert instances == expected
+    events = [e for e in factory.get_logs() if "OAppDeployed" in str(e)]
+    assert [e.instance for e in events] == expected
+
+
+def test_salt_is_bound_to_deployer(mock_endpoint, dev_deployer):
+    """Test that the same salt gives different addresses for different deployers."""
+    factory = boa.load("src/OAppFactory.vy")
+    blueprint = _blueprint()
+
+    with boa.env.prank(dev_deployer):
+        first = factory.deploy(blueprint.address, _args(mock_endpoint.address), SALTS[0])
+    with boa.env.prank(boa.env.generate_address()):
+        second = factory.deploy(blueprint.address, _args(mock_endpoint.address), SALTS[0])
+
+    assert first != second
+
+    with boa.env.prank(dev_deployer):
+        with boa.reverts():  # CREATE2 collision
+            factory.deploy(blueprint.address, _args(mock_endpoint.address), SALTS[0])
+
+
+def test_deploy_many_length_mismatch(mock_endpoint):
+    """Test that deployMany reverts on mismatched arrays."""
+    factory = boa.load("src/OAppFactory.vy")
+
+    with boa.reverts("OAppFactory: Array length mismatch"):
+        factory.deployMany(_blueprint().address, [_args(mock_endpoint.address)], SALTS)
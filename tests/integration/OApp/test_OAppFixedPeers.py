@@ -0,0 +1,116 @@
+"""Test OAppFixedPeers immutable peers against the mock endpoint."""
+
+import boa
+from AddressUtils import to_bytes32
+
+FIXED_EIDS = [30101 + i for i in range(8)]
+FIXED_PEERS = [to_bytes32("0x" + f"{i + 1:02x}" * 20) for i in range(8)]
+OTHER_EID = 30201
+OTHER_PEER = to_bytes32("0x" + "42" * 20)
+
+
+def _deliver(mock_endpoint, oapp, src_eid, sender, message=b"hello"):
+    origin = (src_eid, sender, 1)
+    mock_endpoint.lzReceive(origin, oapp.address, b"\x01" * 32, message, b"")
+
+
+def test_fixed_peers(oapp_fixed_peers_factory):
+    """Test that fixed peers are exposed through peers/getPeers/isFixedPeer."""
+    oapp = oapp_fixed_peers_factory(FIXED_EIDS, FIXED_PEERS)
+
+    for eid, peer in zip(FIXED_EIDS, FIXED_PEERS):
+        assert oapp.peers(eid) == peer
+        assert oapp.isFixedPeer(eid)
+
+    assert oapp.getPeers(FIXED_EIDS + [OTHER_EID]) == FIXED_PEERS + [b"\x00" * 32]
+    assert not oapp.isFixedPeer(OTHER_EID)
+
+
+def test_fixed_peers_constructor_validation(oapp_fixed_peers_factory):
+    """Test that invalid fixed peer sets are rejected at deployment."""
+    with boa.reverts("OApp: Array length mismatch"):
+        oapp_fixed_peers_factory(FIXED_EIDS[:2], FIXED_PEERS[:1])
+
+    with boa.reverts("OApp: duplicate fixed eid"):
+        oapp_fixed_peers_factory([30101, 30102, 30101], FIXED_PEERS[:3])
+
+    with boa.reverts("OApp: invalid fixed eid"):
+        oapp_fixed_peers_factory([0], FIXED_PEERS[:1])
+
+    with boa.reverts("OApp: invalid fixed peer"):
+        oapp_fixed_peers_factory([30101], [b"\x00" * 32])
+
+
+def test_fixed_peers_cannot_be_changed(oapp_fixed_peers_factory, dev_deployer):
+    """Test that setPeer/setPeers/setReadChannel revert for fixed eids."""
+    oapp = oapp_fixed_peers_factory(FIXED_EIDS, FIXED_PEERS)
+
+    with boa.env.prank(dev_deployer):
+        with boa.reverts("OApp: fixed peer"):
+            oapp.setPeer(FIXED_EIDS[3], OTHER_PEER)
+        with boa.reverts("OApp: fixed peer"):
+            oapp.setPeers([OTHER_EID, FIXED_EIDS[0]], [OTHER_PEER, OTHER_PEER])
+        with boa.reverts("OApp: fixed peer"):
+            oapp.setReadChannel(FIXED_EIDS[0], False)
+
+
+def test_fallback_to_stored_peers(oapp_fixed_peers_factory, dev_deployer):
+    """Test that eids outside the fixed set are managed through the peers mapping."""
+    oapp = oapp_fixed_peers_factory(FIXED_EIDS[:2], FIXED_PEERS[:2])
+
+    with boa.env.prank(dev_deployer):
+        oapp.setPeer(OTHER_EID, OTHER_PEER)
+    assert oapp.peers(OTHER_EID) == OTHER_PEER
+
+    with boa.env.prank(boa.env.generate_address()):
+        with boa.reverts("ownable: caller is not the owner"):
+            oapp.setPeer(OTHER_EID + 1, OTHER_PEER)
+
+
+def test_send_to_fixed_and_stored_peer(oapp_fixed_peers_factory, mock_endpoint, dev_deployer):
+    """Test that sends resolve fixed and stored peers, and revert without a peer."""
+    oapp = oapp_fixed_peers_factory(FIXED_EIDS, FIXED_PEERS)
+    with boa.env.prank(dev_deployer):
+        oapp.setPeer(OTHER_EID, OTHER_PEER)
+
+    for eid, peer in [(FIXED_EIDS[-1], FIXED_PEERS[-1]), (OTHER_EID, OTHER_PEER)]:
+        fee = oapp.quote(eid, b"hello")[0]
+        boa.env.set_balance(dev_deployer, fee)
+        with boa.env.prank(dev_deployer):
+            oapp.send(eid, b"hello", value=fee)
+
+        packet = [e for e in oapp.get_logs() if "PacketSent" in str(e)][0]
+        payload = packet.encodedPayload
+        # PacketV1Codec: version(1) nonce(8) srcEid(4) sender(32) dstEid(4) receiver(32)
+        assert int.from_bytes(payload[45:49], "big") == eid
+        assert payload[49:81] == peer
+
+    with boa.reverts("OApp: no peer"):
+        oapp.quote(OTHER_EID + 1, b"hello")
+
+
+def test_receive_from_fixed_peer(oapp_fixed_peers_factory, mock_endpoint):
+    """Test that lzReceive and allowInitializePath accept only the fixed peer."""
+    oapp = oapp_fixed_peers_factory(FIXED_EIDS, FIXED_PEERS)
+
+    _deliver(mock_endpoint, oapp, FIXED_EIDS[5], FIXED_PEERS[5])
+    assert oapp.allowInitializePath((FIXED_EIDS[5], FIXED_PEERS[5], 1))
+    assert not oapp.allowInitializePath((FIXED_EIDS[5], OTHER_PEER, 1))
+
+    with boa.reverts("OApp: invalid sender"):
+        _deliver(mock_endpoint, oapp, FIXED_EIDS[5], OTHER_PEER)
+
+    with boa.reverts("OApp: no peer"):
+        _deliver(mock_endpoint, oapp, OTHER_EID, OTHER_PEER)
+
+    with boa.reverts("OApp: only endpoint"):
+        oapp.lzReceive((FIXED_EIDS[5], FIXED_PEERS[5], 1), b"\x01" * 32, b"", oapp.address, b"")
+
+
+def test_fixed_peers_events(oapp_fixed_peers_factory):
+    """Test that PeerSet is emitted for every fixed peer at deployment."""
+    oapp = oapp_fixed_peers_factory(FIXED_EIDS[:3], FIXED_PEERS[:3])
+
+    events = [str(e) for e in oapp.get_logs() if "PeerSet" in str(e)]
+    assert len(events) == 3
+    assert all(str(eid) in event for eid, event in zip(FIXED_EIDS, events))
@@ -0,0 +1,130 @@
+"""Test OAppGasTank funding, allowances and sends paid from the contract balance."""
+
+import boa
+from conftest import WRAPPER_PEER_EID
+
+DST_EID = WRAPPER_PEER_EID  # peer set by the fixture
+MESSAGE = b"keeper update"
+UNLIMITED = 2**256 - 1
+
+
+def _fee(mock_endpoint):
+    return mock_endpoint.nativeFeeBase() + mock_endpoint.nativeFeePerByte() * len(MESSAGE)
+
+
+def _fund(oapp, amount):
+    funder = boa.env.generate_address()
+    boa.env.set_balance(funder, amount)
+    with boa.env.prank(funder):
+        oapp.fundTank(value=amount)
+    return funder
+
+
+def _setup(oapp, dev_deployer, keeper, spender_allowance, eid_allowance=UNLIMITED):
+    with boa.env.prank(dev_deployer):
+        oapp.setSpenderAllowance(keeper, spender_allowance)
+        oapp.setEidAllowance(DST_EID, eid_allowance)
+
+
+def test_send_from_tank(oapp_gas_tank_contract, mock_endpoint, dev_deployer):
+    """Test that a keeper sends without msg.value and refunds are recycled into the tank."""
+    oapp = oapp_gas_tank_contract
+    keeper = boa.env.generate_address()
+    fee = _fee(mock_endpoint)
+    funder = _fund(oapp, 10 * fee)
+    assert "TankFunded" in str(oapp.get_logs()[0]) and str(funder) in str(oapp.get_logs()[0])
+
+    _setup(oapp, dev_deployer, keeper, 3 * fee)
+
+    # Overpay by 2x: the endpoint refunds the excess to the tank
+    with boa.env.prank(keeper):
+        oapp.push(DST_EID, MESSAGE, b"", 2 * fee)
+
+    spent = [e for e in oapp.get_logs() if "TankSpent" in str(e)][0]
+    assert (spent.spender, spent.dstEid, spent.nativeFee) == (keeper, DST_EID, fee)
+    assert boa.env.get_balance(oapp.address) == 9 * fee
+    assert oapp.tankBalance() == 9 * fee
+    assert boa.env.get_balance(keeper) == 0
+    assert oapp.spenderAllowance(keeper) == 2 * fee
+    assert oapp.eidAllowance(DST_EID) == UNLIMITED
+
+
+def test_allowances(oapp_gas_tank_contract, mock_endpoint, dev_deployer):
+    """Test per-caller and per-eid budgets."""
+    oapp = oapp_gas_tank_contract
+    keeper = boa.env.generate_address()
+    fee = _fee(mock_endpoint)
+    _fund(oapp, 10 * fee)
+
+    with boa.env.prank(keeper):
+        with boa.reverts("OApp: spender allowance exceeded"):
+            oapp.push(DST_EID, MESSAGE, b"", fee)
+
+    _setup(oapp, dev_deployer, keeper, UNLIMITED, eid_allowance=fee)
+    with boa.env.prank(keeper):
+        oapp.push(DST_EID, MESSAGE, b"", fee)
+        with boa.reverts("OApp: eid allowance exceeded"):
+            oapp.push(DST_EID, MESSAGE, b"", fee)
+
+    assert oapp.spenderAllowance(keeper) == UNLIMITED
+    assert oapp.eidAllowance(DST_EID) == 0
+
+
+def test_insufficient_tank_balance(oapp_gas_tank_contract, mock_endpoint, dev_deployer):
+    """Test that sends and withdrawals are bounded by the tank balance."""
+    oapp = oapp_gas_tank_contract
+    keeper = boa.env.generate_address()
+    fee = _fee(mock_endpoint)
+    _fund(oapp, fee - 1)
+    _setup(oapp, dev_deployer, keeper, UNLIMITED)
+
+    with boa.env.prank(keeper):
+        with boa.reverts("OApp: insufficient tank balance"):
+            oapp.push(DST_EID, MESSAGE, b"", fee)
+
+    with boa.env.prank(dev_deployer):
+        with boa.reverts("OApp: insufficient tank balance"):
+            oapp.withdrawTank(dev_deployer, fee)
+
+
+def test_tank_owner_functions(oapp_gas_tank_contract, dev_deployer):
+    """Test that only the owner manages allowances and withdraws."""
+    oapp = oapp_gas_tank_contract
+    _fund(oapp, 1000)
+    receiver = boa.env.generate_address()
+
+    with boa.reverts("ownable: caller is not the owner"):
+        oapp.setSpenderAllowance(receiver, 1)
+    with boa.reverts("ownable: caller is not the owner"):
+        oapp.setEidAllowance(DST_EID, 1)
+    with boa.reverts("ownable: caller is not the owner"):
+        oapp.withdrawTank(receiver, 1)
+
+    with boa.env.prank(dev_deployer):
+        oapp.withdrawTank(receiver, 600)
+    assert "TankWithdrawn" in str(oapp.get_logs()[0])
+    assert boa.env.get_balance(receiver) == 600
+    assert boa.env.get_balance(oapp.address) == 400
+    assert oapp.tankBalance() == 400
+
+
+def test_tank_balance_excludes_other_funds(oapp_gas_tank_contract, mock_endpoint, dev_deployer):
+    """Test that native tokens not added with fundTank are neither spent nor withdrawn."""
+    oapp = oapp_gas_tank_contract
+    keeper = boa.env.generate_address()
+    fee = _fee(mock_endpoint)
+    _fund(oapp, fee - 1)
+    _setup(oapp, dev_deployer, keeper, UNLIMITED)
+    boa.env.set_balance(oapp.address, 10 * fee)  # e.g. lzReceive value held by the OApp
+
+    with boa.env.prank(keeper):
+        with boa.reverts("OApp: insufficient tank balance"):
+            oapp.push(DST_EID, MESSAGE, b"", fee)
+
+    with boa.env.prank(dev_deployer):
+        with boa.reverts("OApp: insufficient tank balance"):
+            oapp.withdrawTank(dev_deployer, fee)
+        oapp.withdrawTank(dev_deployer, fee - 1)
+
+    assert oapp.tankBalance() == 0
+    assert boa.env.get_balance(oapp.address) == 9 * fee + 1
@@ -0,0 +1,137 @@
+"""Test OAppNonblocking failed-message store and retries against the mock endpoint."""
+
+import boa
+import pytest
+from AddressUtils import to_bytes32
+from conftest import WRAPPER_PEER, WRAPPER_PEER_EID
+from eth_utils import keccak
+
+SRC_EID = WRAPPER_PEER_EID  # peer set by the fixture
+PEER = WRAPPER_PEER
+
+
+def _guid(nonce):
+    return nonce.to_bytes(32, "big")
+
+
+def _deliver(mock_endpoint, oapp, nonce, message, **kwargs):
+    origin = (SRC_EID, PEER, nonce)
+    mock_endpoint.lzReceive(origin, oapp.address, _guid(nonce), message, b"", **kwargs)
+    return origin
+
+
+@pytest.fixture()
+def oapp(oapp_nonblocking_contract):
+    oapp_nonblocking_contract.setFailing(True)
+    return oapp_nonblocking_contract
+
+
+def test_receive_success(oapp, mock_endpoint):
+    """Test that successful messages are handled and nothing is stored."""
+    _deliver(mock_endpoint, oapp, 1, b"hello")
+
+    assert oapp.received() == 1
+    assert oapp.failedMessages(SRC_EID, PEER, 1) == b"\x00" * 32
+
+
+def test_receive_failure_is_stored(oapp, mock_endpoint):
+    """Test that a failing handler stores the payload hash and the pathway keeps flowing."""
+    _deliver(mock_endpoint, oapp, 1, b"fail-1")
+
+    events = [e for e in mock_endpoint.get_logs() if "MessageFailed" in str(e)]
+    assert len(events) == 1
+    assert events[0].nonce == 1
+    assert b"handler failed" in events[0].reason
+
+    assert oapp.failedMessages(SRC_EID, PEER, 1) == keccak(_guid(1) + b"fail-1")
+    assert oapp.received() == 0
+
+    _deliver(mock_endpoint, oapp, 2, b"hello")
+    assert oapp.received() == 1
+
+
+def test_receive_out_of_gas_is_stored(oapp, mock_endpoint):
+    """Test that a handler running out of gas is stored thanks to the gas reserve."""
+    _deliver(mock_endpoint, oapp, 1, b"burn", gas=500_000)
+
+    assert oapp.failedMessages(SRC_EID, PEER, 1) == keccak(_guid(1) + b"burn")
+
+
+def test_receive_checks_origin(oapp, mock_endpoint):
+    """Test that origin checks still revert lzReceive."""
+    with boa.reverts("OApp: invalid sender"):
+        mock_endpoint.lzReceive(
+            (SRC_EID, to_bytes32("0x" + "43" * 20), 1), oapp.address, _guid(1), b"hello", b""
+        )
+
+    with boa.reverts("OApp: only self"):
+        oapp.nonblockingLzReceive((SRC_EID, PEER, 1), _guid(1), b"hello")
+
+
+def test_retry_message(oapp, mock_endpoint):
+    """Test that a failed message can be retried by anyone once the handler is fixed."""
+    origin = _deliver(mock_endpoint, oapp, 1, b"fail-1")
+
+    with boa.reverts("handler failed"):
+        oapp.retryMessage(origin, _guid(1), b"fail-1")
+
+    oapp.setFailing(False)
+    with boa.env.prank(boa.env.generate_address()):
+        oapp.retryMessage(origin, _guid(1), b"fail-1")
+
+    assert oapp.received() == 1
+    assert oapp.failedMessages(SRC_EID, PEER, 1) == b"\x00" * 32
+
+    with boa.reverts("OApp: no failed message"):
+        oapp.retryMessage(origin, _guid(1), b"fail-1")
+
+
+def test_retry_invalid_payload(oapp, mock_endpoint):
+    """Test that only the original payload can be retried."""
+    origin = _deliver(mock_endpoint, oapp, 1, b"fail-1")
+
+    with boa.reverts("OApp: invalid payload"):
+        oapp.retryMessage(origin, _guid(1), b"fail-2")
+
+    with boa.reverts("OApp: invalid payload"):
+        oapp.retryMessages([(origin, _guid(2), b"fail-1")])
+
+
+def test_retry_messages(oapp, mock_endpoint):
+    """Test bulk retry: successes are cleared, messages failing again stay stored."""
+    messages = [b"fail-1", b"fail-2", b"fail-3"]
+    origins = [_deliver(mock_endpoint, oapp, i + 1, m) for i, m in enumerate(messages)]
+
+    batch = [(o, _guid(o[2]), m) for o, m in zip(origins, messages)]
+
+    # still failing: stays stored without reverting the batch
+    assert oapp.retryMessages(batch[:1]) == [False]
+    oapp.setFailing(False)
+
+    assert oapp.retryMessages(batch[1:]) == [True, True]
+    assert oapp.received() == 2
+    assert oapp.failedMessages(SRC_EID, PEER, 1) != b"\x00" * 32
+    assert oapp.failedMessages(SRC_EID, PEER, 2) == b"\x00" * 32
+    assert oapp.failedMessages(SRC_EID, PEER, 3) == b"\x00" * 32
+
+    assert oapp.retryMessages(batch[:1]) == [True]
+    assert oapp.received() == 3
+
+
+@pytest.mark.parametrize("gas", [300_000, 1_000_000, 3_000_000])
+def test_retry_messages_out_of_gas(oapp, mock_endpoint, gas):
+    """Test that a handler running out of gas stops the batch without reverting it."""
+    messages = [b"burn", b"fail-1", b"fail-2"]
+    origins = [_deliver(mock_endpoint, oapp, i + 1, m, gas=500_000) for i, m in enumerate(messages)]
+    batch = [(o, _guid(o[2]), m) for o, m in zip(origins, messages)]
+
+    results = oapp.retryMessages(batch, gas=gas)
+
+    assert results[0] is False
+    assert len(results) < len(batch)
+    for o, m in zip(origins, messages):
+        assert oapp.failedMessages(SRC_EID, PEER, o[2]) == keccak(_guid(o[2]) + m)
+
+    # the messages left over can be retried later
+    oapp.setFailing(False)
+    assert oapp.retryMessages(batch[1:]) == [True, True]
@@ -0,0 +1,146 @@
+"""Test OAppPathways batch onboarding against the mock endpoint."""
+
+import boa
+import eth_abi
+from AddressUtils import to_bytes32
+from conftest import LZ_READ_CHANNEL
+
+CONFIG_TYPE_ULN = 0
+CONFIG_TYPE_EXECUTOR = 1
+CONFIG_TYPE_READ = 2
+
+SEND_LIB = "0x" + "51" * 20
+RECEIVE_LIB = "0x" + "52" * 20
+READ_LIB = "0x" + "53" * 20
+EXECUTOR = "0x" + "e0" * 20
+DVN_1 = "0x" + "d1" * 20
+DVN_2 = "0x" + "d2" * 20
+
+
+def _pathway(eid, peer, send_lib=SEND_LIB, receive_lib=RECEIVE_LIB, executor=EXECUTOR, dvns=True):
+    return (
+        eid,
+        peer,
+        send_lib,
+        receive_lib,
+        0,  # grace period
+        executor,
+        15,  # confirmations
+        1 if dvns else 0,  # optional dvn threshold
+        [DVN_1] if dvns else [],  # required dvns
+        [DVN_2] if dvns else [],  # optional dvns
+    )
+
+
+def _decode_uln(config):
+    return eth_abi.decode(["(uint64,uint8,uint8,uint8,address[],address[])"], config)[0]
+
+
+def test_apply_pathways(oapp_pathways_contract, mock_endpoint, dev_deployer):
+    """Test that libraries, configs and peers are set for every eid in one call."""
+    oapp = oapp_pathways_contract.address
+    eids = [30101 + i for i in range(20)]
+    peers = [to_bytes32("0x" + f"{i + 1:02x}" * 20) for i in range(20)]
+
+    with boa.env.prank(dev_deployer):
+        oapp_pathways_contract.applyPathways(
+            [_pathway(eid, peer) for eid, peer in zip(eids, peers)]
+        )
+
+    for eid, peer in zip(eids, peers):
+        assert oapp_pathways_contract.peers(eid) == peer
+        assert mock_endpoint.getSendLibrary(oapp, eid) == SEND_LIB
+        assert mock_endpoint.getReceiveLibrary(oapp, eid) == (RECEIVE_LIB, False)
+
+        for lib in [SEND_LIB, RECEIVE_LIB]:
+            uln = _decode_uln(mock_endpoint.getConfig(oapp, lib, eid, CONFIG_TYPE_ULN))
+            assert uln == (15, 1, 1, 1, (DVN_1,), (DVN_2,))
+
+        executor_config = mock_endpoint.getConfig(oapp, SEND_LIB, eid, CONFIG_TYPE_EXECUTOR)
+        assert eth_abi.decode(["uint32", "address"], executor_config) == (1024, EXECUTOR)
+        assert mock_endpoint.getConfig(oapp, RECEIVE_LIB, eid, CONFIG_TYPE_EXECUTOR) == b""
+
+
+def test_apply_pathways_read_channel(oapp_pathways_contract, mock_endpoint, dev_deployer):
+    """Test that read channels get a ULN Read config on the read library and self as peer."""
+    oapp = oapp_pathways_contract.address
+    self_as_bytes32 = to_bytes32(oapp)
+
+    with boa.env.prank(dev_deployer):
+        oapp_pathways_contract.applyPathways(
+            [_pathway(LZ_READ_CHANNEL, self_as_bytes32, READ_LIB, READ_LIB)]
+        )
+
+    assert oapp_pathways_contract.peers(LZ_READ_CHANNEL) == self_as_bytes32
+    assert mock_endpoint.getSendLibrary(oapp, LZ_READ_CHANNEL) == READ_LIB
+    assert mock_endpoint.getReceiveLibrary(oapp, LZ_READ_CHANNEL) == (READ_LIB, False)
+
+    read_config = mock_endpoint.getConfig(oapp, READ_LIB, LZ_READ_CHANNEL, CONFIG_TYPE_READ)
+    read_config = eth_abi.decode(["(address,uint8,uint8,uint8,address[],address[])"], read_config)
+    assert read_config[0] == (EXECUTOR, 1, 1, 1, (DVN_1,), (DVN_2,))
+    assert mock_endpoint.getConfig(oapp, READ_LIB, LZ_READ_CHANNEL, CONFIG_TYPE_ULN) == b""
+    assert mock_endpoint.getConfig(oapp, READ_LIB, LZ_READ_CHANNEL, CONFIG_TYPE_EXECUTOR) == b""
+
+
+def test_apply_pathways_partial(oapp_pathways_contract, mock_endpoint, dev_deployer):
+    """Test that empty libraries, executor and DVNs leave the corresponding settings untouched."""
+    oapp = oapp_pathways_contract.address
+    eid = 30101
+    peer = to_bytes32("0x" + "42" * 20)
+
+    with boa.env.prank(dev_deployer):
+        oapp_pathways_contract.applyPathways(
+            [_pathway(eid, peer, boa.eval("empty(address)"), RECEIVE_LIB, dvns=False)]
+        )
+
+    assert oapp_pathways_contract.peers(eid) == peer
+    assert mock_endpoint.isDefaultSendLibrary(oapp, eid)
+    assert mock_endpoint.getReceiveLibrary(oapp, eid) == (RECEIVE_LIB, False)
+    assert mock_endpoint.getConfig(oapp, RECEIVE_LIB, eid, CONFIG_TYPE_ULN) == b""
+
+
+def test_apply_pathways_keeps_peer(oapp_pathways_contract, mock_endpoint, dev_deployer):
+    """Test that re-applying a pathway without a peer updates configs and keeps the peer."""
+    oapp = oapp_pathways_contract.address
+    eid = 30101
+    peer = to_bytes32("0x" + "42" * 20)
+
+    with boa.env.prank(dev_deployer):
+        oapp_pathways_contract.applyPathways([_pathway(eid, peer)])
+        oapp_pathways_contract.applyPathways([_pathway(eid, b"\x00" * 32, READ_LIB)])
+
+    assert oapp_pathways_contract.peers(eid) == peer
+    assert mock_endpoint.getSendLibrary(oapp, eid) == READ_LIB
+    events = [e for e in oapp_pathways_contract.get_logs() if "PeerSet" in str(e)]
+    assert events == []
+
+
+def test_apply_pathways_invalid_threshold(oapp_pathways_contract, dev_deployer):
+    """Test that a DVN threshold above the optional DVN count reverts."""
+    pathway = list(_pathway(30101, to_bytes32("0x" + "42" * 20)))
+    pathway[7] = 2  # threshold above 1 optional dvn
+
+    with boa.env.prank(dev_deployer):
+        with boa.reverts("OAppConfig: Invalid DVN threshold"):
+            oapp_pathways_contract.applyPathways([tuple(pathway)])
+
+
+def test_apply_pathways_unauthorized(oapp_pathways_contract):
+    """Test that unauthorized users cannot apply pathways."""
+    with boa.env.prank(boa.env.generate_address()):
+        with boa.reverts("ownable: caller is not the owner"):
+            oapp_pathways_contract.applyPathways([_pathway(30101, to_bytes32("0x" + "42" * 20))])
+
+
+def test_apply_pathways_events(oapp_pathways_contract, dev_deployer):
+    """Test that PeerSet is emitted for every pathway."""
+    eids = [30101, 30102, 30103]
+
+    with boa.env.prank(dev_deployer):
+        oapp_pathways_contract.applyPathways(
+            [_pathway(eid, to_bytes32("0x" + "42" * 20)) for eid in eids]
+        )
+
+    events = [str(e) for e in oapp_pathways_contract.get_logs() if "PeerSet" in str(e)]
+    assert len(events) == len(eids)
+    assert all(str(eid) in event for eid, event in zip(eids, events))
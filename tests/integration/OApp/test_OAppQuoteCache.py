@@ -0,0 +1,130 @@
+"""Test OAppQuoteCache hits, staleness, buckets and forced refresh against the mock endpoint."""
+
+import boa
+import eth_abi
+from conftest import WRAPPER_PEER_EID
+from eth_utils import keccak
+
+DST_EID = WRAPPER_PEER_EID  # peer set by the fixture
+MESSAGE = b"\x01" * 40
+BUCKET_MESSAGE = b"\x01" * 64  # longest message of MESSAGE's bucket, cached fees quote it
+FEE_BASE = 10**12
+FEE_PER_BYTE = 10**9
+
+
+def _cache_key(dst_eid, message_length, options=b"", pay_in_lz_token=False):
+    bucket = (message_length + 31) // 32
+    return keccak(
+        eth_abi.encode(
+            ["uint32", "uint256", "bytes32", "bool"],
+            [dst_eid, bucket, keccak(options), pay_in_lz_token],
+        )
+    )
+
+
+def _send(oapp, message=MESSAGE, options=b""):
+    boa.env.set_balance(boa.env.eoa, 10**18)
+    oapp.send(DST_EID, message, options, value=10**18)
+
+
+def _live_fee(mock_endpoint, message=MESSAGE):
+    return mock_endpoint.nativeFeeBase() + mock_endpoint.nativeFeePerByte() * len(message)
+
+
+def test_cache_disabled_by_default(oapp_quote_cache_contract, mock_endpoint):
+    """Test that without a max age every send quotes the endpoint and nothing is stored."""
+    oapp = oapp_quote_cache_contract
+    _send(oapp)
+
+    assert oapp.quoteMaxAge() == 0
+    assert oapp.quoteCache(_cache_key(DST_EID, len(MESSAGE))) == 0
+    assert oapp.quote(DST_EID, MESSAGE, b"")[0] == _live_fee(mock_endpoint)
+
+
+def test_cache_hit_and_expiry(oapp_quote_cache_contract, mock_endpoint, dev_deployer):
+    """Test that a cached quote (plus buffer) is used until it is older than the max age."""
+    oapp = oapp_quote_cache_contract
+    with boa.env.prank(dev_deployer):
+        oapp.setQuoteCacheConfig(10, 500)
+
+    cached_fee = _live_fee(mock_endpoint, BUCKET_MESSAGE)
+    _send(oapp)
+    packed = oapp.quoteCache(_cache_key(DST_EID, len(MESSAGE)))
+    assert packed & (2**128 - 1) == cached_fee
+    assert packed >> 128 == boa.env.evm.patch.block_number
+
+    # Price moves within the buffer: the cached fee (+5%) is still used and is enough
+    mock_endpoint.setFees(FEE_BASE * 104 // 100, FEE_PER_BYTE)
+    boa.env.time_travel(blocks=10)
+    assert oapp.quote(DST_EID, MESSAGE, b"")[0] == cached_fee * 105 // 100
+    _send(oapp)
+
+    # Older than max age: quoted live again
+    boa.env.time_travel(blocks=1)
+    assert oapp.quote(DST_EID, MESSAGE, b"")[0] == _live_fee(mock_endpoint)
+
+
+def test_cache_key(oapp_quote_cache_contract, mock_endpoint, dev_deployer):
+    """Test that lengths share a cache entry per 32-byte bucket, options do not."""
+    oapp = oapp_quote_cache_contract
+    with boa.env.prank(dev_deployer):
+        oapp.setQuoteCacheConfig(100, 0)
+    _send(oapp)
+
+    cached_fee = _live_fee(mock_endpoint, BUCKET_MESSAGE)
+    mock_endpoint.setFees(FEE_BASE * 2, FEE_PER_BYTE)
+
+    assert oapp.quote(DST_EID, b"\x01" * 33, b"")[0] == cached_fee
+    assert oapp.quote(DST_EID, b"\x01" * 64, b"")[0] == cached_fee
+    assert oapp.quote(DST_EID, b"\x01" * 65, b"")[0] == _live_fee(mock_endpoint, b"\x01" * 65)
+    assert (
+        oapp.quote(DST_EID, MESSAGE, b"\x00\x03")[0] == _live_fee(mock_endpoint) + FEE_PER_BYTE * 2
+    )
+
+
+def test_refresh_after_price_jump(oapp_quote_cache_contract, mock_endpoint, dev_deployer):
+    """Test that a stale-low cached fee fails the send until it is force-refreshed."""
+    oapp = oapp_quote_cache_contract
+    with boa.env.prank(dev_deployer):
+        oapp.setQuoteCacheConfig(100, 100)
+    _send(oapp)
+
+    mock_endpoint.setFees(FEE_BASE * 2, FEE_PER_BYTE)
+    with boa.reverts("Endpoint: insufficient fee"):
+        _send(oapp)
+
+    # Anyone can force a refresh, the value comes from the endpoint for the bucket's maximum
+    with boa.env.prank(boa.env.generate_address()):
+        fee = oapp.refreshQuote(DST_EID, b"\x01" * 33, b"", False)
+    assert fee[0] == _live_fee(mock_endpoint, BUCKET_MESSAGE)
+    _send(oapp)
+
+
+def test_bucket_covers_longest_message(oapp_quote_cache_contract, mock_endpoint, dev_deployer):
+    """Test that a bucket filled by a short message still pays for its longest message."""
+    oapp = oapp_quote_cache_contract
+    with boa.env.prank(dev_deployer):
+        oapp.setQuoteCacheConfig(100, 0)
+
+    # Exact fees: the send reverts if the cached fee is below the live one
+    short, longest = b"\x01" * 33, b"\x01" * 64
+    boa.env.set_balance(boa.env.eoa, 10**18)
+    oapp.send(DST_EID, short, b"", value=_live_fee(mock_endpoint, longest))
+    assert oapp.quote(DST_EID, longest, b"")[0] == _live_fee(mock_endpoint, longest)
+    oapp.send(DST_EID, longest, b"", value=_live_fee(mock_endpoint, longest))
+
+
+def test_set_quote_cache_config(oapp_quote_cache_contract, dev_deployer):
+    """Test that only the owner can configure the cache, with a capped buffer."""
+    oapp = oapp_quote_cache_contract
+
+    with boa.reverts("ownable: caller is not the owner"):
+        oapp.setQuoteCacheConfig(10, 100)
+
+    with boa.env.prank(dev_deployer):
+        with boa.reverts("OApp: invalid quote buffer"):
+            oapp.setQuoteCacheConfig(10, 10001)
+
+        oapp.setQuoteCacheConfig(10, 100)
+    assert "QuoteCacheConfigSet" in str(oapp.get_logs()[0])
+    assert (oapp.quoteMaxAge(), oapp.quoteBufferBps()) == (10, 100)
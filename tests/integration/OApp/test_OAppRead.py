@@ -1,17 +1,18 @@
 """Test OAppRead functionality for OApp."""
 
 import boa
-from conftest import _to_bytes32, LZ_READ_CHANNEL
+from AddressUtils import to_bytes32
+from conftest import LZ_READ_CHANNEL
 
 
 def test_set_read_channel_activate(oapp_module_contract, dev_deployer):
     """Test activating a read channel."""
     # Set up test data
     test_channel_id = LZ_READ_CHANNEL
-    self_as_bytes32 = _to_bytes32(oapp_module_contract.address)
+    self_as_bytes32 = to_bytes32(oapp_module_contract.address)
 
     # Initially should be empty/zero
-    assert oapp_module_contract.peers(test_channel_id) == _to_bytes32("0x" + "00" * 20)
+    assert oapp_module_contract.peers(test_channel_id) == to_bytes32("0x" + "00" * 20)
 
     # Activate the read channel as owner
     with boa.env.prank(dev_deployer):
@@ -25,7 +26,7 @@ def test_set_read_channel_deactivate(oapp_module_contract, dev_deployer):
     """Test deactivating a read channel."""
     # Set up test data
     test_channel_id = LZ_READ_CHANNEL
-    self_as_bytes32 = _to_bytes32(oapp_module_contract.address)
+    self_as_bytes32 = to_bytes32(oapp_module_contract.address)
 
     # First activate the read channel
     with boa.env.prank(dev_deployer):
@@ -39,14 +40,14 @@ def test_set_read_channel_deactivate(oapp_module_contract, dev_deployer):
         oapp_module_contract.setReadChannel(test_channel_id, False)
 
     # Verify channel is deactivated (set to empty address)
-    assert oapp_module_contract.peers(test_channel_id) == _to_bytes32("0x" + "00" * 20)
+    assert oapp_module_contract.peers(test_channel_id) == to_bytes32("0x" + "00" * 20)
 
 
 def test_multiple_read_channels(oapp_module_contract, dev_deployer):
     """Test activating multiple read channels."""
     # Set up test data for multiple channels
     channel_ids = [LZ_READ_CHANNEL - i for i in range(3)]
-    self_as_bytes32 = _to_bytes32(oapp_module_contract.address)
+    self_as_bytes32 = to_bytes32(oapp_module_contract.address)
 
     # Activate multiple read channels
     for channel_id in channel_ids:
@@ -62,7 +63,7 @@ def test_multiple_read_channels(oapp_module_contract, dev_deployer):
         oapp_module_contract.setReadChannel(channel_ids[1], False)
 
     # Verify specific channel is deactivated
-    assert oapp_module_contract.peers(channel_ids[1]) == _to_bytes32("0x" + "00" * 20)
+    assert oapp_module_contract.peers(channel_ids[1]) == to_bytes32("0x" + "00" * 20)
 
     # Verify other channels remain active
     assert oapp_module_contract.peers(channel_ids[0]) == self_as_bytes32
@@ -84,7 +85,7 @@ def test_unauthorized_read_channel_setting(oapp_module_contract):
 def test_read_channel_event_emission(oapp_module_contract, dev_deployer):
     """Test that PeerSet event is emitted when setting a read channel."""
     test_channel_id = LZ_READ_CHANNEL
-    self_as_bytes32 = _to_bytes32(oapp_module_contract.address)
+    self_as_bytes32 = to_bytes32(oapp_module_contract.address)
 
     # Set read channel
     with boa.env.prank(dev_deployer):
@@ -105,7 +106,7 @@ def test_read_channel_event_emission(oapp_module_contract, dev_deployer):
 
     # Verify event emission for deactivation
     events = oapp_module_contract.get_logs()
-    empty_bytes32 = _to_bytes32("0x" + "00" * 20)
+    empty_bytes32 = to_bytes32("0x" + "00" * 20)
     assert any(
         "PeerSet" in str(event)
         and str(test_channel_id) in str(event)
@@ -128,7 +129,7 @@ def test_read_channel_threshold_compatibility(oapp_module_contract, dev_deployer
         oapp_module_contract.setReadChannel(above_threshold, True)
 
     # Verify above threshold channel is properly set
-    self_as_bytes32 = _to_bytes32(oapp_module_contract.address)
+    self_as_bytes32 = to_bytes32(oapp_module_contract.address)
     assert oapp_module_contract.peers(above_threshold) == self_as_bytes32
 
     # Below threshold should also work since setReadChannel doesn't check for threshold
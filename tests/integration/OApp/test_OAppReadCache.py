@@ -0,0 +1,174 @@
+"""Test OAppReadCache request deduplication, freshness and response matching."""
+
+import boa
+import eth_abi
+from AddressUtils import to_bytes32
+from conftest import LZ_READ_CHANNEL
+from eth_utils import keccak
+
+TARGET_EID = 30101
+TARGET = "0x" + "42" * 20
+CALLDATA = bytes.fromhex("18160ddd")  # totalSupply()
+FEE = 10**16
+MAX_AGE = 600
+NO_GUID = b"\x00" * 32
+CACHE_KEY = keccak(
+    eth_abi.encode(["uint32", "address", "bytes32"], [TARGET_EID, TARGET, keccak(CALLDATA)])
+)
+
+
+def _request(oapp, is_block_num=False, block_num_or_timestamp=None):
+    if block_num_or_timestamp is None:
+        block_num_or_timestamp = boa.env.evm.patch.timestamp
+    boa.env.set_balance(boa.env.eoa, FEE)
+    return oapp.requestIfStale(
+        LZ_READ_CHANNEL,
+        TARGET_EID,
+        TARGET,
+        CALLDATA,
+        is_block_num,
+        block_num_or_timestamp,
+        value=FEE,
+    )
+
+
+def _deliver(oapp, mock_endpoint, guid, response, nonce=1):
+    origin = (LZ_READ_CHANNEL, to_bytes32(oapp.address), nonce)
+    mock_endpoint.lzReceive(origin, oapp.address, guid, response, b"")
+
+
+def _response(value):
+    return value.to_bytes(32, "big")
+
+
+def test_read_cache_flow(oapp_read_cache_contract, mock_endpoint, dev_deployer):
+    """Test that a fresh response is served locally and a stale one triggers a new read."""
+    oapp = oapp_read_cache_contract
+    with boa.env.prank(dev_deployer):
+        oapp.setReadMaxAge(MAX_AGE)
+    assert "ReadCacheConfigSet" in str(oapp.get_logs()[0])
+
+    requested_at = boa.env.evm.patch.timestamp
+    guid = _request(oapp)
+    assert guid != NO_GUID
+    assert oapp.pendingReads(guid)[0] == CACHE_KEY
+    assert oapp.getCachedRead(TARGET_EID, TARGET, CALLDATA) == (b"", False)
+
+    _deliver(oapp, mock_endpoint, guid, _response(12345))
+    assert oapp.getCachedRead(TARGET_EID, TARGET, CALLDATA) == (_response(12345), True)
+    assert oapp.readCache(CACHE_KEY)[:3] == (_response(12345), False, requested_at)
+    assert oapp.pendingReads(guid)[3] == 0
+
+    # Fresh: nothing is sent and msg.value is returned
+    assert _request(oapp) == NO_GUID
+    assert boa.env.get_balance(boa.env.eoa) == FEE
+
+    boa.env.time_travel(seconds=MAX_AGE + 1)
+    assert not oapp.isReadFresh(TARGET_EID, TARGET, CALLDATA)
+    assert oapp.getCachedRead(TARGET_EID, TARGET, CALLDATA) == (_response(12345), False)
+    assert _request(oapp) != NO_GUID
+
+
+def _sends(oapp, mock_endpoint):
+    return mock_endpoint.outboundNonce(oapp.address, LZ_READ_CHANNEL, to_bytes32(oapp.address))
+
+
+def test_read_in_flight(oapp_read_cache_contract, mock_endpoint, dev_deployer):
+    """Test that a read in flight is not sent again until its response arrives."""
+    oapp = oapp_read_cache_contract
+    with boa.env.prank(dev_deployer):
+        oapp.setReadMaxAge(MAX_AGE)
+
+    guid = _request(oapp)
+    assert _request(oapp) == NO_GUID
+    assert _sends(oapp, mock_endpoint) == 1
+    assert oapp.inFlightReads(CACHE_KEY) == guid
+
+    _deliver(oapp, mock_endpoint, guid, _response(1))
+    assert oapp.inFlightReads(CACHE_KEY) == NO_GUID
+
+    # A lost response blocks new reads for readMaxAge only
+    boa.env.time_travel(seconds=MAX_AGE + 1)
+    assert _request(oapp) != NO_GUID
+    assert _request(oapp) == NO_GUID
+    boa.env.time_travel(seconds=MAX_AGE + 1)
+    assert _request(oapp) != NO_GUID
+    assert _sends(oapp, mock_endpoint) == 3
+
+
+def test_read_cache_disabled(oapp_read_cache_contract, mock_endpoint):
+    """Test that responses are stored but never fresh while readMaxAge is 0."""
+    oapp = oapp_read_cache_contract
+    _deliver(oapp, mock_endpoint, _request(oapp), _response(1))
+
+    assert oapp.getCachedRead(TARGET_EID, TARGET, CALLDATA) == (_response(1), False)
+    assert _request(oapp) != NO_GUID
+
+
+def test_block_number_freshness(oapp_read_cache_contract, mock_endpoint, dev_deployer):
+    """Test that block number reads are aged from the local request time."""
+    oapp = oapp_read_cache_contract
+    with boa.env.prank(dev_deployer):
+        oapp.setReadMaxAge(MAX_AGE)
+
+    guid = _request(oapp, is_block_num=True, block_num_or_timestamp=21_000_000)
+    boa.env.time_travel(seconds=MAX_AGE // 2)
+    _deliver(oapp, mock_endpoint, guid, _response(7))
+    assert oapp.readCache(CACHE_KEY)[1:3] == (True, 21_000_000)
+    assert oapp.isReadFresh(TARGET_EID, TARGET, CALLDATA)
+
+    boa.env.time_travel(seconds=MAX_AGE // 2 + 1)
+    assert not oapp.isReadFresh(TARGET_EID, TARGET, CALLDATA)
+
+
+def test_out_of_order_responses(oapp_read_cache_contract, mock_endpoint):
+    """Test that a late response to an older request does not overwrite a newer one."""
+    oapp = oapp_read_cache_contract
+    old_guid = _request(oapp)
+    boa.env.time_travel(seconds=60)
+    new_guid = _request(oapp)
+
+    _deliver(oapp, mock_endpoint, new_guid, _response(2), nonce=2)
+    _deliver(oapp, mock_endpoint, old_guid, _response(1), nonce=1)
+
+    assert oapp.readCache(CACHE_KEY)[0] == _response(2)
+    assert oapp.pendingReads(old_guid)[3] == 0
+
+
+def _skipped(mock_endpoint):
+    # Logs of the last lzReceive, emitted by the OApp during the endpoint call
+    return [e for e in mock_endpoint.get_logs() if type(e).__name__ == "ReadResponseSkipped"]
+
+
+def test_invalid_responses(oapp_read_cache_contract, mock_endpoint):
+    """Test that unknown, replayed and oversized responses are skipped without reverting."""
+    oapp = oapp_read_cache_contract
+
+    unknown = b"\x01" * 32
+    _deliver(oapp, mock_endpoint, unknown, _response(1))
+    (event,) = _skipped(mock_endpoint)
+    assert (event.guid, event.key, event.length) == (unknown, NO_GUID, 32)
+    assert event.responseHash == keccak(_response(1))
+
+    guid = _request(oapp)
+    _deliver(oapp, mock_endpoint, guid, b"\x01" * 129)
+    (event,) = _skipped(mock_endpoint)
+    assert (event.guid, event.key, event.length) == (guid, CACHE_KEY, 129)
+    assert oapp.pendingReads(guid)[3] == 0
+    assert oapp.readCache(CACHE_KEY)[4] == 0
+
+    # The channel keeps flowing: the next request is cached
+    boa.env.time_travel(seconds=1)
+    next_guid = _request(oapp)
+    _deliver(oapp, mock_endpoint, next_guid, _response(2), nonce=2)
+    assert oapp.readCache(CACHE_KEY)[0] == _response(2)
+
+    _deliver(oapp, mock_endpoint, next_guid, _response(3), nonce=3)
+    assert len(_skipped(mock_endpoint)) == 1
+    assert oapp.readCache(CACHE_KEY)[0] == _response(2)
+
+
+def test_set_read_max_age_owner_only(oapp_read_cache_contract):
+    """Test that only the owner sets the max age."""
+    with boa.reverts("ownable: caller is not the owner"):
+        oapp_read_cache_contract.setReadMaxAge(MAX_AGE)
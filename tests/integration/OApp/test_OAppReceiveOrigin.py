@@ -0,0 +1,44 @@
+"""Test the _lzReceiveOrigin receive path against the mock endpoint."""
+
+import boa
+import pytest
+from AddressUtils import to_bytes32
+from conftest import WRAPPER_PEER, WRAPPER_PEER_EID
+
+SRC_EID = WRAPPER_PEER_EID  # peer set by the fixture
+PEER = WRAPPER_PEER
+GUID = b"\x01" * 32
+
+
+@pytest.fixture()
+def receiver(oapp_receiver_factory):
+    return oapp_receiver_factory()
+
+
+def _deliver(mock_endpoint, receiver, message, sender=PEER, extra_data=b"\xee" * 64):
+    mock_endpoint.lzReceive((SRC_EID, sender, 1), receiver.address, GUID, message, extra_data)
+    return [e for e in mock_endpoint.get_logs() if "MessageRead" in str(e)][0]
+
+
+@pytest.mark.parametrize("size,offset", [(32, 0), (64, 32), (100, 60), (512, 480)])
+def test_read_message_word(receiver, mock_endpoint, size, offset):
+    """Test that the handler reads fields from its own _message after origin checks."""
+    message = bytes((i * 7 + 1) % 256 for i in range(size))
+    receiver.setReadOffset(offset)
+
+    event = _deliver(mock_endpoint, receiver, message)
+
+    assert event.length == size
+    assert event.word == message[offset : offset + 32]
+
+
+def test_origin_checks(receiver, mock_endpoint):
+    """Test that _lzReceiveOrigin keeps the endpoint and peer checks of _lzReceive."""
+    with boa.reverts("OApp: no peer"):
+        mock_endpoint.lzReceive((SRC_EID + 1, PEER, 1), receiver.address, GUID, b"hello", b"")
+
+    with boa.reverts("OApp: invalid sender"):
+        _deliver(mock_endpoint, receiver, b"hello", sender=to_bytes32("0x" + "43" * 20))
+
+    with boa.reverts("OApp: only endpoint"):
+        receiver.lzReceive((SRC_EID, PEER, 1), GUID, b"hello", receiver.address, b"")
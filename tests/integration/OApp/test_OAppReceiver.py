@@ -1,7 +1,8 @@
 """Test OAppReceiver functionality for OApp."""
 
 import boa
-from conftest import _to_bytes32, LZ_ENDPOINT_BASE_SEPOLIA, LZ_ENDPOINT_ID
+from AddressUtils import to_bytes32
+from conftest import LZ_ENDPOINT_BASE_SEPOLIA, LZ_ENDPOINT_ID
 
 
 def test_is_compose_msg_sender(oapp_module_contract, dev_deployer):
@@ -9,7 +10,7 @@ def test_is_compose_msg_sender(oapp_module_contract, dev_deployer):
     # Set up test data
     origin = (
         LZ_ENDPOINT_ID,  # srcEid
-        _to_bytes32(dev_deployer),  # sender
+        to_bytes32(dev_deployer),  # sender
         1,  # nonce
     )
     test_message = bytes("Test message", "utf-8")
@@ -30,7 +31,7 @@ def test_allow_initialize_path_with_peer_set(oapp_module_contract, dev_deployer)
     """Test allowInitializePath returns true when peer is set."""
     # Set up test data
     test_eid = LZ_ENDPOINT_ID
-    test_peer = _to_bytes32(dev_deployer)
+    test_peer = to_bytes32(dev_deployer)
 
     # Set peer as owner
     with boa.env.prank(dev_deployer):
@@ -50,7 +51,7 @@ def test_allow_initialize_path_with_peer_set(oapp_module_contract, dev_deployer)
     # Test with different peer
     wrong_peer_origin = (
         test_eid,  # srcEid
-        _to_bytes32(boa.env.generate_address()),  # different sender
+        to_bytes32(boa.env.generate_address()),  # different sender
         1,  # nonce
     )
     result = oapp_module_contract.allowInitializePath(wrong_peer_origin)
@@ -61,7 +62,7 @@ def test_allow_initialize_path_with_no_peer(oapp_module_contract):
     """Test allowInitializePath returns false when no peer is set."""
     # Set up test data without setting a peer
     test_eid = LZ_ENDPOINT_ID
-    test_peer = _to_bytes32(boa.env.generate_address())
+    test_peer = to_bytes32(boa.env.generate_address())
 
     # Create origin struct with non-matching peer
     origin = (
@@ -79,14 +80,14 @@ def test_next_nonce(oapp_module_contract):
     """Test nextNonce returns 0 by default (no nonce ordering)."""
     # Set up test data
     test_eid = LZ_ENDPOINT_ID
-    test_peer = _to_bytes32(boa.env.generate_address())
+    test_peer = to_bytes32(boa.env.generate_address())
 
     # Check if nextNonce returns 0 (default)
     nonce = oapp_module_contract.nextNonce(test_eid, test_peer)
     assert nonce == 0
 
     # Test with different values (should still return 0)
-    nonce = oapp_module_contract.nextNonce(999, _to_bytes32("random"))
+    nonce = oapp_module_contract.nextNonce(999, to_bytes32("random"))
     assert nonce == 0
 
 
@@ -95,7 +96,7 @@ def test_lz_receive_basic(oapp_module_contract, dev_deployer):
     """Test basic _lzReceive functionality through eval."""
     # Set up test data
     test_eid = LZ_ENDPOINT_ID
-    test_peer = _to_bytes32(dev_deployer)
+    test_peer = to_bytes32(dev_deployer)
     test_message = bytes("Test message", "utf-8")
 
     # Set peer as owner
@@ -119,7 +120,7 @@ def test_lz_receive_invalid_sender(oapp_module_contract, dev_deployer):
     """Test _lzReceive reverts when caller is not endpoint."""
     # Set up test data
     test_eid = LZ_ENDPOINT_ID
-    test_peer = _to_bytes32(dev_deployer)
+    test_peer = to_bytes32(dev_deployer)
     test_message = bytes("Test message", "utf-8")
 
     # Set peer as owner
@@ -140,8 +141,8 @@ def test_lz_receive_invalid_peer(oapp_module_contract, dev_deployer):
     """Test _lzReceive reverts when origin.sender is not a valid peer."""
     # Set up test data
     test_eid = LZ_ENDPOINT_ID
-    valid_peer = _to_bytes32(dev_deployer)
-    invalid_peer = _to_bytes32(boa.env.generate_address())
+    valid_peer = to_bytes32(dev_deployer)
+    invalid_peer = to_bytes32(boa.env.generate_address())
     test_message = bytes("Test message", "utf-8")
 
     # Set peer as owner
@@ -164,7 +165,7 @@ def test_lz_receive_no_peer_set(oapp_module_contract, dev_deployer):
     """Test _lzReceive reverts when no peer is set for the origin chain."""
     # Set up test data
     test_eid = LZ_ENDPOINT_ID
-    test_peer = _to_bytes32(dev_deployer)
+    test_peer = to_bytes32(dev_deployer)
     test_message = bytes("Test message", "utf-8")
 
     # Don't set a peer for test_eid
@@ -183,7 +184,7 @@ def test_lz_receive_with_zero_peer(oapp_module_contract, dev_deployer):
     """Test _lzReceive reverts when peer is set to zero."""
     # Set up test data
     test_eid = LZ_ENDPOINT_ID
-    zero_peer = _to_bytes32("0x" + "00" * 20)
+    zero_peer = to_bytes32("0x" + "00" * 20)
     test_message = bytes("Test message", "utf-8")
 
     # Set peer to zero bytes32
@@ -1,7 +1,8 @@
 """Test OAppSender functionality for OApp. This actually tests the OAppExample contract (to simplify options building)"""
 
 import boa
-from conftest import _to_bytes32, LZ_ENDPOINT_ID, LZ_READ_CHANNEL
+from AddressUtils import to_bytes32
+from conftest import LZ_ENDPOINT_ID, LZ_READ_CHANNEL
 
 
 def test_quote_message_fee(messenger_contract, dev_deployer):
@@ -14,7 +15,7 @@ def test_quote_message_fee(messenger_contract, dev_deployer):
 
     # Set peer as owner to allow quote to work
     with boa.env.prank(dev_deployer):
-        messenger_contract.setPeer(test_eid, _to_bytes32(test_receiver))
+        messenger_contract.setPeer(test_eid, to_bytes32(test_receiver))
 
     # Get quote for message
     fee = messenger_contract.quote_message_fee(
@@ -49,7 +50,7 @@ def test_quote_with_pay_in_lz_token(messenger_contract, dev_deployer):
 
     # Set peer as owner
     with boa.env.prank(dev_deployer):
-        messenger_contract.setPeer(test_eid, _to_bytes32(test_receiver))
+        messenger_contract.setPeer(test_eid, to_bytes32(test_receiver))
 
     # Get quote with LZ token payment option
     with boa.reverts():  # must revert because its not enabled
@@ -68,7 +69,7 @@ def test_send_message(messenger_contract, dev_deployer):
 
     # Set peer as owner
     with boa.env.prank(dev_deployer):
-        messenger_contract.setPeer(test_eid, _to_bytes32(test_receiver))
+        messenger_contract.setPeer(test_eid, to_bytes32(test_receiver))
 
     # Get quote for the fee
     fee = messenger_contract.quote_message_fee(
@@ -0,0 +1,439 @@
+# pragma version 0.4.3
+
+"""
+@title EndpointV2Mock
+
+@notice Minimal stand-in for the LayerZero EndpointV2, for local (non-forked) tests and tooling.
+Implements the subset of the endpoint used by the OApp modules: fee quotes, sends, delegate,
+message library and config management, compose queue. Packets are not verified or executed
+automatically: a relayer delivers them by calling lzReceive (and lzCompose for queued compose
+messages) on the destination chain's mock.
+
+@dev Fees are linear: nativeFee = nativeFeeBase + nativeFeePerByte * (len(message) + len(options)).
+guid, nonce and packet encoding follow EndpointV2 (GUID.generate, PacketV1Codec).
+
+@license Copyright (c) Curve.Fi, 2025 - all rights reserved
+
+@author curve.fi
+
+@custom:security security@curve.fi
+"""
+
+################################################################
+#                            MODULES                           #
+################################################################
+
+from ...src import VyperConstants as constants
+
+################################################################
+#                         INTERFACES                           #
+################################################################
+
+interface ILayerZeroReceiver:
+    def lzReceive(
+        _origin: Origin,
+        _guid: bytes32,
+        _message: Bytes[MAX_MESSAGE_SIZE],
+        _executor: address,
+        _extraData: Bytes[MAX_EXTRA_DATA_SIZE],
+    ): payable
+
+
+interface ILayerZeroComposer:
+    def lzCompose(
+        _from: address,
+        _guid: bytes32,
+        _message: Bytes[MAX_MESSAGE_SIZE],
+        _executor: address,
+        _extraData: Bytes[MAX_EXTRA_DATA_SIZE],
+    ): payable
+
+
+################################################################
+#                           EVENTS                            #
+################################################################
+
+event PacketSent:
+    encodedPayload: Bytes[PACKET_HEADER_SIZE + MAX_MESSAGE_SIZE]
+    options: Bytes[MAX_OPTIONS_TOTAL_SIZE]
+    sendLibrary: address
+
+
+event PacketDelivered:
+    origin: Origin
+    receiver: address
+
+
+event ComposeSent:
+    sender: address
+    to: address
+    guid: bytes32
+    index: uint16
+    message: Bytes[MAX_MESSAGE_SIZE]
+
+
+event ComposeDelivered:
+    sender: address
+    to: address
+    guid: bytes32
+    index: uint16
+
+
+event DelegateSet:
+    sender: address
+    delegate: address
+
+
+event SendLibrarySet:
+    sender: address
+    eid: uint32
+    newLib: address
+
+
+event ReceiveLibrarySet:
+    receiver: address
+    eid: uint32
+    newLib: address
+
+
+event InboundNonceSkipped:
+    srcEid: uint32
+    sender: bytes32
+    receiver: address
+    nonce: uint64
+
+
+################################################################
+#                           CONSTANTS                          #
+################################################################
+
+MAX_MESSAGE_SIZE: constant(uint256) = constants.MAX_MESSAGE_SIZE
+MAX_OPTIONS_TOTAL_SIZE: constant(uint256) = constants.MAX_OPTIONS_TOTAL_SIZE
+MAX_EXTRA_DATA_SIZE: constant(uint256) = constants.MAX_EXTRA_DATA_SIZE
+MAX_DVNS: constant(uint256) = constants.MAX_DVNS
+MAX_CONFIG_ITEMS: constant(uint256) = constants.MAX_CONFIG_ITEMS
+MAX_CONFIG_SIZE: constant(uint256) = 9 * 32 + 2 * MAX_DVNS * 32
+
+# PacketV1Codec: version(1) + nonce(8) + srcEid(4) + sender(32) + dstEid(4) + receiver(32) + guid(32)
+PACKET_HEADER_SIZE: constant(uint256) = 113
+PACKET_VERSION: constant(uint8) = 1
+
+# EndpointV2 marks delivered compose messages with this hash
+RECEIVED_MESSAGE_HASH: constant(bytes32) = 0x0000000000000000000000000000000000000000000000000000000000000001
+
+
+################################################################
+#                           STRUCTS                            #
+################################################################
+
+struct MessagingParams:
+    dstEid: uint32
+    receiver: bytes32
+    message: Bytes[MAX_MESSAGE_SIZE]
+    options: Bytes[MAX_OPTIONS_TOTAL_SIZE]
+    payInLzToken: bool
+
+
+struct MessagingReceipt:
+    guid: bytes32
+    nonce: uint64
+    fee: MessagingFee
+
+
+struct MessagingFee:
+    nativeFee: uint256
+    lzTokenFee: uint256
+
+
+struct Origin:
+    srcEid: uint32
+    sender: bytes32
+    nonce: uint64
+
+
+struct SetConfigParam:
+    eid: uint32
+    configType: uint32
+    config: Bytes[MAX_CONFIG_SIZE]
+
+
+################################################################
+#                           STORAGE                            #
+################################################################
+
+eid: public(immutable(uint32))
+
+lzToken: public(address)
+delegates: public(HashMap[address, address])
+
+nativeFeeBase: public(uint256)
+nativeFeePerByte: public(uint256)
+
+# sender => dstEid => receiver => nonce
+outboundNonce: public(HashMap[address, HashMap[uint32, HashMap[bytes32, uint64]]])
+# receiver => srcEid => sender => nonce
+lazyInboundNonce: public(HashMap[address, HashMap[uint32, HashMap[bytes32, uint64]]])
+
+# from => to => guid => index => message hash
+composeQueue: public(HashMap[address, HashMap[address, HashMap[bytes32, HashMap[uint16, bytes32]]]])
+
+defaultSendLibrary: public(address)
+defaultReceiveLibrary: public(address)
+sendLibrary: HashMap[address, HashMap[uint32, address]]
+receiveLibrary: HashMap[address, HashMap[uint32, address]]
+receiveLibraryGracePeriod: public(HashMap[address, HashMap[uint32, uint256]])
+
+# oapp => lib => eid => configType => config
+configs: HashMap[address, HashMap[address, HashMap[uint32, HashMap[uint32, Bytes[MAX_CONFIG_SIZE]]]]]
+
+
+################################################################
+#                         CONSTRUCTOR                          #
+################################################################
+
+@deploy
+def __init__(_eid: uint32):
+    """
+    @notice Initialize the mock endpoint
+    @param _eid Endpoint ID of the chain this mock stands in for
+    """
+    eid = _eid
+    self.nativeFeeBase = 10**12
+    self.nativeFeePerByte = 10**9
+
+
+################################################################
+#                        MOCK SETTINGS                         #
+################################################################
+
+@external
+def setFees(_nativeFeeBase: uint256, _nativeFeePerByte: uint256):
+    self.nativeFeeBase = _nativeFeeBase
+    self.nativeFeePerByte = _nativeFeePerByte
+
+
+@external
+def setLzToken(_lzToken: address):
+    self.lzToken = _lzToken
+
+
+@external
+def setDefaultLibraries(_sendLib: address, _receiveLib: address):
+    self.defaultSendLibrary = _sendLib
+    self.defaultReceiveLibrary = _receiveLib
+
+
+################################################################
+#                          MESSAGING                           #
+################################################################
+
+@internal
+@view
+def _quote(_params: MessagingParams) -> MessagingFee:
+    if _params.payInLzToken:
+        assert self.lzToken != empty(address), "Endpoint: lzToken unavailable"
+
+    return MessagingFee(
+        nativeFee=self.nativeFeeBase
+        + self.nativeFeePerByte * (len(_params.message) + len(_params.options)),
+        lzTokenFee=0,
+    )
+
+
+@external
+@view
+def quote(_params: MessagingParams, _sender: address) -> MessagingFee:
+    return self._quote(_params)
+
+
+@external
+@payable
+def send(_params: MessagingParams, _refundAddress: address) -> MessagingReceipt:
+    fee: MessagingFee = self._quote(_params)
+    assert msg.value >= fee.nativeFee, "Endpoint: insufficient fee"
+
+    nonce: uint64 = self.outboundNonce[msg.sender][_params.dstEid][_params.receiver] + 1
+    self.outboundNonce[msg.sender][_params.dstEid][_params.receiver] = nonce
+
+    sender: bytes32 = convert(msg.sender, bytes32)
+    guid: bytes32 = keccak256(
+        concat(
+            convert(nonce, bytes8),
+            convert(eid, bytes4),
+            sender,
+            convert(_params.dstEid, bytes4),
+            _params.receiver,
+        )
+    )
+
+    log PacketSent(
+        encodedPayload=concat(
+            convert(PACKET_VERSION, bytes1),
+            convert(nonce, bytes8),
+            convert(eid, bytes4),
+            sender,
+            convert(_params.dstEid, bytes4),
+            _params.receiver,
+            guid,
+            _params.message,
+        ),
+        options=_params.options,
+        sendLibrary=self._getSendLibrary(msg.sender, _params.dstEid),
+    )
+
+    refund: uint256 = msg.value - fee.nativeFee
+    if refund > 0:
+        send(_refundAddress, refund)
+
+    return MessagingReceipt(guid=guid, nonce=nonce, fee=fee)
+
+
+@external
+@payable
+def lzReceive(
+    _origin: Origin,
+    _receiver: address,
+    _guid: bytes32,
+    _message: Bytes[MAX_MESSAGE_SIZE],
+    _extraData: Bytes[MAX_EXTRA_DATA_SIZE],
+):
+    """
+    @notice Deliver a packet to the receiver, acting as both verifier and executor
+    @dev Unlike EndpointV2, any caller may deliver and nonces are not enforced.
+    """
+    if _origin.nonce > self.lazyInboundNonce[_receiver][_origin.srcEid][_origin.sender]:
+        self.lazyInboundNonce[_receiver][_origin.srcEid][_origin.sender] = _origin.nonce
+
+    extcall ILayerZeroReceiver(_receiver).lzReceive(
+        _origin, _guid, _message, msg.sender, _extraData, value=msg.value
+    )
+
+    log PacketDelivered(origin=_origin, receiver=_receiver)
+
+
+@external
+def sendCompose(_to: address, _guid: bytes32, _index: uint16, _message: Bytes[MAX_MESSAGE_SIZE]):
+    assert self.composeQueue[msg.sender][_to][_guid][_index] == empty(bytes32), "Endpoint: compose exists"
+    self.composeQueue[msg.sender][_to][_guid][_index] = keccak256(_message)
+
+    log ComposeSent(sender=msg.sender, to=_to, guid=_guid, index=_index, message=_message)
+
+
+@external
+@payable
+def lzCompose(
+    _from: address,
+    _to: address,
+    _guid: bytes32,
+    _index: uint16,
+    _message: Bytes[MAX_MESSAGE_SIZE],
+    _extraData: Bytes[MAX_EXTRA_DATA_SIZE],
+):
+    """
+    @notice Deliver a queued compose message, acting as the executor
+    """
+    message_hash: bytes32 = self.composeQueue[_from][_to][_guid][_index]
+    assert message_hash != RECEIVED_MESSAGE_HASH, "Endpoint: compose already delivered"
+    assert message_hash == keccak256(_message), "Endpoint: compose not found"
+    self.composeQueue[_from][_to][_guid][_index] = RECEIVED_MESSAGE_HASH
+
+    extcall ILayerZeroComposer(_to).lzCompose(
+        _from, _guid, _message, msg.sender, _extraData, value=msg.value
+    )
+
+    log ComposeDelivered(sender=_from, to=_to, guid=_guid, index=_index)
+
+
+@external
+def skip(_oapp: address, _srcEid: uint32, _sender: bytes32, _nonce: uint64):
+    self._assertAuthorized(_oapp)
+
+    self.lazyInboundNonce[_oapp][_srcEid][_sender] = _nonce
+    log InboundNonceSkipped(srcEid=_srcEid, sender=_sender, receiver=_oapp, nonce=_nonce)
+
+
+################################################################
+#                    DELEGATE AND LIBRARIES                    #
+################################################################
+
+@internal
+@view
+def _assertAuthorized(_oapp: address):
+    assert msg.sender == _oapp or msg.sender == self.delegates[_oapp], "Endpoint: unauthorized"
+
+
+@external
+def setDelegate(_delegate: address):
+    self.delegates[msg.sender] = _delegate
+    log DelegateSet(sender=msg.sender, delegate=_delegate)
+
+
+@internal
+@view
+def _getSendLibrary(_sender: address, _dstEid: uint32) -> address:
+    lib: address = self.sendLibrary[_sender][_dstEid]
+    if lib == empty(address):
+        return self.defaultSendLibrary
+    return lib
+
+
+@external
+@view
+def getSendLibrary(_sender: address, _dstEid: uint32) -> address:
+    return self._getSendLibrary(_sender, _dstEid)
+
+
+@external
+@view
+def isDefaultSendLibrary(_sender: address, _dstEid: uint32) -> bool:
+    return self.sendLibrary[_sender][_dstEid] == empty(address)
+
+
+@external
+@view
+def getReceiveLibrary(_receiver: address, _srcEid: uint32) -> (address, bool):
+    lib: address = self.receiveLibrary[_receiver][_srcEid]
+    if lib == empty(address):
+        return self.defaultReceiveLibrary, True
+    return lib, False
+
+
+@external
+def setSendLibrary(_oapp: address, _eid: uint32, _newLib: address):
+    self._assertAuthorized(_oapp)
+
+    self.sendLibrary[_oapp][_eid] = _newLib
+    log SendLibrarySet(sender=_oapp, eid=_eid, newLib=_newLib)
+
+
+@external
+def setReceiveLibrary(_oapp: address, _eid: uint32, _newLib: address, _gracePeriod: uint256):
+    self._assertAuthorized(_oapp)
+    if _gracePeriod > 0:
+        # As EndpointV2, the old library only stays valid between two non-default libraries
+        assert self.receiveLibrary[_oapp][_eid] != empty(address), "Endpoint: only non-default lib"
+        assert _newLib != empty(address), "Endpoint: only non-default lib"
+
+    self.receiveLibrary[_oapp][_eid] = _newLib
+    self.receiveLibraryGracePeriod[_oapp][_eid] = _gracePeriod
+    log ReceiveLibrarySet(receiver=_oapp, eid=_eid, newLib=_newLib)
+
+
+################################################################
+#                            CONFIG                            #
+################################################################
+
+@external
+def setConfig(_oapp: address, _lib: address, _params: DynArray[SetConfigParam, MAX_CONFIG_ITEMS]):
+    self._assertAuthorized(_oapp)
+
+    for param: SetConfigParam in _params:
+        self.configs[_oapp][_lib][param.eid][param.configType] = param.config
+
+
+@external
+@view
+def getConfig(
+    _oapp: address, _lib: address, _eid: uint32, _configType: uint32
+) -> Bytes[MAX_CONFIG_SIZE]:
+    return self.configs[_oapp][_lib][_eid][_configType]
@@ -0,0 +1,51 @@
+# pragma version 0.4.3
+
+"""
+@title Multicall3Mock
+
+@notice Minimal stand-in for Multicall3 (0xcA11bde05977b3631167028862bE2a6d83deD2b4), for local
+tests of batched readers. Implements aggregate3 only.
+
+@dev Declared view and executed with static calls: readers only use it through eth_call.
+Calls and return data are bounded, unlike the real contract.
+
+@license Copyright (c) Curve.Fi, 2025 - all rights reserved
+
+@author curve.fi
+
+@custom:security security@curve.fi
+"""
+
+MAX_CALLS: constant(uint256) = 128
+MAX_CALLDATA_SIZE: constant(uint256) = 1024
+MAX_RETURN_SIZE: constant(uint256) = 2048
+
+
+struct Call3:
+    target: address
+    allowFailure: bool
+    callData: Bytes[MAX_CALLDATA_SIZE]
+
+
+struct Result:
+    success: bool
+    returnData: Bytes[MAX_RETURN_SIZE]
+
+
+@external
+@view
+def aggregate3(_calls: DynArray[Call3, MAX_CALLS]) -> DynArray[Result, MAX_CALLS]:
+    results: DynArray[Result, MAX_CALLS] = []
+    for call: Call3 in _calls:
+        success: bool = False
+        data: Bytes[MAX_RETURN_SIZE] = b""
+        success, data = raw_call(
+            call.target,
+            call.callData,
+            max_outsize=MAX_RETURN_SIZE,
+            is_static_call=True,
+            revert_on_failure=False,
+        )
+        assert success or call.allowFailure, "Multicall3: call failed"
+        results.append(Result(success=success, returnData=data))
+    return results
@@ -0,0 +1,64 @@
+"""Test the lazy ABI registry: loading, selector/topic indexes and decoding."""
+
+import subprocess
+import sys
+
+import boa
+from ABIRegistry import ABIRegistry, registry
+from DeployOrchestrator import encode_call
+from eth_utils import function_signature_to_4byte_selector
+from MessageTracker import PACKET_DELIVERED_TOPIC, PACKET_SENT_TOPIC
+
+
+def test_lazy_loading():
+    loads = []
+    abi = '[{"type": "function", "name": "f", "inputs": [{"name": "x", "type": "uint32"}]}]'
+    local = ABIRegistry()
+    local.register("a", lambda: loads.append(1) or abi)
+    assert not local.is_loaded("a") and loads == []
+
+    assert local["a"].selector("f") == function_signature_to_4byte_selector("f(uint32)")
+    local["a"].functions
+    assert local.is_loaded("a") and loads == [1]
+
+
+def test_decode_calldata():
+    endpoint = registry["endpoint"]
+    oapp, lib = "0x" + "0a" * 20, "0x" + "51" * 20
+    params = [(30101, 2, b"\x01\x02"), (30110, 1, b"")]
+    calldata = encode_call("setConfig(address,address,(uint32,uint32,bytes)[])", oapp, lib, params)
+
+    decoded = endpoint.decode_calldata(calldata)
+    assert decoded.name == "setConfig"
+    assert list(decoded.args.values()) == [oapp, lib, tuple(params)]
+    assert endpoint.decode_calldata(b"\xde\xad\xbe\xef") is None
+
+
+def test_decode_endpoint_logs(mock_endpoint, dev_deployer):
+    # The mock emits the EndpointV2 events the trackers rely on
+    origin = (30110, b"\x01" * 32, 7)
+    with boa.env.prank(dev_deployer):
+        receiver = boa.load("examples/OAppExample.vy", mock_endpoint.address)
+        receiver.setPeer(origin[0], origin[1])
+    mock_endpoint.lzReceive(origin, receiver.address, b"\x02" * 32, b"", b"")
+    logs = mock_endpoint._computation.get_raw_log_entries()
+    (_, _, topics, data) = next(
+        log for log in logs if log[2][0].to_bytes(32, "big") == PACKET_DELIVERED_TOPIC
+    )
+
+    name, decoded = registry.decode_log([t.to_bytes(32, "big") for t in topics], data)
+    assert (name, decoded.name) == ("endpoint", "PacketDelivered")
+    assert decoded.args == {"origin": origin, "receiver": str(receiver.address).lower()}
+    assert PACKET_SENT_TOPIC in registry["endpoint"].events
+
+
+def test_import_time_dependencies():
+    # Importing the registry or LZMetadata must not pull in requests, eth_abi or eth_utils
+    code = (
+        "import sys, ABIRegistry, LZMetadata;"
+        "print(sorted(m for m in ('requests', 'eth_abi', 'eth_utils') if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd="scripts"
+    )
+    assert out.stdout.strip() == "[]"
@@ -0,0 +1,18 @@
+"""Test the shared bytes32 padding helper."""
+
+import boa
+import pytest
+from AddressUtils import to_bytes32
+
+
+def test_to_bytes32():
+    address = boa.env.generate_address()
+    assert to_bytes32(address) == b"\x00" * 12 + address.canonical_address
+    assert to_bytes32(str(address).lower()) == to_bytes32(address)
+    assert to_bytes32("0x" + "42" * 20) == b"\x00" * 12 + b"\x42" * 20
+    assert to_bytes32("0x123") == b"\x00" * 30 + b"\x01\x23"
+    assert to_bytes32(b"\x01" * 32) == b"\x01" * 32
+    assert to_bytes32("market-1") == b"market-1".rjust(32, b"\x00")
+
+    with pytest.raises(ValueError):
+        to_bytes32("0x" + "00" * 33)
@@ -0,0 +1,200 @@
+"""Test the diff-based config planner against the mock endpoint."""
+
+import json
+
+import boa
+from AddressUtils import to_bytes32
+from conftest import LZ_READ_CHANNEL
+from ConfigPlanner import (
+    BoaReader,
+    MAX_CONFIG_ITEMS,
+    MulticallReader,
+    PathwayConfig,
+    apply_plan,
+    load_desired,
+    plan,
+    read_state,
+)
+
+SEND_LIB = "0x" + "51" * 20
+RECEIVE_LIB = "0x" + "52" * 20
+READ_LIB = "0x" + "53" * 20
+NEW_RECEIVE_LIB = "0x" + "54" * 20
+EXECUTOR = "0x" + "e0" * 20
+DVN_1 = "0x" + "d1" * 20
+DVN_2 = "0x" + "d2" * 20
+DVN_3 = "0x" + "d3" * 20
+
+
+def _pathway(eid, **overrides):
+    params = dict(
+        eid=eid,
+        peer=to_bytes32("0x" + f"{eid % 256:02x}" * 20),
+        send_lib=SEND_LIB,
+        receive_lib=RECEIVE_LIB,
+        executor=EXECUTOR,
+        confirmations=15,
+        required_dvns=[DVN_1],
+        optional_dvns=[DVN_2],
+        optional_dvn_threshold=1,
+    )
+    params.update(overrides)
+    return PathwayConfig(**params)
+
+
+def _plan(oapp, endpoint, desired):
+    return plan(desired, read_state(BoaReader(), endpoint, oapp, desired))
+
+
+def _apply(oapp, calls, owner):
+    with boa.env.prank(owner):
+        apply_plan(oapp, calls)
+
+
+def test_plan_from_scratch(oapp_config_contract, mock_endpoint, dev_deployer):
+    """Test that an unconfigured OApp gets every setting, grouped per setter."""
+    desired = [_pathway(30101 + i) for i in range(3)]
+
+    calls = _plan(oapp_config_contract, mock_endpoint, desired)
+    assert [c.fn for c in calls] == [
+        "setSendLibraries",
+        "setReceiveLibraries",
+        "setUlnConfigs",
+        "setExecutorConfigs",
+        "setPeers",
+    ]
+    uln_call = calls[2]
+    assert len(uln_call.args[1]) == 6  # send and receive lib for each eid
+    assert uln_call.args[0] == sorted(uln_call.args[0])  # grouped by lib
+
+    _apply(oapp_config_contract, calls, dev_deployer)
+
+    for p in desired:
+        assert oapp_config_contract.peers(p.eid) == p.peer
+        assert mock_endpoint.getSendLibrary(oapp_config_contract.address, p.eid) == SEND_LIB
+
+
+def test_plan_is_empty_when_converged(oapp_config_contract, mock_endpoint, dev_deployer):
+    """Test that re-running the planner after applying emits no calls."""
+    desired = [_pathway(30101 + i) for i in range(3)]
+    _apply(oapp_config_contract, _plan(oapp_config_contract, mock_endpoint, desired), dev_deployer)
+
+    assert _plan(oapp_config_contract, mock_endpoint, desired) == []
+
+
+def test_plan_only_changes(oapp_config_contract, mock_endpoint, dev_deployer):
+    """Test that a DVN change on one eid only re-submits that eid's ULN configs."""
+    desired = [_pathway(30101 + i) for i in range(3)]
+    _apply(oapp_config_contract, _plan(oapp_config_contract, mock_endpoint, desired), dev_deployer)
+
+    desired[1].optional_dvns = [DVN_3, DVN_2]
+    desired[1].optional_dvn_threshold = 2
+    calls = _plan(oapp_config_contract, mock_endpoint, desired)
+
+    assert [c.fn for c in calls] == ["setUlnConfigs"]
+    libs, eids, _, thresholds, _, optional_dvns = calls[0].args
+    assert eids == [30102, 30102]
+    assert thresholds == [2, 2]
+    assert optional_dvns[0] == [DVN_2, DVN_3]  # sorted as required by LayerZero
+
+    _apply(oapp_config_contract, calls, dev_deployer)
+    assert _plan(oapp_config_contract, mock_endpoint, desired) == []
+
+
+def test_plan_no_opinion_fields(oapp_config_contract, mock_endpoint):
+    """Test that unset fields of the desired config produce no calls."""
+    desired = [PathwayConfig(eid=30101, peer=to_bytes32("0x" + "42" * 20))]
+
+    calls = _plan(oapp_config_contract, mock_endpoint, desired)
+    assert [c.fn for c in calls] == ["setPeers"]
+
+
+def test_plan_chunks(oapp_config_contract, mock_endpoint, dev_deployer):
+    """Test that calls are packed into MAX_CONFIG_ITEMS-sized chunks."""
+    desired = [
+        PathwayConfig(eid=30101 + i, peer=to_bytes32("0x" + "42" * 20), send_lib=SEND_LIB)
+        for i in range(MAX_CONFIG_ITEMS + 8)
+    ]
+
+    calls = _plan(oapp_config_contract, mock_endpoint, desired)
+    assert [c.fn for c in calls] == ["setSendLibraries"] * 2 + ["setPeers"] * 2
+    assert [len(c.args[0]) for c in calls] == [MAX_CONFIG_ITEMS, 8] * 2
+
+    _apply(oapp_config_contract, calls, dev_deployer)
+    assert _plan(oapp_config_contract, mock_endpoint, desired) == []
+
+
+def test_plan_read_channel(oapp_config_contract, mock_endpoint, dev_deployer):
+    """Test that read channels are configured with a ULN Read config on the read library."""
+    desired = [
+        _pathway(
+            LZ_READ_CHANNEL,
+            peer=to_bytes32(oapp_config_contract.address),
+            send_lib=READ_LIB,
+            receive_lib=READ_LIB,
+        )
+    ]
+
+    calls = _plan(oapp_config_contract, mock_endpoint, desired)
+    assert [c.fn for c in calls] == [
+        "setSendLibraries",
+        "setReceiveLibraries",
+        "setUlnReadConfigs",
+        "setPeers",
+    ]
+
+    _apply(oapp_config_contract, calls, dev_deployer)
+    assert _plan(oapp_config_contract, mock_endpoint, desired) == []
+
+
+def test_plan_grace_period(oapp_config_contract, mock_endpoint, dev_deployer):
+    """Test that the grace period is dropped when leaving the default receive library."""
+    desired = [_pathway(30101, grace_period=3600)]
+
+    calls = _plan(oapp_config_contract, mock_endpoint, desired)
+    assert calls[1].fn == "setReceiveLibraries"
+    assert calls[1].args[2] == [0]  # the endpoint rejects a grace period off the default lib
+    _apply(oapp_config_contract, calls, dev_deployer)
+
+    desired[0].receive_lib = NEW_RECEIVE_LIB
+    calls = _plan(oapp_config_contract, mock_endpoint, desired)
+    assert calls[0].fn == "setReceiveLibraries"
+    assert calls[0].args[2] == [3600]
+    _apply(oapp_config_contract, calls, dev_deployer)
+
+    address = oapp_config_contract.address
+    assert mock_endpoint.getReceiveLibrary(address, 30101) == (NEW_RECEIVE_LIB, False)
+    assert mock_endpoint.receiveLibraryGracePeriod(address, 30101) == 3600
+
+
+def test_multicall_reader(oapp_config_contract, mock_endpoint, dev_deployer):
+    """Test that Multicall3 batches return the same state as per-getter reads."""
+    multicall = boa.load("tests/mocks/Multicall3Mock.vy")
+    desired = [_pathway(30101 + i) for i in range(3)]
+    desired.append(_pathway(LZ_READ_CHANNEL, send_lib=READ_LIB, receive_lib=READ_LIB))
+    _apply(oapp_config_contract, _plan(oapp_config_contract, mock_endpoint, desired), dev_deployer)
+    desired.append(_pathway(30201))  # not configured yet
+
+    reader = MulticallReader(multicall, max_batch=4)
+    states = read_state(reader, mock_endpoint, oapp_config_contract, desired)
+
+    assert states == read_state(BoaReader(), mock_endpoint, oapp_config_contract, desired)
+    assert plan(desired, states) == _plan(oapp_config_contract, mock_endpoint, desired)
+
+
+def test_load_desired(tmp_path):
+    """Test loading the desired config from a JSON file."""
+    config = {
+        "pathways": [
+            {"eid": 30101, "peer": "0x" + "42" * 20, "send_lib": SEND_LIB},
+            {"eid": 30102, "required_dvns": [DVN_1]},
+        ]
+    }
+    filepath = tmp_path / "config.json"
+    filepath.write_text(json.dumps(config))
+
+    desired = load_desired(str(filepath))
+    assert desired[0].peer == to_bytes32("0x" + "42" * 20)
+    assert desired[0].send_lib == SEND_LIB
+    assert desired[1].peer is None
+    assert desired[1].required_dvns == [DVN_1]
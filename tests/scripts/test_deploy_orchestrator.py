@@ -0,0 +1,170 @@
+"""Test the pipelined rollout orchestrator against local node stand-ins."""
+
+import asyncio
+import json
+
+import boa
+import eth_abi
+import pytest
+from AddressUtils import to_bytes32
+from conftest import LZ_READ_CHANNEL
+from DeployOrchestrator import (
+    CONFIRMED,
+    ChainSpec,
+    DeployOrchestrator,
+    LocalNode,
+    create_address,
+    oapp_rollout,
+)
+
+SEND_LIB = "0x" + "51" * 20
+RECEIVE_LIB = "0x" + "52" * 20
+READ_LIB = "0x" + "53" * 20
+EXECUTOR = "0x" + "e0" * 20
+DVN = "0x" + "d1" * 20
+EIDS = {"chain-a": 30101, "chain-b": 30110, "chain-c": 30184}
+
+
+@pytest.fixture()
+def rollout():
+    # One node (boa env) per chain with a mock endpoint, and the OAppExample rollout plans
+    nodes, endpoints, specs = {}, {}, []
+    for name, eid in EIDS.items():
+        nodes[name] = LocalNode(block_time=0.02)
+        # Not from the node account, whose nonces the rollout uses from 0
+        with boa.swap_env(nodes[name].env), boa.env.prank(boa.env.generate_address()):
+            endpoints[name] = boa.load("tests/mocks/EndpointV2Mock.vy", eid)
+        specs.append(
+            ChainSpec(
+                name=name,
+                eid=eid,
+                endpoint=str(endpoints[name].address),
+                send_lib=SEND_LIB,
+                receive_lib=RECEIVE_LIB,
+                executor=EXECUTOR,
+                required_dvns=[DVN],
+                read_channel=LZ_READ_CHANNEL if name == "chain-a" else None,
+                read_lib=READ_LIB,
+                read_dvns=[DVN],
+            )
+        )
+
+    deployer = boa.load_partial("examples/OAppExample.vy")
+    plans = oapp_rollout(
+        specs,
+        lambda c: deployer.compiler_data.bytecode + eth_abi.encode(["address"], [c.endpoint]),
+    )
+    return nodes, endpoints, plans, deployer
+
+
+def _orchestrator(nodes, plans, tmp_path):
+    return DeployOrchestrator(
+        nodes, plans, str(tmp_path / "state.json"), poll_interval=0.005, timeout=30
+    )
+
+
+def test_rollout(rollout, tmp_path):
+    nodes, endpoints, plans, deployer = rollout
+    orchestrator = _orchestrator(nodes, plans, tmp_path)
+    results = asyncio.run(orchestrator.run())
+
+    addresses = orchestrator.addresses()
+    for name, eid in EIDS.items():
+        result = results[name]
+        assert result.error is None and result.failed == []
+        assert result.confirmed == [s.name for s in plans[name]]
+        # Configuration is pipelined: several transactions in flight at once
+        assert nodes[name].max_mempool > 1
+
+        address = addresses[name]["deploy"]
+        assert address == create_address(nodes[name].address, 0)
+        with boa.swap_env(nodes[name].env):
+            oapp = deployer.at(address)
+            for other, other_eid in EIDS.items():
+                if other != name:
+                    assert oapp.peers(other_eid) == to_bytes32(addresses[other]["deploy"])
+                    assert endpoints[name].getSendLibrary(address, other_eid) == SEND_LIB
+                    assert endpoints[name].getConfig(address, SEND_LIB, other_eid, 1)
+
+    with boa.swap_env(nodes["chain-a"].env):
+        oapp = deployer.at(addresses["chain-a"]["deploy"])
+        assert oapp.peers(LZ_READ_CHANNEL) == to_bytes32(oapp.address)
+
+
+def test_resume_after_crash(rollout, tmp_path):
+    nodes, _, plans, _ = rollout
+    node = nodes["chain-b"]
+    broadcast, calls = node.broadcast, []
+
+    async def crashing_broadcast(raw):
+        calls.append(raw)
+        if len(calls) == 3:
+            raise ConnectionError("node went away")
+        await broadcast(raw)
+
+    node.broadcast = crashing_broadcast
+    results = asyncio.run(_orchestrator(nodes, plans, tmp_path).run())
+    assert "ConnectionError" in results["chain-b"].error
+    assert len(results["chain-a"].confirmed) == len(plans["chain-a"])
+
+    with open(tmp_path / "state.json") as f:
+        before = json.load(f)["chains"]["chain-b"]["steps"]
+    del node.broadcast
+
+    # A new process picks up the state: nothing is signed twice, every nonce is used once
+    results = asyncio.run(_orchestrator(nodes, plans, tmp_path).run())
+    assert results["chain-b"].error is None
+    assert results["chain-b"].confirmed == [s.name for s in plans["chain-b"]]
+    assert len(node.receipts) == len(plans["chain-b"])
+
+    with open(tmp_path / "state.json") as f:
+        after = json.load(f)["chains"]["chain-b"]["steps"]
+    for name, entry in before.items():
+        assert after[name]["nonce"] == entry["nonce"]
+        if "tx_hash" in entry:
+            assert after[name]["tx_hash"] == entry["tx_hash"]
+    assert all(entry["status"] == CONFIRMED for entry in after.values())
+
+
+def test_create_address():
+    sender = "0x6ac7ea33f8831ea9dcc53393aaa88b25a785dbf0"
+    assert [create_address(sender, n) for n in range(3)] == [
+        "0xcd234A471b72ba2F1Ccf0A70FCABA648a5eeCD8d",
+        "0x343c43A37D37dfF08AE8C4A11544c718AbB4fCF8",
+        "0xf778B86FA74E846c4f0a1fBd1335FE81c00a0C91",
+    ]
+
+
+def test_rollout_configs():
+    # No required DVNs still gets the executor config; duplicated DVNs are counted once
+    specs = [
+        ChainSpec("chain-a", 30101, EXECUTOR, send_lib=SEND_LIB, executor=EXECUTOR),
+        ChainSpec(
+            "chain-b",
+            30110,
+            EXECUTOR,
+            send_lib=SEND_LIB,
+            receive_lib=RECEIVE_LIB,
+            required_dvns=[DVN, DVN.upper().replace("0X", "0x")],
+        ),
+    ]
+    plans = oapp_rollout(specs, lambda c: b"")
+    addresses = {name: {"deploy": "0x" + "0a" * 20} for name in ("chain-a", "chain-b")}
+
+    def params(chain, name):
+        (step,) = [s for s in plans[chain] if s.name == name]
+        _, _, decoded = eth_abi.decode(
+            ["address", "address", "(uint32,uint32,bytes)[]"], step.data(addresses)[4:]
+        )
+        return decoded
+
+    assert [s.name for s in plans["chain-a"]].count("receiveConfig") == 0
+    (executor,) = params("chain-a", "sendConfig")
+    assert executor[:2] == (30110, 1)
+    assert eth_abi.decode(["uint32", "address"], executor[2])[1] == EXECUTOR
+
+    for name in ("sendConfig", "receiveConfig"):
+        ((eid, config_type, uln),) = params("chain-b", name)
+        assert (eid, config_type) == (30101, 0)
+        uln = eth_abi.decode(["(uint64,uint8,uint8,uint8,address[],address[])"], uln)[0]
+        assert uln[1:3] == (1, 0) and uln[4] == (DVN,)
@@ -0,0 +1,28 @@
+"""Test the gas profiler: per-line and per-function tables of the OApp modules."""
+
+from GasProfile import format_file, functions, profile, write_profile
+
+
+def test_profile_modules(tmp_path):
+    files = profile()
+    assert list(files) == ["src/OApp.vy", "src/OptionsBuilder.vy", "src/ReadCmdCodecV1.vy"]
+
+    by_fn = {p: {f.fn_name: f for f in functions(lines)} for p, lines in files.items()}
+    assert by_fn["src/OApp.vy"]["_lzSend"].gas > 0
+    assert by_fn["src/OptionsBuilder.vy"]["addExecutorOption"].lines > 1
+    assert by_fn["src/ReadCmdCodecV1.vy"]["appendEVMCallRequestV1"].gas > 0
+    # Setup is not profiled
+    assert "setPeer" not in by_fn["src/OApp.vy"]
+
+    # The extcall line excludes the endpoint's gas: the callee is profiled separately
+    (send,) = [
+        line for line in files["src/OApp.vy"] if line.source.startswith("return extcall endpoint")
+    ]
+    assert send.count == 4 and send.gas < 50_000
+
+    # Deterministic, so written profiles can be diffed between releases
+    written = write_profile(files, str(tmp_path))
+    assert written[0] == str(tmp_path / "src" / "OApp.vy.gas")
+    assert {p: format_file(p, lines) for p, lines in profile().items()} == {
+        p: format_file(p, lines) for p, lines in files.items()
+    }
@@ -0,0 +1,56 @@
+"""Test the multi-chain load-test harness on a few local chains."""
+
+import pytest
+from LoadTest import LoadTest, Traffic, format_report
+
+
+@pytest.fixture(scope="module")
+def ping_pong_report():
+    with LoadTest(3, Traffic(ping_pong=1, ping_pong_replies=3)) as test:
+        report = test.run(blocks=1)
+        yield test, report
+
+
+def test_ping_pong_recursion(ping_pong_report):
+    test, report = ping_pong_report
+    # 3 pings, each answered 3 times from lzReceive, one hop per block
+    assert (report.sent, report.delivered, report.pending) == (12, 12, 0)
+    assert report.blocks == 4
+    assert report.gas["ping"].count == 3
+    assert report.gas["lzReceive + reply"].count == 9
+    assert report.gas["lzReceive (last pong)"].count == 3
+    # Replies cost a receive plus a send
+    assert report.gas["lzReceive + reply"].min > report.gas["lzReceive (last pong)"].max
+
+    # Replies are paid from the tanks, and every wei reaches an endpoint
+    assert report.fee_drift == dict.fromkeys(test.eids, 0)
+    assert not report.errors
+
+
+def test_hotspots(ping_pong_report):
+    _, report = ping_pong_report
+    names = [name for name, _, _ in report.hotspots]
+    assert {"OAppPingPong.lzReceive", "EndpointV2Mock.send", "EndpointV2Mock.lzReceive"} <= set(
+        names
+    )
+    net = [gas for _, _, gas in report.hotspots]
+    assert net == sorted(net, reverse=True)
+    # Net gas of the frames adds up to the gas of the metered operations
+    assert sum(net) == sum(s.total for s in report.gas.values())
+    assert "msg/s simulated" in format_report(report)
+
+
+def test_fan_out_and_reads():
+    traffic = Traffic(fan_out=2, random=1, reads=1)
+    with LoadTest(3, traffic, seed=7) as test:
+        report = test.run(blocks=2)
+
+    # Per block and chain: 2 messages to each of 2 chains, 1 random message, 1 read
+    assert report.gas["send"].count == 3 * 2 * (2 * 2 + 1)
+    assert report.gas["read"].count == report.gas["read response"].count == 3 * 2
+    assert report.delivered == report.sent == 3 * 2 * 6
+    assert report.messages_per_second == report.delivered / report.simulated_seconds
+    # Endpoint nonces are the only lasting storage, the apps keep nothing per message
+    grown = {key for key, slots in report.storage_growth.items() if slots}
+    assert grown == {f"{eid}:EndpointV2Mock" for eid in test.eids}
+    assert report.fee_drift == dict.fromkeys(test.eids, 0)
@@ -0,0 +1,64 @@
+"""Test the lzReceive gas estimator on the example OApp, which logs every message."""
+
+import boa
+import pytest
+from AddressUtils import to_bytes32
+from LzReceiveGasEstimator import (
+    ENDPOINT_OVERHEAD,
+    estimate,
+    measure_lz_receive,
+    percentile,
+    recommend_gas_limit,
+)
+from OptionsCodec import decode_options
+
+SRC_EID = 30101
+PEER = to_bytes32("0x" + "42" * 20)
+
+
+@pytest.fixture()
+def messenger(dev_deployer, mock_endpoint):
+    with boa.env.prank(dev_deployer):
+        oapp = boa.load("examples/OAppExample.vy", mock_endpoint.address)
+        oapp.setPeer(SRC_EID, PEER)
+    return oapp
+
+
+def test_percentile_and_recommendation():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([7], 99) == 7
+
+    gas_limit = recommend_gas_limit(100_000, margin=0.2)
+    assert gas_limit % 1_000 == 0
+    assert gas_limit >= (100_000 * 64 // 63 + ENDPOINT_OVERHEAD) * 1.2
+
+
+# reset_gas_used() drops the journal checkpoints boa's test isolation relies on
+@pytest.mark.ignore_isolation
+def test_measure_lz_receive(messenger):
+    # Samples are rolled back and priced cold, so repeats measure the same
+    first = measure_lz_receive(messenger, SRC_EID, b"\x01" * 64)
+    assert measure_lz_receive(messenger, SRC_EID, b"\x01" * 64) == first
+
+    # 64 more bytes of log data, 8 gas each
+    assert measure_lz_receive(messenger, SRC_EID, b"\x01" * 128) > first + 64 * 8
+
+
+# reset_gas_used() drops the journal checkpoints boa's test isolation relies on
+@pytest.mark.ignore_isolation
+def test_estimate(messenger):
+    corpus = {SRC_EID: [b"\x01" * 32] * 8 + [b"\x01" * 256]}
+
+    report = estimate(messenger, corpus)[SRC_EID]
+    assert report.samples == 9
+    assert report.p50 < report.max == report.p99
+    assert report.gas_limit == recommend_gas_limit(report.max)
+
+    options = decode_options(report.options())
+    assert options.has_lz_receive and options.lz_receive_gas == report.gas_limit
+
+    # Unknown peer: origin checks fail and the sample is reported
+    with pytest.raises(ValueError, match="eid 30110, sample 0"):
+        estimate(messenger, {30110: [b"\x01" * 32]})
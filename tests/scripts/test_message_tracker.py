@@ -0,0 +1,96 @@
+"""Test guid correlation, latency and delivery stats with the local LayerZero simulation."""
+
+import random
+
+import boa
+import pytest
+from AddressUtils import to_bytes32
+from LocalLayerZero import LocalLayerZero
+from MessageTracker import MessageTracker, compute_guid
+
+EID_A = 30101
+EID_B = 30110
+
+
+@pytest.fixture()
+def local_lz(dev_deployer):
+    with LocalLayerZero([EID_A, EID_B]) as lz:
+        with boa.env.prank(dev_deployer):
+            apps = {
+                eid: boa.load("examples/OAppExample.vy", lz.endpoint(eid).address)
+                for eid in (EID_A, EID_B)
+            }
+            apps[EID_A].setPeer(EID_B, to_bytes32(apps[EID_B].address))
+            apps[EID_B].setPeer(EID_A, to_bytes32(apps[EID_A].address))
+        yield lz, apps
+
+
+def _send(app, dst_eid, message="ping"):
+    fee = app.quote_message_fee(dst_eid, "0x" + "00" * 20, message, 100_000)[0]
+    boa.env.set_balance(boa.env.eoa, fee)
+    app.send_message(dst_eid, "0x" + "00" * 20, message, 100_000, value=fee)
+
+
+def _ingest(tracker, lz):
+    for eid, endpoint in lz.endpoints.items():
+        tracker.sync(eid, lz.source, str(endpoint.address), 0, lz.source.block_number())
+
+
+def test_latency_and_delivery(local_lz, tmp_path):
+    lz, apps = local_lz
+    for _ in range(4):
+        _send(apps[EID_A], EID_B)
+    _send(apps[EID_B], EID_A)
+
+    packets = lz.pending()
+    assert [(p.src_eid, p.dst_eid, p.nonce) for p in packets][-1] == (EID_B, EID_A, 1)
+    lz.deliver(packets[0], delay=30)
+    lz.deliver(packets[1], delay=90)
+    lz.drop(packets[2])
+    lz.deliver(packets[4], delay=5)
+    assert lz.pending() == [packets[3]]
+
+    tracker = MessageTracker(str(tmp_path / "tracker.sqlite"))
+    _ingest(tracker, lz)
+    # Ingesting again is idempotent
+    _ingest(tracker, lz)
+
+    stats = tracker.pathway_stats()
+    a_to_b = stats[(EID_A, EID_B)]
+    assert (a_to_b.sent, a_to_b.delivered, a_to_b.pending) == (4, 2, 2)
+    assert a_to_b.delivery_rate == 0.5
+    # Packets 0 and 1 were sent in the same second; 1 is delivered 90s after 0
+    assert (a_to_b.p50, a_to_b.max) == (30, 120)
+    assert stats[(EID_B, EID_A)].p50 == 30 + 90 + 5
+
+    assert tracker.latency_histogram(EID_A, EID_B, buckets=[30, 60])[:2] == [(30, 1), (60, 0)]
+    assert tracker.latency_histogram(EID_A, EID_B, buckets=[30, 60])[2] == (None, 1)
+    now = boa.env.evm.patch.timestamp
+    assert tracker.pending(older_than=0, now=now) == [packets[2].guid, packets[3].guid]
+
+
+def test_guid_matches_endpoint(local_lz):
+    lz, apps = local_lz
+    _send(apps[EID_A], EID_B)
+    packet = lz.pending()[0]
+
+    assert packet.guid == compute_guid(
+        packet.nonce, packet.src_eid, packet.sender, packet.dst_eid, packet.receiver
+    )
+    assert packet.receiver == to_bytes32(apps[EID_B].address)
+
+
+def test_relay_with_drops(local_lz):
+    lz, apps = local_lz
+    for _ in range(20):
+        _send(apps[EID_A], EID_B)
+
+    delivered = lz.relay(delay=10, jitter=20, drop_rate=0.25, rng=random.Random(1))
+    assert 0 < delivered < 20
+    assert lz.pending() == []
+
+    tracker = MessageTracker(":memory:")
+    _ingest(tracker, lz)
+    stats = tracker.pathway_stats()[(EID_A, EID_B)]
+    assert (stats.sent, stats.delivered) == (20, delivered)
+    assert 10 <= stats.p50 <= stats.max
@@ -0,0 +1,134 @@
+"""Test the OApp event indexer against a local boa chain."""
+
+import boa
+import pytest
+from AddressUtils import to_bytes32
+from conftest import WRAPPER_PEER, WRAPPER_PEER_EID
+from OAppIndexer import BoaLogSource, OAppIndexer
+
+DST_EID = WRAPPER_PEER_EID  # peer set by the fixture
+OTHER_EID = 30110
+PEER = WRAPPER_PEER
+
+
+@pytest.fixture()
+def messenger(dev_deployer, mock_endpoint):
+    with boa.env.prank(dev_deployer):
+        return boa.load("examples/OAppExample.vy", mock_endpoint.address)
+
+
+def _send(messenger, eid, message="hello"):
+    fee = messenger.quote_message_fee(eid, "0x" + "42" * 20, message, 200_000)
+    boa.env.set_balance(boa.env.eoa, fee[0])
+    messenger.send_message(eid, "0x" + "42" * 20, message, 200_000, value=fee[0])
+    return fee[0]
+
+
+def _receive(messenger, mock_endpoint, eid, nonce, message=b"pong"):
+    origin = (eid, PEER, nonce)
+    mock_endpoint.lzReceive(origin, messenger.address, b"\x01" * 32, message, b"")
+
+
+def test_sync_and_resume(messenger, mock_endpoint, dev_deployer, tmp_path):
+    db_path = str(tmp_path / "index.sqlite")
+    with BoaLogSource() as source:
+        with boa.env.prank(dev_deployer):
+            messenger.setPeers([DST_EID, OTHER_EID], [PEER, PEER])
+        boa.env.time_travel(blocks=10)
+        fees = _send(messenger, DST_EID) + _send(messenger, DST_EID)
+        boa.env.time_travel(blocks=10)
+        _receive(messenger, mock_endpoint, DST_EID, 1)
+        _send(messenger, OTHER_EID)
+
+        indexer = OAppIndexer(source, [messenger.address], db_path)
+        assert indexer.sync() == 6
+        stats = indexer.throughput()
+        assert (stats[DST_EID].messages_sent, stats[DST_EID].messages_received) == (2, 1)
+        assert stats[DST_EID].native_fees == fees
+        assert stats[OTHER_EID].messages_sent == 1
+        assert indexer.checkpoint(messenger.address) == source.block_number()
+        indexer.close()
+
+        # A new process resumes from the checkpoint
+        boa.env.time_travel(blocks=5)
+        _receive(messenger, mock_endpoint, OTHER_EID, 1)
+        indexer = OAppIndexer(source, [messenger.address], db_path)
+        assert indexer.sync() == 1
+        assert indexer.sync() == 0
+        assert indexer.throughput()[OTHER_EID].messages_received == 1
+        assert indexer.throughput(from_block=source.block_number())[OTHER_EID].messages_sent == 0
+
+
+def test_peers_and_block_buckets(messenger, mock_endpoint, dev_deployer, tmp_path):
+    new_peer = to_bytes32("0x" + "43" * 20)
+    with BoaLogSource() as source:
+        with boa.env.prank(dev_deployer):
+            messenger.setPeer(DST_EID, PEER)
+        start = source.block_number()
+        _send(messenger, DST_EID)
+        boa.env.time_travel(blocks=100)
+        _send(messenger, DST_EID)
+        _receive(messenger, mock_endpoint, DST_EID, 1)
+        with boa.env.prank(dev_deployer):
+            messenger.setPeer(DST_EID, new_peer)
+
+    indexer = OAppIndexer(source, [messenger.address], str(tmp_path / "index.sqlite"))
+    indexer.sync()
+    assert indexer.peers(messenger.address) == {DST_EID: "0x" + new_peer.hex()}
+    assert indexer.throughput_per_block(DST_EID, 100, from_block=start) == [
+        (start // 100 * 100, 1),
+        ((start + 100) // 100 * 100, 2),
+    ]
+
+
+def test_adaptive_chunks(messenger, dev_deployer, tmp_path):
+    class LimitedSource(BoaLogSource):
+        # Rejects ranges wider than 64 blocks, like a provider with a range limit
+        ranges = []
+
+        def get_logs(self, addresses, topics, from_block, to_block):
+            if to_block - from_block >= 64:
+                raise ValueError("block range too large")
+            self.ranges.append((from_block, to_block))
+            return super().get_logs(addresses, topics, from_block, to_block)
+
+    with LimitedSource() as source:
+        for eid in range(1, 6):
+            with boa.env.prank(dev_deployer):
+                messenger.setPeer(eid, PEER)
+            boa.env.time_travel(blocks=100)
+
+    indexer = OAppIndexer(source, [messenger.address], str(tmp_path / "index.sqlite"))
+    assert indexer.sync() == 5
+    assert indexer.chunk_size <= 64
+    assert all(end - start < 64 for start, end in source.ranges)
+    assert source.ranges[-1][1] == source.block_number()
+    assert sorted(indexer.peers(messenger.address)) == [1, 2, 3, 4, 5]
+
+
+def test_light_events_payloads(oapp_events_factory, mock_endpoint, tmp_path):
+    light, full = oapp_events_factory(True), oapp_events_factory(False)
+    with BoaLogSource() as source:
+        guids = {}
+        for oapp, message in ((light, b"light"), (full, b"full")):
+            fee = oapp.quote(DST_EID, message)[0]
+            boa.env.set_balance(boa.env.eoa, fee)
+            oapp.send(DST_EID, message, value=fee)
+            names = ("PayloadSent", "PayloadHashSent")
+            (event,) = [e for e in oapp.get_logs() if type(e).__name__ in names]
+            guids[message] = event.guid
+        mock_endpoint.lzReceive((DST_EID, PEER, 1), light.address, b"\x07" * 32, b"in", b"")
+
+    addresses = [light.address, full.address]
+    indexer = OAppIndexer(
+        source, addresses, str(tmp_path / "index.sqlite"), endpoint=mock_endpoint.address
+    )
+    indexer.sync()
+    stats = indexer.throughput()[DST_EID]
+    assert (stats.messages_sent, stats.messages_received) == (2, 1)
+
+    # Light mode payloads come from the endpoint's PacketSent, full mode ones from the event
+    assert indexer.payload(guids[b"light"]) == b"light"
+    assert indexer.payload(guids[b"full"]) == b"full"
+    # Received payloads resolve on the source chain's index
+    assert indexer.payload(b"\x07" * 32) is None
@@ -0,0 +1,59 @@
+"""Test the Python options codec against OptionsBuilder.vy."""
+
+import pytest
+from AddressUtils import to_bytes32
+from OptionsCodec import compact_options, decode_options, merge_options, parse_options
+
+
+def _build(ob, steps):
+    options = ob.newOptions()
+    for name, *args in steps:
+        options = getattr(ob, name)(options, *args)
+    return options
+
+
+RECEIVER_1 = to_bytes32("0x" + "42" * 20)
+RECEIVER_2 = to_bytes32("0x" + "43" * 20)
+
+ENFORCED = [
+    ("addExecutorLzReceiveOption", 200_000, 0),
+    ("addExecutorNativeDropOption", 1_000, RECEIVER_1),
+    ("addDVNPreCrimeOption", 1),
+]
+CALLER = [
+    ("addExecutorLzReceiveOption", 65_000, 5),
+    ("addExecutorNativeDropOption", 250, RECEIVER_1),
+    ("addExecutorNativeDropOption", 100, RECEIVER_2),
+    ("addExecutorLzComposeOption", 0, 80_000, 0),
+    ("addExecutorOrderedExecutionOption",),
+]
+
+
+def test_parse_options(options_builder_contract):
+    options = _build(options_builder_contract.internal, ENFORCED)
+    entries = parse_options(options)
+
+    assert [(e.worker_id, e.option_type) for e in entries] == [(1, 1), (1, 2), (2, 1)]
+    assert b"".join(e.encode() for e in entries) == options[2:]
+    assert decode_options(options).lz_receive_gas == 200_000
+
+
+@pytest.mark.parametrize("steps", [ENFORCED, CALLER, ENFORCED[:1] * 4 + CALLER[-2:] * 2])
+def test_compact_matches_vyper(options_builder_contract, steps):
+    ob = options_builder_contract.internal
+    options = _build(ob, steps)
+    assert compact_options(options) == ob.compactOptions(options)
+
+
+def test_merge_matches_vyper(options_builder_contract):
+    ob = options_builder_contract.internal
+    enforced = _build(ob, ENFORCED)
+    caller = _build(ob, CALLER)
+
+    merged = merge_options(enforced, caller)
+    assert merged == ob.mergeOptions(enforced, caller)
+
+    # Smaller than the plain concatenation, same executor totals
+    concatenated = enforced + caller[2:]
+    assert len(merged) < len(concatenated)
+    assert decode_options(merged) == decode_options(concatenated)
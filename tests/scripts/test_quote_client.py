@@ -0,0 +1,96 @@
+"""Test the batched, cached quote client against a local boa-backed JSON-RPC stand-in."""
+
+import asyncio
+
+import boa
+import pytest
+from AddressUtils import to_bytes32
+from QuoteClient import LocalRPC, QuoteClient, message_quote, read_quote
+
+EIDS = [30101 + i for i in range(50)]
+PEER = to_bytes32("0x" + "42" * 20)
+RECEIVER = "0x" + "42" * 20
+LZ_READ_CHANNEL = 4294967295
+
+
+class Clock:
+    now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture()
+def messenger(dev_deployer, mock_endpoint):
+    with boa.env.prank(dev_deployer):
+        oapp = boa.load("examples/OAppExample.vy", mock_endpoint.address)
+        for i in range(0, len(EIDS), 25):  # setPeers takes up to 32 eids
+            oapp.setPeers(EIDS[i : i + 25], [PEER] * 25)
+        oapp.setReadChannel(LZ_READ_CHANNEL, True)
+    return oapp
+
+
+def test_one_round_trip_and_cache(messenger):
+    rpc, clock = LocalRPC(), Clock()
+    client = QuoteClient(rpc, ttl=12, clock=clock)
+    requests = [message_quote(messenger.address, eid, RECEIVER, "hello", 200_000) for eid in EIDS]
+
+    fees = asyncio.run(client.quote_many(requests))
+    assert (rpc.round_trips, rpc.calls) == (1, 50)
+    assert fees == [messenger.quote_message_fee(eid, RECEIVER, "hello", 200_000) for eid in EIDS]
+
+    # Same length and options: cached, another message included
+    clock.now = 11
+    assert asyncio.run(client.quote(requests[0])) == fees[0]
+    other = message_quote(messenger.address, EIDS[0], RECEIVER, "world", 200_000)
+    assert asyncio.run(client.quote(other)) == fees[0]
+    assert rpc.round_trips == 1 and client.hits == 2
+
+    # Expired, or different options
+    clock.now = 12
+    asyncio.run(client.quote(requests[0]))
+    asyncio.run(client.quote(message_quote(messenger.address, EIDS[0], RECEIVER, "hello", 1)))
+    assert rpc.round_trips == 3
+
+
+def test_deduplicate_concurrent_requests(messenger):
+    rpc = LocalRPC(latency=0.01)
+    client = QuoteClient(rpc, max_batch=4)
+    read = read_quote(messenger.address, LZ_READ_CHANNEL, EIDS[0], messenger.address, b"\x01" * 36)
+
+    async def bots():
+        # Ten bots asking for the same quotes; the second wave joins the batch in flight
+        first = asyncio.gather(*(client.quote(read) for _ in range(10)))
+        await asyncio.sleep(0.005)  # the batch is on the wire
+        second = asyncio.ensure_future(client.quote_many([read] * 5))
+        return await first, await second
+
+    first, second = asyncio.run(bots())
+    assert set(first + second) == {messenger.quote_read_fee(*_read_args(messenger), 64)}
+    assert (rpc.round_trips, rpc.calls) == (1, 1)
+    assert client.deduplicated == 14
+
+    # Batches are capped at max_batch calls
+    requests = [message_quote(messenger.address, eid, RECEIVER, "x") for eid in EIDS[:10]]
+    asyncio.run(client.quote_many(requests))
+    assert (rpc.round_trips, rpc.calls) == (4, 11)
+
+
+def test_errors_are_per_request(messenger):
+    rpc = LocalRPC()
+    client = QuoteClient(rpc)
+    ok = message_quote(messenger.address, EIDS[0], RECEIVER, "hello")
+    no_peer = message_quote(messenger.address, 1, RECEIVER, "hello")
+
+    async def quote_both():
+        return await asyncio.gather(client.quote(ok), client.quote(no_peer), return_exceptions=True)
+
+    fee, error = asyncio.run(quote_both())
+    assert fee == messenger.quote_message_fee(EIDS[0], RECEIVER, "hello")
+    assert isinstance(error, ValueError) and "execution reverted" in str(error)
+    assert rpc.round_trips == 1
+    assert no_peer.key not in client.cache and not client._inflight
+
+
+def _read_args(messenger):
+    return (LZ_READ_CHANNEL, EIDS[0], messenger.address, b"\x01" * 36, 0, 0)
@@ -0,0 +1,68 @@
+"""Test the Python read codec against ReadCmdCodecV1.vy."""
+
+import pytest
+from ReadCodec import (
+    EVMCallCompute,
+    EVMCallRequest,
+    decode_cmd,
+    decode_responses,
+    encode_cmd,
+    responses_by_label,
+)
+
+REQUESTS = [
+    EVMCallRequest(7, 30101, False, 1234567890, 3, "0x" + "42" * 20, bytes.fromhex("18160ddd")),
+    EVMCallRequest(9, 30110, True, 21_000_000, 0, "0x" + "43" * 20, bytes(36)),
+]
+COMPUTE = EVMCallCompute(1, 30101, False, 1234567890, 3, "0x" + "44" * 20)
+
+
+def _vyper_cmd(codec, requests, compute=None):
+    structs = [
+        codec.eval(
+            f"EVMCallRequestV1(appRequestLabel={r.app_request_label}, targetEid={r.target_eid},"
+            f" isBlockNum={r.is_block_num}, blockNumOrTimestamp={r.block_num_or_timestamp},"
+            f" confirmations={r.confirmations}, to={r.to}, callData=x'{r.call_data.hex()}')"
+        )
+        for r in requests
+    ]
+    if compute is None:
+        return codec.internal.encode(0, structs)
+    compute_struct = codec.eval(
+        f"EVMCallComputeV1(computeSetting={compute.compute_setting},"
+        f" targetEid={compute.target_eid}, isBlockNum={compute.is_block_num},"
+        f" blockNumOrTimestamp={compute.block_num_or_timestamp},"
+        f" confirmations={compute.confirmations}, to={compute.to})"
+    )
+    # boa's internal calls drop overridden default args, so append the compute separately
+    return codec.internal.appendEVMCallComputeV1(codec.internal.encode(0, structs), compute_struct)
+
+
+@pytest.mark.parametrize("compute", [None, COMPUTE])
+def test_encode_decode_cmd(read_cmd_codec_contract, compute):
+    cmd = _vyper_cmd(read_cmd_codec_contract, REQUESTS, compute)
+
+    assert encode_cmd(0, REQUESTS, compute) == cmd
+    decoded = decode_cmd(cmd)
+    assert (decoded.app_cmd_label, decoded.requests, decoded.compute) == (0, REQUESTS, compute)
+
+
+def test_decode_responses_matches_vyper(read_cmd_codec_contract):
+    cmd = _vyper_cmd(read_cmd_codec_contract, REQUESTS)
+    response = (1).to_bytes(32, "big") + (2).to_bytes(32, "big")
+
+    expected = [
+        (r.appRequestLabel, r.result)
+        for r in read_cmd_codec_contract.internal.decodeResponses(cmd, response)
+    ]
+    assert decode_responses(cmd, response) == expected
+    assert decode_responses(cmd, response + b"\x03", [32, 33])[1] == (9, response[32:] + b"\x03")
+    assert responses_by_label(expected) == {7: response[:32], 9: response[32:]}
+
+
+def test_decode_responses_invalid():
+    cmd = encode_cmd(0, REQUESTS)
+    with pytest.raises(AssertionError, match="invalid read response"):
+        decode_responses(cmd, bytes(63))
+    with pytest.raises(AssertionError, match="compute not supported"):
+        decode_responses(encode_cmd(0, REQUESTS, COMPUTE), bytes(64))
@@ -0,0 +1,33 @@
+"""Test the --timing plugin on a small run of the suite."""
+
+import json
+import subprocess
+import sys
+
+
+def test_timing_report(tmp_path):
+    report = tmp_path / "timing.json"
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            "-q",
+            "-p",
+            "no:cacheprovider",
+            "tests/scripts/test_abi_registry.py::test_lazy_loading",
+            "tests/scripts/test_abi_registry.py::test_decode_endpoint_logs",
+            "--timing",
+            f"--timing-report={report}",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    with open(report) as f:
+        data = json.load(f)
+
+    assert set(data["phases"]) == {"setup", "call", "teardown"}
+    assert data["phases"]["call"]["count"] == 2
+    assert data["categories"]["compile"]["count"] > 0
+    assert "mock_endpoint" in data["fixtures"]
+    assert len(data["slowest"]) == 2
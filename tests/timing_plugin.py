@@ -0,0 +1,211 @@
+"""
+Pytest plugin timing where a suite run goes: fixture setup (per fixture), test phases
+(setup, call, teardown), and time spent in vyper compilation, forking, JSON-RPC fetches
+and block explorer fetches (boa entry points are wrapped while the session runs).
+
+Enable with --timing (conftest.py adds the options): the summary is printed at the end of the
+run and written as JSON to --timing-report (default timing_report.json). Works with
+pytest-xdist: workers send their records to the controller, which merges them. Categories
+can overlap: fork includes the RPC calls made while forking, and fixture times include
+whatever the fixture compiles.
+"""
+
+import json
+import time
+from collections import defaultdict
+
+import pytest
+
+CATEGORIES = {
+    # category: (module, attribute owner path, attribute)
+    "compile": ("boa.interpret", None, "compiler_data"),
+    "fork": ("boa.environment", "Env", "fork_rpc"),
+    "rpc": ("boa.rpc", "EthereumRPC", "fetch"),
+    "rpc_multi": ("boa.rpc", "EthereumRPC", "fetch_multi"),
+    "explorer": ("boa.explorer", "Etherscan", "fetch_abi"),
+}
+PHASES = ("setup", "call", "teardown")
+
+
+def _stat():
+    return {"count": 0, "total": 0.0, "max": 0.0}
+
+
+def _add(stat, seconds):
+    stat["count"] += 1
+    stat["total"] += seconds
+    stat["max"] = max(stat["max"], seconds)
+
+
+def _merge(into, other):
+    into["count"] += other["count"]
+    into["total"] += other["total"]
+    into["max"] = max(into["max"], other["max"])
+
+
+class TimingPlugin:
+    def __init__(self, config):
+        self.config = config
+        self.report_path = config.getoption("timing_report")
+        self.fixtures = defaultdict(_stat)
+        self.phases = defaultdict(_stat)
+        self.categories = defaultdict(_stat)
+        self.tests = defaultdict(lambda: defaultdict(float))  # nodeid -> phase/category -> s
+        self._current = None
+        self._patches = []
+        self._depth = defaultdict(int)  # nested calls of a category are timed once
+
+    ################################################################
+    #                        INSTRUMENTATION                       #
+    ################################################################
+
+    def _wrap(self, category, fn):
+        def timed(*args, **kwargs):
+            self._depth[category] += 1
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._depth[category] -= 1
+                if self._depth[category] == 0:
+                    self._record(category, time.perf_counter() - start)
+
+        return timed
+
+    def _record(self, category, seconds):
+        _add(self.categories[category], seconds)
+        if self._current is not None:
+            self.tests[self._current][category] += seconds
+
+    def patch(self):
+        import importlib
+
+        for category, (module_name, owner_name, attribute) in CATEGORIES.items():
+            module = importlib.import_module(module_name)
+            owner = getattr(module, owner_name) if owner_name else module
+            original = getattr(owner, attribute)
+            setattr(owner, attribute, self._wrap(category, original))
+            self._patches.append((owner, attribute, original))
+
+    def unpatch(self):
+        for owner, attribute, original in reversed(self._patches):
+            setattr(owner, attribute, original)
+        self._patches = []
+
+    ################################################################
+    #                            HOOKS                             #
+    ################################################################
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        # Dependencies are set up before this hook runs: this is the fixture's own time
+        start = time.perf_counter()
+        yield
+        _add(self.fixtures[fixturedef.argname], time.perf_counter() - start)
+
+    def _phase(self, item, phase):
+        self._current = item.nodeid
+        start = time.perf_counter()
+        yield
+        seconds = time.perf_counter() - start
+        _add(self.phases[phase], seconds)
+        self.tests[item.nodeid][phase] += seconds
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        yield from self._phase(item, "setup")
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        yield from self._phase(item, "call")
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item):
+        yield from self._phase(item, "teardown")
+        self._current = None
+
+    ################################################################
+    #                           REPORTING                          #
+    ################################################################
+
+    def data(self):
+        return {
+            "fixtures": dict(self.fixtures),
+            "phases": dict(self.phases),
+            "categories": dict(self.categories),
+            "tests": {nodeid: dict(t) for nodeid, t in self.tests.items()},
+        }
+
+    def merge(self, data):
+        for key in ("fixtures", "phases", "categories"):
+            for name, stat in data[key].items():
+                _merge(getattr(self, key)[name], stat)
+        for nodeid, times in data["tests"].items():
+            for name, seconds in times.items():
+                self.tests[nodeid][name] += seconds
+
+    def summary(self, top=10):
+        tests = sorted(self.tests.items(), key=lambda t: -sum(t[1].get(p, 0) for p in PHASES))
+        return {
+            **self.data(),
+            "slowest": [
+                {"nodeid": nodeid, **{k: round(v, 6) for k, v in times.items()}}
+                for nodeid, times in tests[:top]
+            ],
+        }
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session):
+        workeroutput = getattr(self.config, "workeroutput", None)
+        if workeroutput is not None:
+            workeroutput["timing"] = json.dumps(self.data())
+            return
+        with open(self.report_path, "w") as f:
+            json.dump(self.summary(), f, indent=1)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        # xdist controller: merge the records of a finished worker
+        data = getattr(node, "workeroutput", {}).get("timing")
+        if data:
+            self.merge(json.loads(data))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        write = terminalreporter.write_line
+        terminalreporter.section("timing")
+        rows = [("phase " + p, self.phases[p]) for p in PHASES if p in self.phases]
+        rows += [(c, s) for c, s in sorted(self.categories.items())]
+        fixtures = sorted(self.fixtures.items(), key=lambda f: -f[1]["total"])[:10]
+        rows += [("fixture " + name, stat) for name, stat in fixtures]
+        write(f"{'':<44}{'count':>8}{'total s':>10}{'max s':>10}")
+        for name, stat in rows:
+            write(f"{name:<44}{stat['count']:>8}{stat['total']:>10.2f}{stat['max']:>10.2f}")
+        for test in self.summary(top=5)["slowest"]:
+            total = sum(test.get(p, 0) for p in PHASES)
+            write(f"slow: {total:7.2f}s  {test['nodeid']}")
+        write(f"report written to {self.report_path}")
+
+
+def add_options(parser):
+    group = parser.getgroup("timing")
+    group.addoption(
+        "--timing", action="store_true", help="time fixtures, test phases, compile and fork/RPC"
+    )
+    group.addoption(
+        "--timing-report",
+        default="timing_report.json",
+        help="JSON summary written by --timing (default: timing_report.json)",
+    )
+
+
+def configure(config):
+    if config.getoption("timing"):
+        plugin = TimingPlugin(config)
+        plugin.patch()
+        config.pluginmanager.register(plugin, "timing-plugin")
+
+
+def unconfigure(config):
+    plugin = config.pluginmanager.get_plugin("timing-plugin")
+    if plugin is not None:
+        plugin.unpatch()
@@ -1,7 +1,7 @@
 """Test OptionsBuilder module functionality."""
 
 from binascii import hexlify
-from conftest import _to_bytes32
+from AddressUtils import to_bytes32
 import boa
 
 
@@ -74,7 +74,7 @@ def test_add_executor_native_drop_option(options_builder_contract):
 
     # Pass the bytes32 recipient properly formatted
     options = options_builder_contract.internal.addExecutorNativeDropOption(
-        options, amount, _to_bytes32(recipient)
+        options, amount, to_bytes32(recipient)
     )
 
     # Inspect the options
@@ -241,3 +241,81 @@ def test_executor_option_size_limit_enforcement(options_builder_contract, consta
         options_builder_contract.internal.addExecutorLzReceiveOption(
             options, 100000 + max_options, 1000 + max_options
         )
+
+
+def test_decode_options_sums_executor_options(options_builder_contract):
+    """Test parsing sums duplicate executor options like the executor does."""
+    ob = options_builder_contract.internal
+    receiver = to_bytes32("0x" + "42" * 20)
+
+    options = ob.newOptions()
+    options = ob.addExecutorLzReceiveOption(options, 100_000, 0)
+    options = ob.addExecutorLzReceiveOption(options, 50_000, 7)
+    options = ob.addExecutorNativeDropOption(options, 1_000, receiver)
+    options = ob.addExecutorLzComposeOption(options, 0, 30_000, 0)
+    options = ob.addExecutorLzComposeOption(options, 1, 20_000, 0)
+    options = ob.addExecutorLzComposeOption(options, 0, 10_000, 3)
+
+    summary = ob.decodeOptions(options)
+    assert summary.hasLzReceive
+    assert (summary.lzReceiveGas, summary.lzReceiveValue) == (150_000, 7)
+    assert [(d.receiver, d.amount) for d in summary.nativeDrops] == [(receiver, 1_000)]
+    assert [(c.index, c.gas, c.value) for c in summary.lzComposes] == [
+        (0, 40_000, 3),
+        (1, 20_000, 0),
+    ]
+    assert not summary.orderedExecution and not summary.hasLzRead
+    assert summary.passthrough == b""
+
+
+def test_compact_options(options_builder_contract):
+    """Test compaction keeps one executor option per (type, index)."""
+    ob = options_builder_contract.internal
+
+    options = ob.newOptions()
+    for _ in range(4):
+        options = ob.addExecutorLzReceiveOption(options, 25_000, 0)
+        options = ob.addExecutorOrderedExecutionOption(options)
+
+    compacted = ob.compactOptions(options)
+    expected = ob.addExecutorOrderedExecutionOption(
+        ob.addExecutorLzReceiveOption(ob.newOptions(), 100_000, 0)
+    )
+    assert compacted == expected
+    assert len(compacted) < len(options)
+
+
+def test_merge_options(options_builder_contract):
+    """Test merging enforced and caller options, DVN options are kept verbatim."""
+    ob = options_builder_contract.internal
+
+    enforced = ob.addExecutorLzReceiveOption(ob.newOptions(), 200_000, 0)
+    enforced = ob.addDVNPreCrimeOption(enforced, 0)
+    caller = ob.addExecutorLzReceiveOption(ob.newOptions(), 50_000, 1_000)
+    caller = ob.addExecutorLzReadOption(caller, 10_000, 32, 0)
+
+    merged = ob.mergeOptions(enforced, caller)
+    expected = ob.addExecutorLzReceiveOption(ob.newOptions(), 250_000, 1_000)
+    expected = ob.addExecutorLzReadOption(expected, 10_000, 32, 0)
+    expected = ob.addDVNPreCrimeOption(expected, 0)
+    assert merged == expected
+
+    # Empty options are treated as no options
+    assert ob.mergeOptions(enforced, b"") == ob.compactOptions(enforced)
+    assert ob.mergeOptions(b"", caller) == caller
+
+
+def test_decode_options_invalid(options_builder_contract):
+    """Test malformed options containers are rejected."""
+    ob = options_builder_contract.internal
+    options = ob.addExecutorLzReceiveOption(ob.newOptions(), 100_000, 0)
+
+    with boa.reverts("OApp: invalid option type"):
+        ob.decodeOptions(b"\x00\x01" + options[2:])
+    with boa.reverts("OApp: invalid options"):
+        ob.decodeOptions(options[:-1])
+    with boa.reverts("OApp: invalid worker id"):
+        ob.decodeOptions(options[:2] + b"\x03" + options[3:])
+    with boa.reverts("OApp: invalid lzReceive option"):
+        # lzReceive body must be 16 or 32 bytes
+        ob.decodeOptions(options[:2] + b"\x01\x00\x02\x01\x00")
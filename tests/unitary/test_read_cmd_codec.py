@@ -2,6 +2,8 @@
 
 import time
 
+import boa
+
 
 def create_evm_call_request(
     read_cmd_codec_contract,
@@ -265,3 +267,60 @@ def test_request_fields_encoding(read_cmd_codec_contract):
     assert encoded[0:2] == (1).to_bytes(2, byteorder="big")  # CMD_VERSION = 1
     assert encoded[2:4] == app_cmd_label.to_bytes(2, byteorder="big")
     assert encoded[4:6] == (1).to_bytes(2, byteorder="big")  # Number of requests = 1
+
+
+def _two_request_cmd(read_cmd_codec_contract, labels=(7, 9)):
+    requests = [
+        create_evm_call_request(
+            read_cmd_codec_contract, label, 1, False, 1234567890, 1, "0x" + "42" * 20, calldata
+        )
+        for label, calldata in zip(labels, [bytes.fromhex("18160ddd"), bytes(36)])
+    ]
+    return read_cmd_codec_contract.internal.encode(0, requests)
+
+
+def test_decode_responses_equal_sizes(read_cmd_codec_contract):
+    """Test splitting a response of equal-sized results, keyed by appRequestLabel."""
+    cmd = _two_request_cmd(read_cmd_codec_contract)
+    response = (1).to_bytes(32, "big") + (2).to_bytes(32, "big")
+
+    assert read_cmd_codec_contract.internal.decodeRequestLabels(cmd) == [7, 9]
+    decoded = read_cmd_codec_contract.internal.decodeResponses(cmd, response)
+    assert [(r.appRequestLabel, r.result) for r in decoded] == [
+        (7, response[:32]),
+        (9, response[32:]),
+    ]
+
+
+def test_decode_responses_with_sizes(read_cmd_codec_contract):
+    """Test splitting a response with per-request result sizes."""
+    codec = read_cmd_codec_contract.internal
+    response = bytes(range(96))
+
+    decoded = codec.splitResponses(response, [7, 9], [32, 64])
+    assert [(r.appRequestLabel, r.result) for r in decoded] == [
+        (7, response[:32]),
+        (9, response[32:]),
+    ]
+
+    for sizes in ([32, 63], [32, 65], [96]):
+        with boa.reverts("OApp: invalid read response"):
+            codec.splitResponses(response, [7, 9], sizes)
+    with boa.reverts("OApp: invalid read response"):
+        codec.decodeResponses(_two_request_cmd(read_cmd_codec_contract), response[:95])
+
+
+def test_decode_responses_rejects_compute(read_cmd_codec_contract):
+    """Test that commands with a compute cannot be split per request."""
+    request = create_evm_call_request(
+        read_cmd_codec_contract, 1, 1, False, 1234567890, 1, "0x" + "42" * 20, b"\x01"
+    )
+    compute = create_evm_call_compute(
+        read_cmd_codec_contract, 1, 1, False, 1234567890, 1, "0x" + "43" * 20
+    )
+    # appendEVMCallComputeV1 directly: boa's internal calls drop overridden default args
+    codec = read_cmd_codec_contract.internal
+    cmd = codec.appendEVMCallComputeV1(codec.encode(0, [request]), compute)
+
+    with boa.reverts("OApp: compute not supported"):
+        read_cmd_codec_contract.internal.decodeRequestLabels(cmd)